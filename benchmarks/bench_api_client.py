@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Benchmark: API validation posts, one-shot urllib vs the pooled ApiValidationClient.
+
+Both paths post an API JSON to the local stand-in server
+(orchestrators/mock_api_server.py) --posts times, each with a fresh unique
+template code, the way call_api does:
+  - one-shot: urllib.request per post (new connection, uncompressed body,
+              no retries), the previous fallback path of call_api
+  - client:   ApiValidationClient (keep-alive pool, gzip body via
+              use_gzip=True, retries with jitter on 503)
+
+The server adds --latency per response plus the upload time of the body at
+--upload-mbps, and answers --fail-rate of posts with 503. Reports wall time
+per post, bytes sent, connections opened and how many posts were accepted.
+
+Usage:
+    python benchmarks/bench_api_client.py
+    python benchmarks/bench_api_client.py --file documents/json_output/3334-schema.json --posts 50 --fail-rate 0.2
+"""
+
+import argparse
+import json
+import logging
+import sys
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+from typing import Callable, Dict, Tuple
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "orchestrators"))
+
+from api_client import ApiValidationClient
+from mock_api_server import DEFAULT_TOKEN, start_mock_server
+
+DEFAULT_FILE = PROJECT_ROOT / "documents" / "json_output" / "vendor_creation.json"
+HEADERS = {"X-Authorization": DEFAULT_TOKEN, "Content-Type": "application/json"}
+
+
+def post_one_shot(url: str, body: bytes) -> int:
+    request = urllib.request.Request(url, data=body, headers=HEADERS, method="POST")
+    try:
+        with urllib.request.urlopen(request, timeout=60) as response:
+            response.read()
+            return response.status
+    except urllib.error.HTTPError as e:
+        return e.code
+
+
+def run(post: Callable[[str, bytes], int], schema: Dict, args) -> Tuple[float, int, Dict]:
+    """Seconds taken, accepted posts and server stats for --posts posts."""
+    server, url = start_mock_server(latency=args.latency, fail_rate=args.fail_rate, upload_mbps=args.upload_mbps)
+    accepted = 0
+    start = time.perf_counter()
+    for i in range(args.posts):
+        schema["template"]["code"] = f"bench_{i}"
+        status = post(url, json.dumps(schema).encode("utf-8"))
+        accepted += 200 <= status < 300
+    elapsed = time.perf_counter() - start
+    server.shutdown()
+    server.server_close()
+    return elapsed, accepted, server.stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark one-shot urllib posts vs ApiValidationClient")
+    parser.add_argument("--file", default=str(DEFAULT_FILE), help="API JSON to post (default: vendor_creation.json)")
+    parser.add_argument("--posts", type=int, default=20, help="Posts per path (default: 20)")
+    parser.add_argument("--latency", type=float, default=0.02, help="Server latency per response (default: 0.02)")
+    parser.add_argument("--fail-rate", type=float, default=0.1, help="Share of posts answered 503 (default: 0.1)")
+    parser.add_argument("--upload-mbps", type=float, default=50, help="Simulated upload bandwidth (default: 50)")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.ERROR)
+
+    with open(args.file) as f:
+        schema = json.load(f)
+    schema.setdefault("template", {})
+
+    client = ApiValidationClient(backoff_base=0.05, use_gzip=True)
+    results = {
+        "one-shot": run(post_one_shot, schema, args),
+        "client": run(lambda url, body: client.post(url, body, HEADERS)[0], schema, args),
+    }
+    client.close()
+
+    print("\n" + "="*70)
+    print("API CLIENT BENCHMARK")
+    print("="*70)
+    print(f"{Path(args.file).name}: {len(json.dumps(schema)) / 1024:.0f} KB, {args.posts} posts, "
+          f"latency {args.latency * 1000:.0f} ms, upload {args.upload_mbps:g} Mbit/s, 503 rate {args.fail_rate:.0%}")
+    print(f"  {'':<9} {'per post':>10} {'sent':>10} {'connections':>12} {'accepted':>9}")
+    for name, (elapsed, accepted, stats) in results.items():
+        print(f"  {name:<9} {elapsed / args.posts * 1000:7.1f} ms {stats['bytes_received'] / 1024 / 1024:7.2f} MB "
+              f"{stats['connections']:12d} {accepted:5d}/{args.posts}")
+    print(f"  Client retries: {client.stats['retries']}")
+    print("="*70)
+
+    sys.exit(0 if results["client"][1] == args.posts else 1)
+
+
+if __name__ == "__main__":
+    main()
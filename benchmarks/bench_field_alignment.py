@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Benchmark: FieldComparator.compare_all_fields staged alignment vs per-field full scan.
+
+Aligns the fields of a generated API JSON with a reference API JSON (default:
+vendor_creation_generated.json vs vendor_creation.json) in two ways:
+  - legacy: the previous first pass, which calls find_matching_field for every
+            generated field and compares it with every unmatched reference
+            field (reproduced below as the reference)
+  - staged: compare_all_fields as is, with exact/normalized hash buckets and
+            then LLM adjudication of a few candidates per leftover field
+
+Without LLM matching both must produce the same field ID mapping and match
+types. The script then repeats both runs with a simulated LLM client to count
+LLM requests. The client is deterministic and answers "match" for names with
+at least half of their tokens in common; it answers single-pair and batched
+prompts. Matches can differ in that mode because the staged aligner only asks
+about the leftover fields; the script reports how many. Each run gets an empty
+persistent decision cache in a temporary directory. A second staged run with a
+new comparator on the same cache (as in the next eval run or self-heal
+iteration) must need no LLM requests.
+
+Usage:
+    python benchmarks/bench_field_alignment.py
+    python benchmarks/bench_field_alignment.py --generated out.json --reference ref.json --repeat 5
+"""
+
+import argparse
+import json
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from eval.evaluator import FormFillEvaluator
+from eval.field_comparator import FieldComparator
+from eval.llm_client import LLMClient
+from eval.llm_decision_cache import LLMDecisionCache
+
+DEFAULT_GENERATED = PROJECT_ROOT / "documents" / "json_output" / "vendor_creation_generated.json"
+DEFAULT_REFERENCE = PROJECT_ROOT / "documents" / "json_output" / "vendor_creation.json"
+
+
+class SimulatedLLMClient(LLMClient):
+    """Deterministic stand-in for the field-matching LLM that counts requests and pairs."""
+
+    model = "simulated"
+
+    def __init__(self):
+        self.calls = 0
+        self.pairs = 0
+
+    def is_available(self) -> bool:
+        return True
+
+    def complete(self, prompt: str, system_prompt: Optional[str] = None,
+                 temperature: float = 0.0, max_tokens: int = 1000) -> str:
+        self.calls += 1
+        batched = re.findall(r'^Pair (\d+): Field 1 "(.*)" \| Field 2 "(.*)"$', prompt, re.MULTILINE)
+        if batched:
+            self.pairs += len(batched)
+            return json.dumps([dict(self.decide(name1, name2), index=int(index)) for index, name1, name2 in batched])
+        self.pairs += 1
+        names = [line.split('"')[1] for line in prompt.splitlines() if line.startswith("Field ") and '"' in line]
+        return json.dumps(self.decide(*names[:2]))
+
+    @staticmethod
+    def decide(name1: str, name2: str) -> Dict[str, Any]:
+        tokens = [set(FieldComparator.normalize_name(name).split()) for name in (name1, name2)]
+        overlap = len(tokens[0] & tokens[1]) / max(1, min(len(tokens[0]), len(tokens[1])))
+        is_match = overlap >= 0.5
+        return {"is_match": is_match, "confidence": 0.85 if is_match else 0.1, "reasoning": "simulated"}
+
+
+def legacy_alignment(comparator: FieldComparator, generated: List[Dict], reference: List[Dict]) -> Dict[int, Any]:
+    """The previous compare_all_fields first pass."""
+    matched_ref_ids = set()
+    mapping = {}
+    for gen_field in generated:
+        ref_field, comparison = comparator.find_matching_field(gen_field, reference, matched_ref_ids)
+        if ref_field and comparison:
+            matched_ref_ids.add(ref_field.get("id", 0))
+            mapping[gen_field.get("id", 0)] = (ref_field.get("id", 0), comparison.name_match.match_type)
+    return mapping
+
+
+def staged_alignment(comparator: FieldComparator, generated: List[Dict], reference: List[Dict]) -> Dict[int, Any]:
+    result = comparator.compare_all_fields(generated, reference)
+    return {
+        gen_field.get("id", 0): (ref_field.get("id", 0), comparison.name_match.match_type)
+        for gen_field, ref_field, comparison in result["matched_pairs"]
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark staged field alignment vs per-field full scan")
+    parser.add_argument("--generated", default=str(DEFAULT_GENERATED), help="Generated API JSON")
+    parser.add_argument("--reference", default=str(DEFAULT_REFERENCE), help="Reference API JSON")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing repetitions, best is reported (default: 5)")
+    args = parser.parse_args()
+
+    evaluator = FormFillEvaluator(use_llm=False)
+    generated = evaluator.extract_form_fill_metadatas(evaluator.load_json(args.generated))
+    reference = evaluator.extract_form_fill_metadatas(evaluator.load_json(args.reference))
+
+    def best_of(fn):
+        best = float('inf')
+        result = None
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            result = fn()
+            best = min(best, time.perf_counter() - start)
+        return best, result
+
+    comparator = FieldComparator(use_llm=False)
+    legacy_time, legacy_mapping = best_of(lambda: legacy_alignment(comparator, generated, reference))
+    staged_time, staged_mapping = best_of(lambda: staged_alignment(comparator, generated, reference))
+    mismatches = sum(1 for gen_id in set(legacy_mapping) | set(staged_mapping)
+                     if legacy_mapping.get(gen_id) != staged_mapping.get(gen_id))
+
+    # Simulated LLM: fresh comparators and decision caches so the LLM result caches start empty
+    legacy_client, staged_client, warm_client = SimulatedLLMClient(), SimulatedLLMClient(), SimulatedLLMClient()
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy_cache = LLMDecisionCache(Path(tmp) / "legacy.sqlite3")
+        staged_cache = LLMDecisionCache(Path(tmp) / "staged.sqlite3")
+
+        start = time.perf_counter()
+        legacy_llm_mapping = legacy_alignment(
+            FieldComparator(llm_client=legacy_client, decision_cache=legacy_cache), generated, reference)
+        legacy_llm_time = time.perf_counter() - start
+        start = time.perf_counter()
+        staged_llm_mapping = staged_alignment(
+            FieldComparator(llm_client=staged_client, decision_cache=staged_cache), generated, reference)
+        staged_llm_time = time.perf_counter() - start
+
+        # Next run: new comparator (empty in-memory cache), same persistent cache
+        start = time.perf_counter()
+        warm_llm_mapping = staged_alignment(
+            FieldComparator(llm_client=warm_client, decision_cache=LLMDecisionCache(staged_cache.path)),
+            generated, reference)
+        warm_llm_time = time.perf_counter() - start
+    llm_differences = sum(1 for gen_id in set(legacy_llm_mapping) | set(staged_llm_mapping)
+                          if legacy_llm_mapping.get(gen_id) != staged_llm_mapping.get(gen_id))
+    warm_ok = warm_client.calls == 0 and warm_llm_mapping == staged_llm_mapping
+
+    print(f"Generated: {args.generated} ({len(generated)} fields)")
+    print(f"Reference: {args.reference} ({len(reference)} fields)")
+    print("\n" + "="*70)
+    print("FIELD ALIGNMENT BENCHMARK")
+    print("="*70)
+    print("Without LLM:")
+    print(f"  Legacy full scan:    {legacy_time * 1000:9.2f} ms  ({len(legacy_mapping)} matched)")
+    print(f"  Staged buckets:      {staged_time * 1000:9.2f} ms  ({len(staged_mapping)} matched)")
+    if staged_time > 0:
+        print(f"  Speedup:             {legacy_time / staged_time:9.1f}x")
+    print(f"  Mismatched pairs:    {mismatches}")
+    print("With simulated LLM:")
+    print(f"  Legacy LLM requests: {legacy_client.calls:6d}  ({legacy_client.pairs} pairs, "
+          f"{len(legacy_llm_mapping)} matched, {legacy_llm_time * 1000:.1f} ms)")
+    print(f"  Staged LLM requests: {staged_client.calls:6d}  ({staged_client.pairs} pairs, "
+          f"{len(staged_llm_mapping)} matched, {staged_llm_time * 1000:.1f} ms)")
+    print(f"  Warm cache requests: {warm_client.calls:6d}  ({len(warm_llm_mapping)} matched, "
+          f"{warm_llm_time * 1000:.1f} ms, {'same' if warm_ok else 'DIFFERENT'} result)")
+    print(f"  Differing pairs:     {llm_differences}")
+    print("="*70)
+
+    sys.exit(0 if mismatches == 0 and warm_ok else 1)
+
+
+if __name__ == "__main__":
+    main()
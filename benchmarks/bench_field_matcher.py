@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Benchmark: FieldMatcher.match_field with the inverted token index vs a full scan.
+
+Loads the largest API schema in documents/json_output (by field count, unless
+--schema is given) into a FieldMatcher. It then runs a fixed set of fuzzy
+queries derived from the schema's field names: dropped, reordered and extra
+tokens, "<field> <other field>" combinations like the VERIFY destination
+search, and misses. Two implementations are compared:
+  - legacy:  the previous match_field, which re-normalizes every field name and
+             scores all fields per query (reproduced below as the reference)
+  - indexed: match_field as is, scoring only fields that share a query token
+
+Every query must return the same field from both.
+
+Usage:
+    python benchmarks/bench_field_matcher.py
+    python benchmarks/bench_field_matcher.py --schema documents/json_output/3334-schema.json --repeat 5
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from rule_extraction_agent.field_matcher import FieldMatcher
+from rule_extraction_agent.models import FieldInfo
+
+
+class LegacyFieldMatcher(FieldMatcher):
+    """FieldMatcher with the pre-index match_field."""
+
+    def match_field(self, query: str, threshold: float = 0.6) -> Optional[FieldInfo]:
+        exact = self.find_by_name(query)
+        if exact:
+            return exact
+
+        best_match = None
+        best_score = threshold
+
+        query_normalized = self._normalize(query)
+        query_tokens = set(query_normalized.split())
+
+        for field in self.fields:
+            field_normalized = self._normalize(field.name)
+            field_tokens = set(field_normalized.split())
+
+            score = self._token_similarity(query_tokens, field_tokens)
+
+            if score > best_score:
+                best_score = score
+                best_match = field
+
+        return best_match
+
+
+def schema_fields(path: Path) -> Optional[List[dict]]:
+    try:
+        with open(path, 'r') as f:
+            data = json.load(f)
+        fields = data['template']['documentTypes'][0]['formFillMetadatas']
+    except (KeyError, IndexError, TypeError, ValueError):
+        return None
+    return fields if isinstance(fields, list) else None
+
+
+def largest_schema(directory: Path) -> Path:
+    sized = []
+    for path in sorted(directory.glob("*.json")):
+        fields = schema_fields(path)
+        if fields:
+            sized.append((len(fields), path))
+    if not sized:
+        raise SystemExit(f"No API schemas found in {directory}")
+    return max(sized, key=lambda item: item[0])[1]
+
+
+def build_queries(names: List[str]) -> List[str]:
+    """Deterministic fuzzy queries: variations of the schema's own field names."""
+    queries = []
+    for i, name in enumerate(names):
+        tokens = name.split()
+        other = names[(i * 7 + 3) % len(names)]
+        queries.append(f"{name} details")
+        queries.append(f"upload {name}")
+        queries.append(f"{name} {other}")
+        queries.append(f"{name} number")
+        if len(tokens) > 1:
+            queries.append(" ".join(tokens[:-1]))
+            queries.append(" ".join(tokens[1:]))
+            queries.append(" ".join(reversed(tokens)))
+        queries.append(f"unrelated reference {i}")
+    return queries
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark FieldMatcher fuzzy matching (indexed vs full scan)")
+    parser.add_argument("--schema", help="API schema JSON (default: largest schema in documents/json_output)")
+    parser.add_argument("--repeat", type=int, default=3, help="Timing repetitions, best is reported (default: 3)")
+    args = parser.parse_args()
+
+    schema_path = Path(args.schema) if args.schema else largest_schema(PROJECT_ROOT / "documents" / "json_output")
+    fields = schema_fields(schema_path)
+    if not fields:
+        raise SystemExit(f"Not an API schema: {schema_path}")
+
+    legacy = LegacyFieldMatcher(fields)
+    indexed = FieldMatcher(fields)
+    queries = build_queries([f.name for f in indexed.fields if f.name])
+    thresholds = (0.6, 0.7)
+
+    def run(matcher):
+        return [matcher.match_field(q, threshold=t) for t in thresholds for q in queries]
+
+    def best_of(fn):
+        best = float('inf')
+        result = None
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            result = fn()
+            best = min(best, time.perf_counter() - start)
+        return best, result
+
+    load_time, _ = best_of(lambda: FieldMatcher(fields))
+    legacy_time, legacy_results = best_of(lambda: run(legacy))
+    indexed_time, indexed_results = best_of(lambda: run(indexed))
+
+    calls = len(legacy_results)
+    mismatches = sum(1 for a, b in zip(legacy_results, indexed_results)
+                     if (a.id if a else None) != (b.id if b else None))
+    matched = sum(1 for r in indexed_results if r)
+
+    print(f"Schema: {schema_path}")
+    print(f"Fields: {len(indexed.fields)}, distinct tokens: {len(indexed._token_index)}, "
+          f"queries: {calls} ({matched} matched)")
+    print("\n" + "="*70)
+    print("FIELD MATCHER BENCHMARK")
+    print("="*70)
+    print(f"load_fields:         {load_time * 1000:9.2f} ms")
+    print(f"Legacy full scan:    {legacy_time * 1000:9.2f} ms  ({legacy_time / calls * 1e6:.1f} us/query)")
+    print(f"Inverted index:      {indexed_time * 1000:9.2f} ms  ({indexed_time / calls * 1e6:.1f} us/query)")
+    if indexed_time > 0:
+        print(f"Speedup:             {legacy_time / indexed_time:9.1f}x")
+    print(f"Mismatched results:  {mismatches}")
+    print("="*70)
+
+    sys.exit(0 if mismatches == 0 else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Benchmark: eval lookup structures, separate ID maps vs one FormIndex.
+
+For each API JSON, two ways to build the lookups the evaluator and
+RuleComparator need:
+  - maps:  the previous helpers (field ID -> name, field ID -> type,
+           rule ID -> field info dict, rules by action type), each walking
+           the field list on its own (reproduced below)
+  - index: FormIndex, one pass with slotted records and tuple locations
+
+Reports best-of-N build time and the tracemalloc size of the lookups alone,
+built for an already loaded document. "Retained" is what evaluate() keeps
+while comparing: previously the whole parsed document plus the maps, now
+the FormIndex and the metadata dicts it points to. The metadata dicts are
+most of an API JSON, so retained memory only drops by the difference in
+lookup size plus the template wrapper. Every lookup must give the same
+answer both ways.
+
+Usage:
+    python benchmarks/bench_form_index.py
+    python benchmarks/bench_form_index.py --file stage_7.json --repeat 20
+"""
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from common import json_io
+from eval.form_index import FormIndex, extract_form_fill_metadatas
+
+JSON_DIR = PROJECT_ROOT / "documents" / "json_output"
+DEFAULT_FILES = [
+    JSON_DIR / "vendor_creation_with_execute_rules.json",
+    JSON_DIR / "vendor_creation.json",
+    JSON_DIR / "3334-schema.json",
+]
+
+
+def build_maps(fields: List[Dict[str, Any]]) -> Tuple[Dict, Dict, Dict, Dict]:
+    """The previous build_field_id_to_name_map, _type_map, build_rule_id_to_field_map and count_rules_by_type."""
+    id_to_name = {}
+    for field in fields:
+        field_id = field.get("id", 0)
+        id_to_name[field_id] = field.get("formTag", {}).get("name", f"field_{field_id}")
+    id_to_type = {}
+    for field in fields:
+        id_to_type[field.get("id", 0)] = field.get("formTag", {}).get("type", "UNKNOWN")
+    rule_to_field = {}
+    for field in fields:
+        field_id = field.get("id", 0)
+        form_tag = field.get("formTag", {})
+        for rule in field.get("formFillRules", []):
+            rule_to_field[rule.get("id", 0)] = {
+                "field_id": field_id,
+                "field_name": form_tag.get("name", f"field_{field_id}"),
+                "field_type": form_tag.get("type", "UNKNOWN"),
+                "rule": rule,
+            }
+    counts = {}
+    for field in fields:
+        for rule in field.get("formFillRules", []):
+            action_type = rule.get("actionType", "UNKNOWN")
+            counts[action_type] = counts.get(action_type, 0) + 1
+    return id_to_name, id_to_type, rule_to_field, counts
+
+
+def traced_size(build: Callable[[], Any]) -> Tuple[Any, int]:
+    """Object built by `build` and the bytes it still holds."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, size
+
+
+def best_time(build: Callable[[], Any], repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        build()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def mismatches(maps: Tuple[Dict, Dict, Dict, Dict], index: FormIndex) -> int:
+    id_to_name, id_to_type, rule_to_field, counts = maps
+    errors = 0
+    for field_id, name in id_to_name.items():
+        record = index.field(field_id)
+        errors += record is None or record.label != name or record.type != id_to_type[field_id]
+    for rule_id, info in rule_to_field.items():
+        owner = index.rule_owner(rule_id)
+        errors += owner is None or owner[0].label != info["field_name"] or owner[1] is not info["rule"]
+    errors += index.rule_counts != counts
+    return errors
+
+
+def bench_file(path: str, repeat: int) -> int:
+    """Print the build/lookup/retained table for one API JSON; returns mismatched lookups."""
+    fields = extract_form_fill_metadatas(json_io.load(path))
+    rule_count = sum(len(f.get("formFillRules", [])) for f in fields)
+
+    maps, maps_size = traced_size(lambda: build_maps(fields))
+    index, index_size = traced_size(lambda: FormIndex(fields))
+    maps_time = best_time(lambda: build_maps(fields), repeat)
+    index_time = best_time(lambda: FormIndex(fields), repeat)
+    errors = mismatches(maps, index)
+
+    def load_with_maps():
+        loaded = json_io.load(path)
+        return loaded, build_maps(extract_form_fill_metadatas(loaded))
+
+    _, retained_before = traced_size(load_with_maps)
+    _, retained_after = traced_size(lambda: FormIndex.from_document(json_io.load(path)))
+
+    print(f"{Path(path).name}: {Path(path).stat().st_size / 1024:.0f} KB, "
+          f"{len(fields)} fields, {rule_count} rules")
+    print(f"  {'':<8} {'build':>10} {'lookups':>10} {'retained':>10}")
+    print(f"  {'maps':<8} {maps_time * 1000:7.2f} ms {maps_size / 1024:7.0f} KB {retained_before / 1024:7.0f} KB")
+    print(f"  {'index':<8} {index_time * 1000:7.2f} ms {index_size / 1024:7.0f} KB {retained_after / 1024:7.0f} KB")
+    if errors:
+        print(f"  MISMATCHED LOOKUPS: {errors}")
+    print()
+    return errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark eval ID maps vs FormIndex")
+    parser.add_argument("--file", action="append", help="API JSON to index (repeatable, default: 4 BUD outputs)")
+    parser.add_argument("--repeat", type=int, default=10, help="Timing repetitions, best is reported (default: 10)")
+    args = parser.parse_args()
+
+    total_mismatches = 0
+    print("\n" + "="*70)
+    print("FORM INDEX BENCHMARK")
+    print("="*70)
+    for path in args.file or DEFAULT_FILES:
+        total_mismatches += bench_file(str(path), args.repeat)
+    print(f"Mismatched lookups: {total_mismatches}")
+    print("="*70)
+
+    sys.exit(0 if total_mismatches == 0 else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Benchmark: incremental vs full FormFillEvaluator.evaluate across self-heal iterations.
+
+Simulates a self-heal loop on a generated/reference pair (default:
+vendor_creation_with_execute_rules.json vs vendor_creation.json). Each
+iteration edits --changes random generated fields in a seeded way: change a
+rule's condition, drop a rule, rename a field (which also affects rules that
+reference it), or add a rule. It then evaluates the new output twice:
+  - full:        a new FormFillEvaluator, as the orchestrators did
+  - incremental: one FormFillEvaluator(incremental=True) kept across iterations
+
+Both evaluations must produce the same EvalResult.to_dict() on every
+iteration. The script reports time per iteration and how many matched field
+results were reused.
+
+Usage:
+    python benchmarks/bench_incremental_eval.py
+    python benchmarks/bench_incremental_eval.py --iterations 10 --changes 3
+"""
+
+import argparse
+import copy
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from common import json_io
+from eval.evaluator import FormFillEvaluator
+
+JSON_DIR = PROJECT_ROOT / "documents" / "json_output"
+DEFAULT_GENERATED = JSON_DIR / "vendor_creation_with_execute_rules.json"
+DEFAULT_REFERENCE = JSON_DIR / "vendor_creation.json"
+
+
+def metadatas(document: Dict) -> List[Dict]:
+    template = document.get("template", document)
+    return [field for doc_type in template.get("documentTypes", []) for field in doc_type.get("formFillMetadatas", [])]
+
+
+def mutate(document: Dict, rng: random.Random, changes: int, iteration: int) -> List[str]:
+    """Apply seeded edits like a self-heal agent would; returns a description of each."""
+    fields = metadatas(document)
+    edits = []
+    for field in rng.sample(fields, min(changes, len(fields))):
+        rules = field.get("formFillRules", [])
+        name = field.get("formTag", {}).get("name", "")
+        kind = rng.choice(["condition", "drop", "rename", "add"] if rules else ["rename", "add"])
+        if kind == "condition":
+            rule = rng.choice(rules)
+            rule["condition"] = "IN" if rule.get("condition") != "IN" else "NOT_IN"
+        elif kind == "drop":
+            rules.remove(rng.choice(rules))
+        elif kind == "rename":
+            field.setdefault("formTag", {})["name"] = f"{name} v{iteration}"
+        else:
+            field.setdefault("formFillRules", []).append({
+                "id": 900000 + iteration * 100 + len(edits),
+                "actionType": "MAKE_VISIBLE",
+                "sourceIds": [field.get("id")],
+                "destinationIds": [],
+                "condition": "IN",
+                "conditionalValues": ["Yes"],
+            })
+        edits.append(f"{kind} '{name}'")
+    return edits
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark incremental vs full evaluation across iterations")
+    parser.add_argument("--generated", default=str(DEFAULT_GENERATED), help="Generated API JSON (iteration 1)")
+    parser.add_argument("--reference", default=str(DEFAULT_REFERENCE), help="Reference API JSON")
+    parser.add_argument("--iterations", type=int, default=5, help="Self-heal iterations (default: 5)")
+    parser.add_argument("--changes", type=int, default=3, help="Fields edited per iteration (default: 3)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for the edits (default: 0)")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    document = json_io.load(args.generated)
+    incremental = FormFillEvaluator(use_llm=False, incremental=True)
+    rows = []
+    mismatches = 0
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for iteration in range(1, args.iterations + 1):
+            edits = mutate(document, rng, args.changes, iteration) if iteration > 1 else []
+            generated_path = os.path.join(tmp, f"stage_output_v{iteration}.json")
+            json_io.dump(copy.deepcopy(document), generated_path)
+
+            start = time.perf_counter()
+            full_result = FormFillEvaluator(use_llm=False).evaluate(generated_path, args.reference)
+            full_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            incremental_result = incremental.evaluate(generated_path, args.reference)
+            incremental_time = time.perf_counter() - start
+
+            same = incremental_result.to_dict() == full_result.to_dict()
+            mismatches += not same
+            state = incremental.incremental_state
+            rows.append((iteration, full_time, incremental_time, state.reused, state.recomputed,
+                         full_result.overall_score, same, edits))
+
+    print(f"Generated: {args.generated}")
+    print(f"Reference: {args.reference}")
+    print("\n" + "="*70)
+    print("INCREMENTAL EVALUATION BENCHMARK")
+    print("="*70)
+    print(f"{'iter':>4} {'full':>10} {'incremental':>12} {'reused':>7} {'recomputed':>11} {'score':>7}  result")
+    for iteration, full_time, incremental_time, reused, recomputed, score, same, edits in rows:
+        print(f"{iteration:4d} {full_time * 1000:7.1f} ms {incremental_time * 1000:9.1f} ms {reused:7d} "
+              f"{recomputed:11d} {score:7.1%}  {'same' if same else 'DIFFERENT'}")
+        if edits:
+            print(f"{'':6}edits: {', '.join(edits)}")
+    later = rows[1:]
+    if later:
+        full_total = sum(r[1] for r in later)
+        incremental_total = sum(r[2] for r in later)
+        print(f"\nIterations 2-{len(rows)}: full {full_total * 1000:.1f} ms, incremental {incremental_total * 1000:.1f} ms"
+              + (f", speedup {full_total / incremental_total:.1f}x" if incremental_total > 0 else ""))
+    print(f"Mismatched results: {mismatches}")
+    print("="*70)
+
+    sys.exit(0 if mismatches == 0 else 1)
+
+
+if __name__ == "__main__":
+    main()
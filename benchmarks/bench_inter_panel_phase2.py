@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Benchmark: inter-panel Phase 2 delegations, sequential vs dependency-ordered pool.
+
+Runs run_delegations from inter_panel_dispatcher on a synthetic set of
+panels and chained delegations:
+  - A -> B, then B -> C (reads B after the first delegation merged into it)
+  - C -> A (writes A, which the first delegation read)
+  - D -> B (a second writer of B, after B was read by B -> C)
+  - independent E -> F, F -> G, H -> H delegations that can run in parallel
+  - "Bank Details" -> "Vendor" and "Bank" -> "Details Vendor", independent
+    delegations whose panel names sanitize to the same temp file name
+
+run_agent is replaced by a deterministic stand-in that sleeps a random
+--latency, then reads its input file and appends a rule derived from it.
+Any difference in what an agent saw therefore shows up in the merged
+output. The sequential run (max_workers=1) and the pooled run must
+produce identical panels and identical agent inputs on every repeat.
+
+Usage:
+    python benchmarks/bench_inter_panel_phase2.py
+    python benchmarks/bench_inter_panel_phase2.py --workers 8 --repeat 10 --latency 0.05
+"""
+
+import argparse
+import contextlib
+import copy
+import hashlib
+import io
+import json
+import random
+import re
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT / "dispatchers" / "agents"))
+
+import inter_panel_dispatcher
+from agent_runner import AgentRun
+
+PANELS = list("ABCDEFGH") + ["Bank Details", "Vendor", "Bank", "Details Vendor"]
+DELEGATIONS = [
+    ("A", "B", "derivation"),
+    ("B", "C", "derivation"),
+    ("C", "A", "clearing"),
+    ("E", "F", "edv"),
+    ("D", "B", "edv"),
+    ("F", "G", "derivation"),
+    ("H", "H", "clearing"),
+    ("B", "D", "derivation"),
+    ("Bank Details", "Vendor", "edv"),
+    ("Bank", "Details Vendor", "edv"),
+]
+
+
+def build_case() -> Tuple[Dict[str, List[Dict]], List[Dict]]:
+    """Panels with one source and one target field each, plus the delegations."""
+    panels = {}
+    for panel in PANELS:
+        panels[panel] = [
+            {"variableName": f"_{panel.lower()}_src_", "rules": [{"rule_name": f"Base {panel}"}]},
+            {"variableName": f"_{panel.lower()}_dst_", "rules": []},
+        ]
+    delegations = [
+        {
+            "type": delegation_type,
+            "source_panel": source,
+            "target_panel": target,
+            "source_field": f"_{source.lower()}_src_" if source != target else f"_{source.lower()}_dst_",
+            "target_field": f"_{target.lower()}_src_" if source != target else f"_{target.lower()}_dst_",
+            "logic": f"{source} to {target}",
+            "description": "",
+        }
+        for source, target, delegation_type in DELEGATIONS
+    ]
+    return panels, delegations
+
+
+class FakeAgent:
+    """run_agent stand-in: appends a rule fingerprinting the agent's input file."""
+
+    def __init__(self, latency: float, seed: int):
+        self.latency = latency
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.inputs: Dict[str, List[str]] = {}
+
+    def __call__(self, prompt, output_file, agent="", label="", estimated_tokens=0, **kwargs):
+        with self.lock:
+            delay = self.random.uniform(0, self.latency)
+        time.sleep(delay)  # Agent start-up: the input file is read only after it
+        input_path = re.search(r"^Fields: (.+)$", prompt, re.MULTILINE).group(1)
+        with open(input_path) as f:
+            raw = f.read()
+        with self.lock:
+            self.inputs.setdefault(label, []).append(raw)
+
+        fields = json.loads(raw)
+        target = fields[-1]
+        target["rules"] = target.get("rules", []) + [{
+            "rule_name": f"Delegated {label}",
+            "input_digest": hashlib.sha256(raw.encode()).hexdigest()[:16],
+            "source_rule_count": len(fields[0].get("rules", [])) if len(fields) > 1 else 0,
+        }]
+        with open(output_file, "w") as f:
+            json.dump(fields, f)
+        return AgentRun(returncode=0, output_valid=True, elapsed_seconds=delay)
+
+
+def run_phase2(workers: int, latency: float, seed: int) -> Tuple[Dict, Dict, float, List[int]]:
+    """Panels after Phase 2, the agent inputs per delegation label, the wall time and failed delegations."""
+    panels, delegations = build_case()
+    agent = FakeAgent(latency, seed)
+    inter_panel_dispatcher.run_agent = agent
+    with tempfile.TemporaryDirectory() as tmp, contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        outcomes = inter_panel_dispatcher.run_delegations(
+            delegations, panels, copy.deepcopy(panels), Path(tmp), max_workers=workers
+        )
+        elapsed = time.perf_counter() - start
+    failed = [i + 1 for i, ok in enumerate(outcomes) if not ok]
+    return panels, agent.inputs, elapsed, failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark sequential vs pooled inter-panel Phase 2")
+    parser.add_argument("--workers", type=int, default=4, help="Pool size for the pooled run (default: 4)")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs with different agent timings (default: 5)")
+    parser.add_argument("--latency", type=float, default=0.02, help="Max simulated agent latency in s (default: 0.02)")
+    args = parser.parse_args()
+
+    mismatches = 0
+    sequential_times, pooled_times = [], []
+    for seed in range(args.repeat):
+        sequential, sequential_inputs, sequential_time, sequential_failed = run_phase2(1, args.latency, seed)
+        pooled, pooled_inputs, pooled_time, pooled_failed = run_phase2(args.workers, args.latency, seed)
+        sequential_times.append(sequential_time)
+        pooled_times.append(pooled_time)
+        if sequential_failed or pooled_failed:
+            mismatches += 1
+            print(f"  seed {seed}: delegations failed (sequential: {sequential_failed}, pooled: {pooled_failed})")
+        elif json.dumps(sequential, sort_keys=True) != json.dumps(pooled, sort_keys=True):
+            mismatches += 1
+            print(f"  seed {seed}: merged panels differ")
+        elif sequential_inputs != pooled_inputs:
+            mismatches += 1
+            print(f"  seed {seed}: agent inputs differ")
+
+    dependencies = inter_panel_dispatcher.delegation_dependencies(build_case()[1])
+    print("\n" + "="*70)
+    print("INTER-PANEL PHASE 2 BENCHMARK")
+    print("="*70)
+    print(f"{len(DELEGATIONS)} delegations over {len(PANELS)} panels, {args.repeat} runs")
+    for i, (source, target, _) in enumerate(DELEGATIONS):
+        waits = ", ".join(str(j + 1) for j in dependencies[i]) or "-"
+        print(f"  {i + 1}. {source} -> {target}  waits for: {waits}")
+    print(f"Sequential best: {min(sequential_times) * 1000:7.1f} ms")
+    print(f"Pooled best:     {min(pooled_times) * 1000:7.1f} ms ({args.workers} workers)")
+    print(f"Runs with differences: {mismatches}")
+    print("="*70)
+
+    sys.exit(0 if mismatches == 0 else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Benchmark: logic-text regexes in rule_extraction_agent/patterns.py on adversarial input.
+
+Every pattern in the bank is run (finditer over the whole text) against a set
+of 10 KB adversarial logic strings: repeated "if ", "if the field " with no
+closing quote, "is ... then" chains, long letter-only runs, and so on. Each
+run must finish within --bound seconds or the script exits non-zero.
+
+The patterns that were rewritten for linear-time matching are also run in
+their previous form (reproduced below) for comparison. A legacy run that
+exceeds --legacy-timeout is stopped and reported as a timeout.
+
+Finally, rewritten and legacy patterns must produce the same matches on every
+"logic" text in documents/json_output plus a few built-in conditional
+sentences.
+
+Usage:
+    python benchmarks/bench_logic_patterns.py
+    python benchmarks/bench_logic_patterns.py --size 20000 --bound 0.5 --legacy-timeout 5
+"""
+
+import argparse
+import json
+import multiprocessing
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from rule_extraction_agent import patterns
+
+
+# Previous form of each rewritten pattern: name -> (legacy regex, current compiled pattern)
+LEGACY_PATTERNS = {
+    "BUD_FIELD_CONDITION": (
+        r"(?:if|when)\s+.*?field.*?['\"](.+?)['\"].*?(?:is|=|equals?|value\s+is)\s+['\"]?(\w+)['\"]?\s+then\s+(.*?)(?:\.|$)",
+        patterns.BUD_FIELD_CONDITION,
+    ),
+    "BUD_QUOTED_CONDITION": (
+        r"(?:if|when)\s+['\"](.+?)['\"].*?(?:is|=|equals?|value\s+is)\s+['\"]?(\w+)['\"]?\s+then\s+(.*?)(?:\.|$)",
+        patterns.BUD_QUOTED_CONDITION,
+    ),
+    "BUD_UNQUALIFIED_CONDITION": (
+        r"(?:if|when)\s+['\"]?(yes|no)['\"]?\s*[,;]?\s+then\s+(.*?)(?:\.|,|$)",
+        patterns.BUD_UNQUALIFIED_CONDITION,
+    ),
+    "CONDITION_PATTERNS[based on]": (
+        r"based\s+on\s+(?:the\s+)?['\"]?([^'\"]+?)['\"]?\s+selection",
+        patterns.CONDITION_PATTERNS[3],
+    ),
+    "FIELD_REFERENCE_PATTERNS[the X field]": (
+        r"the\s+([A-Z][a-zA-Z\s]+)\s+field",
+        patterns.FIELD_REFERENCE_PATTERNS[1],
+    ),
+    "VISIBILITY_VISIBLE_VALUE": (
+        r"(?:values?\s+is|is)\s+([^,]+?)\s+then\s+visible",
+        patterns.VISIBILITY_VISIBLE_VALUE,
+    ),
+    "CONDITIONAL_VALUE_PATTERNS[is X then]": (
+        r"(?:value[s]?\s+is|is)\s+['\"]?([^'\"]+?)['\"]?\s+then",
+        patterns.CONDITIONAL_VALUE_PATTERNS[0],
+    ),
+}
+
+# Repeated units for the adversarial inputs
+ADVERSARIAL_UNITS = {
+    "if": "if ",
+    "if-field-unquoted": "if the field ",
+    "if-field-quoted": "if field 'a' ",
+    "if-field-quoted-is": "if field 'a' is ",
+    "if-quote-open": "if 'x ",
+    "when-field": "when field ",
+    "is": "is ",
+    "is-then": "is x then ",
+    "based-on": "based on ",
+    "the-letters": "the Abc ",
+    "field-letters": "field Abc ",
+    "quotes": "'a' ",
+    "select": "select ",
+    "equals": "equals to ",
+    "otherwise": "if otherwise ",
+    "data-from": "data will come from ",
+}
+
+SAMPLE_SENTENCES = [
+    "If the field 'Vendor Type' values is Domestic then visible and mandatory otherwise invisible.",
+    'if field "GST Applicable" is yes then mandatory. otherwise non-mandatory',
+    "If the field 'Country' is India then visible, if the field 'Country' is Other then invisible",
+    "If 'Account Group' is ZDOM then visible and mandatory.",
+    "If Yes then visible and mandatory, else hidden.",
+    "If 'No', then invisible.",
+    "based on the 'Vendor Type' selection the panel is shown",
+    "Make visible when the Bank Details field is selected",
+]
+
+
+def bank_patterns() -> List[Tuple[str, "re.Pattern"]]:
+    """Every compiled pattern in the bank, with a display name."""
+    found = []
+    for name, value in vars(patterns).items():
+        if not name.isupper():
+            continue
+        if isinstance(value, re.Pattern):
+            found.append((name, value))
+        elif isinstance(value, (list, tuple)):
+            for i, item in enumerate(value):
+                pattern = item[0] if isinstance(item, tuple) else item
+                if isinstance(pattern, re.Pattern):
+                    found.append((f"{name}[{i}]", pattern))
+    return found
+
+
+def adversarial_inputs(size: int) -> Dict[str, str]:
+    return {name: (unit * (size // len(unit) + 1))[:size] for name, unit in ADVERSARIAL_UNITS.items()}
+
+
+def logic_corpus() -> List[str]:
+    """Every "logic" string in documents/json_output, plus the sample sentences."""
+    texts = []
+
+    def walk(node):
+        if isinstance(node, dict):
+            for key, value in node.items():
+                if key == 'logic' and isinstance(value, str) and value.strip():
+                    texts.append(value)
+                else:
+                    walk(value)
+        elif isinstance(node, list):
+            for value in node:
+                walk(value)
+
+    for path in sorted((PROJECT_ROOT / "documents" / "json_output").glob("*.json")):
+        try:
+            with open(path, 'r') as f:
+                walk(json.load(f))
+        except (OSError, ValueError):
+            continue
+    return texts + SAMPLE_SENTENCES
+
+
+def scan_time(pattern, text: str) -> float:
+    start = time.perf_counter()
+    for _ in pattern.finditer(text):
+        pass
+    return time.perf_counter() - start
+
+
+def _legacy_scan(regex: str, text: str, result):
+    result.value = scan_time(re.compile(regex, re.IGNORECASE), text)
+
+
+def legacy_scan_time(regex: str, text: str, timeout: float):
+    """Scan time of a legacy regex in a child process, or None if it timed out."""
+    result = multiprocessing.Value('d', -1.0)
+    proc = multiprocessing.Process(target=_legacy_scan, args=(regex, text, result))
+    proc.start()
+    proc.join(timeout)
+    if proc.is_alive():
+        proc.terminate()
+        proc.join()
+        return None
+    return result.value
+
+
+def match_signature(pattern, text: str) -> list:
+    return [(m.span(), m.groups()) for m in pattern.finditer(text)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark logic-text regexes on adversarial input")
+    parser.add_argument("--size", type=int, default=10_000, help="Adversarial input length in characters (default: 10000)")
+    parser.add_argument("--bound", type=float, default=0.25,
+                        help="Max seconds for one pattern scan of one input (default: 0.25)")
+    parser.add_argument("--legacy-timeout", type=float, default=10.0,
+                        help="Seconds before a legacy scan is stopped (default: 10)")
+    args = parser.parse_args()
+
+    inputs = adversarial_inputs(args.size)
+    bank = bank_patterns()
+
+    # 1. Bank patterns within the time bound
+    worst = []
+    for input_name, text in inputs.items():
+        for pattern_name, pattern in bank:
+            worst.append((scan_time(pattern, text), pattern_name, input_name))
+    worst.sort(reverse=True)
+    over_bound = [w for w in worst if w[0] > args.bound]
+
+    # 2. Rewritten vs legacy worst case
+    comparison = []
+    for name, (legacy_regex, current) in LEGACY_PATTERNS.items():
+        legacy_worst, legacy_input, timed_out = 0.0, "", False
+        for input_name, text in inputs.items():
+            elapsed = legacy_scan_time(legacy_regex, text, args.legacy_timeout)
+            if elapsed is None:
+                legacy_worst, legacy_input, timed_out = args.legacy_timeout, input_name, True
+                break
+            if elapsed > legacy_worst:
+                legacy_worst, legacy_input = elapsed, input_name
+        current_worst = max(scan_time(current, text) for text in inputs.values())
+        comparison.append((name, legacy_worst, legacy_input, timed_out, current_worst))
+
+    # 3. Same matches on real logic text
+    corpus = logic_corpus()
+    mismatches = []
+    for name, (legacy_regex, current) in LEGACY_PATTERNS.items():
+        legacy = re.compile(legacy_regex, re.IGNORECASE)
+        for text in corpus:
+            for variant in (text, text.lower()):
+                if match_signature(legacy, variant) != match_signature(current, variant):
+                    mismatches.append((name, variant))
+
+    print(f"Adversarial inputs: {len(inputs)} x {args.size} chars, bank patterns: {len(bank)}, "
+          f"corpus texts: {len(corpus)}")
+    print("\n" + "="*70)
+    print("LOGIC PATTERN BENCHMARK")
+    print("="*70)
+    print("Slowest bank scans:")
+    for elapsed, pattern_name, input_name in worst[:5]:
+        print(f"  {elapsed * 1000:9.2f} ms  {pattern_name}  ({input_name})")
+    print(f"Scans over {args.bound:.2f}s bound: {len(over_bound)}")
+    print("\nRewritten patterns, worst adversarial scan:")
+    print(f"  {'pattern':<40} {'legacy':>12} {'bank':>10}")
+    for name, legacy_worst, legacy_input, timed_out, current_worst in comparison:
+        legacy_text = f">{legacy_worst:.0f} s" if timed_out else f"{legacy_worst * 1000:.1f} ms"
+        print(f"  {name:<40} {legacy_text:>12} {current_worst * 1000:7.1f} ms  ({legacy_input})")
+    print(f"\nCorpus mismatches (legacy vs bank): {len(mismatches)}")
+    for name, text in mismatches[:5]:
+        print(f"  {name}: {text[:100]!r}")
+    print("="*70)
+
+    sys.exit(0 if not over_bound and not mismatches else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Benchmark: RuleComparator rule pairing, greedy vs optimal assignment.
+
+For every field pair matched by FieldComparator (no LLM), the rules of the
+two fields are paired in two ways:
+  - greedy:     the previous compare_field_rules loop, find_matching_rule for
+                each generated rule in order (reproduced below)
+  - assignment: match_rules_by_assignment, action-type buckets and the
+                Hungarian method
+
+Reported per BUD pair: time (new RuleComparator per repetition, so its
+caches start empty), rules paired, full matches (is_match) and total
+rule_match_score. Order sensitivity is measured by shuffling each field's
+generated rules --shuffles times and counting fields whose pairing changes.
+Assignment must never pair fewer rules or find fewer full matches than
+greedy, and no field's pairing may change under shuffling.
+
+Usage:
+    python benchmarks/bench_rule_assignment.py
+    python benchmarks/bench_rule_assignment.py --pair gen.json ref.json --repeat 5 --shuffles 10
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from eval.evaluator import FormFillEvaluator
+from eval.field_comparator import FieldComparator
+from eval.rule_comparator import RuleComparator, rule_match_score
+
+JSON_DIR = PROJECT_ROOT / "documents" / "json_output"
+DEFAULT_PAIRS = [
+    (JSON_DIR / "vendor_creation_generated.json", JSON_DIR / "vendor_creation.json"),
+    (JSON_DIR / "vendor_creation_with_execute_rules.json", JSON_DIR / "vendor_creation.json"),
+    (JSON_DIR / "vendor_creation_sample_bud.json", JSON_DIR / "vendor_creation.json"),
+    (JSON_DIR / "3334-schema.json", JSON_DIR / "3526-schema.json"),
+]
+
+Pairing = Dict[int, Tuple[Dict[str, Any], Any]]
+
+
+def greedy_pairing(comparator: RuleComparator, gen_rules: List[Dict], ref_rules: List[Dict],
+                   field_name: str) -> Pairing:
+    """The previous compare_field_rules matching loop."""
+    matched_ref_ids = set()
+    pairing = {}
+    for gen_index, gen_rule in enumerate(gen_rules):
+        ref_rule, eval_result = comparator.find_matching_rule(gen_rule, ref_rules, field_name, matched_ref_ids)
+        if ref_rule and eval_result:
+            matched_ref_ids.add(ref_rule.get("id"))
+            pairing[gen_index] = (ref_rule, eval_result)
+    return pairing
+
+
+def assignment_pairing(comparator: RuleComparator, gen_rules: List[Dict], ref_rules: List[Dict],
+                       field_name: str) -> Pairing:
+    return comparator.match_rules_by_assignment(gen_rules, ref_rules, field_name)
+
+
+def totals(pairings: List[Pairing]) -> Tuple[int, int, int]:
+    """(rules paired, full matches, total score)."""
+    evals = [eval_result for pairing in pairings for _, eval_result in pairing.values()]
+    return len(evals), sum(e.is_match for e in evals), sum(rule_match_score(e) for e in evals)
+
+
+def id_pairs(gen_rules: List[Dict], pairing: Pairing) -> frozenset:
+    return frozenset((gen_rules[i].get("id"), ref_rule.get("id")) for i, (ref_rule, _) in pairing.items())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark greedy vs optimal-assignment rule pairing")
+    parser.add_argument("--pair", nargs=2, action="append", metavar=("GENERATED", "REFERENCE"),
+                        help="Generated and reference API JSON (repeatable, default: vendor_creation pairs)")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing repetitions, best is reported (default: 5)")
+    parser.add_argument("--shuffles", type=int, default=5, help="Shuffled rule orders per field (default: 5)")
+    args = parser.parse_args()
+
+    evaluator = FormFillEvaluator(use_llm=False)
+    field_comparator = FieldComparator(use_llm=False)
+    rng = random.Random(0)
+    failures = []
+
+    print("\n" + "="*70)
+    print("RULE ASSIGNMENT BENCHMARK")
+    print("="*70)
+    for generated_path, reference_path in args.pair or DEFAULT_PAIRS:
+        generated = evaluator.extract_form_fill_metadatas(evaluator.load_json(str(generated_path)))
+        reference = evaluator.extract_form_fill_metadatas(evaluator.load_json(str(reference_path)))
+        field_result = field_comparator.compare_all_fields(generated, reference)
+
+        def new_comparator():
+            return RuleComparator(generated, reference, field_result["field_id_mapping"], field_comparator)
+
+        fields = [
+            (gen_field.get("formFillRules", []), ref_field.get("formFillRules", []),
+             gen_field.get("formTag", {}).get("name", "Unknown"))
+            for gen_field, ref_field, _ in field_result["matched_pairs"]
+        ]
+
+        results = {}
+        for label, pair_rules in (("greedy", greedy_pairing), ("assignment", assignment_pairing)):
+            best = float('inf')
+            pairings = []
+            for _ in range(args.repeat):
+                comparator = new_comparator()
+                start = time.perf_counter()
+                pairings = [pair_rules(comparator, gen_rules, ref_rules, name) for gen_rules, ref_rules, name in fields]
+                best = min(best, time.perf_counter() - start)
+
+            # Order sensitivity: shuffled generated rules
+            changed_fields = 0
+            match_count_changes = 0
+            for (gen_rules, ref_rules, name), pairing in zip(fields, pairings):
+                baseline = id_pairs(gen_rules, pairing)
+                baseline_matches = sum(e.is_match for _, e in pairing.values())
+                changed = False
+                for _ in range(args.shuffles if len(gen_rules) > 1 else 0):
+                    shuffled = list(gen_rules)
+                    rng.shuffle(shuffled)
+                    shuffled_pairing = pair_rules(comparator, shuffled, ref_rules, name)
+                    changed |= id_pairs(shuffled, shuffled_pairing) != baseline
+                    if sum(e.is_match for _, e in shuffled_pairing.values()) != baseline_matches:
+                        match_count_changes += 1
+                changed_fields += changed
+            results[label] = (best, totals(pairings), changed_fields, match_count_changes)
+
+        rule_count = sum(len(gen_rules) for gen_rules, _, _ in fields)
+        print(f"{Path(generated_path).name} vs {Path(reference_path).name}: "
+              f"{len(fields)} matched fields, {rule_count} generated rules")
+        print(f"  {'':<12} {'time':>10} {'paired':>8} {'matches':>8} {'score':>8} "
+              f"{'order-sensitive fields':>24}")
+        for label, (elapsed, (paired, matches, score), changed_fields, match_count_changes) in results.items():
+            print(f"  {label:<12} {elapsed * 1000:7.1f} ms {paired:8d} {matches:8d} {score:8d} "
+                  f"{changed_fields:11d} ({match_count_changes} match-count changes)")
+
+        greedy, assignment = results["greedy"][1], results["assignment"][1]
+        if assignment[0] < greedy[0] or assignment[1] < greedy[1] or results["assignment"][2]:
+            failures.append(Path(generated_path).name)
+        print()
+    print(f"Assignment worse than greedy or order-dependent: {len(failures)}")
+    print("="*70)
+
+    sys.exit(0 if not failures else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Benchmark: RuleExtractionAgent.process with serial vs pooled per-field rule generation.
+
+Loads the largest API schema in documents/json_output (by field count, unless
+--schema is given). Without --intra-panel, it builds deterministic intra-panel
+references for it: each field gets the "logic" texts found in
+documents/json_output plus visibility, validation and value_derivation refs
+to other fields. --scale N repeats the field list N times, with new IDs and
+names, to emulate a larger form.
+
+process() runs once with workers=1 and once per --workers value. The rules
+and populated schema must be identical for every worker count, rule IDs
+included.
+
+Usage:
+    python benchmarks/bench_rule_generation.py
+    python benchmarks/bench_rule_generation.py --scale 10 --workers 2 4 8
+"""
+
+import argparse
+import contextlib
+import copy
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from rule_extraction_agent.main import RuleExtractionAgent
+
+DEPENDENCY_TYPES = [
+    ("visibility_mandatory", "If yes then visible and mandatory"),
+    ("visibility", "if 'X' is No then visible"),
+    ("mandatory_control", "Visible and Mandatory if Is GST present is Yes"),
+    ("conditional_behavior", "Field is visible and mandatory when yes"),
+    ("validation", "validation check"),
+    ("value_derivation", "derived from source copy"),
+]
+
+
+def schema_fields(schema: Dict) -> Optional[List[dict]]:
+    try:
+        fields = schema['template']['documentTypes'][0]['formFillMetadatas']
+    except (KeyError, IndexError, TypeError):
+        return None
+    return fields if isinstance(fields, list) else None
+
+
+def largest_schema(directory: Path) -> Path:
+    sized = []
+    for path in sorted(directory.glob("*.json")):
+        with open(path, 'r') as f:
+            try:
+                fields = schema_fields(json.load(f))
+            except ValueError:
+                continue
+        if fields:
+            sized.append((len(fields), path))
+    if not sized:
+        raise SystemExit(f"No API schemas found in {directory}")
+    return max(sized, key=lambda item: item[0])[1]
+
+
+def scale_schema(schema: Dict, scale: int) -> Dict:
+    """Repeat the field list `scale` times with new IDs and suffixed names."""
+    if scale <= 1:
+        return schema
+    schema = copy.deepcopy(schema)
+    fields = schema_fields(schema)
+    max_id = max((f.get('id') or 0 for f in fields), default=0)
+    scaled = list(fields)
+    for copy_no in range(1, scale):
+        for field in fields:
+            clone = copy.deepcopy(field)
+            if clone.get('id') is not None:
+                clone['id'] += max_id * copy_no
+            form_tag = clone.get('formTag', {})
+            if form_tag.get('name'):
+                form_tag['name'] = f"{form_tag['name']} {copy_no}"
+            scaled.append(clone)
+    schema['template']['documentTypes'][0]['formFillMetadatas'] = scaled
+    return schema
+
+
+def logic_texts() -> List[str]:
+    texts = []
+
+    def walk(node):
+        if isinstance(node, dict):
+            for key, value in node.items():
+                if key == 'logic' and isinstance(value, str) and value.strip():
+                    texts.append(value)
+                else:
+                    walk(value)
+        elif isinstance(node, list):
+            for value in node:
+                walk(value)
+
+    for path in sorted((PROJECT_ROOT / "documents" / "json_output").glob("*.json")):
+        try:
+            with open(path, 'r') as f:
+                walk(json.load(f))
+        except (OSError, ValueError):
+            continue
+    return texts or ["Non-Editable"]
+
+
+def build_intra_panel(names: List[str]) -> Dict:
+    """Deterministic intra-panel references over the schema's field names."""
+    texts = logic_texts()
+    refs = []
+    for i, name in enumerate(names):
+        refs.append({
+            "dependency_type": "conditional_behavior",
+            "dependent_field": name,
+            "referenced_field": names[(i * 7 + 3) % len(names)],
+            "rule_description": texts[i % len(texts)],
+        })
+        dep_type, description = DEPENDENCY_TYPES[i % len(DEPENDENCY_TYPES)]
+        refs.append({
+            "dependency_type": dep_type,
+            "source_field": names[(i * 11 + 1) % len(names)],
+            "target_field": name,
+            "dependent_field": name,
+            "referenced_field": names[(i * 5 + 2) % len(names)],
+            "rule_description": description,
+        })
+    return {"panel_results": [{"intra_panel_references": refs}]}
+
+
+def run(schema_path: str, intra_panel_path: str, workers: int):
+    agent = RuleExtractionAgent(workers=workers)
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = agent.process(schema_path, intra_panel_path, None)
+    elapsed = time.perf_counter() - start
+    output = json.dumps({"rules": result["rules"], "schema": result["schema"]}, sort_keys=True, default=str)
+    return elapsed, output, len(result["rules"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark serial vs pooled per-field rule generation")
+    parser.add_argument("--schema", help="API schema JSON (default: largest schema in documents/json_output)")
+    parser.add_argument("--intra-panel", help="Intra-panel references JSON (default: generated)")
+    parser.add_argument("--scale", type=int, default=1, help="Repeat the schema's fields N times (default: 1)")
+    parser.add_argument("--workers", type=int, nargs="+",
+                        default=[max(2, os.cpu_count() or 1)], help="Pool sizes to compare against serial")
+    parser.add_argument("--repeat", type=int, default=3, help="Timing repetitions, best is reported (default: 3)")
+    args = parser.parse_args()
+
+    schema_path = Path(args.schema) if args.schema else largest_schema(PROJECT_ROOT / "documents" / "json_output")
+    with open(schema_path, 'r') as f:
+        schema = scale_schema(json.load(f), args.scale)
+    fields = schema_fields(schema)
+    if not fields:
+        raise SystemExit(f"Not an API schema: {schema_path}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        scaled_schema_path = os.path.join(tmp, "schema.json")
+        with open(scaled_schema_path, 'w') as f:
+            json.dump(schema, f)
+
+        intra_panel_path = args.intra_panel
+        if not intra_panel_path:
+            names = [f.get('formTag', {}).get('name') for f in fields]
+            intra_panel_path = os.path.join(tmp, "intra_panel.json")
+            with open(intra_panel_path, 'w') as f:
+                json.dump(build_intra_panel([n for n in names if n]), f)
+
+        def best_of(workers):
+            best, output, rule_count = float('inf'), None, 0
+            for _ in range(args.repeat):
+                elapsed, output, rule_count = run(scaled_schema_path, intra_panel_path, workers)
+                best = min(best, elapsed)
+            return best, output, rule_count
+
+        serial_time, serial_output, rule_count = best_of(1)
+        pooled = [(workers, *best_of(workers)[:2]) for workers in args.workers]
+
+    mismatches = [workers for workers, _, output in pooled if output != serial_output]
+
+    print(f"Schema: {schema_path} (x{args.scale}), fields: {len(fields)}, rules: {rule_count}, "
+          f"CPUs: {os.cpu_count()}")
+    print("\n" + "="*70)
+    print("RULE GENERATION BENCHMARK")
+    print("="*70)
+    print(f"Serial (workers=1):  {serial_time * 1000:9.1f} ms")
+    for workers, elapsed, _ in pooled:
+        print(f"Pool (workers={workers}):{'':<{max(0, 3 - len(str(workers)))}} {elapsed * 1000:9.1f} ms  "
+              f"speedup {serial_time / elapsed:5.2f}x")
+    print(f"Mismatched outputs:  {len(mismatches)}" + (f" (workers={mismatches})" if mismatches else ""))
+    print("="*70)
+
+    sys.exit(0 if not mismatches else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Benchmark: copy-on-write inject_rules_into_schema vs a full deep copy.
+
+For every API schema in documents/json_output (files with
+template.documentTypes[0].formFillMetadatas), builds EDV rules input from
+the schema's own formFillRules and injects them back into a rule-free copy.
+The two variants are:
+  - deepcopy: copy.deepcopy(schema) and then inject, which is the cost of the
+              previous implementation (it deep-copied the whole template first)
+  - cow:      inject_rules_into_schema as is; only touched metadata entries are copied
+
+Reports best-of-N wall time and tracemalloc peak memory for each schema. It
+checks that both variants produce the same document and that the input
+schema is left unmodified.
+
+Usage:
+    python benchmarks/bench_schema_injection.py
+    python benchmarks/bench_schema_injection.py --dir documents/json_output --repeat 5
+"""
+
+import argparse
+import contextlib
+import copy
+import io
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "dispatchers" / "agents"))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from convert_to_api_format import inject_rules_into_schema
+from bench_variable_resolution import build_edv_data_from_schema, strip_rules
+
+
+def is_api_schema(data) -> bool:
+    try:
+        return isinstance(data['template']['documentTypes'][0]['formFillMetadatas'], list)
+    except (KeyError, IndexError, TypeError):
+        return False
+
+
+def measure(fn, repeat: int):
+    """Best wall time over `repeat` runs and the tracemalloc peak of one run."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            fn()
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark schema rule injection (copy-on-write vs deepcopy)")
+    parser.add_argument("--dir", default=str(PROJECT_ROOT / "documents" / "json_output"),
+                        help="Directory of API schema JSON files (default: documents/json_output)")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing repetitions, best is reported (default: 5)")
+    args = parser.parse_args()
+
+    rows = []
+    mismatches = []
+    for path in sorted(Path(args.dir).glob("*.json")):
+        with open(path, 'r') as f:
+            data = json.load(f)
+        if not is_api_schema(data):
+            continue
+
+        edv_data = build_edv_data_from_schema(data)
+        schema = strip_rules(data)
+        before = json.dumps(schema, sort_keys=True)
+
+        dc_time, dc_peak, (dc_result, _) = measure(
+            lambda: inject_rules_into_schema(copy.deepcopy(schema), edv_data), args.repeat)
+        cow_time, cow_peak, (cow_result, stats) = measure(
+            lambda: inject_rules_into_schema(schema, edv_data), args.repeat)
+
+        if json.dumps(dc_result, sort_keys=True) != json.dumps(cow_result, sort_keys=True):
+            mismatches.append(f"{path.name}: outputs differ")
+        if json.dumps(schema, sort_keys=True) != before:
+            mismatches.append(f"{path.name}: input schema was modified")
+
+        rows.append((path.name, path.stat().st_size, stats['total_schema_fields'], stats['total_rules_injected'],
+                     dc_time, cow_time, dc_peak, cow_peak))
+
+    print("\n" + "="*108)
+    print("SCHEMA INJECTION BENCHMARK (best of {} runs, tracemalloc peak)".format(args.repeat))
+    print("="*108)
+    print(f"{'Schema':<42} {'KB':>6} {'Fields':>6} {'Rules':>6} "
+          f"{'deepcopy ms':>11} {'cow ms':>8} {'deepcopy MB':>11} {'cow MB':>8}")
+    print("-"*108)
+    for name, size, fields, rules, dc_time, cow_time, dc_peak, cow_peak in rows:
+        print(f"{name:<42} {size // 1024:>6} {fields:>6} {rules:>6} "
+              f"{dc_time * 1000:>11.2f} {cow_time * 1000:>8.2f} "
+              f"{dc_peak / 2**20:>11.2f} {cow_peak / 2**20:>8.2f}")
+    if rows:
+        print("-"*108)
+        total_dc = sum(r[4] for r in rows)
+        total_cow = sum(r[5] for r in rows)
+        print(f"{'TOTAL':<42} {'':>6} {'':>6} {'':>6} {total_dc * 1000:>11.2f} {total_cow * 1000:>8.2f}")
+    print("="*108)
+
+    for problem in mismatches:
+        print(f"MISMATCH: {problem}")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Benchmark: running generated stage code in a fresh interpreter vs the stage worker.
+
+A small stage-like script (argparse, loads keyword_tree.json and
+Rule-Schemas.json through the shared modules, writes a JSON output) is run
+the way execute_generated_code runs generated code:
+  - subprocess: `python3 script.py ...` per run (the previous behaviour)
+  - worker:     StageCodeWorker.run(), a fork of the preloaded worker per run
+
+The worker's one-time startup is reported separately. Both paths must exit
+with 0 and write identical outputs.
+
+Usage:
+    python benchmarks/bench_stage_worker.py
+    python benchmarks/bench_stage_worker.py --runs 20 --script generated_code/stage_1_v1.py -- --schema s.json
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "orchestrators"))
+
+from stage_code_worker import StageCodeWorker
+
+STAGE_SCRIPT = '''
+import argparse
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path.cwd()))
+from common import json_io
+from common.rule_schema_registry import RuleSchemaRegistry
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--output", required=True)
+parser.add_argument("--keyword-tree", required=True)
+args = parser.parse_args()
+
+tree = json_io.load(args.keyword_tree)
+registry = RuleSchemaRegistry.load()
+json_io.dump({"keyword_tree_keys": len(tree), "rule_schemas": len(registry)}, args.output)
+'''
+
+
+def run_subprocess(script: str, args: List[str]) -> subprocess.CompletedProcess:
+    return subprocess.run(["python3", script] + args, capture_output=True, text=True,
+                          timeout=600, cwd=str(PROJECT_ROOT))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark fresh interpreter vs stage worker")
+    parser.add_argument("--runs", type=int, default=10, help="Runs per path (default: 10)")
+    parser.add_argument("--script", help="Stage script to run instead of the built-in one (args after --)")
+    parser.add_argument("script_args", nargs="*", help="Arguments for --script")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.script:
+            script, script_args = args.script, args.script_args
+            outputs = None
+        else:
+            script = os.path.join(tmp, "stage_bench.py")
+            with open(script, "w") as f:
+                f.write(STAGE_SCRIPT)
+            outputs = {name: os.path.join(tmp, f"{name}.json") for name in ("subprocess", "worker")}
+            script_args = ["--keyword-tree", "rule_extractor/static/keyword_tree.json"]
+
+        def path_args(name):
+            return script_args + (["--output", outputs[name]] if outputs else [])
+
+        failures = 0
+        last_error = ""
+        subprocess_times = []
+        for _ in range(args.runs):
+            start = time.perf_counter()
+            result = run_subprocess(script, path_args("subprocess"))
+            subprocess_times.append(time.perf_counter() - start)
+            if result.returncode != 0:
+                failures += 1
+                last_error = result.stderr
+
+        worker = StageCodeWorker()
+        start = time.perf_counter()
+        worker.run(script, path_args("worker"), cwd=str(PROJECT_ROOT))
+        first_run = time.perf_counter() - start
+        worker_times = []
+        for _ in range(args.runs):
+            start = time.perf_counter()
+            result = worker.run(script, path_args("worker"), cwd=str(PROJECT_ROOT))
+            worker_times.append(time.perf_counter() - start)
+            if result.returncode != 0:
+                failures += 1
+                last_error = result.stderr
+        preloaded = worker.preloaded
+        worker.stop()
+
+        mismatch = False
+        if outputs and not failures:
+            with open(outputs["subprocess"]) as a, open(outputs["worker"]) as b:
+                mismatch = json.load(a) != json.load(b)
+
+    print("\n" + "="*70)
+    print("STAGE WORKER BENCHMARK")
+    print("="*70)
+    print(f"Script: {args.script or 'built-in stage script'}, {args.runs} runs per path")
+    print(f"Preloaded: {', '.join(preloaded)}")
+    print(f"  {'':<12} {'best':>10} {'median':>10} {'total':>10}")
+    for name, times in (("subprocess", subprocess_times), ("worker", worker_times)):
+        ordered = sorted(times)
+        print(f"  {name:<12} {ordered[0] * 1000:7.1f} ms {ordered[len(ordered) // 2] * 1000:7.1f} ms "
+              f"{sum(times):8.2f} s")
+    print(f"  Worker startup + first run: {first_run * 1000:.1f} ms")
+    print(f"Failed runs: {failures}" + ("  OUTPUT MISMATCH" if mismatch else ""))
+    if last_error:
+        print(f"Last error:\n{last_error.strip()[-1000:]}")
+    print("="*70)
+
+    sys.exit(0 if failures == 0 and not mismatch else 1)
+
+
+if __name__ == "__main__":
+    main()
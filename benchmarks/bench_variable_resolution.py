@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Benchmark: variable name -> field ID resolution in convert_to_api_format.
+
+Builds EDV-style rules input from an API schema's own formFillRules (IDs
+mapped back to variableNames). It then compares two implementations:
+  - legacy:   the previous per-call linear scan (_resolve_variable_to_id before
+              VariableIdResolver), reproduced below as the reference
+  - resolver: VariableIdResolver built once per conversion
+
+Both must return identical IDs for every source/destination. The script also
+times a full inject_rules_into_schema() run.
+
+Usage:
+    python benchmarks/bench_variable_resolution.py
+    python benchmarks/bench_variable_resolution.py --schema documents/json_output/3334-schema.json --repeat 5
+"""
+
+import argparse
+import contextlib
+import copy
+import io
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "dispatchers" / "agents"))
+
+from convert_to_api_format import (
+    VariableIdResolver,
+    _build_schema_panel_map,
+    build_id_map_from_schema,
+    inject_rules_into_schema,
+    sanitize_variable_name,
+)
+
+
+def legacy_resolve_variable_to_id(variable_name: str, current_panel: str, panel_field_map: Dict[str, Dict[str, int]],
+                                  metadatas: List[Dict], global_id_map: Dict[str, int], field_id: int,
+                                  edv_data: Dict = None) -> int:
+    """The pre-index implementation: linear scans on every call."""
+    if variable_name == "-1":
+        return -1
+
+    if current_panel in panel_field_map and edv_data and current_panel in edv_data:
+        target_field_name = None
+        for field in edv_data[current_panel]:
+            field_var = field.get('variableName', sanitize_variable_name(field.get('field_name', '')))
+            if field_var == variable_name:
+                target_field_name = field.get('field_name', '')
+                break
+
+        if target_field_name and target_field_name in panel_field_map[current_panel]:
+            meta_idx = panel_field_map[current_panel][target_field_name]
+            return metadatas[meta_idx]['id']
+
+    if current_panel in panel_field_map:
+        for field_name, meta_idx in panel_field_map[current_panel].items():
+            meta = metadatas[meta_idx]
+            meta_var_name = meta.get('variableName', '')
+            edv_var_name = sanitize_variable_name(field_name)
+            if meta_var_name == variable_name or edv_var_name == variable_name:
+                return meta['id']
+
+    if variable_name in global_id_map:
+        return global_id_map[variable_name]
+
+    return field_id
+
+
+def build_edv_data_from_schema(schema_data: Dict) -> Dict[str, List[Dict]]:
+    """Turn a schema's formFillRules back into EDV panel/field/rule input."""
+    metadatas = schema_data['template']['documentTypes'][0]['formFillMetadatas']
+    id_to_var = {m['id']: m.get('variableName') or sanitize_variable_name(m['formTag']['name']) for m in metadatas}
+
+    edv_data: Dict[str, List[Dict]] = {}
+    current_panel = None
+    for meta in metadatas:
+        ft = meta.get('formTag', {})
+        if ft.get('type') == 'PANEL':
+            current_panel = ft.get('name', '')
+            edv_data.setdefault(current_panel, [])
+            continue
+        if current_panel is None or not ft.get('name'):
+            continue
+
+        rules = []
+        for rule in meta.get('formFillRules', []):
+            rules.append({
+                'rule_name': rule.get('actionType', ''),
+                'source_fields': [id_to_var.get(i, '-1') for i in rule.get('sourceIds', [])],
+                'destination_fields': [id_to_var.get(i, '-1') for i in rule.get('destinationIds', [])],
+            })
+        edv_data[current_panel].append({
+            'field_name': ft['name'],
+            'type': ft.get('type', 'TEXT'),
+            'variableName': id_to_var[meta['id']],
+            'rules': rules,
+        })
+    return edv_data
+
+
+def strip_rules(schema_data: Dict) -> Dict:
+    stripped = copy.deepcopy(schema_data)
+    for meta in stripped['template']['documentTypes'][0]['formFillMetadatas']:
+        meta['formFillRules'] = []
+    return stripped
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark variable -> ID resolution")
+    parser.add_argument("--schema", default=str(PROJECT_ROOT / "documents" / "json_output" / "3334-schema.json"),
+                        help="API schema JSON with formFillRules (default: documents/json_output/3334-schema.json)")
+    parser.add_argument("--repeat", type=int, default=3, help="Timing repetitions, best is reported (default: 3)")
+    args = parser.parse_args()
+
+    with open(args.schema, 'r') as f:
+        schema_data = json.load(f)
+
+    edv_data = build_edv_data_from_schema(schema_data)
+    empty_schema = strip_rules(schema_data)
+    metadatas = empty_schema['template']['documentTypes'][0]['formFillMetadatas']
+    panel_field_map = _build_schema_panel_map(metadatas)
+    id_map = build_id_map_from_schema(empty_schema, edv_data)
+
+    # Every (variable, panel, field_id) lookup a conversion performs
+    lookups = []
+    for panel_name, fields in edv_data.items():
+        for field in fields:
+            for rule in field['rules']:
+                for var in rule['source_fields'] + rule['destination_fields']:
+                    lookups.append((var, panel_name, -999))
+
+    total_fields = sum(len(fields) for fields in edv_data.values())
+    print(f"Schema: {args.schema}")
+    print(f"Panels: {len(edv_data)}, fields: {total_fields}, lookups per conversion: {len(lookups)}")
+
+    def run_legacy():
+        return [legacy_resolve_variable_to_id(v, p, panel_field_map, metadatas, id_map, fid, edv_data)
+                for v, p, fid in lookups]
+
+    def run_resolver():
+        resolver = VariableIdResolver(panel_field_map, metadatas, id_map, edv_data)
+        return [resolver.resolve(v, p, fid) for v, p, fid in lookups]
+
+    def best_of(fn):
+        best = float('inf')
+        result = None
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                result = fn()
+            best = min(best, time.perf_counter() - start)
+        return best, result
+
+    legacy_time, legacy_ids = best_of(run_legacy)
+    resolver_time, resolver_ids = best_of(run_resolver)
+    mismatches = sum(1 for a, b in zip(legacy_ids, resolver_ids) if a != b)
+
+    inject_time, (api_data, stats) = best_of(lambda: inject_rules_into_schema(empty_schema, edv_data))
+
+    print("\n" + "="*70)
+    print("VARIABLE RESOLUTION BENCHMARK")
+    print("="*70)
+    print(f"Legacy linear scan:   {legacy_time * 1000:9.2f} ms  ({legacy_time / max(len(lookups), 1) * 1e6:.2f} us/lookup)")
+    print(f"VariableIdResolver:   {resolver_time * 1000:9.2f} ms  ({resolver_time / max(len(lookups), 1) * 1e6:.2f} us/lookup)")
+    if resolver_time > 0:
+        print(f"Speedup:              {legacy_time / resolver_time:9.1f}x")
+    print(f"Mismatched IDs:       {mismatches}")
+    print(f"inject_rules_into_schema: {inject_time * 1000:.2f} ms ({stats['total_rules_injected']} rules injected)")
+    print("="*70)
+
+    sys.exit(0 if mismatches == 0 else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,7 @@
+"""
+Shared utilities used across the pipeline (dispatchers, eval, rule_extraction_agent).
+
+Modules:
+- json_io.py: JSON load/dump with an optional orjson backend and streaming writer
+- rule_schema_registry.py: Rule-Schemas.json indexes shared by all stages, cached as a precompiled artifact
+"""
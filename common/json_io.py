@@ -0,0 +1,207 @@
+"""
+Shared JSON I/O
+
+One place for reading and writing the pipeline's JSON files:
+
+- Fast backend: orjson when it is installed, the stdlib json module otherwise
+  (set JSON_IO_BACKEND=json to force the stdlib).
+- Compact by default: intermediate stage files are written without
+  indentation. Set PIPELINE_JSON_PRETTY=1 to indent them for debugging, or
+  pass pretty=True for files people or agents read (agent input files,
+  reports).
+- Streaming writer: dump_streaming() writes one large array (e.g.
+  formFillMetadatas) one element at a time, so a whole API document never
+  has to exist as a single serialized string.
+
+Both backends produce equivalent JSON. orjson writes non-ASCII characters
+as UTF-8 rather than \\u escapes, and pretty output is always 2-space
+indented.
+
+Usage:
+    from common import json_io
+
+    data = json_io.load(args.input)
+    json_io.dump(all_results, output_file)                     # compact
+    json_io.dump(panel_fields, fields_input_file, pretty=True)  # agent-readable
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import IO, Any, Callable, Iterable, Optional, Sequence, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+PathOrFile = Union[str, Path, IO]
+
+BACKEND = "orjson" if ORJSON_AVAILABLE and os.environ.get("JSON_IO_BACKEND", "").lower() != "json" else "json"
+
+# Location of the field list in API schema documents, for dump_streaming()
+FORM_FILL_METADATAS_PATH = ("template", "documentTypes", 0, "formFillMetadatas")
+
+_STREAM_PLACEHOLDER = "__json_io_stream_placeholder__"
+
+
+def pretty_default() -> bool:
+    """Whether dump() indents when pretty is not given (PIPELINE_JSON_PRETTY)."""
+    return os.environ.get("PIPELINE_JSON_PRETTY", "").lower() in ("1", "true", "yes")
+
+
+def loads(data: Union[str, bytes, bytearray]) -> Any:
+    """Parse a JSON document from a string or bytes."""
+    if BACKEND == "orjson":
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load(source: PathOrFile) -> Any:
+    """
+    Read a JSON file.
+
+    Args:
+        source: File path or an open file object (text or binary)
+
+    Returns:
+        The parsed document
+    """
+    if isinstance(source, (str, Path)):
+        with open(source, 'rb') as f:
+            return loads(f.read())
+    return loads(source.read())
+
+
+def _dumps_bytes(obj: Any, pretty: bool, sort_keys: bool, default: Optional[Callable]) -> bytes:
+    if BACKEND == "orjson":
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(obj, default=default, option=option)
+        except (orjson.JSONEncodeError, TypeError):
+            # e.g. integers beyond 64 bits - let the stdlib handle it
+            pass
+    return _stdlib_dumps(obj, pretty, sort_keys, default).encode('utf-8')
+
+
+def _stdlib_dumps(obj: Any, pretty: bool, sort_keys: bool, default: Optional[Callable]) -> str:
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False, sort_keys=sort_keys, default=default)
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False, sort_keys=sort_keys, default=default)
+
+
+def dumps(obj: Any, pretty: bool = False, sort_keys: bool = False,
+          default: Optional[Callable] = None) -> str:
+    """
+    Serialize obj to a JSON string.
+
+    Args:
+        obj: Object to serialize
+        pretty: Indent with 2 spaces (compact otherwise)
+        sort_keys: Sort object keys
+        default: Fallback serializer for unsupported types (e.g. str)
+
+    Returns:
+        JSON text
+    """
+    return _dumps_bytes(obj, pretty, sort_keys, default).decode('utf-8')
+
+
+def dump(obj: Any, target: PathOrFile, pretty: Optional[bool] = None, sort_keys: bool = False,
+         default: Optional[Callable] = None) -> None:
+    """
+    Write obj as JSON to a file.
+
+    Args:
+        obj: Object to serialize
+        target: File path or an open file object (text or binary)
+        pretty: Indent with 2 spaces; None uses pretty_default() (compact
+            unless PIPELINE_JSON_PRETTY is set)
+        sort_keys: Sort object keys
+        default: Fallback serializer for unsupported types
+    """
+    if pretty is None:
+        pretty = pretty_default()
+    data = _dumps_bytes(obj, pretty, sort_keys, default)
+
+    if isinstance(target, (str, Path)):
+        with open(target, 'wb') as f:
+            f.write(data)
+    elif 'b' in getattr(target, 'mode', 'b'):
+        target.write(data)
+    else:
+        target.write(data.decode('utf-8'))
+
+
+def dump_streaming(document: Any, target: Union[str, Path], array_path: Sequence[Union[str, int]],
+                   items: Optional[Iterable[Any]] = None, pretty: Optional[bool] = None) -> int:
+    """
+    Write a document whose largest array is serialized one element at a time.
+
+    The rest of the document is serialized normally. The array at array_path
+    is written element by element from `items` (defaults to the array already
+    in the document), so items may come from a generator. The output is the
+    same as dump(document_with_items, target, pretty).
+
+    Args:
+        document: Document skeleton (not modified)
+        target: Output file path
+        array_path: Keys/indexes leading to the array, e.g.
+            ("template", "documentTypes", 0, "formFillMetadatas")
+        items: Elements to write; defaults to the array at array_path
+        pretty: Indent with 2 spaces; None uses pretty_default()
+
+    Returns:
+        Number of array elements written
+    """
+    if pretty is None:
+        pretty = pretty_default()
+
+    # Copy only the containers along array_path and put a placeholder in the array's slot
+    skeleton = _shallow_copy(document)
+    parent = skeleton
+    for key in array_path[:-1]:
+        parent[key] = _shallow_copy(parent[key])
+        parent = parent[key]
+    if items is None:
+        items = parent[array_path[-1]]
+    parent[array_path[-1]] = _STREAM_PLACEHOLDER
+
+    text = dumps(skeleton, pretty=pretty)
+    marker = f'"{_STREAM_PLACEHOLDER}"'
+    split_at = text.index(marker)
+    prefix, suffix = text[:split_at], text[split_at + len(marker):]
+
+    # In pretty mode the elements are indented one level deeper than the line holding the key
+    indent = prefix[prefix.rfind('\n') + 1:]
+    indent = indent[:len(indent) - len(indent.lstrip(' '))]
+    item_indent = indent + "  "
+
+    count = 0
+    with open(target, 'w', encoding='utf-8') as f:
+        f.write(prefix)
+        f.write('[')
+        for item in items:
+            item_text = dumps(item, pretty=pretty)
+            if pretty:
+                f.write(',\n' if count else '\n')
+                f.write(item_indent + item_text.replace('\n', '\n' + item_indent))
+            else:
+                f.write(',' if count else '')
+                f.write(item_text)
+            count += 1
+        if pretty and count:
+            f.write('\n' + indent)
+        f.write(']')
+        f.write(suffix)
+    return count
+
+
+def _shallow_copy(container: Any) -> Any:
+    return list(container) if isinstance(container, list) else dict(container)
@@ -0,0 +1,214 @@
+"""
+Rule-Schemas.json Registry
+
+Rule-Schemas.json holds the platform's rule definitions (name, id, action,
+source, source/destination fields). Several stages need lookups into it. They
+all get them from one RuleSchemaRegistry instead of each parsing the file and
+building its own indexes:
+
+    by_name           rule name -> schema (last definition wins)
+    by_id             schema id -> schema
+    by_action         action type -> [schemas] in file order
+    by_source         source type -> schema
+    by_action_source  "ACTION:SOURCE" -> preferred schema (SERVER processing
+                      first, then more destination fields)
+    action_to_names   action type -> {rule names}
+
+RuleSchemaRegistry.load() returns one shared instance per file and process.
+The built registry is also saved as a precompiled artifact (a pickle keyed by
+the source file's path, size and mtime), so later stage processes skip the
+JSON parse and index build. A stale, unreadable or foreign-owned artifact is
+ignored and rebuilt.
+
+    RULE_SCHEMA_CACHE_DIR   Artifact directory (default: <tmp>/doc_parser_rule_schemas,
+                            set to "off" to disable the artifact)
+
+Usage:
+    from common.rule_schema_registry import RuleSchemaRegistry
+
+    registry = RuleSchemaRegistry.load()            # rules/Rule-Schemas.json
+    schema = registry.by_action_source.get("VERIFY:PAN_NUMBER")
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Union
+
+from common import json_io
+
+
+DEFAULT_RULE_SCHEMAS_PATH = Path(__file__).parent.parent / "rules" / "Rule-Schemas.json"
+
+# Bump when the registry's attributes change so old artifacts are rebuilt
+ARTIFACT_VERSION = 1
+
+_registries: Dict[str, "RuleSchemaRegistry"] = {}
+
+
+class RuleSchemaRegistry:
+    """
+    Indexed view of Rule-Schemas.json shared by every consumer in a process.
+
+    Attributes:
+        path: Source Rule-Schemas.json path
+        schemas: Rule schema entries in file order
+        by_name, by_id, by_action, by_source, by_action_source, action_to_names:
+            Lookup indexes (see module docstring). Treat them as read-only; they
+            are shared between consumers.
+    """
+
+    def __init__(self, schemas: List[Dict], path: Optional[Path] = None):
+        self.path = path
+        self.schemas = schemas
+        self._build_indexes()
+
+    @classmethod
+    def load(cls, path: Union[str, Path, None] = None) -> "RuleSchemaRegistry":
+        """
+        Get the registry for a Rule-Schemas.json file.
+
+        Args:
+            path: Rule-Schemas.json path (default: rules/Rule-Schemas.json
+                under the project root)
+
+        Returns:
+            The process-wide registry for that file, loaded from the
+            precompiled artifact when it is current
+        """
+        path = Path(path) if path else DEFAULT_RULE_SCHEMAS_PATH
+        key = str(path.resolve())
+        registry = _registries.get(key)
+        if registry is None:
+            registry = _load_artifact(path) or cls.from_file(path)
+            _registries[key] = registry
+        return registry
+
+    @classmethod
+    def from_file(cls, path: Union[str, Path]) -> "RuleSchemaRegistry":
+        """Parse Rule-Schemas.json, build the indexes and save the artifact."""
+        path = Path(path)
+        raw = json_io.load(path)
+
+        # Paginated format ({"content": [...]}) or a flat array
+        if isinstance(raw, dict):
+            schemas = raw.get('content', [])
+        elif isinstance(raw, list):
+            schemas = raw
+        else:
+            raise ValueError(f"Unexpected Rule-Schemas.json format in {path}")
+
+        registry = cls(schemas, path)
+        _save_artifact(registry)
+        return registry
+
+    def _build_indexes(self):
+        """Build every lookup index in one pass over the schemas."""
+        self.by_name: Dict[str, Dict] = {}
+        self.by_id: Dict[int, Dict] = {}
+        self.by_action: Dict[str, List[Dict]] = {}
+        self.by_source: Dict[str, Dict] = {}
+        self.by_action_source: Dict[str, Dict] = {}
+        self.action_to_names: Dict[str, Set[str]] = {}
+
+        for schema in self.schemas:
+            name = schema.get('name')
+            schema_id = schema.get('id')
+            action = schema.get('action')
+            source = schema.get('source')
+
+            if name:
+                self.by_name[name] = schema
+
+            if schema_id:
+                self.by_id[schema_id] = schema
+
+            if action:
+                self.by_action.setdefault(action, []).append(schema)
+                if name:
+                    self.action_to_names.setdefault(action, set()).add(name)
+
+            if source:
+                self.by_source[source] = schema
+
+            if action and source:
+                key = f"{action}:{source}"
+                existing = self.by_action_source.get(key)
+                if existing is None or _is_preferred(schema, existing):
+                    self.by_action_source[key] = schema
+
+    def __len__(self) -> int:
+        return len(self.schemas)
+
+
+def _is_preferred(new: Dict, existing: Dict) -> bool:
+    """Prefer SERVER over CLIENT processing, then more destination fields."""
+    existing_dest_count = existing.get('destinationFields', {}).get('numberOfItems', 0)
+    new_dest_count = new.get('destinationFields', {}).get('numberOfItems', 0)
+    existing_is_server = existing.get('processingType') == 'SERVER'
+    new_is_server = new.get('processingType') == 'SERVER'
+
+    return (new_is_server and not existing_is_server) or \
+        (new_dest_count > existing_dest_count and new_is_server == existing_is_server)
+
+
+# ── Precompiled artifact ────────────────────────────────────────────────────
+
+def _artifact_dir() -> Optional[Path]:
+    setting = os.environ.get("RULE_SCHEMA_CACHE_DIR", "")
+    if setting.lower() == "off":
+        return None
+    return Path(setting) if setting else Path(tempfile.gettempdir()) / "doc_parser_rule_schemas"
+
+
+def _artifact_path(source: Path) -> Optional[Path]:
+    cache_dir = _artifact_dir()
+    if cache_dir is None:
+        return None
+    digest = hashlib.sha256(str(source.resolve()).encode('utf-8')).hexdigest()[:16]
+    return cache_dir / f"{source.stem}-{digest}.pickle"
+
+
+def _source_stamp(source: Path) -> tuple:
+    st = source.stat()
+    return (ARTIFACT_VERSION, str(source.resolve()), st.st_size, st.st_mtime_ns)
+
+
+def _owned_by_us(path: Path) -> bool:
+    # Only unpickle files this user wrote (the default directory is shared /tmp)
+    return not hasattr(os, "getuid") or path.stat().st_uid == os.getuid()
+
+
+def _load_artifact(source: Path) -> Optional[RuleSchemaRegistry]:
+    artifact = _artifact_path(source)
+    if artifact is None:
+        return None
+    try:
+        if not (artifact.is_file() and _owned_by_us(artifact.parent) and _owned_by_us(artifact)):
+            return None
+        with open(artifact, 'rb') as f:
+            stamp, registry = pickle.load(f)
+        if stamp != _source_stamp(source) or not isinstance(registry, RuleSchemaRegistry):
+            return None
+        return registry
+    except Exception:
+        return None
+
+
+def _save_artifact(registry: RuleSchemaRegistry) -> None:
+    artifact = _artifact_path(registry.path)
+    if artifact is None:
+        return
+    try:
+        artifact.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        if not _owned_by_us(artifact.parent):
+            return
+        tmp = artifact.with_name(f"{artifact.name}.{os.getpid()}.tmp")
+        with open(tmp, 'wb') as f:
+            pickle.dump((_source_stamp(registry.path), registry), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, artifact)
+    except OSError:
+        # The artifact is only an optimization
+        pass
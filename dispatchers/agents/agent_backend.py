@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Pluggable Agent Backend (live / record / replay)
+
+Lets the dispatch, merge and conversion layers be benchmarked without live
+agent calls. The backend is chosen through environment variables, so a whole
+run_pipeline.sh run switches at once:
+
+    AGENT_BACKEND          live (default), record or replay
+    AGENT_RECORDINGS_DIR   Recording store (default: output/agent_recordings)
+    AGENT_REPLAY_LATENCY   Replay delay per call: 0 (default), a number of
+                           seconds, or "recorded" to sleep the recorded duration
+
+Agent launch sites build their command through agent_command(). In live mode
+it returns the `claude` argv unchanged. In record/replay mode the argv is
+wrapped so it runs this module as a subprocess:
+
+    python agent_backend.py record -- claude -p "<prompt>" --agent ...
+    python agent_backend.py replay -- claude -p "<prompt>" --agent ...
+
+Because the wrapper is a real process, callers (streaming, timeouts, the
+governor, hedging and kill in agent_runner) behave the same in every mode.
+
+record runs claude, passes its output through and then stores one call
+directory:
+    call.json    normalized argv, return code, duration, input/output files
+    stdout.txt   combined stdout/stderr
+    inputs/      files named in the prompt that existed and were not modified
+    outputs/     files named in the prompt that the agent created or modified
+
+replay looks the call up and writes the recorded outputs to the paths named
+in the current prompt. It then prints the recorded stdout and exits with the
+recorded return code. It does not touch the network.
+
+Calls are keyed by the argv with every file path in the prompt reduced to
+its basename (and hedge/retry ".attemptN" suffixes removed). Recordings
+therefore replay under a different --output-dir. Input file contents are
+not part of the key. They are hashed into call.json instead, and replay
+warns when the current inputs differ from the recorded ones.
+"""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+BACKENDS = ("live", "record", "replay")
+DEFAULT_RECORDINGS_DIR = PROJECT_ROOT / "output" / "agent_recordings"
+
+# File paths mentioned in prompts (temp inputs, outputs, logs, agent docs)
+PATH_PATTERN = re.compile(r'[\w./~\-]*[\w\-]\.(?:json|jsonl|txt|md|csv|py)\b')
+ATTEMPT_SUFFIX = re.compile(r'\.attempt\d+(?=\.\w+$)')
+
+
+def get_backend() -> str:
+    """Active backend from AGENT_BACKEND (live, record or replay)."""
+    backend = os.environ.get("AGENT_BACKEND", "live").strip().lower() or "live"
+    if backend not in BACKENDS:
+        raise ValueError(f"AGENT_BACKEND must be one of {', '.join(BACKENDS)}, got '{backend}'")
+    return backend
+
+
+def get_recordings_dir() -> Path:
+    """Recording store from AGENT_RECORDINGS_DIR."""
+    return Path(os.environ.get("AGENT_RECORDINGS_DIR") or DEFAULT_RECORDINGS_DIR)
+
+
+def agent_command(cmd: List[str]) -> List[str]:
+    """
+    Route a `claude` command through the active backend.
+
+    Args:
+        cmd: The claude argv, e.g. ["claude", "-p", prompt, "--agent", name]
+
+    Returns:
+        cmd itself for the live backend, otherwise the argv of the
+        record/replay wrapper around it
+    """
+    backend = get_backend()
+    if backend == "live":
+        return cmd
+    return [sys.executable, str(Path(__file__).resolve()), backend, "--"] + list(cmd)
+
+
+# ── Call keys ───────────────────────────────────────────────────────────────
+
+def _prompt_index(argv: List[str]) -> Optional[int]:
+    try:
+        return argv.index("-p") + 1
+    except ValueError:
+        return None
+
+
+def prompt_paths(prompt: str) -> List[str]:
+    """File path tokens mentioned in a prompt, in order of appearance."""
+    seen = []
+    for match in PATH_PATTERN.finditer(prompt):
+        token = match.group(0)
+        if token not in seen:
+            seen.append(token)
+    return seen
+
+
+def normalize_name(token: str) -> str:
+    """Basename of a prompt path with any .attemptN suffix removed."""
+    return ATTEMPT_SUFFIX.sub('', Path(token).name)
+
+
+def normalize_argv(argv: List[str]) -> List[str]:
+    """argv with the prompt's file paths reduced to normalized basenames."""
+    normalized = list(argv)
+    idx = _prompt_index(argv)
+    if idx is not None and idx < len(argv):
+        normalized[idx] = PATH_PATTERN.sub(lambda m: normalize_name(m.group(0)), argv[idx])
+    return normalized
+
+
+def call_key(argv: List[str]) -> str:
+    """Stable recording key for a claude invocation."""
+    encoded = json.dumps(normalize_argv(argv), ensure_ascii=False)
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()[:24]
+
+
+def content_hash(path: Path) -> str:
+    """Hash of a file; JSON files are canonicalized so formatting changes don't count."""
+    data = path.read_bytes()
+    if path.suffix == '.json':
+        try:
+            data = json.dumps(json.loads(data), sort_keys=True).encode('utf-8')
+        except ValueError:
+            pass
+    return hashlib.sha256(data).hexdigest()
+
+
+def _snapshot(tokens: List[str]) -> Dict[str, Tuple[int, int]]:
+    state = {}
+    for token in tokens:
+        path = Path(token)
+        if path.is_file():
+            st = path.stat()
+            state[token] = (st.st_mtime_ns, st.st_size)
+    return state
+
+
+# ── Record / replay ─────────────────────────────────────────────────────────
+
+def record(argv: List[str]) -> int:
+    """Run claude live, stream its output, then store the call."""
+    idx = _prompt_index(argv)
+    tokens = prompt_paths(argv[idx]) if idx is not None and idx < len(argv) else []
+    before = _snapshot(tokens)
+
+    start = time.monotonic()
+    process = subprocess.Popen(argv, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                               text=True, bufsize=1)
+    stdout_lines = []
+    for line in process.stdout:
+        print(line, end='', flush=True)
+        stdout_lines.append(line)
+    process.wait()
+    elapsed = time.monotonic() - start
+
+    after = _snapshot(tokens)
+    outputs = [t for t in tokens if t in after and before.get(t) != after[t]]
+    inputs = [t for t in tokens if t in before and t not in outputs]
+
+    # Build the call directory aside and rename it in, so concurrent
+    # attempts of the same call (hedges) never see a half-written recording
+    final_dir = get_recordings_dir() / call_key(argv)
+    call_dir = final_dir.with_name(f"{final_dir.name}.{os.getpid()}.tmp")
+    (call_dir / "inputs").mkdir(parents=True)
+    (call_dir / "outputs").mkdir()
+
+    for token in inputs:
+        shutil.copyfile(token, call_dir / "inputs" / normalize_name(token))
+    for token in outputs:
+        shutil.copyfile(token, call_dir / "outputs" / normalize_name(token))
+
+    (call_dir / "stdout.txt").write_text(''.join(stdout_lines))
+    (call_dir / "call.json").write_text(json.dumps({
+        "argv": normalize_argv(argv),
+        "returncode": process.returncode,
+        "elapsed_seconds": round(elapsed, 3),
+        "inputs": {normalize_name(t): content_hash(Path(t)) for t in inputs},
+        "outputs": [normalize_name(t) for t in outputs],
+    }, indent=2, ensure_ascii=False))
+
+    if final_dir.exists():
+        shutil.rmtree(final_dir, ignore_errors=True)
+    try:
+        os.replace(call_dir, final_dir)
+    except OSError:
+        # Another attempt of the same call recorded first - keep that one
+        shutil.rmtree(call_dir, ignore_errors=True)
+
+    return process.returncode
+
+
+def replay(argv: List[str]) -> int:
+    """Serve a recorded call: write its outputs, print its stdout, return its exit code."""
+    key = call_key(argv)
+    call_dir = get_recordings_dir() / key
+    if not (call_dir / "call.json").exists():
+        print(f"[replay] No recording for this call (key {key}) in {get_recordings_dir()}",
+              file=sys.stderr)
+        return 3
+
+    meta = json.loads((call_dir / "call.json").read_text())
+    idx = _prompt_index(argv)
+    tokens = prompt_paths(argv[idx]) if idx is not None and idx < len(argv) else []
+    current = {normalize_name(t): t for t in tokens}
+
+    for name, recorded_hash in meta.get("inputs", {}).items():
+        token = current.get(name)
+        if token and Path(token).is_file() and content_hash(Path(token)) != recorded_hash:
+            print(f"[replay] Warning: input {name} differs from the recording", file=sys.stderr)
+
+    latency = os.environ.get("AGENT_REPLAY_LATENCY", "0").strip().lower()
+    if latency == "recorded":
+        time.sleep(meta.get("elapsed_seconds", 0))
+    elif latency:
+        time.sleep(float(latency))
+
+    for name in meta.get("outputs", []):
+        token = current.get(name)
+        if not token:
+            print(f"[replay] Warning: recorded output {name} is not named in the prompt", file=sys.stderr)
+            continue
+        Path(token).parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(call_dir / "outputs" / name, token)
+
+    sys.stdout.write((call_dir / "stdout.txt").read_text())
+    sys.stdout.flush()
+    return meta.get("returncode", 0)
+
+
+def main():
+    if len(sys.argv) < 4 or sys.argv[1] not in ("record", "replay") or sys.argv[2] != "--":
+        print("Usage: agent_backend.py {record|replay} -- claude -p <prompt> [args...]", file=sys.stderr)
+        sys.exit(2)
+
+    mode, argv = sys.argv[1], sys.argv[3:]
+    sys.exit(record(argv) if mode == "record" else replay(argv))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Agent Concurrency Governor
+
+Caps the number of concurrent `claude` agent processes and rate-limits the
+estimated tokens sent per minute. The limits hold across threads in one
+process AND across processes (parallel stages, parallel BUDs), coordinated
+through lock files in a shared local directory:
+
+- slot_<i>.lock  — holding an exclusive flock on one of N slot files is one
+                   concurrency slot
+- bucket.json    — token bucket state, guarded by an flock on bucket.lock
+
+Configuration comes from environment variables so every dispatcher and
+orchestrator started from the same shell shares one budget:
+
+    AGENT_MAX_CONCURRENCY    Max concurrent agent processes (default: 4)
+    AGENT_TOKENS_PER_MINUTE  Estimated token budget per minute, 0 = unlimited (default: 0)
+    AGENT_GOVERNOR_DIR       Lock directory (default: <tmp>/doc_parser_agent_governor)
+
+Usage:
+    from agent_governor import agent_slot, estimate_tokens
+
+    with agent_slot(estimate_tokens(prompt, fields_input_file), label=panel_name):
+        process = subprocess.Popen(["claude", "-p", prompt, ...])
+        ...
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Union
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    # No cross-process locking (e.g. Windows) - limits apply per process only
+    FCNTL_AVAILABLE = False
+
+
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_TOKENS_PER_MINUTE = 0
+CHARS_PER_TOKEN = 4
+POLL_INTERVAL = 0.25
+
+
+def estimate_tokens(*parts: Union[str, Path, None]) -> int:
+    """
+    Roughly estimate the input tokens of an agent call.
+
+    Strings are counted by length; Paths by file size (files the agent is
+    told to read). Uses the usual ~4 characters per token heuristic.
+
+    Args:
+        *parts: Prompt strings and/or input file paths
+
+    Returns:
+        Estimated token count
+    """
+    chars = 0
+    for part in parts:
+        if part is None:
+            continue
+        if isinstance(part, Path):
+            try:
+                chars += part.stat().st_size
+            except OSError:
+                pass
+        else:
+            chars += len(part)
+    return chars // CHARS_PER_TOKEN
+
+
+class AgentGovernor:
+    """
+    Process-wide and cross-process limiter for agent launches.
+
+    Attributes:
+        max_concurrency: Max agent processes running at once
+        tokens_per_minute: Token bucket refill rate (0 disables rate limiting)
+        lock_dir: Directory holding the shared slot and bucket lock files
+    """
+
+    def __init__(self,
+                 max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                 tokens_per_minute: int = DEFAULT_TOKENS_PER_MINUTE,
+                 lock_dir: Optional[Path] = None):
+        self.max_concurrency = max(1, max_concurrency)
+        self.tokens_per_minute = max(0, tokens_per_minute)
+        self.lock_dir = Path(lock_dir) if lock_dir else Path(tempfile.gettempdir()) / "doc_parser_agent_governor"
+        self.lock_dir.mkdir(parents=True, exist_ok=True)
+
+        # Threads of this process queue here first so they don't spin on flock
+        self._local_slots = threading.BoundedSemaphore(self.max_concurrency)
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            "launches": 0,
+            "total_wait_seconds": 0.0,
+            "max_wait_seconds": 0.0,
+            "estimated_tokens": 0,
+        }
+
+    @classmethod
+    def from_env(cls) -> "AgentGovernor":
+        """Build a governor from AGENT_* environment variables."""
+        return cls(
+            max_concurrency=int(os.environ.get("AGENT_MAX_CONCURRENCY", DEFAULT_MAX_CONCURRENCY)),
+            tokens_per_minute=int(os.environ.get("AGENT_TOKENS_PER_MINUTE", DEFAULT_TOKENS_PER_MINUTE)),
+            lock_dir=os.environ.get("AGENT_GOVERNOR_DIR") or None,
+        )
+
+    @contextmanager
+    def slot(self, estimated_tokens: int = 0, label: str = "") -> Iterator[float]:
+        """
+        Block until a concurrency slot and enough token budget are available.
+
+        Args:
+            estimated_tokens: Estimated tokens for this agent call
+            label: Panel/stage name (for wait messages only)
+
+        Yields:
+            Seconds spent waiting in the queue
+        """
+        start = time.monotonic()
+        self._local_slots.acquire()
+        slot_fd = None
+        try:
+            slot_fd = self._acquire_slot_file()
+            self._consume_tokens(estimated_tokens)
+            wait = time.monotonic() - start
+            self._record(wait, estimated_tokens)
+            if wait >= 1.0:
+                print(f"  [governor] {label or 'agent'} waited {wait:.1f}s for an agent slot", flush=True)
+            yield wait
+        finally:
+            if slot_fd is not None:
+                fcntl.flock(slot_fd, fcntl.LOCK_UN)
+                os.close(slot_fd)
+            self._local_slots.release()
+
+    def stats(self) -> Dict:
+        """Return a copy of this process's queue-wait statistics."""
+        with self._stats_lock:
+            return dict(self._stats)
+
+    def _record(self, wait: float, estimated_tokens: int) -> None:
+        with self._stats_lock:
+            self._stats["launches"] += 1
+            self._stats["total_wait_seconds"] += wait
+            self._stats["max_wait_seconds"] = max(self._stats["max_wait_seconds"], wait)
+            self._stats["estimated_tokens"] += estimated_tokens
+
+    def _acquire_slot_file(self) -> Optional[int]:
+        """Take an exclusive flock on one of the shared slot files."""
+        if not FCNTL_AVAILABLE:
+            return None
+
+        while True:
+            for i in range(self.max_concurrency):
+                fd = os.open(str(self.lock_dir / f"slot_{i}.lock"), os.O_RDWR | os.O_CREAT, 0o644)
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    return fd
+                except BlockingIOError:
+                    os.close(fd)
+            time.sleep(POLL_INTERVAL)
+
+    def _consume_tokens(self, estimated_tokens: int) -> None:
+        """Take tokens from the shared bucket, sleeping until they refill."""
+        if not self.tokens_per_minute or estimated_tokens <= 0 or not FCNTL_AVAILABLE:
+            return
+
+        capacity = float(self.tokens_per_minute)
+        rate = capacity / 60.0
+        # A single call larger than the whole budget would never fit; let it
+        # through once the bucket is full.
+        needed = min(float(estimated_tokens), capacity)
+        state_path = self.lock_dir / "bucket.json"
+
+        while True:
+            with open(self.lock_dir / "bucket.lock", "a") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    now = time.time()
+                    try:
+                        state = json.loads(state_path.read_text())
+                    except (OSError, ValueError):
+                        state = {"tokens": capacity, "updated": now}
+
+                    tokens = min(capacity, state["tokens"] + (now - state["updated"]) * rate)
+                    if tokens >= needed:
+                        state_path.write_text(json.dumps({"tokens": tokens - needed, "updated": now}))
+                        return
+
+                    state_path.write_text(json.dumps({"tokens": tokens, "updated": now}))
+                    deficit_seconds = (needed - tokens) / rate
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+            time.sleep(min(max(deficit_seconds, POLL_INTERVAL), 5.0))
+
+
+_governor: Optional[AgentGovernor] = None
+_governor_lock = threading.Lock()
+
+
+def get_governor() -> AgentGovernor:
+    """Return the process-wide governor, creating it from the environment on first use."""
+    global _governor
+    with _governor_lock:
+        if _governor is None:
+            _governor = AgentGovernor.from_env()
+        return _governor
+
+
+def agent_slot(estimated_tokens: int = 0, label: str = ""):
+    """Shortcut for get_governor().slot(...) - wrap every agent launch in this."""
+    return get_governor().slot(estimated_tokens, label)
+
+
+def governor_stats() -> Dict:
+    """Queue-wait statistics for all agent launches made by this process."""
+    return get_governor().stats()
+
+
+def format_queue_wait_summary() -> str:
+    """One-line queue-wait metric for dispatcher/orchestrator summaries."""
+    stats = governor_stats()
+    return (f"Agent Queue Wait: {stats['total_wait_seconds']:.1f}s total, "
+            f"{stats['max_wait_seconds']:.1f}s max over {stats['launches']} launches "
+            f"(~{stats['estimated_tokens']} est. tokens)")
@@ -0,0 +1,404 @@
+#!/usr/bin/env python3
+"""
+Panel Agent Runner
+
+Runs a `claude -p` mini agent for one panel and returns once a valid output
+file exists. It adds two ways to recover from slow or broken agents without
+a manual re-run:
+
+- Hedging: per-agent latencies are recorded. When a run takes longer than
+  the configured percentile of that agent's history, a duplicate attempt is
+  launched. The first attempt to write valid JSON wins and the other is
+  killed.
+- Malformed-JSON retry: if the agent exits cleanly but its output is
+  missing or not valid JSON, a new attempt is launched right away instead
+  of failing the panel.
+
+Extra attempts write to their own copies of the output files
+(<name>.attempt<N>.json), built by rewriting the output paths in the prompt.
+Callers list every file the prompt has the agent write, logs included, so a
+hedge never shares a file with the primary it runs next to. The winning
+attempt's files are then moved onto the original paths, so callers read the
+same output files as before. Every attempt runs inside an agent_governor
+slot.
+
+Configuration (environment variables):
+    AGENT_HEDGE_PERCENTILE   Latency percentile that triggers a hedge, 0 disables (default: 90)
+    AGENT_HEDGE_MIN_SAMPLES  Latency samples needed before hedging an agent (default: 5)
+    AGENT_JSON_RETRIES       Immediate retries on malformed/missing JSON output (default: 1)
+"""
+
+import json
+import os
+import queue
+import re
+import signal
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+
+from agent_backend import agent_command, get_backend
+from agent_governor import agent_slot, estimate_tokens, get_governor
+
+
+PROJECT_ROOT = str(Path(__file__).parent.parent.parent)
+
+DEFAULT_HEDGE_PERCENTILE = 90.0
+DEFAULT_HEDGE_MIN_SAMPLES = 5
+DEFAULT_JSON_RETRIES = 1
+LATENCY_HISTORY_SIZE = 50
+POLL_INTERVAL = 1.0
+
+
+@dataclass
+class AgentRun:
+    """Outcome of run_agent()."""
+    returncode: Optional[int]
+    output_valid: bool
+    elapsed_seconds: float
+    attempts: int = 1
+    hedged: bool = False
+    winner: str = "primary"  # primary, hedge or retry
+    output_lines: List[str] = field(default_factory=list)
+
+
+class _Attempt:
+    """One claude process writing to its own set of output files."""
+
+    def __init__(self, index: int, kind: str, prompt: str, output_files: List[Path]):
+        self.index = index
+        self.kind = kind
+        self.prompt = prompt
+        self.output_files = output_files
+        self.process: Optional[subprocess.Popen] = None
+        self.started: Optional[float] = None
+        self.elapsed = 0.0
+        self.returncode: Optional[int] = None
+        self.error: Optional[BaseException] = None
+        self.cancelled = False
+        self.output_lines: List[str] = []
+        self.thread: Optional[threading.Thread] = None
+        # Held while checking `cancelled` and starting the process, so kill() can't slip in between
+        self.lock = threading.Lock()
+
+    def kill(self) -> None:
+        with self.lock:
+            self.cancelled = True
+            process = self.process
+        if process and process.poll() is None:
+            # Attempts run in their own session; kill the whole group so a
+            # record/replay wrapper doesn't leave its claude child behind
+            try:
+                os.killpg(process.pid, signal.SIGKILL)
+            except (AttributeError, OSError):
+                process.kill()
+
+
+# ── Latency history ─────────────────────────────────────────────────────────
+
+def _latency_file(agent_key: str) -> Path:
+    safe_key = re.sub(r'[^\w\-]', '_', agent_key)
+    return get_governor().lock_dir / f"latency_{safe_key}.json"
+
+
+def load_latencies(agent_key: str) -> List[float]:
+    """Recent wall-clock latencies (seconds) of successful runs of an agent."""
+    try:
+        data = json.loads(_latency_file(agent_key).read_text())
+        return [float(x) for x in data if isinstance(x, (int, float))]
+    except (OSError, ValueError):
+        return []
+
+
+def record_latency(agent_key: str, seconds: float) -> None:
+    """Append a latency sample, keeping the last LATENCY_HISTORY_SIZE."""
+    history = (load_latencies(agent_key) + [round(seconds, 2)])[-LATENCY_HISTORY_SIZE:]
+    path = _latency_file(agent_key)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp_path.write_text(json.dumps(history))
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """Linear-interpolated percentile (pct in 0-100) of a non-empty sequence."""
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100.0
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def hedge_threshold(agent_key: str) -> Optional[float]:
+    """Seconds after which a run of agent_key gets a hedged duplicate, or None."""
+    pct = float(os.environ.get("AGENT_HEDGE_PERCENTILE", DEFAULT_HEDGE_PERCENTILE))
+    min_samples = int(os.environ.get("AGENT_HEDGE_MIN_SAMPLES", DEFAULT_HEDGE_MIN_SAMPLES))
+    if pct <= 0:
+        return None
+    history = load_latencies(agent_key)
+    if len(history) < max(1, min_samples):
+        return None
+    return percentile(history, min(pct, 100.0))
+
+
+# ── Run statistics (per process, for dispatcher summaries) ──────────────────
+
+_stats_lock = threading.Lock()
+_stats = {"runs": 0, "hedged": 0, "hedge_wins": 0, "json_retries": 0}
+
+
+def _bump(key: str, amount: int = 1) -> None:
+    with _stats_lock:
+        _stats[key] += amount
+
+
+def runner_stats() -> Dict:
+    """Hedge/retry counters for all run_agent() calls made by this process."""
+    with _stats_lock:
+        return dict(_stats)
+
+
+def format_runner_summary() -> str:
+    """One-line hedge/retry metric for dispatcher summaries."""
+    stats = runner_stats()
+    return (f"Agent Runs: {stats['runs']} ({stats['hedged']} hedged, "
+            f"{stats['hedge_wins']} won by hedge, {stats['json_retries']} JSON retries)")
+
+
+# ── Runner ──────────────────────────────────────────────────────────────────
+
+def _attempt_path(path: Path, index: int) -> Path:
+    return path.with_name(f"{path.stem}.attempt{index}{path.suffix}")
+
+
+def _is_valid_json_output(path: Path, not_before: float) -> bool:
+    """Output exists, was written by this attempt and parses as JSON."""
+    try:
+        if path.stat().st_mtime < not_before:
+            return False
+        with open(path, 'r') as f:
+            json.load(f)
+        return True
+    except (OSError, ValueError):
+        return False
+
+
+def run_agent(prompt: str,
+              output_file: Path,
+              agent: Optional[str] = None,
+              label: str = "",
+              extra_output_files: Sequence[Path] = (),
+              allowed_tools: str = "Read,Write",
+              estimated_tokens: Optional[int] = None,
+              validate: Optional[Callable[[Path], bool]] = None,
+              cwd: str = PROJECT_ROOT) -> AgentRun:
+    """
+    Run a mini agent with latency hedging and malformed-JSON retry.
+
+    Args:
+        prompt: Prompt passed to claude -p (must mention output_file verbatim)
+        output_file: Main JSON output file the agent writes
+        agent: Agent name for --agent (e.g. "mini/05_condition_agent_v2");
+               also the key for latency history
+        label: Panel name or similar, for log lines
+        extra_output_files: Other files the agent writes, including its log;
+                            each hedge/retry gets its own copies, moved
+                            along with output_file when it wins
+        allowed_tools: Value for --allowedTools
+        estimated_tokens: Token estimate for the governor (default: from prompt)
+        validate: Optional extra check on a parsed-OK output file
+        cwd: Working directory for claude
+
+    Returns:
+        AgentRun describing the winning attempt (or the last failure)
+
+    Raises:
+        FileNotFoundError: If the claude CLI is not installed
+    """
+    agent_key = agent or "claude_p"
+    if get_backend() == "replay":
+        # Replayed latencies are simulated; keep them out of the live history
+        agent_key = f"replay_{agent_key}"
+    primary_files = [Path(output_file)] + [Path(p) for p in extra_output_files]
+    if estimated_tokens is None:
+        estimated_tokens = estimate_tokens(prompt)
+    json_retries_left = int(os.environ.get("AGENT_JSON_RETRIES", DEFAULT_JSON_RETRIES))
+    hedge_after = hedge_threshold(agent_key)
+
+    completions: "queue.Queue[_Attempt]" = queue.Queue()
+    attempts: List[_Attempt] = []
+    run_start = time.monotonic()
+    _bump("runs")
+
+    def launch(kind: str) -> _Attempt:
+        index = len(attempts) + 1
+        if index == 1:
+            files = primary_files
+            attempt_prompt = prompt
+        else:
+            files = [_attempt_path(p, index) for p in primary_files]
+            attempt_prompt = prompt
+            for original, variant in zip(primary_files, files):
+                attempt_prompt = attempt_prompt.replace(str(original), str(variant))
+                if variant.exists():
+                    variant.unlink()
+        attempt = _Attempt(index, kind, attempt_prompt, files)
+        attempt.thread = threading.Thread(
+            target=_run_attempt,
+            args=(attempt, agent, allowed_tools, estimated_tokens, label, cwd, completions),
+            daemon=True,
+        )
+        attempts.append(attempt)
+        attempt.thread.start()
+        return attempt
+
+    primary = launch("primary")
+    hedged = False
+    winner: Optional[_Attempt] = None
+    last_finished: Optional[_Attempt] = None
+    running = 1
+
+    while running > 0:
+        timeout = None
+        if hedge_after is not None and not hedged:
+            timeout = POLL_INTERVAL
+            if primary.started is not None:
+                timeout = max(0.0, hedge_after - (time.monotonic() - primary.started))
+
+        try:
+            attempt = completions.get(timeout=timeout)
+        except queue.Empty:
+            if primary.started is not None and time.monotonic() - primary.started >= hedge_after:
+                hedged = True
+                _bump("hedged")
+                print(f"\n  [runner] {label or agent_key}: still running after {hedge_after:.1f}s "
+                      f"(p{os.environ.get('AGENT_HEDGE_PERCENTILE', DEFAULT_HEDGE_PERCENTILE)} latency), "
+                      f"launching hedged duplicate", flush=True)
+                launch("hedge")
+                running += 1
+            continue
+
+        running -= 1
+        last_finished = attempt
+
+        if attempt.error is not None:
+            if isinstance(attempt.error, FileNotFoundError) and running == 0:
+                raise attempt.error
+            print(f"  [runner] {attempt.kind} attempt error: {attempt.error}", file=sys.stderr)
+            continue
+
+        if attempt.returncode == 0:
+            valid = _is_valid_json_output(attempt.output_files[0], run_start - 1)
+            if valid and validate is not None:
+                valid = validate(attempt.output_files[0])
+            if valid:
+                winner = attempt
+                break
+
+            print(f"  [runner] {attempt.kind} attempt wrote missing/malformed JSON: "
+                  f"{attempt.output_files[0]}", file=sys.stderr)
+            if json_retries_left > 0 and running == 0:
+                json_retries_left -= 1
+                _bump("json_retries")
+                print(f"  [runner] Retrying {label or agent_key} immediately", flush=True)
+                launch("retry")
+                running += 1
+        else:
+            print(f"  [runner] {attempt.kind} attempt exited with code {attempt.returncode}",
+                  file=sys.stderr)
+
+    # Kill whatever is still running (the loser of a hedge)
+    for attempt in attempts:
+        if attempt is not winner and attempt.thread.is_alive():
+            attempt.kill()
+            if attempt.started is not None and attempt.kind == "primary":
+                # Censored sample: the slow primary took at least this long
+                record_latency(agent_key, time.monotonic() - attempt.started)
+    for attempt in attempts:
+        attempt.thread.join(timeout=10)
+
+    if winner is None:
+        final = last_finished or primary
+        return AgentRun(
+            returncode=final.returncode,
+            output_valid=False,
+            elapsed_seconds=time.monotonic() - run_start,
+            attempts=len(attempts),
+            hedged=hedged,
+            winner=final.kind,
+            output_lines=final.output_lines,
+        )
+
+    record_latency(agent_key, winner.elapsed)
+
+    if winner.index > 1:
+        if winner.kind == "hedge":
+            _bump("hedge_wins")
+        for original, variant in zip(primary_files, winner.output_files):
+            if variant.exists():
+                os.replace(variant, original)
+        print(f"  [runner] {winner.kind} attempt won for {label or agent_key}", flush=True)
+
+    for attempt in attempts:
+        if attempt is not winner and attempt.index > 1:
+            for variant in attempt.output_files:
+                if variant.exists():
+                    variant.unlink()
+
+    return AgentRun(
+        returncode=winner.returncode,
+        output_valid=True,
+        elapsed_seconds=time.monotonic() - run_start,
+        attempts=len(attempts),
+        hedged=hedged,
+        winner=winner.kind,
+        output_lines=winner.output_lines,
+    )
+
+
+def _run_attempt(attempt: _Attempt,
+                 agent: Optional[str],
+                 allowed_tools: str,
+                 estimated_tokens: int,
+                 label: str,
+                 cwd: str,
+                 completions: "queue.Queue[_Attempt]") -> None:
+    """Thread body: run one attempt inside a governor slot and stream its output."""
+    cmd = ["claude", "-p", attempt.prompt]
+    if agent:
+        cmd.extend(["--agent", agent])
+    cmd.extend(["--allowedTools", allowed_tools])
+    prefix = "" if attempt.index == 1 else f"[{attempt.kind} {attempt.index}] "
+
+    try:
+        with agent_slot(estimated_tokens, label=label):
+            with attempt.lock:
+                if attempt.cancelled:
+                    return
+                attempt.started = time.monotonic()
+                attempt.process = subprocess.Popen(
+                    agent_command(cmd),
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    text=True,
+                    bufsize=1,
+                    cwd=cwd,
+                    start_new_session=True
+                )
+            for line in attempt.process.stdout:
+                if not attempt.cancelled:
+                    print(f"{prefix}{line}", end='', flush=True)
+                attempt.output_lines.append(line)
+            attempt.process.wait()
+            attempt.returncode = attempt.process.returncode
+            attempt.elapsed = time.monotonic() - attempt.started
+    except BaseException as e:
+        attempt.error = e
+    finally:
+        completions.put(attempt)
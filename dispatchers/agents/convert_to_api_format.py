@@ -10,20 +10,32 @@ Supports two modes:
      and injects EDV rules into matching fields.
   2. Legacy mode (no --schema): Builds the entire API template from scratch.
 
+--batch MANIFEST runs many conversions (either mode) on a process pool,
+loading Rule-Schemas.json once, and prints a per-job timing table.
+
 Input: output/edv_rules/all_panels_edv.json
 Output: documents/json_output/vendor_creation.json (or custom path)
 """
 
 import argparse
-import copy
+import contextlib
+import io
 import json
+import os
 import uuid
 import sys
 import re
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Any, Tuple
+from typing import Any, Callable, Dict, List, Tuple
 from datetime import datetime
 
+# Shared JSON I/O from the project root
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from common import json_io
+from common.rule_schema_registry import RuleSchemaRegistry
+
 
 def sanitize_variable_name(field_name: str) -> str:
     """
@@ -83,31 +95,43 @@ def map_field_type_to_form_tag_type(field_type: str) -> str:
     return type_mapping.get(field_type, 'TEXT')
 
 
-def set_header_metadata_ids(metadatas: List[Dict]) -> int:
+def set_header_metadata_ids(metadatas: List[Dict], touch: Callable[[int], Dict] = None) -> int:
     """
     Set headerMetadataId on fields between ARRAY_HDR and ARRAY_END.
 
     Fields between an ARRAY_HDR and its matching ARRAY_END (inclusive of
     ARRAY_END) get headerMetadataId set to the ARRAY_HDR's id.
 
+    Args:
+        metadatas: List of metadata entries (updated in place)
+        touch: Optional callback returning a writable entry for an index
+            (copy-on-write); only called for entries whose value changes
+
     Returns:
         Number of fields updated
     """
     updated = 0
     array_hdr_id = None
 
-    for meta in metadatas:
+    def assign(idx: int, meta: Dict, header_id: int) -> None:
+        if touch is not None:
+            if meta.get('headerMetadataId') == header_id:
+                return
+            meta = touch(idx)
+        meta['headerMetadataId'] = header_id
+
+    for idx, meta in enumerate(metadatas):
         ftype = meta.get('formTag', {}).get('type', '')
 
         if ftype == 'ARRAY_HDR':
             array_hdr_id = meta['id']
         elif ftype == 'ARRAY_END':
             if array_hdr_id is not None:
-                meta['headerMetadataId'] = array_hdr_id
+                assign(idx, meta, array_hdr_id)
                 updated += 1
             array_hdr_id = None
         elif array_hdr_id is not None:
-            meta['headerMetadataId'] = array_hdr_id
+            assign(idx, meta, array_hdr_id)
             updated += 1
 
     return updated
@@ -134,35 +158,29 @@ def load_rule_schemas(schema_path: str = None) -> Dict[str, Dict]:
             print("  Warning: Rule-Schemas.json not found, using fallback mapping")
             return {}
 
-    with open(schema_path, 'r') as f:
-        raw = json.load(f)
-
-    # Handle paginated format ({"content": [...]}) or flat array
-    if isinstance(raw, dict) and 'content' in raw:
-        schemas = raw['content']
-    elif isinstance(raw, list):
-        schemas = raw
-    else:
+    try:
+        registry = RuleSchemaRegistry.load(schema_path)
+    except ValueError:
         print(f"  Warning: Unexpected Rule-Schemas.json format")
         return {}
 
-    rule_map = {}
-    action_map = {}  # actionType -> first matching schema entry (fallback)
-    for entry in schemas:
-        name = entry.get('name', '')
-        action = entry.get('action', '')
-        if name:
-            info = {
-                'id': entry.get('id'),
-                'actionType': action,
-                'processingType': entry.get('processingType', 'CLIENT'),
-                'sourceType': entry.get('source', ''),
-                'button': entry.get('button', ''),
-            }
-            rule_map[name] = info
-            # Build reverse lookup: actionType -> schema entry (first match wins)
-            if action and action not in action_map:
-                action_map[action] = info
+    def to_info(entry: Dict) -> Dict:
+        return {
+            'id': entry.get('id'),
+            'actionType': entry.get('action', ''),
+            'processingType': entry.get('processingType', 'CLIENT'),
+            'sourceType': entry.get('source', ''),
+            'button': entry.get('button', ''),
+        }
+
+    rule_map = {name: to_info(entry) for name, entry in registry.by_name.items()}
+
+    # Reverse lookup: actionType -> first named schema entry (fallback)
+    action_map = {}
+    for action, entries in registry.by_action.items():
+        first_named = next((entry for entry in entries if entry.get('name')), None)
+        if first_named is not None:
+            action_map[action] = to_info(first_named)
 
     # Store the action_map for fallback lookups
     rule_map['__action_map__'] = action_map
@@ -206,72 +224,124 @@ def _has_yes_no_params(rules: List[Dict]) -> bool:
     return False
 
 
-def _resolve_variable_to_id(variable_name: str, current_panel: str, panel_field_map: Dict[str, Dict[str, int]],
-                           metadatas: List[Dict], global_id_map: Dict[str, int], field_id: int,
-                           edv_data: Dict = None) -> int:
+class VariableIdResolver:
     """
-    Resolve a variable name to a field ID with panel-scoped priority.
+    Resolve variable names to field IDs with panel-scoped priority.
 
-    Resolution order:
-    1. Check if variable is in the current panel (panel-scoped lookup by field name)
-    2. Check global ID map (cross-panel lookup)
-    3. Fall back to current field ID
+    Built once per conversion. Per-panel variableName -> ID maps are created
+    lazily on first use, so each rule source/destination is a dict lookup
+    instead of a scan over the panel's EDV fields and schema fields.
 
-    Args:
-        variable_name: The variable name to resolve (e.g., "__street__")
-        current_panel: The name of the panel containing the current field
-        panel_field_map: Dict mapping panel_name -> {field_name -> metadata_index}
+    Resolution order:
+    1. EDV field in the current panel with this variableName, looked up by
+       field_name in the schema panel
+    2. Schema field in the current panel whose variableName (or sanitized
+       field name) matches
+    3. Global ID map (cross-panel lookup)
+    4. The current field ID
+
+    Attributes:
         metadatas: List of all metadata entries
-        global_id_map: Global variable name -> ID map (fallback)
-        field_id: Current field ID (last resort fallback)
+        global_id_map: Global variable name -> ID map, read live (entries
+            added during injection are visible)
         edv_data: EDV data dict (optional, for better field name matching)
-
-    Returns:
-        The resolved field ID
     """
-    # Special case: -1 passes through
-    if variable_name == "-1":
-        return -1
-
-    # First, try to find in current panel
-    # Strategy: Look up the field_name from EDV data that corresponds to this variable_name,
-    # then find that field_name in the schema panel
-    if current_panel in panel_field_map and edv_data and current_panel in edv_data:
-        # Find the field_name in EDV data that has this variable_name
-        target_field_name = None
-        for field in edv_data[current_panel]:
-            field_var = field.get('variableName', sanitize_variable_name(field.get('field_name', '')))
-            if field_var == variable_name:
-                target_field_name = field.get('field_name', '')
-                break
 
-        # If found, look up this field_name in the schema panel
-        if target_field_name and target_field_name in panel_field_map[current_panel]:
-            meta_idx = panel_field_map[current_panel][target_field_name]
-            return metadatas[meta_idx]['id']
+    def __init__(self, panel_field_map: Dict[str, Dict[str, int]], metadatas: List[Dict],
+                 global_id_map: Dict[str, int], edv_data: Dict = None):
+        self.metadatas = metadatas
+        self.global_id_map = global_id_map
+        self.edv_data = edv_data
+        self.panel_field_map = panel_field_map
+        self._edv_panel_maps: Dict[str, Dict[str, int]] = {}
+        self._schema_panel_maps: Dict[str, Dict[str, int]] = {}
+
+    def invalidate_panel(self, panel_name: str) -> None:
+        """Drop cached maps for a panel whose fields changed (e.g. RuleCheck inserted)."""
+        self._edv_panel_maps.pop(panel_name, None)
+        self._schema_panel_maps.pop(panel_name, None)
+
+    def _edv_panel_map(self, panel_name: str) -> Dict[str, int]:
+        """variableName -> ID via EDV field_name, first EDV field winning."""
+        if panel_name not in self._edv_panel_maps:
+            schema_fields = self.panel_field_map[panel_name]
+            var_map = {}
+            seen = set()
+            for field in self.edv_data[panel_name]:
+                field_var = field.get('variableName', sanitize_variable_name(field.get('field_name', '')))
+                if field_var in seen:
+                    continue
+                seen.add(field_var)
+                target_field_name = field.get('field_name', '')
+                if target_field_name and target_field_name in schema_fields:
+                    var_map[field_var] = self.metadatas[schema_fields[target_field_name]]['id']
+            self._edv_panel_maps[panel_name] = var_map
+        return self._edv_panel_maps[panel_name]
+
+    def _schema_panel_map(self, panel_name: str) -> Dict[str, int]:
+        """variableName -> ID over schema fields, first field in panel order winning."""
+        if panel_name not in self._schema_panel_maps:
+            var_map = {}
+            for field_name, meta_idx in self.panel_field_map[panel_name].items():
+                meta = self.metadatas[meta_idx]
+                var_map.setdefault(meta.get('variableName', ''), meta['id'])
+                var_map.setdefault(sanitize_variable_name(field_name), meta['id'])
+            self._schema_panel_maps[panel_name] = var_map
+        return self._schema_panel_maps[panel_name]
+
+    def resolve(self, variable_name: str, current_panel: str, field_id: int) -> int:
+        """
+        Resolve a variable name to a field ID.
+
+        Args:
+            variable_name: The variable name to resolve (e.g., "__street__")
+            current_panel: The name of the panel containing the current field
+            field_id: Current field ID (last resort fallback)
+
+        Returns:
+            The resolved field ID
+        """
+        # Special case: -1 passes through
+        if variable_name == "-1":
+            return -1
+
+        if current_panel in self.panel_field_map:
+            # First, the EDV field with this variable_name, found by field_name in the schema panel
+            if self.edv_data and current_panel in self.edv_data:
+                resolved = self._edv_panel_map(current_panel).get(variable_name)
+                if resolved is not None:
+                    return resolved
+
+            # Fallback: schema fields in current panel by variableName matching
+            resolved = self._schema_panel_map(current_panel).get(variable_name)
+            if resolved is not None:
+                return resolved
+
+        # Second, check global ID map (cross-panel lookup)
+        if variable_name in self.global_id_map:
+            return self.global_id_map[variable_name]
+
+        # Last resort: use current field ID
+        print(f"  Warning: Variable '{variable_name}' not found in panel '{current_panel}' or globally, using current field ID")
+        return field_id
 
-    # Fallback: Check all fields in current panel by variableName matching
-    if current_panel in panel_field_map:
-        for field_name, meta_idx in panel_field_map[current_panel].items():
-            meta = metadatas[meta_idx]
-            # Check both schema variableName and EDV-style variableName
-            meta_var_name = meta.get('variableName', '')
-            edv_var_name = sanitize_variable_name(field_name)
-            if meta_var_name == variable_name or edv_var_name == variable_name:
-                return meta['id']
 
-    # Second, check global ID map (cross-panel lookup)
-    if variable_name in global_id_map:
-        return global_id_map[variable_name]
+def _resolve_variable_to_id(variable_name: str, current_panel: str, panel_field_map: Dict[str, Dict[str, int]],
+                           metadatas: List[Dict], global_id_map: Dict[str, int], field_id: int,
+                           edv_data: Dict = None) -> int:
+    """
+    Resolve a single variable name to a field ID with panel-scoped priority.
 
-    # Last resort: use current field ID
-    print(f"  Warning: Variable '{variable_name}' not found in panel '{current_panel}' or globally, using current field ID")
-    return field_id
+    Builds a throwaway VariableIdResolver; conversions should build one
+    resolver and pass it to create_form_fill_rule instead.
+    """
+    resolver = VariableIdResolver(panel_field_map, metadatas, global_id_map, edv_data)
+    return resolver.resolve(variable_name, current_panel, field_id)
 
 
 def create_form_fill_rule(rule: Dict, field_id: int, id_map: Dict[str, int], rule_id_counter: int,
                           current_panel: str = None, panel_field_map: Dict = None, metadatas: List[Dict] = None,
-                          edv_data: Dict = None):
+                          edv_data: Dict = None, resolver: VariableIdResolver = None):
     """
     Convert EDV rule to formFillRule format.
 
@@ -287,6 +357,8 @@ def create_form_fill_rule(rule: Dict, field_id: int, id_map: Dict[str, int], rul
         panel_field_map: Panel-scoped field lookup (panel_name -> {field_name -> meta_idx})
         metadatas: List of all metadata entries (for panel-scoped resolution)
         edv_data: EDV data dict (for better field name matching in panel-scoped resolution)
+        resolver: Prebuilt VariableIdResolver for the conversion (built from the
+            panel arguments if omitted)
 
     Returns:
         Dict containing the rule, or None if the rule doesn't exist in Rule-Schemas.json
@@ -315,11 +387,13 @@ def create_form_fill_rule(rule: Dict, field_id: int, id_map: Dict[str, int], rul
 
     # Use panel-aware resolution if panel context is available
     use_panel_aware = (current_panel is not None and panel_field_map is not None and metadatas is not None)
+    if use_panel_aware and resolver is None:
+        resolver = VariableIdResolver(panel_field_map, metadatas, id_map, edv_data)
 
     source_ids = []
     for sf in source_fields:
         if use_panel_aware:
-            resolved_id = _resolve_variable_to_id(sf, current_panel, panel_field_map, metadatas, id_map, field_id, edv_data)
+            resolved_id = resolver.resolve(sf, current_panel, field_id)
             source_ids.append(resolved_id)
         else:
             # Fallback to simple lookup
@@ -334,7 +408,7 @@ def create_form_fill_rule(rule: Dict, field_id: int, id_map: Dict[str, int], rul
     destination_ids = []
     for df in destination_fields:
         if use_panel_aware:
-            resolved_id = _resolve_variable_to_id(df, current_panel, panel_field_map, metadatas, id_map, field_id, edv_data)
+            resolved_id = resolver.resolve(df, current_panel, field_id)
             destination_ids.append(resolved_id)
         else:
             # Fallback to simple lookup
@@ -471,6 +545,27 @@ def _build_schema_panel_map(metadatas: List[Dict]) -> Dict[str, Dict[str, int]]:
     return panel_field_map
 
 
+def _insert_into_panel_map(panel_field_map: Dict[str, Dict[str, int]], insert_idx: int,
+                           panel_name: str, field_name: str) -> None:
+    """
+    Update a panel map in place for a metadata entry inserted at insert_idx
+    as the first field of panel_name.
+
+    Equivalent to rebuilding with _build_schema_panel_map, without rescanning
+    every metadata entry: indices at or after insert_idx shift by one.
+    """
+    for fields in panel_field_map.values():
+        for name, idx in fields.items():
+            if idx >= insert_idx:
+                fields[name] = idx + 1
+
+    fields = panel_field_map.setdefault(panel_name, {})
+    shifted = dict(fields)
+    fields.clear()
+    fields[field_name] = insert_idx
+    fields.update(shifted)
+
+
 def build_id_map_from_schema(schema_data: Dict, edv_data: Dict) -> Dict[str, int]:
     """
     Build a mapping from EDV variableNames to schema formFillMetadata IDs.
@@ -520,11 +615,37 @@ def inject_rules_into_schema(schema_data: Dict, edv_data: Dict) -> Tuple[Dict, D
     Takes a schema with empty formFillRules arrays and populates them
     with rules from the EDV data, matching fields by (panel_name, field_name).
 
+    schema_data is not modified. The result shares every untouched part of
+    it: only the path down to formFillMetadatas and the metadata entries that
+    receive rules, prefill values or headerMetadataId are copied (shallowly,
+    plus their formFillRules list and preFillData dict).
+
     Returns:
         Tuple of (modified schema dict, stats dict)
     """
-    result = copy.deepcopy(schema_data)
-    metadatas = result['template']['documentTypes'][0]['formFillMetadatas']
+    result = dict(schema_data)
+    result['template'] = dict(schema_data['template'])
+    result['template']['documentTypes'] = list(schema_data['template']['documentTypes'])
+    doc_type = dict(result['template']['documentTypes'][0])
+    result['template']['documentTypes'][0] = doc_type
+    doc_type['formFillMetadatas'] = list(doc_type['formFillMetadatas'])
+    metadatas = doc_type['formFillMetadatas']
+
+    # Entries already copied for this result (by object id, so inserts that
+    # shift list positions don't matter)
+    owned = set()
+
+    def touch(idx: int) -> Dict:
+        """Return metadatas[idx], copying it first if it is still shared with schema_data."""
+        meta = metadatas[idx]
+        if id(meta) not in owned:
+            meta = dict(meta)
+            meta['formFillRules'] = list(meta.get('formFillRules', []))
+            if isinstance(meta.get('preFillData'), dict):
+                meta['preFillData'] = dict(meta['preFillData'])
+            metadatas[idx] = meta
+            owned.add(id(meta))
+        return meta
 
     # Build panel-scoped lookup from schema
     panel_field_map = _build_schema_panel_map(metadatas)
@@ -533,6 +654,9 @@ def inject_rules_into_schema(schema_data: Dict, edv_data: Dict) -> Tuple[Dict, D
     id_map = build_id_map_from_schema(schema_data, edv_data)
     print(f"Built ID map: {len(id_map)} variable names mapped to schema IDs")
 
+    # Indexed variable -> ID resolution shared by every rule in this conversion
+    resolver = VariableIdResolver(panel_field_map, metadatas, id_map, edv_data)
+
     # Find the max existing rule ID in the schema to continue from
     rule_id_counter = 1
     for meta in metadatas:
@@ -606,11 +730,13 @@ def inject_rules_into_schema(schema_data: Dict, edv_data: Dict) -> Tuple[Dict, D
                         "formTagValidations": [], "extendedFormFillLocations": [],
                         "formFillMetaTranslations": [], "formFillRules": []
                     }
+                    owned.add(id(new_meta))
 
                     for rule in rules:
                         form_fill_rule = create_form_fill_rule(rule, new_field_id, id_map, rule_id_counter,
                                                                current_panel=panel_name, panel_field_map=panel_field_map,
-                                                               metadatas=metadatas, edv_data=edv_data)
+                                                               metadatas=metadatas, edv_data=edv_data,
+                                                               resolver=resolver)
                         if form_fill_rule is not None:
                             new_meta['formFillRules'].append(form_fill_rule)
                             rule_id_counter += 1
@@ -625,7 +751,8 @@ def inject_rules_into_schema(schema_data: Dict, edv_data: Dict) -> Tuple[Dict, D
                     )
                     if panel_idx is not None:
                         metadatas.insert(panel_idx + 1, new_meta)
-                        panel_field_map = _build_schema_panel_map(metadatas)
+                        _insert_into_panel_map(panel_field_map, panel_idx + 1, panel_name, field_name)
+                        resolver.invalidate_panel(panel_name)
                     else:
                         metadatas.append(new_meta)
 
@@ -645,10 +772,12 @@ def inject_rules_into_schema(schema_data: Dict, edv_data: Dict) -> Tuple[Dict, D
             # Inject existing rules
             if rules:
                 fields_with_rules += 1
+                touch(meta_idx)
                 for rule in rules:
                     form_fill_rule = create_form_fill_rule(rule, field_id, id_map, rule_id_counter,
                                                            current_panel=panel_name, panel_field_map=panel_field_map,
-                                                           metadatas=metadatas, edv_data=edv_data)
+                                                           metadatas=metadatas, edv_data=edv_data,
+                                                           resolver=resolver)
                     if form_fill_rule is not None:
                         metadatas[meta_idx]['formFillRules'].append(form_fill_rule)
                         rule_id_counter += 1
@@ -661,7 +790,7 @@ def inject_rules_into_schema(schema_data: Dict, edv_data: Dict) -> Tuple[Dict, D
                         print(f"  Set prefill value to 'No' for field '{field_name}' (has YES_NO params)")
 
     # Set headerMetadataId on fields between ARRAY_HDR and ARRAY_END
-    array_fields_updated = set_header_metadata_ids(metadatas)
+    array_fields_updated = set_header_metadata_ids(metadatas, touch=touch)
     if array_fields_updated:
         print(f"  Set headerMetadataId on {array_fields_updated} fields inside ARRAY sections")
 
@@ -922,50 +1051,37 @@ def convert_edv_to_api_format(edv_data: Dict, bud_filename: str) -> Dict:
     return {"template": template}
 
 
-def main():
-    parser = argparse.ArgumentParser(
-        description="Convert EDV output to API-compatible format. "
-                    "Use --schema to inject rules into an existing schema, "
-                    "or omit it for legacy full-build mode."
-    )
-    parser.add_argument(
-        "--schema",
-        help="Existing API schema JSON with empty formFillRules (inject mode)"
-    )
-    parser.add_argument(
-        "--rules", "--input",
-        dest="input",
-        default="output/edv_rules/all_panels_edv.json",
-        help="Input EDV rules JSON file (default: output/edv_rules/all_panels_edv.json)"
-    )
-    parser.add_argument(
-        "--output",
-        default="documents/json_output/vendor_creation_generated.json",
-        help="Output API JSON file (default: documents/json_output/vendor_creation_generated.json)"
-    )
-    parser.add_argument(
-        "--bud-name",
-        default="Vendor Creation",
-        help="BUD document name for template naming (legacy mode only)"
-    )
-    parser.add_argument(
-        "--pretty",
-        action="store_true",
-        help="Pretty print JSON output"
-    )
+def run_conversion(input_file: str, output_file: str, schema_file: str = None,
+                   bud_name: str = "Vendor Creation", pretty: bool = False) -> Dict:
+    """
+    Convert one EDV rules file and write the API JSON.
 
-    args = parser.parse_args()
+    Args:
+        input_file: EDV rules JSON (dispatcher output)
+        output_file: Output API JSON path
+        schema_file: Existing API schema to inject into (inject mode); None builds
+            the template from scratch (legacy mode)
+        bud_name: BUD document name for template naming (legacy mode only)
+        pretty: Pretty print the output
+
+    Returns:
+        Job stats: mode, panels, fields, edv_rules, metadatas, rules_written and
+        load/convert/write seconds
 
+    Raises:
+        FileNotFoundError: If the rules or schema file does not exist
+    """
     # Validate EDV rules input
-    input_path = Path(args.input)
-    if not input_path.exists():
-        print(f"Error: Input file not found: {args.input}", file=sys.stderr)
-        sys.exit(1)
+    if not Path(input_file).exists():
+        raise FileNotFoundError(f"Input file not found: {input_file}")
+    if schema_file and not Path(schema_file).exists():
+        raise FileNotFoundError(f"Schema file not found: {schema_file}")
+
+    start = time.perf_counter()
 
     # Read EDV rules
-    print(f"Reading EDV rules: {args.input}")
-    with open(args.input, 'r') as f:
-        edv_data = json.load(f)
+    print(f"Reading EDV rules: {input_file}")
+    edv_data = json_io.load(input_file)
 
     print(f"Found {len(edv_data)} panels")
     total_fields = sum(len(fields) for fields in edv_data.values())
@@ -976,30 +1092,26 @@ def main():
     )
     print(f"Total fields: {total_fields}, Total rules: {total_edv_rules}")
 
-    if args.schema:
+    if schema_file:
         # --- Inject mode: merge rules into existing schema ---
-        schema_path = Path(args.schema)
-        if not schema_path.exists():
-            print(f"Error: Schema file not found: {args.schema}", file=sys.stderr)
-            sys.exit(1)
-
-        print(f"Reading schema: {args.schema}")
-        with open(args.schema, 'r') as f:
-            schema_data = json.load(f)
+        print(f"Reading schema: {schema_file}")
+        schema_data = json_io.load(schema_file)
 
         schema_fields = len(schema_data['template']['documentTypes'][0]['formFillMetadatas'])
         print(f"Schema fields: {schema_fields}")
+        loaded = time.perf_counter()
 
         print("\nInjecting rules into schema...")
         api_data, stats = inject_rules_into_schema(schema_data, edv_data)
+        converted = time.perf_counter()
 
         # Print inject-mode summary
         print("\n" + "="*70)
         print("INJECTION COMPLETE")
         print("="*70)
-        print(f"Schema:  {args.schema}")
-        print(f"Rules:   {args.input}")
-        print(f"Output:  {args.output}")
+        print(f"Schema:  {schema_file}")
+        print(f"Rules:   {input_file}")
+        print(f"Output:  {output_file}")
         print(f"\nResults:")
         print(f"  Schema fields:          {stats['total_schema_fields']}")
         print(f"  EDV fields matched:     {stats['fields_matched']}")
@@ -1011,17 +1123,23 @@ def main():
             for name in stats['fields_unmatched']:
                 print(f"    - {name}")
         print("="*70)
+
+        metadatas = stats['total_schema_fields']
+        total_rules = stats['total_rules_injected']
     else:
+        loaded = time.perf_counter()
+
         # --- Legacy mode: build from scratch ---
         print("\nConverting to API format (legacy mode)...")
-        api_data = convert_edv_to_api_format(edv_data, args.bud_name)
+        api_data = convert_edv_to_api_format(edv_data, bud_name)
+        converted = time.perf_counter()
 
         # Print legacy-mode summary
         print("\n" + "="*70)
         print("CONVERSION COMPLETE")
         print("="*70)
-        print(f"Input:  {args.input}")
-        print(f"Output: {args.output}")
+        print(f"Input:  {input_file}")
+        print(f"Output: {output_file}")
         print(f"\nTemplate Details:")
         print(f"  Name: {api_data['template']['templateName']}")
         print(f"  Code: {api_data['template']['code']}")
@@ -1044,16 +1162,240 @@ def main():
         print(f"  EDV Rules w/ Params: {edv_rules}")
         print("="*70)
 
+        metadatas = len(doc_type['formFillMetadatas'])
+
     # Write output
-    output_path = Path(args.output)
+    output_path = Path(output_file)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    print(f"\nWriting output: {args.output}")
-    with open(args.output, 'w') as f:
-        if args.pretty:
-            json.dump(api_data, f, indent=2)
+    print(f"\nWriting output: {output_file}")
+    json_io.dump_streaming(api_data, output_path, json_io.FORM_FILL_METADATAS_PATH, pretty=pretty)
+    written = time.perf_counter()
+
+    return {
+        'mode': 'inject' if schema_file else 'legacy',
+        'panels': len(edv_data),
+        'fields': total_fields,
+        'edv_rules': total_edv_rules,
+        'metadatas': metadatas,
+        'rules_written': total_rules,
+        'load_seconds': loaded - start,
+        'convert_seconds': converted - loaded,
+        'write_seconds': written - converted,
+    }
+
+
+# ── Batch mode ──────────────────────────────────────────────────────────────
+
+def load_batch_manifest(manifest_file: str) -> List[Dict]:
+    """
+    Read a batch manifest.
+
+    The manifest is a JSON list of jobs, or {"jobs": [...]}. Each job has
+    "rules" and "output", plus optional "schema" (inject mode), "bud_name"
+    (legacy mode), "pretty" and "name" (label in the summary table; defaults
+    to the output file stem). Relative paths are resolved against the
+    manifest's directory, as in the eval and orchestrator batch manifests.
+
+    Args:
+        manifest_file: Manifest JSON path
+
+    Returns:
+        List of job dicts with absolute rules/schema/output paths
+
+    Raises:
+        ValueError: If the manifest is malformed
+    """
+    raw = json_io.load(manifest_file)
+    jobs = raw.get('jobs') if isinstance(raw, dict) else raw
+    if not isinstance(jobs, list):
+        raise ValueError("Manifest must be a list of jobs or {\"jobs\": [...]}")
+
+    base_dir = Path(manifest_file).resolve().parent
+    for i, job in enumerate(jobs, 1):
+        if not isinstance(job, dict) or not job.get('rules') or not job.get('output'):
+            raise ValueError(f"Manifest job {i} needs 'rules' and 'output'")
+        for key in ('rules', 'schema', 'output'):
+            if job.get(key):
+                job[key] = os.path.normpath(base_dir / job[key])
+        job.setdefault('name', Path(job['output']).stem)
+
+    outputs = [str(Path(job['output']).resolve()) for job in jobs]
+    if len(set(outputs)) != len(outputs):
+        raise ValueError("Manifest jobs must write to distinct output files")
+
+    return jobs
+
+
+def _init_batch_worker(rule_schemas: Dict[str, Dict]) -> None:
+    """Pool initializer: reuse the parent's Rule-Schemas.json lookup."""
+    global _rule_schemas_cache
+    _rule_schemas_cache = rule_schemas
+
+
+def _run_batch_job(job: Dict, pretty: bool) -> Dict:
+    """Run one manifest job in a worker, capturing its console output."""
+    log = io.StringIO()
+    start = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(log):
+            stats = run_conversion(
+                job['rules'], job['output'],
+                schema_file=job.get('schema'),
+                bud_name=job.get('bud_name', "Vendor Creation"),
+                pretty=job.get('pretty', pretty),
+            )
+        result = {'status': 'success', **stats}
+    except Exception as e:
+        result = {'status': 'failed', 'error': f"{type(e).__name__}: {e}", 'log': log.getvalue()}
+
+    result['name'] = job['name']
+    result['output'] = job['output']
+    result['total_seconds'] = time.perf_counter() - start
+    return result
+
+
+def run_batch(manifest_file: str, workers: int = None, pretty: bool = False) -> List[Dict]:
+    """
+    Run every conversion in a manifest on a process pool.
+
+    Rule-Schemas.json is loaded once here and handed to each worker, instead
+    of every conversion reloading it.
+
+    Args:
+        manifest_file: Manifest JSON path (see load_batch_manifest)
+        workers: Worker processes (default: CPU count, at most one per job)
+        pretty: Pretty print outputs unless a job sets "pretty" itself
+
+    Returns:
+        Per-job results in manifest order
+    """
+    jobs = load_batch_manifest(manifest_file)
+    if not jobs:
+        print("Manifest has no jobs")
+        return []
+
+    workers = max(1, min(workers or os.cpu_count() or 1, len(jobs)))
+    rule_schemas = get_rule_schemas()
+
+    print(f"Batch: {len(jobs)} jobs from {manifest_file}, {workers} workers")
+    start = time.perf_counter()
+
+    results = [None] * len(jobs)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_batch_worker,
+                             initargs=(rule_schemas,)) as pool:
+        futures = {pool.submit(_run_batch_job, job, pretty): i for i, job in enumerate(jobs)}
+        for future in as_completed(futures):
+            i = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                # The worker itself died (e.g. killed); report it like a failed job
+                result = {'status': 'failed', 'error': f"{type(e).__name__}: {e}",
+                          'name': jobs[i]['name'], 'output': jobs[i]['output'], 'total_seconds': 0.0}
+            results[i] = result
+            mark = "✓" if result['status'] == 'success' else "✗"
+            print(f"  {mark} {result['name']} ({result['total_seconds']:.2f}s)")
+
+    elapsed = time.perf_counter() - start
+    print_batch_summary(results, elapsed, workers)
+    return results
+
+
+def print_batch_summary(results: List[Dict], elapsed: float, workers: int) -> None:
+    """Print the per-job timing and stats table for a batch run."""
+    print("\n" + "="*100)
+    print("BATCH CONVERSION COMPLETE")
+    print("="*100)
+    print(f"{'Job':<32} {'Mode':<7} {'Panels':>6} {'Fields':>6} {'Rules':>6} "
+          f"{'Load s':>7} {'Conv s':>7} {'Write s':>7} {'Total s':>7}  Status")
+    print("-"*100)
+    for r in results:
+        if r['status'] == 'success':
+            print(f"{r['name'][:32]:<32} {r['mode']:<7} {r['panels']:>6} {r['metadatas']:>6} "
+                  f"{r['rules_written']:>6} {r['load_seconds']:>7.2f} {r['convert_seconds']:>7.2f} "
+                  f"{r['write_seconds']:>7.2f} {r['total_seconds']:>7.2f}  ok")
         else:
-            json.dump(api_data, f)
+            print(f"{r['name'][:32]:<32} {'':<7} {'':>6} {'':>6} {'':>6} {'':>7} {'':>7} {'':>7} "
+                  f"{r['total_seconds']:>7.2f}  FAILED")
+    print("-"*100)
+
+    succeeded = [r for r in results if r['status'] == 'success']
+    busy = sum(r['total_seconds'] for r in results)
+    print(f"Jobs: {len(succeeded)}/{len(results)} succeeded, "
+          f"{sum(r['rules_written'] for r in succeeded)} rules written")
+    print(f"Wall time: {elapsed:.2f}s with {workers} workers "
+          f"(sum of job times {busy:.2f}s)")
+
+    for r in results:
+        if r['status'] != 'success':
+            print(f"\nFAILED {r['name']}: {r['error']}")
+            if r.get('log'):
+                print(r['log'].rstrip())
+    print("="*100)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Convert EDV output to API-compatible format. "
+                    "Use --schema to inject rules into an existing schema, "
+                    "or omit it for legacy full-build mode. "
+                    "Use --batch to run many conversions from a manifest."
+    )
+    parser.add_argument(
+        "--schema",
+        help="Existing API schema JSON with empty formFillRules (inject mode)"
+    )
+    parser.add_argument(
+        "--rules", "--input",
+        dest="input",
+        default="output/edv_rules/all_panels_edv.json",
+        help="Input EDV rules JSON file (default: output/edv_rules/all_panels_edv.json)"
+    )
+    parser.add_argument(
+        "--output",
+        default="documents/json_output/vendor_creation_generated.json",
+        help="Output API JSON file (default: documents/json_output/vendor_creation_generated.json)"
+    )
+    parser.add_argument(
+        "--bud-name",
+        default="Vendor Creation",
+        help="BUD document name for template naming (legacy mode only)"
+    )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Pretty print JSON output"
+    )
+    parser.add_argument(
+        "--batch",
+        metavar="MANIFEST",
+        help="Manifest JSON of {rules, schema, output} jobs to convert in parallel "
+             "(--schema/--rules/--output/--bud-name are ignored)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for --batch (default: CPU count)"
+    )
+
+    args = parser.parse_args()
+
+    if args.batch:
+        try:
+            results = run_batch(args.batch, workers=args.workers, pretty=args.pretty)
+        except (OSError, ValueError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        sys.exit(0 if all(r['status'] == 'success' for r in results) else 1)
+
+    try:
+        run_conversion(args.input, args.output, schema_file=args.schema,
+                       bud_name=args.bud_name, pretty=args.pretty)
+    except FileNotFoundError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
 
     print("Done!")
 
@@ -16,6 +16,15 @@ import re
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from agent_backend import agent_command
+from agent_governor import agent_slot, estimate_tokens, format_queue_wait_summary
+from agent_runner import run_agent, format_runner_summary
+from panel_checkpoint import PanelCheckpoint, add_resume_argument, compute_input_hash
+
+# Shared JSON I/O from the project root
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from common import json_io
+
 
 PROJECT_ROOT = str(Path(__file__).parent.parent.parent)
 
@@ -38,13 +47,14 @@ def query_context_usage(panel_name: str, agent_name: str) -> Optional[str]:
     )
 
     try:
-        process = subprocess.run(
-            ["claude", "--continue", "-p", usage_prompt],
-            capture_output=True,
-            text=True,
-            timeout=30,
-            cwd=PROJECT_ROOT
-        )
+        with agent_slot(label=panel_name):
+            process = subprocess.run(
+                agent_command(["claude", "--continue", "-p", usage_prompt]),
+                capture_output=True,
+                text=True,
+                timeout=30,
+                cwd=PROJECT_ROOT
+            )
 
         if process.returncode == 0 and process.stdout.strip():
             return process.stdout.strip()
@@ -104,8 +114,7 @@ def call_derivation_logic_mini_agent(panel_fields: List[Dict],
     log_file = temp_dir / f"{safe_panel_name}_derivation_log.txt"
 
     # Write fields to temp file
-    with open(fields_input_file, 'w') as f:
-        json.dump(panel_fields, f, indent=2)
+    json_io.dump(panel_fields, fields_input_file, pretty=True)
 
     prompt = f"""Process fields for panel "{panel_name}".
 
@@ -156,30 +165,17 @@ Write a JSON array to: {output_file}
         print('='*70)
 
         # Call claude -p with the Derivation Logic mini agent
-        process = subprocess.Popen(
-            [
-                "claude",
-                "-p", prompt,
-                "--agent", "mini/06_derivation_agent",
-                "--allowedTools", "Read,Write"
-            ],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1,
-            cwd=PROJECT_ROOT
+        run = run_agent(
+            prompt,
+            output_file,
+            agent="mini/06_derivation_agent",
+            label=panel_name,
+            extra_output_files=[log_file],
+            estimated_tokens=estimate_tokens(prompt, fields_input_file),
         )
 
-        # Collect output
-        output_lines = []
-        for line in process.stdout:
-            print(line, end='', flush=True)
-            output_lines.append(line)
-
-        process.wait()
-
-        if process.returncode != 0:
-            print(f"  Mini agent failed with exit code: {process.returncode}", file=sys.stderr)
+        if run.returncode != 0:
+            print(f"  Mini agent failed with exit code: {run.returncode}", file=sys.stderr)
             return None
 
         # Query context usage from the agent session
@@ -194,8 +190,7 @@ Write a JSON array to: {output_file}
         # Read output file
         if output_file.exists():
             try:
-                with open(output_file, 'r') as f:
-                    result = json.load(f)
+                result = json_io.load(output_file)
                 print(f"  Panel '{panel_name}' completed - {len(result)} fields processed")
                 return result
             except json.JSONDecodeError as e:
@@ -229,6 +224,7 @@ def main():
         default="output/derivation_logic/all_panels_derivation.json",
         help="Output file for all panels (default: output/derivation_logic/all_panels_derivation.json)"
     )
+    add_resume_argument(parser)
 
     args = parser.parse_args()
 
@@ -246,8 +242,7 @@ def main():
 
     # Load Conditional Logic agent output
     print(f"Loading Conditional Logic agent output: {args.conditional_logic_output}")
-    with open(args.conditional_logic_output, 'r') as f:
-        conditional_data = json.load(f)
+    conditional_data = json_io.load(args.conditional_logic_output)
 
     print(f"Found {len(conditional_data)} panels in input")
 
@@ -261,6 +256,7 @@ def main():
     skipped_panels = 0
     total_fields_processed = 0
     all_results = {}
+    checkpoint = PanelCheckpoint(output_file, resume=args.resume)
 
     for panel_name, panel_fields in conditional_data.items():
         if not panel_fields:
@@ -273,6 +269,14 @@ def main():
 
         print(f"\nPanel '{panel_name}': {len(panel_fields)} fields, {total_rules} existing rules, ~{estimated_derivations} may have derivation logic")
 
+        input_hash = compute_input_hash(panel_fields)
+        cached = checkpoint.get(panel_name, input_hash)
+        if cached is not None:
+            successful_panels += 1
+            total_fields_processed += len(cached)
+            all_results[panel_name] = cached
+            continue
+
         # Call Derivation Logic mini agent
         result = call_derivation_logic_mini_agent(
             panel_fields,
@@ -291,11 +295,12 @@ def main():
             total_fields_processed += len(panel_fields)
             print(f"  Panel '{panel_name}' failed - using original data", file=sys.stderr)
 
+        checkpoint.record(panel_name, input_hash, all_results.get(panel_name), success=bool(result))
+
     # Write all results to single output file
     if all_results:
         print(f"\nWriting all results to: {output_file}")
-        with open(output_file, 'w') as f:
-            json.dump(all_results, f, indent=2)
+        json_io.dump(all_results, output_file)
         print(f"Successfully wrote {len(all_results)} panels to output file")
 
     # Print final summary
@@ -307,6 +312,9 @@ def main():
     print(f"Failed: {failed_panels}")
     print(f"Skipped (empty): {skipped_panels}")
     print(f"Total Fields Processed: {total_fields_processed}")
+    print(f"Restored from Checkpoint: {checkpoint.reused_panels}")
+    print(format_queue_wait_summary())
+    print(format_runner_summary())
     print(f"Output File: {output_file}")
     print("="*70)
 
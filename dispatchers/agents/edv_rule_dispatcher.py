@@ -20,9 +20,15 @@ from pathlib import Path
 from typing import Dict, List, Optional, Set
 from collections import defaultdict
 
+from agent_backend import agent_command
+from agent_governor import agent_slot, estimate_tokens, format_queue_wait_summary
+from agent_runner import run_agent, format_runner_summary
+from panel_checkpoint import PanelCheckpoint, add_resume_argument, compute_input_hash
+
 # Import doc_parser
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from doc_parser import DocumentParser
+from common import json_io
 
 PROJECT_ROOT = str(Path(__file__).parent.parent.parent)
 
@@ -45,13 +51,14 @@ def query_context_usage(panel_name: str, agent_name: str) -> Optional[str]:
     )
 
     try:
-        process = subprocess.run(
-            ["claude", "--continue", "-p", usage_prompt],
-            capture_output=True,
-            text=True,
-            timeout=30,
-            cwd=PROJECT_ROOT
-        )
+        with agent_slot(label=panel_name):
+            process = subprocess.run(
+                agent_command(["claude", "--continue", "-p", usage_prompt]),
+                capture_output=True,
+                text=True,
+                timeout=30,
+                cwd=PROJECT_ROOT
+            )
 
         if process.returncode == 0 and process.stdout.strip():
             return process.stdout.strip()
@@ -212,12 +219,10 @@ def call_edv_mini_agent(panel_fields: List[Dict], reference_tables: List[Dict],
     output_file = temp_dir / f"{safe_panel_name}_edv_output.json"
 
     # Write fields to temp file
-    with open(fields_input_file, 'w') as f:
-        json.dump(panel_fields, f, indent=2)
+    json_io.dump(panel_fields, fields_input_file, pretty=True)
 
     # Write reference tables to temp file
-    with open(tables_input_file, 'w') as f:
-        json.dump(reference_tables, f, indent=2)
+    json_io.dump(reference_tables, tables_input_file, pretty=True)
 
     prompt = f"""Process fields for panel "{panel_name}" and populate EDV rule parameters.
 
@@ -305,30 +310,16 @@ IMPORTANT:
         print('='*70)
 
         # Call claude -p with the EDV mini agent
-        process = subprocess.Popen(
-            [
-                "claude",
-                "-p", prompt,
-                "--agent", "mini/03_edv_rule_agent_v2",
-                "--allowedTools", "Read,Write"
-            ],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1,
-            cwd=str(Path(__file__).parent.parent.parent)
+        run = run_agent(
+            prompt,
+            output_file,
+            agent="mini/03_edv_rule_agent_v2",
+            label=panel_name,
+            estimated_tokens=estimate_tokens(prompt, fields_input_file, tables_input_file),
         )
 
-        # Collect output
-        output_lines = []
-        for line in process.stdout:
-            print(line, end='', flush=True)
-            output_lines.append(line)
-
-        process.wait()
-
-        if process.returncode != 0:
-            print(f"✗ EDV mini agent failed with exit code: {process.returncode}", file=sys.stderr)
+        if run.returncode != 0:
+            print(f"✗ EDV mini agent failed with exit code: {run.returncode}", file=sys.stderr)
             return None
 
         # Query context usage from the agent session
@@ -343,8 +334,7 @@ IMPORTANT:
         # Read output file
         if output_file.exists():
             try:
-                with open(output_file, 'r') as f:
-                    result = json.load(f)
+                result = json_io.load(output_file)
                 print(f"✓ Panel '{panel_name}' completed - {len(result)} fields processed")
                 return result
             except json.JSONDecodeError as e:
@@ -383,6 +373,7 @@ def main():
         default="output/edv_rules/all_panels_edv.json",
         help="Output file for all panels (default: output/edv_rules/all_panels_edv.json)"
     )
+    add_resume_argument(parser)
 
     args = parser.parse_args()
 
@@ -421,8 +412,7 @@ def main():
 
     # Step 3: Load source-destination agent output
     print(f"\nLoading source-destination output: {args.source_dest_output}")
-    with open(args.source_dest_output, 'r') as f:
-        source_dest_data = json.load(f)
+    source_dest_data = json_io.load(args.source_dest_output)
 
     print(f"Found {len(source_dest_data)} panels in input")
 
@@ -436,6 +426,7 @@ def main():
     skipped_panels = 0
     total_fields_processed = 0
     all_results = {}
+    checkpoint = PanelCheckpoint(output_file, resume=args.resume)
 
     for panel_name, panel_fields in source_dest_data.items():
         if not panel_fields:
@@ -454,6 +445,14 @@ def main():
                 ref_id = table.get('reference_id', 'unknown')
                 print(f"    - {ref_id}")
 
+        input_hash = compute_input_hash(panel_fields, referenced_tables)
+        cached = checkpoint.get(panel_name, input_hash)
+        if cached is not None:
+            successful_panels += 1
+            total_fields_processed += len(cached)
+            all_results[panel_name] = cached
+            continue
+
         # Call EDV mini agent
         result = call_edv_mini_agent(
             panel_fields,
@@ -470,11 +469,12 @@ def main():
             failed_panels += 1
             print(f"✗ Panel '{panel_name}' failed", file=sys.stderr)
 
+        checkpoint.record(panel_name, input_hash, all_results.get(panel_name), success=bool(result))
+
     # Step 5: Write all results to single output file
     if all_results:
         print(f"\nWriting all results to: {output_file}")
-        with open(output_file, 'w') as f:
-            json.dump(all_results, f, indent=2)
+        json_io.dump(all_results, output_file)
         print(f"✓ Successfully wrote {len(all_results)} panels to output file")
 
     # Print final summary
@@ -486,7 +486,10 @@ def main():
     print(f"Failed: {failed_panels}")
     print(f"Skipped: {skipped_panels}")
     print(f"Total Fields Processed: {total_fields_processed}")
+    print(f"Restored from Checkpoint: {checkpoint.reused_panels}")
     print(f"Total Reference Tables: {len(all_reference_tables)}")
+    print(format_queue_wait_summary())
+    print(format_runner_summary())
     print(f"Output File: {output_file}")
     print("="*70)
 
@@ -16,9 +16,14 @@ import json
 import subprocess
 import sys
 import re
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+from agent_backend import agent_command
+from agent_governor import agent_slot, estimate_tokens, format_queue_wait_summary
+from agent_runner import run_agent, format_runner_summary
+from panel_checkpoint import PanelCheckpoint, add_resume_argument, compute_input_hash
 from inter_panel_utils import (
     detect_referenced_panels,
     get_referenced_panel_fields,
@@ -29,6 +34,10 @@ from inter_panel_utils import (
     _merge_rules_into_panel,
 )
 
+# Shared JSON I/O from the project root
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from common import json_io
+
 
 PROJECT_ROOT = str(Path(__file__).parent.parent.parent)
 
@@ -47,13 +56,14 @@ def query_context_usage(panel_name: str, agent_name: str) -> Optional[str]:
     )
 
     try:
-        process = subprocess.run(
-            ["claude", "--continue", "-p", usage_prompt],
-            capture_output=True,
-            text=True,
-            timeout=30,
-            cwd=PROJECT_ROOT
-        )
+        with agent_slot(label=panel_name):
+            process = subprocess.run(
+                agent_command(["claude", "--continue", "-p", usage_prompt]),
+                capture_output=True,
+                text=True,
+                timeout=30,
+                cwd=PROJECT_ROOT
+            )
 
         if process.returncode == 0 and process.stdout.strip():
             return process.stdout.strip()
@@ -130,13 +140,14 @@ Examples:
     detect_output_file = temp_dir / f"{safe_panel_name}_detect_refs.json"
 
     try:
-        process = subprocess.run(
-            ["claude", "-p", prompt, "--allowedTools", ""],
-            capture_output=True,
-            text=True,
-            timeout=60,
-            cwd=PROJECT_ROOT
-        )
+        with agent_slot(estimate_tokens(prompt), label=panel_name):
+            process = subprocess.run(
+                agent_command(["claude", "-p", prompt, "--allowedTools", ""]),
+                capture_output=True,
+                text=True,
+                timeout=60,
+                cwd=PROJECT_ROOT
+            )
 
         if process.returncode != 0:
             print(f"  LLM detection failed (exit {process.returncode}), falling back to regex", file=sys.stderr)
@@ -209,8 +220,7 @@ def call_inter_panel_mini_agent(panel_fields: List[Dict],
     log_file = temp_dir / f"{safe_panel_name}_inter_panel_log.txt"
 
     # Write input files
-    with open(fields_input_file, 'w') as f:
-        json.dump(panel_fields, f, indent=2)
+    json_io.dump(panel_fields, fields_input_file, pretty=True)
 
     write_referenced_panels_file(referenced_data, referenced_file)
 
@@ -263,29 +273,17 @@ Write JSON to the three output files listed above.
         print(f"  Referenced fields: {referenced_field_counts}")
         print('='*70)
 
-        process = subprocess.Popen(
-            [
-                "claude",
-                "-p", prompt,
-                "--agent", "mini/09_inter_panel_agent",
-                "--allowedTools", "Read,Write"
-            ],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1,
-            cwd=PROJECT_ROOT
+        run = run_agent(
+            prompt,
+            output_file,
+            agent="mini/09_inter_panel_agent",
+            label=panel_name,
+            extra_output_files=[inter_panel_output_file, delegation_output_file, log_file],
+            estimated_tokens=estimate_tokens(prompt, fields_input_file, referenced_file),
         )
 
-        output_lines = []
-        for line in process.stdout:
-            print(line, end='', flush=True)
-            output_lines.append(line)
-
-        process.wait()
-
-        if process.returncode != 0:
-            print(f"  Mini agent failed with exit code: {process.returncode}", file=sys.stderr)
+        if run.returncode != 0:
+            print(f"  Mini agent failed with exit code: {run.returncode}", file=sys.stderr)
             return None, None, None
 
         # Query context usage
@@ -301,8 +299,7 @@ Write JSON to the three output files listed above.
         result = None
         if output_file.exists():
             try:
-                with open(output_file, 'r') as f:
-                    result = json.load(f)
+                result = json_io.load(output_file)
                 print(f"  Main output: {len(result)} fields")
             except json.JSONDecodeError as e:
                 print(f"  Failed to parse main output JSON: {e}", file=sys.stderr)
@@ -322,8 +319,7 @@ Write JSON to the three output files listed above.
         delegations = None
         if delegation_output_file.exists():
             try:
-                with open(delegation_output_file, 'r') as f:
-                    delegations = json.load(f)
+                delegations = json_io.load(delegation_output_file)
                 if isinstance(delegations, list) and delegations:
                     print(f"  Delegations: {len(delegations)} complex references")
                 else:
@@ -348,7 +344,8 @@ Write JSON to the three output files listed above.
 def call_specialized_agent(delegation: Dict,
                             all_results: Dict[str, List[Dict]],
                             input_data: Dict[str, List[Dict]],
-                            temp_dir: Path) -> Optional[Tuple[str, List[Dict]]]:
+                            temp_dir: Path,
+                            index: int = 0) -> Optional[Tuple[str, List[Dict]]]:
     """
     Call a specialized agent (derivation, EDV, clearing) for a delegated cross-panel reference.
 
@@ -357,6 +354,8 @@ def call_specialized_agent(delegation: Dict,
         all_results: Current pipeline results (panel -> fields)
         input_data: Original input data
         temp_dir: Directory for temp files
+        index: Delegation number, part of the temp file names so delegations
+            whose panel names sanitize alike don't share files
 
     Returns:
         Tuple of (target_panel, inter_panel_rules_list) or None on failure
@@ -395,7 +394,7 @@ def call_specialized_agent(delegation: Dict,
         print(f"  Delegation target field '{target_field}' not found in panel '{target_panel}'", file=sys.stderr)
         return None
 
-    safe_name = re.sub(r'[^\w\-]', '_', f"{source_panel}_{target_panel}_{delegation_type}")
+    safe_name = re.sub(r'[^\w\-]', '_', f"{index}_{source_panel}_{target_panel}_{delegation_type}")
     delegation_input = temp_dir / f"delegation_{safe_name}_input.json"
     delegation_output = temp_dir / f"delegation_{safe_name}_output.json"
     delegation_log = temp_dir / f"delegation_{safe_name}_log.txt"
@@ -406,8 +405,7 @@ def call_specialized_agent(delegation: Dict,
         targeted_fields.append(source_field_entry)
     targeted_fields.append(target_field_entry)
 
-    with open(delegation_input, 'w') as f_out:
-        json.dump(targeted_fields, f_out, indent=2)
+    json_io.dump(targeted_fields, delegation_input, pretty=True)
 
     # Select agent based on delegation type
     if delegation_type == 'derivation':
@@ -496,33 +494,22 @@ Write JSON array to: {delegation_output}
         print(f"\n  --- Delegation: {agent_label} ({source_panel} -> {target_panel}) ---")
         print(f"  Source: {source_field}, Target: {target_field}")
 
-        process = subprocess.Popen(
-            [
-                "claude",
-                "-p", prompt,
-                "--agent", agent_file,
-                "--allowedTools", "Read,Write"
-            ],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1,
-            cwd=PROJECT_ROOT
+        run = run_agent(
+            prompt,
+            delegation_output,
+            agent=agent_file,
+            label=f"{source_panel} -> {target_panel}",
+            extra_output_files=[delegation_log],
+            estimated_tokens=estimate_tokens(prompt, delegation_input),
         )
 
-        for line in process.stdout:
-            print(line, end='', flush=True)
-
-        process.wait()
-
-        if process.returncode != 0:
-            print(f"  Delegation agent failed with exit code: {process.returncode}", file=sys.stderr)
+        if run.returncode != 0:
+            print(f"  Delegation agent failed with exit code: {run.returncode}", file=sys.stderr)
             return None
 
         if delegation_output.exists():
             try:
-                with open(delegation_output, 'r') as f_in:
-                    result_fields = json.load(f_in)
+                result_fields = json_io.load(delegation_output)
 
                 # Extract new rules from the result (rules not in original)
                 new_rules = []
@@ -560,6 +547,126 @@ Write JSON array to: {delegation_output}
         return None
 
 
+def delegation_dependencies(delegations: List[Dict]) -> List[List[int]]:
+    """
+    For each delegation, the earlier delegations it must wait for.
+
+    A delegation writes its target panel and reads its source panel (when the
+    source differs from the target). Delegation i waits for every earlier j
+    that writes a panel i reads or writes, or that reads the panel i writes.
+    Running the delegations in any order that respects these edges gives
+    every agent the same input, and every panel the same merged rules, as
+    running them one by one in Phase 1 order.
+
+    Args:
+        delegations: Delegation records in Phase 1 order
+
+    Returns:
+        One list of 0-based indices of earlier delegations per delegation
+    """
+    def panels(delegation: Dict) -> Tuple[str, Optional[str]]:
+        target = delegation.get('target_panel', '')
+        source = delegation.get('source_panel', '')
+        return target, (source if source != target else None)
+
+    dependencies = []
+    for i, delegation in enumerate(delegations):
+        target, source = panels(delegation)
+        waits = []
+        for j in range(i):
+            earlier_target, earlier_source = panels(delegations[j])
+            if earlier_target in (target, source) or (earlier_source is not None and earlier_source == target):
+                waits.append(j)
+        dependencies.append(waits)
+    return dependencies
+
+
+def run_delegation(index: int,
+                   delegation: Dict,
+                   delegation_count: int,
+                   all_results: Dict[str, List[Dict]],
+                   input_data: Dict[str, List[Dict]],
+                   temp_dir: Path) -> bool:
+    """
+    Run one delegation and merge its rules into the target panel.
+
+    Args:
+        index: 1-based delegation number (for logging)
+
+    Returns:
+        True if the delegation produced rules for an existing target panel
+    """
+    print(f"\n  Delegation {index}/{delegation_count}: "
+          f"{delegation.get('type', '?')} — "
+          f"{delegation.get('source_panel', '?')} -> {delegation.get('target_panel', '?')}")
+
+    result = call_specialized_agent(delegation, all_results, input_data, temp_dir, index)
+    if not result:
+        return False
+
+    target_panel, inter_panel_entries = result
+    if target_panel not in all_results:
+        print(f"  Target panel '{target_panel}' not found in results", file=sys.stderr)
+        return False
+
+    count = _merge_rules_into_panel(
+        all_results[target_panel], inter_panel_entries, target_panel
+    )
+    if count > 0:
+        print(f"  Merged {count} delegated rules into panel '{target_panel}'")
+    return True
+
+
+def run_delegations(delegations: List[Dict],
+                    all_results: Dict[str, List[Dict]],
+                    input_data: Dict[str, List[Dict]],
+                    temp_dir: Path,
+                    max_workers: int = 1) -> List[bool]:
+    """
+    Run Phase 2 delegations, concurrently where they touch disjoint panels.
+
+    With max_workers <= 1 the delegations run one by one in order. Otherwise
+    a delegation starts once all delegations it depends on (see
+    delegation_dependencies) have finished, so the result is identical to
+    the sequential run.
+
+    Returns:
+        Success flag per delegation, in input order
+    """
+    count = len(delegations)
+    if max_workers <= 1:
+        return [run_delegation(i + 1, d, count, all_results, input_data, temp_dir)
+                for i, d in enumerate(delegations)]
+
+    dependencies = delegation_dependencies(delegations)
+    waiting = {i: set(deps) for i, deps in enumerate(dependencies)}
+    dependents: Dict[int, List[int]] = {i: [] for i in range(count)}
+    for i, deps in enumerate(dependencies):
+        for j in deps:
+            dependents[j].append(i)
+
+    outcomes: List[Optional[bool]] = [None] * count
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        running = {}
+
+        def submit_ready():
+            for i in sorted(i for i, deps in waiting.items() if not deps):
+                del waiting[i]
+                running[executor.submit(run_delegation, i + 1, delegations[i], count,
+                                        all_results, input_data, temp_dir)] = i
+
+        submit_ready()
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                i = running.pop(future)
+                outcomes[i] = future.result()
+                for dependent in dependents[i]:
+                    waiting[dependent].discard(i)
+            submit_ready()
+    return outcomes
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Inter-Panel Cross-Panel Rules Dispatcher - Handle cross-panel field references"
@@ -579,6 +686,13 @@ def main():
         default="output/inter_panel/all_panels_inter_panel.json",
         help="Output file (default: output/inter_panel/all_panels_inter_panel.json)"
     )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=4,
+        help="Max concurrent Phase 2 delegation agents, 1 runs them in order (default: 4)"
+    )
+    add_resume_argument(parser)
 
     args = parser.parse_args()
 
@@ -600,8 +714,7 @@ def main():
 
     # Load input data
     print(f"Loading Clear Child Fields output: {args.clear_child_output}")
-    with open(args.clear_child_output, 'r') as f:
-        input_data = json.load(f)
+    input_data = json_io.load(args.clear_child_output)
 
     all_panel_names = list(input_data.keys())
     print(f"Found {len(input_data)} panels: {', '.join(all_panel_names)}")
@@ -620,6 +733,9 @@ def main():
     all_results = {}
     all_delegations = []
     deferred_rules: Dict[str, List[Dict]] = {}
+    # Phase 1 checkpoints store the raw agent outputs, not the merged panel:
+    # on resume the deterministic merges below are replayed in panel order.
+    checkpoint = PanelCheckpoint(output_file, resume=args.resume)
 
     for panel_name, panel_fields in input_data.items():
         if not panel_fields:
@@ -631,7 +747,12 @@ def main():
         # Detect cross-panel references using LLM pre-scan (with regex fallback)
         print(f"\nPanel '{panel_name}': {len(panel_fields)} fields — scanning for cross-panel references...")
 
-        llm_refs = detect_cross_panel_refs_with_llm(panel_fields, panel_name, all_panel_names, temp_dir)
+        input_hash = compute_input_hash(panel_fields, all_panel_names)
+        cached = checkpoint.get(panel_name, input_hash)
+        if cached is not None:
+            llm_refs = cached['llm_refs']
+        else:
+            llm_refs = detect_cross_panel_refs_with_llm(panel_fields, panel_name, all_panel_names, temp_dir)
 
         if llm_refs is not None:
             # LLM detection succeeded
@@ -649,6 +770,8 @@ def main():
             # Apply any deferred rules from earlier panels
             apply_deferred_rules(deferred_rules, panel_name, all_results[panel_name])
             total_fields_processed += len(panel_fields)
+            if cached is None:
+                checkpoint.record(panel_name, input_hash, {'llm_refs': llm_refs})
             continue
 
         print(f"  Cross-panel references detected ({detection_method}): "
@@ -657,10 +780,23 @@ def main():
         # Get referenced panel data
         referenced_data = get_referenced_panel_fields(referenced_panels, input_data, all_results)
 
-        # Call inter-panel mini agent
-        result, inter_rules, delegations = call_inter_panel_mini_agent(
-            panel_fields, panel_name, referenced_data, temp_dir
-        )
+        # Call inter-panel mini agent (unless checkpointed with the same referenced data)
+        referenced_hash = compute_input_hash(referenced_data)
+        if cached is not None and cached.get('referenced_hash') == referenced_hash:
+            result = cached['result']
+            inter_rules = cached['inter_rules']
+            delegations = cached['delegations']
+        else:
+            result, inter_rules, delegations = call_inter_panel_mini_agent(
+                panel_fields, panel_name, referenced_data, temp_dir
+            )
+            checkpoint.record(panel_name, input_hash, {
+                'llm_refs': llm_refs,
+                'referenced_hash': referenced_hash,
+                'result': result,
+                'inter_rules': inter_rules,
+                'delegations': delegations,
+            }, success=bool(result))
 
         if result:
             successful_panels += 1
@@ -704,28 +840,12 @@ def main():
         print(f"PHASE 2: PROCESSING {delegation_count} COMPLEX DELEGATIONS")
         print("="*70)
 
-        for i, delegation in enumerate(all_delegations, 1):
-            print(f"\n  Delegation {i}/{delegation_count}: "
-                  f"{delegation.get('type', '?')} — "
-                  f"{delegation.get('source_panel', '?')} -> {delegation.get('target_panel', '?')}")
-
-            result = call_specialized_agent(delegation, all_results, input_data, temp_dir)
-
-            if result:
-                target_panel, inter_panel_entries = result
-                # Merge into all_results
-                if target_panel in all_results:
-                    count = _merge_rules_into_panel(
-                        all_results[target_panel], inter_panel_entries, target_panel
-                    )
-                    if count > 0:
-                        print(f"  Merged {count} delegated rules into panel '{target_panel}'")
-                    delegation_success += 1
-                else:
-                    print(f"  Target panel '{target_panel}' not found in results", file=sys.stderr)
-                    delegation_fail += 1
-            else:
-                delegation_fail += 1
+        max_workers = max(1, args.max_workers)
+        print(f"  {max_workers} workers")
+
+        outcomes = run_delegations(all_delegations, all_results, input_data, temp_dir, max_workers)
+        delegation_success = sum(1 for success in outcomes if success)
+        delegation_fail = len(outcomes) - delegation_success
     else:
         print("\nNo complex delegations to process (Phase 2 skipped)")
 
@@ -733,8 +853,7 @@ def main():
     # Write output
     # ══════════════════════════════════════════════════════════════════════
     print(f"\nWriting all results to: {output_file}")
-    with open(output_file, 'w') as f:
-        json.dump(all_results, f, indent=2)
+    json_io.dump(all_results, output_file)
 
     # Verify field counts
     input_field_count = sum(len(fields) for fields in input_data.values())
@@ -770,6 +889,9 @@ def main():
     else:
         print(f"  OK: Field counts match")
     print(f"Cross-Panel Rules Added: {cross_panel_rule_count}")
+    print(f"Restored from Checkpoint: {checkpoint.reused_panels}")
+    print(format_queue_wait_summary())
+    print(format_runner_summary())
     print(f"Output File: {output_file}")
     print("="*70)
 
@@ -11,9 +11,14 @@ Used by all 8 dispatchers in the rule extraction pipeline.
 
 import json
 import re
+import sys
 from pathlib import Path
 from typing import Dict, List, Optional, Set
 
+# Shared JSON I/O from the project root
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from common import json_io
+
 
 def detect_referenced_panels(panel_fields: List[Dict],
                              all_panel_names: List[str],
@@ -258,8 +263,7 @@ def apply_deferred_rules(deferred_rules: Dict[str, List[Dict]],
 
 def write_referenced_panels_file(data: Dict[str, List[Dict]], path: Path) -> None:
     """Write referenced panel data to a temp JSON file."""
-    with open(path, 'w') as f:
-        json.dump(data, f, indent=2)
+    json_io.dump(data, path, pretty=True)
 
 
 def read_inter_panel_output(path: Path) -> Optional[Dict[str, List[Dict]]]:
@@ -277,8 +281,7 @@ def read_inter_panel_output(path: Path) -> Optional[Dict[str, List[Dict]]]:
         return None
 
     try:
-        with open(path, 'r') as f:
-            data = json.load(f)
+        data = json_io.load(path)
         if isinstance(data, dict) and data:
             return data
         return None
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Per-Panel Checkpointing for Dispatchers
+
+Dispatchers keep every panel's result in memory and write all_panels_*.json
+only after the last panel. This module saves each panel's result as soon as
+it finishes, so a crash or Ctrl-C does not lose completed agent calls.
+
+The checkpoint sits next to the dispatcher output as
+<output stem>.checkpoint.jsonl, with one JSON line per finished panel:
+
+    {"panel": "...", "input_hash": "...", "status": "success", "result": [...]}
+
+Every update writes the existing lines plus the new one to a temp file and
+renames it over the checkpoint. A crash mid-write therefore leaves the
+previous checkpoint intact.
+
+Adding --resume to the dispatcher makes it reuse checkpointed panels. A
+panel is reused only if its status is "success" and its input hash matches
+the current input. Without --resume, the checkpoint is cleared at start.
+
+Usage:
+    checkpoint = PanelCheckpoint(output_file, resume=args.resume)
+
+    for panel_name, panel_fields in input_data.items():
+        input_hash = compute_input_hash(panel_fields)
+        cached = checkpoint.get(panel_name, input_hash)
+        if cached is not None:
+            all_results[panel_name] = cached
+            continue
+        result = call_mini_agent(...)
+        checkpoint.record(panel_name, input_hash, result, success=bool(result))
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+def compute_input_hash(*parts: Any) -> str:
+    """
+    Hash a panel's inputs (panel fields, reference tables, prompt options...).
+
+    Args:
+        *parts: JSON-serializable values that determine the panel's output
+
+    Returns:
+        SHA-256 hex digest of the canonical JSON encoding
+    """
+    encoded = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+
+def add_resume_argument(parser: argparse.ArgumentParser) -> None:
+    """Add the shared --resume flag to a dispatcher's argument parser."""
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip panels already checkpointed with matching input (checkpoint: <output>.checkpoint.jsonl)"
+    )
+
+
+class PanelCheckpoint:
+    """
+    Append-only JSONL checkpoint of finished panels for one dispatcher output.
+
+    Attributes:
+        path: Checkpoint file path
+        resume: Whether checkpointed panels are reused
+        reused_panels: Number of panels served from the checkpoint this run
+    """
+
+    def __init__(self, output_file: Path, resume: bool = False):
+        output_file = Path(output_file)
+        self.path = output_file.with_name(f"{output_file.stem}.checkpoint.jsonl")
+        self.resume = resume
+        self.reused_panels = 0
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict] = {}
+
+        if resume:
+            self._entries = self._load()
+            if self._entries:
+                print(f"Resuming from checkpoint: {self.path} ({len(self._entries)} panels)")
+        elif self.path.exists():
+            self.path.unlink()
+
+    def get(self, panel_name: str, input_hash: str) -> Optional[Any]:
+        """
+        Return the checkpointed result for a panel, if it can be reused.
+
+        Args:
+            panel_name: Panel name
+            input_hash: Hash of the panel's current inputs
+
+        Returns:
+            The stored result, or None if the panel must be (re)processed
+        """
+        if not self.resume:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(panel_name)
+        if not entry or entry.get('status') != 'success' or entry.get('input_hash') != input_hash:
+            return None
+
+        self.reused_panels += 1
+        print(f"  Panel '{panel_name}' restored from checkpoint")
+        return entry.get('result')
+
+    def record(self, panel_name: str, input_hash: str, result: Any, success: bool = True) -> None:
+        """
+        Checkpoint a finished panel (atomically, via temp file + rename).
+
+        Args:
+            panel_name: Panel name
+            input_hash: Hash of the panel's inputs
+            result: Panel result as it goes into all_results
+            success: False when the agent failed and result is a pass-through
+        """
+        entry = {
+            'panel': panel_name,
+            'input_hash': input_hash,
+            'status': 'success' if success else 'failed',
+            'result': result,
+        }
+        line = json.dumps(entry, ensure_ascii=False) + '\n'
+
+        with self._lock:
+            self._entries[panel_name] = entry
+            tmp_path = self.path.with_name(f"{self.path.name}.tmp")
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    existing = f.read()
+            except FileNotFoundError:
+                existing = ''
+            if existing and not existing.endswith('\n'):
+                existing += '\n'
+
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(existing)
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+
+    def _load(self) -> Dict[str, Dict]:
+        """Read the checkpoint; later lines for the same panel win."""
+        entries = {}
+        if not self.path.exists():
+            return entries
+
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line_num, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    print(f"  Warning: ignoring unreadable checkpoint line {line_num} in {self.path}",
+                          file=sys.stderr)
+                    continue
+                if isinstance(entry, dict) and 'panel' in entry:
+                    entries[entry['panel']] = entry
+        return entries
@@ -19,9 +19,16 @@ from pathlib import Path
 from typing import Dict, List, Optional, Set
 from collections import defaultdict
 
+from agent_backend import agent_command
+from agent_governor import agent_slot, estimate_tokens, format_queue_wait_summary
+from agent_runner import run_agent, format_runner_summary
+from panel_checkpoint import PanelCheckpoint, add_resume_argument, compute_input_hash
+
 # Import doc_parser
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from doc_parser import DocumentParser
+from common import json_io
+from common.rule_schema_registry import RuleSchemaRegistry
 
 PROJECT_ROOT = str(Path(__file__).parent.parent.parent)
 
@@ -44,13 +51,14 @@ def query_context_usage(panel_name: str, agent_name: str) -> Optional[str]:
     )
 
     try:
-        process = subprocess.run(
-            ["claude", "--continue", "-p", usage_prompt],
-            capture_output=True,
-            text=True,
-            timeout=30,
-            cwd=PROJECT_ROOT
-        )
+        with agent_slot(label=panel_name):
+            process = subprocess.run(
+                agent_command(["claude", "--continue", "-p", usage_prompt]),
+                capture_output=True,
+                text=True,
+                timeout=30,
+                cwd=PROJECT_ROOT
+            )
 
         if process.returncode == 0 and process.stdout.strip():
             return process.stdout.strip()
@@ -64,8 +72,7 @@ class KeywordTreeMatcher:
 
     def __init__(self, keyword_tree_path: str):
         """Load and compile keyword tree patterns"""
-        with open(keyword_tree_path, 'r') as f:
-            data = json.load(f)
+        data = json_io.load(keyword_tree_path)
 
         self.tree_nodes = data.get('tree', {})
         self._compile_patterns()
@@ -93,19 +100,8 @@ class KeywordTreeMatcher:
 
 def load_rule_schemas(rule_schemas_path: str) -> Dict:
     """Load Rule-Schemas.json and create action->rules mapping"""
-    with open(rule_schemas_path, 'r') as f:
-        schemas = json.load(f)
-
-    # Create mapping of action type to rule names
-    action_to_rules = defaultdict(set)
-
-    for rule in schemas.get('content', []):
-        action = rule.get('action', '')
-        name = rule.get('name', '')
-        if action and name:
-            action_to_rules[action].add(name)
-
-    return dict(action_to_rules)
+    registry = RuleSchemaRegistry.load(rule_schemas_path)
+    return {action: set(names) for action, names in registry.action_to_names.items()}
 
 
 def group_fields_by_panel(parsed_doc) -> Dict[str, List[Dict]]:
@@ -215,8 +211,7 @@ def call_mini_agent(fields_with_logic: List[Dict], rule_names: Set[str],
     }
 
     # Write input to temp file
-    with open(input_file, 'w') as f:
-        json.dump(input_data, f, indent=2)
+    json_io.dump(input_data, input_file, pretty=True)
 
     prompt = f"""Process fields for panel "{panel_name}" and determine which rules apply to each field.
 
@@ -285,30 +280,16 @@ Each field must have:
         print('='*70)
 
         # Call claude -p with the mini agent
-        process = subprocess.Popen(
-            [
-                "claude",
-                "-p", prompt,
-                "--agent", "mini/01_rule_type_placement_agent_v2",
-                "--allowedTools", "Read,Write"
-            ],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1,
-            cwd=str(Path(__file__).parent.parent.parent)
+        run = run_agent(
+            prompt,
+            output_file,
+            agent="mini/01_rule_type_placement_agent_v2",
+            label=panel_name,
+            estimated_tokens=estimate_tokens(prompt, input_file),
         )
 
-        # Collect output
-        output_lines = []
-        for line in process.stdout:
-            print(line, end='', flush=True)
-            output_lines.append(line)
-
-        process.wait()
-
-        if process.returncode != 0:
-            print(f"✗ Mini agent failed with exit code: {process.returncode}", file=sys.stderr)
+        if run.returncode != 0:
+            print(f"✗ Mini agent failed with exit code: {run.returncode}", file=sys.stderr)
             return None
 
         # Query context usage from the agent session
@@ -323,8 +304,7 @@ Each field must have:
         # Read output file
         if output_file.exists():
             try:
-                with open(output_file, 'r') as f:
-                    result = json.load(f)
+                result = json_io.load(output_file)
                 print(f"✓ Panel '{panel_name}' completed - {len(result)} fields processed")
                 return result
             except json.JSONDecodeError as e:
@@ -368,6 +348,7 @@ def main():
         default="output/rule_placement/all_panels_rules.json",
         help="Output file for all panels (default: output/rule_placement/all_panels_rules.json)"
     )
+    add_resume_argument(parser)
 
     args = parser.parse_args()
 
@@ -405,6 +386,7 @@ def main():
     failed_panels = 0
     total_fields_processed = 0
     all_results = {}
+    checkpoint = PanelCheckpoint(output_file, resume=args.resume)
 
     for panel_name, fields in panels.items():
         # Filter fields with logic
@@ -419,6 +401,14 @@ def main():
 
         print(f"\nPanel '{panel_name}': {len(fields)} total, {len(fields_with_logic)} with logic, {len(relevant_rules)} relevant rules")
 
+        input_hash = compute_input_hash(fields_with_logic, relevant_rules)
+        cached = checkpoint.get(panel_name, input_hash)
+        if cached is not None:
+            successful_panels += 1
+            total_fields_processed += len(cached)
+            all_results[panel_name] = cached
+            continue
+
         result = call_mini_agent(
             fields_with_logic,
             relevant_rules,
@@ -434,11 +424,12 @@ def main():
             failed_panels += 1
             print(f"✗ Panel '{panel_name}' failed", file=sys.stderr)
 
+        checkpoint.record(panel_name, input_hash, all_results.get(panel_name), success=bool(result))
+
     # Step 6: Write all results to single output file
     if all_results:
         print(f"\nWriting all results to: {output_file}")
-        with open(output_file, 'w') as f:
-            json.dump(all_results, f, indent=2)
+        json_io.dump(all_results, output_file)
         print(f"✓ Successfully wrote {len(all_results)} panels to output file")
 
     # Print final summary
@@ -449,6 +440,9 @@ def main():
     print(f"Successful: {successful_panels}")
     print(f"Failed: {failed_panels}")
     print(f"Total Fields Processed: {total_fields_processed}")
+    print(f"Restored from Checkpoint: {checkpoint.reused_panels}")
+    print(format_queue_wait_summary())
+    print(format_runner_summary())
     print(f"Output File: {output_file}")
     print("="*70)
 
@@ -22,10 +22,16 @@ import re
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
 
+from agent_backend import agent_command
+from agent_governor import agent_slot, estimate_tokens, format_queue_wait_summary
+from agent_runner import run_agent, format_runner_summary
+from panel_checkpoint import PanelCheckpoint, add_resume_argument, compute_input_hash
+
 # Add project root so we can import doc_parser
 PROJECT_ROOT = str(Path(__file__).parent.parent.parent)
 sys.path.insert(0, PROJECT_ROOT)
 from doc_parser import DocumentParser
+from common import json_io
 
 
 RULE_CHECK_VARIABLE = "__rulecheck__"
@@ -145,13 +151,14 @@ def query_context_usage(panel_name: str, agent_name: str) -> Optional[str]:
     )
 
     try:
-        process = subprocess.run(
-            ["claude", "--continue", "-p", usage_prompt],
-            capture_output=True,
-            text=True,
-            timeout=30,
-            cwd=PROJECT_ROOT
-        )
+        with agent_slot(label=panel_name):
+            process = subprocess.run(
+                agent_command(["claude", "--continue", "-p", usage_prompt]),
+                capture_output=True,
+                text=True,
+                timeout=30,
+                cwd=PROJECT_ROOT
+            )
 
         if process.returncode == 0 and process.stdout.strip():
             return process.stdout.strip()
@@ -221,8 +228,7 @@ def call_session_based_mini_agent(panel_fields: List[Dict],
     log_file = temp_dir / f"{safe_panel_name}_session_log.txt"
 
     # Write fields to temp file
-    with open(fields_input_file, 'w') as f:
-        json.dump(panel_fields, f, indent=2)
+    json_io.dump(panel_fields, fields_input_file, pretty=True)
 
     prompt = f"""Process fields for panel "{panel_name}".
 
@@ -268,30 +274,17 @@ Write a JSON array to: {output_file}
         print('='*70)
 
         # Call claude -p with the Session Based mini agent
-        process = subprocess.Popen(
-            [
-                "claude",
-                "-p", prompt,
-                "--agent", "mini/08_session_based_agent",
-                "--allowedTools", "Read,Write"
-            ],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1,
-            cwd=PROJECT_ROOT
+        run = run_agent(
+            prompt,
+            output_file,
+            agent="mini/08_session_based_agent",
+            label=panel_name,
+            extra_output_files=[log_file],
+            estimated_tokens=estimate_tokens(prompt, fields_input_file),
         )
 
-        # Collect output
-        output_lines = []
-        for line in process.stdout:
-            print(line, end='', flush=True)
-            output_lines.append(line)
-
-        process.wait()
-
-        if process.returncode != 0:
-            print(f"  Mini agent failed with exit code: {process.returncode}", file=sys.stderr)
+        if run.returncode != 0:
+            print(f"  Mini agent failed with exit code: {run.returncode}", file=sys.stderr)
             return None
 
         # Query context usage from the agent session
@@ -306,8 +299,7 @@ Write a JSON array to: {output_file}
         # Read output file
         if output_file.exists():
             try:
-                with open(output_file, 'r') as f:
-                    result = json.load(f)
+                result = json_io.load(output_file)
                 print(f"  Panel '{panel_name}' completed - {len(result)} fields processed")
                 return result
             except json.JSONDecodeError as e:
@@ -426,6 +418,7 @@ def main():
         default="output/session_based/all_panels_session_based.json",
         help="Output file (default: output/session_based/all_panels_session_based.json)"
     )
+    add_resume_argument(parser)
 
     args = parser.parse_args()
 
@@ -462,8 +455,7 @@ def main():
 
     # ── Step 2: Load Clear Child Fields agent output ──────────────────────────
     print(f"\nLoading Clear Child Fields output: {args.clear_child_output}")
-    with open(args.clear_child_output, 'r') as f:
-        input_data = json.load(f)
+    input_data = json_io.load(args.clear_child_output)
 
     print(f"Found {len(input_data)} panels in input")
 
@@ -515,6 +507,7 @@ def main():
     skipped_panels = 0
     total_fields_processed = 0
     all_results = {}
+    checkpoint = PanelCheckpoint(output_file, resume=args.resume)
 
     for panel_name, panel_fields in input_data.items():
         if not panel_fields:
@@ -539,6 +532,14 @@ def main():
         print(f"\nPanel '{panel_name}': {len(panel_fields)} fields "
               f"({fields_in_bud} in BUD table, {fields_not_in_bud} not in BUD table)")
 
+        input_hash = compute_input_hash(modified_fields, "SECOND_PARTY")
+        cached = checkpoint.get(panel_name, input_hash)
+        if cached is not None:
+            successful_panels += 1
+            total_fields_processed += len(cached)
+            all_results[panel_name] = cached
+            continue
+
         # Call Session Based mini agent with SECOND_PARTY
         result = call_session_based_mini_agent(
             modified_fields,
@@ -557,10 +558,11 @@ def main():
             total_fields_processed += len(panel_fields)
             print(f"  Panel '{panel_name}' failed - using original data", file=sys.stderr)
 
+        checkpoint.record(panel_name, input_hash, all_results.get(panel_name), success=bool(result))
+
     # ── Step 5: Write output ──────────────────────────────────────────────────
     print(f"\nWriting output to: {output_file}")
-    with open(output_file, 'w') as f:
-        json.dump(all_results, f, indent=2)
+    json_io.dump(all_results, output_file)
 
     # Summary
     total_dest = sum(len(r["destination_fields"]) for r in session_rules)
@@ -572,6 +574,7 @@ def main():
     print(f"Failed: {failed_panels}")
     print(f"Skipped (empty): {skipped_panels}")
     print(f"Total Fields Processed: {total_fields_processed}")
+    print(f"Restored from Checkpoint: {checkpoint.reused_panels}")
     print(f"RuleCheck field placed in: {rulecheck_panel or 'N/A'}")
     print(f"Session rules on RuleCheck: {len(session_rules)}")
     for rule in session_rules:
@@ -579,6 +582,8 @@ def main():
         action = "VISIBLE" if "Visible" in rule["rule_name"] else "INVISIBLE"
         print(f"  {action} ({param}): {len(rule['destination_fields'])} fields")
     print(f"Total destination mappings: {total_dest}")
+    print(format_queue_wait_summary())
+    print(format_runner_summary())
     print(f"Output File: {output_file}")
     print("=" * 70)
 
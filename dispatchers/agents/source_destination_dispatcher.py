@@ -17,6 +17,16 @@ import re
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from agent_backend import agent_command
+from agent_governor import agent_slot, estimate_tokens, format_queue_wait_summary
+from agent_runner import run_agent, format_runner_summary
+from panel_checkpoint import PanelCheckpoint, add_resume_argument, compute_input_hash
+
+# Shared JSON I/O from the project root
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from common import json_io
+from common.rule_schema_registry import RuleSchemaRegistry
+
 
 PROJECT_ROOT = str(Path(__file__).parent.parent.parent)
 
@@ -39,13 +49,14 @@ def query_context_usage(panel_name: str, agent_name: str) -> Optional[str]:
     )
 
     try:
-        process = subprocess.run(
-            ["claude", "--continue", "-p", usage_prompt],
-            capture_output=True,
-            text=True,
-            timeout=30,
-            cwd=PROJECT_ROOT
-        )
+        with agent_slot(label=panel_name):
+            process = subprocess.run(
+                agent_command(["claude", "--continue", "-p", usage_prompt]),
+                capture_output=True,
+                text=True,
+                timeout=30,
+                cwd=PROJECT_ROOT
+            )
 
         if process.returncode == 0 and process.stdout.strip():
             return process.stdout.strip()
@@ -61,18 +72,7 @@ def load_rule_schemas(rule_schemas_path: str) -> Dict[str, Dict]:
     Returns:
         Dict mapping rule names to full rule schemas
     """
-    with open(rule_schemas_path, 'r') as f:
-        data = json.load(f)
-
-    # Create mapping of rule name to full schema
-    name_to_schema = {}
-
-    for rule in data.get('content', []):
-        name = rule.get('name', '')
-        if name:
-            name_to_schema[name] = rule
-
-    return name_to_schema
+    return dict(RuleSchemaRegistry.load(rule_schemas_path).by_name)
 
 
 def get_relevant_rule_schemas(panel_fields: List[Dict],
@@ -133,8 +133,7 @@ def call_mini_agent(panel_fields: List[Dict], rule_schemas: List[Dict],
     }
 
     # Write input to temp file
-    with open(input_file, 'w') as f:
-        json.dump(input_data, f, indent=2)
+    json_io.dump(input_data, input_file, pretty=True)
 
     prompt = f"""Process fields for panel "{panel_name}" and populate source/destination fields for each rule.
 
@@ -208,30 +207,16 @@ Each field must preserve:
         print('='*70)
 
         # Call claude -p with the mini agent
-        process = subprocess.Popen(
-            [
-                "claude",
-                "-p", prompt,
-                "--agent", "mini/02_source_destination_agent_v2",
-                "--allowedTools", "Read,Write"
-            ],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1,
-            cwd=str(Path(__file__).parent.parent.parent)
+        run = run_agent(
+            prompt,
+            output_file,
+            agent="mini/02_source_destination_agent_v2",
+            label=panel_name,
+            estimated_tokens=estimate_tokens(prompt, input_file),
         )
 
-        # Collect output
-        output_lines = []
-        for line in process.stdout:
-            print(line, end='', flush=True)
-            output_lines.append(line)
-
-        process.wait()
-
-        if process.returncode != 0:
-            print(f"✗ Mini agent failed with exit code: {process.returncode}", file=sys.stderr)
+        if run.returncode != 0:
+            print(f"✗ Mini agent failed with exit code: {run.returncode}", file=sys.stderr)
             return None
 
         # Query context usage from the agent session
@@ -246,8 +231,7 @@ Each field must preserve:
         # Read output file
         if output_file.exists():
             try:
-                with open(output_file, 'r') as f:
-                    result = json.load(f)
+                result = json_io.load(output_file)
                 print(f"✓ Panel '{panel_name}' completed - {len(result)} fields processed")
                 return result
             except json.JSONDecodeError as e:
@@ -286,6 +270,7 @@ def main():
         default="output/source_destination/all_panels_source_dest.json",
         help="Output file for all panels (default: output/source_destination/all_panels_source_dest.json)"
     )
+    add_resume_argument(parser)
 
     args = parser.parse_args()
 
@@ -298,8 +283,7 @@ def main():
 
     # Step 1: Load input from Rule Type Placement agent
     print(f"Loading input from: {args.input}")
-    with open(args.input, 'r') as f:
-        panels_data = json.load(f)
+    panels_data = json_io.load(args.input)
 
     print(f"Found {len(panels_data)} panels in input")
 
@@ -317,6 +301,7 @@ def main():
     failed_panels = 0
     total_fields_processed = 0
     all_results = {}
+    checkpoint = PanelCheckpoint(output_file, resume=args.resume)
 
     for panel_name, panel_fields in panels_data.items():
         if not panel_fields:
@@ -329,6 +314,14 @@ def main():
         total_rules_in_panel = sum(len(f.get('rules', [])) for f in panel_fields)
         print(f"\nPanel '{panel_name}': {len(panel_fields)} fields, {total_rules_in_panel} total rules, {len(relevant_schemas)} unique rule schemas")
 
+        input_hash = compute_input_hash(panel_fields, relevant_schemas)
+        cached = checkpoint.get(panel_name, input_hash)
+        if cached is not None:
+            successful_panels += 1
+            total_fields_processed += len(cached)
+            all_results[panel_name] = cached
+            continue
+
         result = call_mini_agent(
             panel_fields,
             relevant_schemas,
@@ -344,11 +337,12 @@ def main():
             failed_panels += 1
             print(f"✗ Panel '{panel_name}' failed", file=sys.stderr)
 
+        checkpoint.record(panel_name, input_hash, all_results.get(panel_name), success=bool(result))
+
     # Step 4: Write all results to single output file
     if all_results:
         print(f"\nWriting all results to: {output_file}")
-        with open(output_file, 'w') as f:
-            json.dump(all_results, f, indent=2)
+        json_io.dump(all_results, output_file)
         print(f"✓ Successfully wrote {len(all_results)} panels to output file")
 
     # Print final summary
@@ -359,6 +353,9 @@ def main():
     print(f"Successful: {successful_panels}")
     print(f"Failed: {failed_panels}")
     print(f"Total Fields Processed: {total_fields_processed}")
+    print(f"Restored from Checkpoint: {checkpoint.reused_panels}")
+    print(format_queue_wait_summary())
+    print(format_runner_summary())
     print(f"Output File: {output_file}")
     print("="*70)
 
@@ -19,9 +19,15 @@ import re
 from pathlib import Path
 from typing import Dict, List, Optional, Set
 
+from agent_backend import agent_command
+from agent_governor import agent_slot, estimate_tokens, format_queue_wait_summary
+from agent_runner import run_agent, format_runner_summary
+from panel_checkpoint import PanelCheckpoint, add_resume_argument, compute_input_hash
+
 # Import doc_parser
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from doc_parser import DocumentParser
+from common import json_io
 
 PROJECT_ROOT = str(Path(__file__).parent.parent.parent)
 
@@ -44,13 +50,14 @@ def query_context_usage(panel_name: str, agent_name: str) -> Optional[str]:
     )
 
     try:
-        process = subprocess.run(
-            ["claude", "--continue", "-p", usage_prompt],
-            capture_output=True,
-            text=True,
-            timeout=30,
-            cwd=PROJECT_ROOT
-        )
+        with agent_slot(label=panel_name):
+            process = subprocess.run(
+                agent_command(["claude", "--continue", "-p", usage_prompt]),
+                capture_output=True,
+                text=True,
+                timeout=30,
+                cwd=PROJECT_ROOT
+            )
 
         if process.returncode == 0 and process.stdout.strip():
             return process.stdout.strip()
@@ -240,12 +247,10 @@ def call_validate_edv_mini_agent(panel_fields: List[Dict], reference_tables: Lis
     log_file = temp_dir / f"{safe_panel_name}_validate_edv_log.txt"
 
     # Write fields to temp file
-    with open(fields_input_file, 'w') as f:
-        json.dump(panel_fields, f, indent=2)
+    json_io.dump(panel_fields, fields_input_file, pretty=True)
 
     # Write reference tables to temp file
-    with open(tables_input_file, 'w') as f:
-        json.dump(reference_tables, f, indent=2)
+    json_io.dump(reference_tables, tables_input_file, pretty=True)
 
     prompt = f"""Process fields for panel "{panel_name}" and determine which dropdown fields need a Validate EDV rule, then place and populate it.
 
@@ -325,30 +330,17 @@ IMPORTANT:
         print('='*70)
 
         # Call claude -p with the Validate EDV mini agent
-        process = subprocess.Popen(
-            [
-                "claude",
-                "-p", prompt,
-                "--agent", "mini/04_validate_edv_agent_v2",
-                "--allowedTools", "Read,Write"
-            ],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1,
-            cwd=str(Path(__file__).parent.parent.parent)
+        run = run_agent(
+            prompt,
+            output_file,
+            agent="mini/04_validate_edv_agent_v2",
+            label=panel_name,
+            extra_output_files=[log_file],
+            estimated_tokens=estimate_tokens(prompt, fields_input_file, tables_input_file),
         )
 
-        # Collect output
-        output_lines = []
-        for line in process.stdout:
-            print(line, end='', flush=True)
-            output_lines.append(line)
-
-        process.wait()
-
-        if process.returncode != 0:
-            print(f"  Mini agent failed with exit code: {process.returncode}", file=sys.stderr)
+        if run.returncode != 0:
+            print(f"  Mini agent failed with exit code: {run.returncode}", file=sys.stderr)
             return None
 
         # Query context usage from the agent session
@@ -363,8 +355,7 @@ IMPORTANT:
         # Read output file
         if output_file.exists():
             try:
-                with open(output_file, 'r') as f:
-                    result = json.load(f)
+                result = json_io.load(output_file)
                 print(f"  Panel '{panel_name}' completed - {len(result)} fields processed")
                 return result
             except json.JSONDecodeError as e:
@@ -403,6 +394,7 @@ def main():
         default="output/validate_edv/all_panels_validate_edv.json",
         help="Output file for all panels (default: output/validate_edv/all_panels_validate_edv.json)"
     )
+    add_resume_argument(parser)
 
     args = parser.parse_args()
 
@@ -442,8 +434,7 @@ def main():
 
     # Step 3: Load EDV agent output
     print(f"\nLoading EDV agent output: {args.edv_output}")
-    with open(args.edv_output, 'r') as f:
-        edv_data = json.load(f)
+    edv_data = json_io.load(args.edv_output)
 
     print(f"Found {len(edv_data)} panels in input")
 
@@ -457,6 +448,7 @@ def main():
     skipped_panels = 0
     total_fields_processed = 0
     all_results = {}
+    checkpoint = PanelCheckpoint(output_file, resume=args.resume)
 
     for panel_name, panel_fields in edv_data.items():
         if not panel_fields:
@@ -477,6 +469,14 @@ def main():
                 cols = list(table.get('attributes/columns', {}).values())
                 print(f"    - {ref_id}: columns={cols}")
 
+        input_hash = compute_input_hash(panel_fields, referenced_tables)
+        cached = checkpoint.get(panel_name, input_hash)
+        if cached is not None:
+            successful_panels += 1
+            total_fields_processed += len(cached)
+            all_results[panel_name] = cached
+            continue
+
         # Call Validate EDV mini agent
         result = call_validate_edv_mini_agent(
             panel_fields,
@@ -496,11 +496,12 @@ def main():
             total_fields_processed += len(panel_fields)
             print(f"  Panel '{panel_name}' failed - using original data", file=sys.stderr)
 
+        checkpoint.record(panel_name, input_hash, all_results.get(panel_name), success=bool(result))
+
     # Step 5: Write all results to single output file
     if all_results:
         print(f"\nWriting all results to: {output_file}")
-        with open(output_file, 'w') as f:
-            json.dump(all_results, f, indent=2)
+        json_io.dump(all_results, output_file)
         print(f"Successfully wrote {len(all_results)} panels to output file")
 
     # Print final summary
@@ -512,7 +513,10 @@ def main():
     print(f"Failed: {failed_panels}")
     print(f"Skipped (empty): {skipped_panels}")
     print(f"Total Fields Processed: {total_fields_processed}")
+    print(f"Restored from Checkpoint: {checkpoint.reused_panels}")
     print(f"Total Reference Tables: {len(all_reference_tables)}")
+    print(format_queue_wait_summary())
+    print(format_runner_summary())
     print(f"Output File: {output_file}")
     print("="*70)
 
@@ -21,8 +21,10 @@ from pathlib import Path
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent / "agents"))
 
 from doc_parser import DocumentParser
+from agent_governor import agent_slot, estimate_tokens
 
 
 def extract_bud_fields(document_path: str) -> dict:
@@ -172,16 +174,17 @@ def call_claude_command(
 
     # Call claude with the command
     try:
-        result = subprocess.run(
-            [
-                "claude",
-                "-p", prompt,
-                "--allowedTools", "mcp__chrome-devtools__*,Read,Write,Bash"
-            ],
-            capture_output=True,
-            text=True,
-            cwd=str(Path(__file__).parent.parent)
-        )
+        with agent_slot(estimate_tokens(prompt), label="form builder comparison"):
+            result = subprocess.run(
+                [
+                    "claude",
+                    "-p", prompt,
+                    "--allowedTools", "mcp__chrome-devtools__*,Read,Write,Bash"
+                ],
+                capture_output=True,
+                text=True,
+                cwd=str(Path(__file__).parent.parent)
+            )
 
         if result.returncode != 0:
             print(f"Claude command failed: {result.stderr}", file=sys.stderr)
@@ -15,6 +15,9 @@ import sys
 import os
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent / "agents"))
+from agent_governor import agent_slot, estimate_tokens
+
 
 def validate_input_files(generated_path: str, reference_path: str) -> tuple:
     """
@@ -99,16 +102,17 @@ Remember:
 """
 
     try:
-        result = subprocess.run(
-            [
-                "claude",
-                "-p", prompt,
-                "--allowedTools", "Read,Write,Bash"
-            ],
-            capture_output=True,
-            text=True,
-            cwd=str(Path(__file__).parent.parent)
-        )
+        with agent_slot(estimate_tokens(prompt), label="rule extraction eval"):
+            result = subprocess.run(
+                [
+                    "claude",
+                    "-p", prompt,
+                    "--allowedTools", "Read,Write,Bash"
+                ],
+                capture_output=True,
+                text=True,
+                cwd=str(Path(__file__).parent.parent)
+            )
 
         if result.returncode != 0:
             print(f"Claude eval skill failed: {result.stderr}", file=sys.stderr)
@@ -19,8 +19,10 @@ from pathlib import Path
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent / "agents"))
 
 from doc_parser import DocumentParser
+from agent_governor import agent_slot, estimate_tokens
 
 
 def extract_fields_data(document_path: str) -> dict:
@@ -103,16 +105,17 @@ Use the /inter_panel_rule_field_references skill to analyze these fields and det
 
     # Call claude with the command
     try:
-        result = subprocess.run(
-            [
-                "claude",
-                "-p", prompt,
-                "--allowedTools", "Read,Write"
-            ],
-            capture_output=True,
-            text=True,
-            cwd=str(Path(__file__).parent.parent)
-        )
+        with agent_slot(estimate_tokens(prompt), label="inter-panel references"):
+            result = subprocess.run(
+                [
+                    "claude",
+                    "-p", prompt,
+                    "--allowedTools", "Read,Write"
+                ],
+                capture_output=True,
+                text=True,
+                cwd=str(Path(__file__).parent.parent)
+            )
 
         if result.returncode != 0:
             print(f"Claude command failed: {result.stderr}", file=sys.stderr)
@@ -16,6 +16,9 @@ import os
 from datetime import datetime
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent / "agents"))
+from agent_governor import agent_slot, estimate_tokens
+
 
 def validate_input_files(schema_path: str, intra_panel_path: str) -> tuple:
     """
@@ -189,26 +192,27 @@ The system should:
         print("CLAUDE AGENT OUTPUT (streaming)")
         print("-"*60 + "\n")
 
-        process = subprocess.Popen(
-            [
-                "claude",
-                "-p", prompt,
-                "--allowedTools", "Read,Write,Edit,Bash,Glob,Grep"
-            ],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1,  # Line buffered
-            cwd=str(Path(__file__).parent.parent)
-        )
-
-        # Stream output in real-time
-        output_lines = []
-        for line in process.stdout:
-            print(line, end='', flush=True)
-            output_lines.append(line)
-
-        process.wait()
+        with agent_slot(estimate_tokens(prompt), label="rule extraction coding agent"):
+            process = subprocess.Popen(
+                [
+                    "claude",
+                    "-p", prompt,
+                    "--allowedTools", "Read,Write,Edit,Bash,Glob,Grep"
+                ],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                bufsize=1,  # Line buffered
+                cwd=str(Path(__file__).parent.parent)
+            )
+
+            # Stream output in real-time
+            output_lines = []
+            for line in process.stdout:
+                print(line, end='', flush=True)
+                output_lines.append(line)
+
+            process.wait()
 
         print("\n" + "-"*60)
         print(f"CLAUDE AGENT FINISHED (exit code: {process.returncode})")
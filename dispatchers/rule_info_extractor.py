@@ -27,8 +27,10 @@ from typing import List, Dict, Any, Optional
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent / "agents"))
 
 from get_section_by_index import SectionIterator
+from agent_governor import agent_slot, estimate_tokens
 
 
 # Keywords that indicate field-level information sections
@@ -291,16 +293,17 @@ Use the /rule_info_extrator skill to analyze these sections and extract implemen
 """
 
     try:
-        result = subprocess.run(
-            [
-                "claude",
-                "-p", prompt,
-                "--allowedTools", "Read,Write"
-            ],
-            capture_output=True,
-            text=True,
-            cwd=str(Path(__file__).parent.parent)
-        )
+        with agent_slot(estimate_tokens(prompt), label="rule info extraction"):
+            result = subprocess.run(
+                [
+                    "claude",
+                    "-p", prompt,
+                    "--allowedTools", "Read,Write"
+                ],
+                capture_output=True,
+                text=True,
+                cwd=str(Path(__file__).parent.parent)
+            )
 
         if result.returncode != 0:
             print(f"Claude command failed: {result.stderr}", file=sys.stderr)
@@ -8,9 +8,13 @@ Main components:
 - models.py: Data classes for evaluation results
 - field_comparator.py: Field name and type comparison
 - rule_comparator.py: Rule comparison with ID resolution
+- form_index.py: One-pass index of a document's fields and rules
 - evaluator.py: Main evaluation orchestrator
 - report_generator.py: LLM-based report generation
 - llm_client.py: LLM client wrapper
+- llm_decision_cache.py: Persistent cache of LLM field-name decisions
+- incremental.py: Per-field result reuse across self-heal iterations
+- batch.py: Manifest-driven evaluation of many pairs on a process pool
 """
 
 from .models import (
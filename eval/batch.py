@@ -0,0 +1,251 @@
+"""
+Batch evaluation of many generated/reference pairs.
+
+Driven by a JSON manifest, either a list of pairs or {"pairs": [...]}:
+
+    {
+      "pairs": [
+        {"name": "vendor_creation",
+         "generated": "documents/json_output/vendor_creation_generated.json",
+         "reference": "documents/json_output/vendor_creation.json",
+         "threshold": 0.9},
+        ...
+      ]
+    }
+
+"name" and "threshold" are optional. Relative paths are resolved against
+the manifest's directory.
+
+Each pair is evaluated in its own worker process from a pool (one task per
+process, so the peak RSS of the process is the pair's). Workers share the
+persistent LLM decision cache (EVAL_LLM_CACHE_DIR, see
+llm_decision_cache.py). Every pair gets a report reports/<name>.json in the
+output directory, so no pair name can collide with summary.json, which lists
+every pair's scores, evaluation time, peak memory, LLM cache hits and errors.
+
+Usage:
+    from eval.batch import load_manifest, run_batch
+
+    pairs = load_manifest("regression.json")
+    summary = run_batch(pairs, "output/eval_batch", workers=4, use_llm=False)
+"""
+
+import multiprocessing
+import os
+import re
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+from common import json_io
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def load_manifest(manifest_path: str) -> List[Dict[str, Any]]:
+    """
+    Load and validate a batch manifest.
+
+    Args:
+        manifest_path: Path to the manifest JSON
+
+    Returns:
+        Pairs with absolute generated/reference paths and unique names
+
+    Raises:
+        ValueError: If the manifest is malformed
+    """
+    data = json_io.load(manifest_path)
+    entries = data.get("pairs") if isinstance(data, dict) else data
+    if not isinstance(entries, list):
+        raise ValueError(f"Manifest must be a list of pairs or {{\"pairs\": [...]}}: {manifest_path}")
+
+    base_dir = os.path.dirname(os.path.abspath(manifest_path))
+    pairs = []
+    used_names = set()
+    for i, entry in enumerate(entries):
+        if not isinstance(entry, dict) or not entry.get("generated") or not entry.get("reference"):
+            raise ValueError(f"Manifest entry {i} needs 'generated' and 'reference' paths")
+
+        generated = os.path.join(base_dir, entry["generated"])
+        reference = os.path.join(base_dir, entry["reference"])
+        name = entry.get("name") or (
+            f"{os.path.splitext(os.path.basename(generated))[0]}__vs__"
+            f"{os.path.splitext(os.path.basename(reference))[0]}"
+        )
+        name = re.sub(r"[^\w.-]+", "_", name)
+        unique_name, suffix = name, 2
+        while unique_name in used_names:
+            unique_name = f"{name}_{suffix}"
+            suffix += 1
+        used_names.add(unique_name)
+
+        pairs.append({
+            "name": unique_name,
+            "generated": os.path.normpath(generated),
+            "reference": os.path.normpath(reference),
+            "threshold": entry.get("threshold"),
+        })
+    return pairs
+
+
+def _max_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process so far, in MB."""
+    if resource is None:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return max_rss / (1024 * 1024) if sys.platform == "darwin" else max_rss / 1024
+
+
+def _evaluate_pair(task: Dict[str, Any]) -> Dict[str, Any]:
+    """Pool task: evaluate one pair and save its report."""
+    from .evaluator import FormFillEvaluator
+
+    result = {
+        "name": task["name"],
+        "generated": task["generated"],
+        "reference": task["reference"],
+        "report": task["report"],
+        "passed": False,
+        "error": None,
+    }
+    baseline_rss = _max_rss_mb()
+    start = time.perf_counter()
+    try:
+        evaluator = FormFillEvaluator(
+            use_llm=task["use_llm"],
+            llm_threshold=task["llm_threshold"],
+            pass_threshold=task["threshold"],
+        )
+        passed, report = evaluator.evaluate_and_save_report(
+            task["generated"],
+            task["reference"],
+            task["report"],
+            verbose=False,
+            include_llm_analysis=task["include_llm_analysis"],
+        )
+        summary = report.to_dict().get("evaluation_summary", {})
+        result.update(
+            passed=passed,
+            overall_score=summary.get("overall_score"),
+            field_coverage=summary.get("field_coverage"),
+            rule_coverage=summary.get("rule_coverage"),
+            rule_accuracy=summary.get("rule_accuracy"),
+        )
+        decision_cache = evaluator.field_comparator.decision_cache
+        if decision_cache is not None:
+            result["llm_cache"] = decision_cache.stats()
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+    result["eval_seconds"] = round(time.perf_counter() - start, 4)
+    result["baseline_rss_mb"] = baseline_rss
+    result["peak_rss_mb"] = _max_rss_mb()
+    return result
+
+
+def run_batch(
+    pairs: List[Dict[str, Any]],
+    output_dir: str,
+    workers: int = 0,
+    use_llm: bool = True,
+    llm_threshold: float = 0.8,
+    pass_threshold: float = 0.90,
+    include_llm_analysis: bool = False,
+    verbose: bool = True
+) -> Dict[str, Any]:
+    """
+    Evaluate every pair on a process pool and write reports plus summary.json.
+
+    Args:
+        pairs: Pairs from load_manifest
+        output_dir: Directory for reports/<name>.json and summary.json
+        workers: Pool size (default: CPU count)
+        use_llm: Whether to use LLM for fuzzy matching
+        llm_threshold: Confidence threshold for LLM matches
+        pass_threshold: Pass threshold for pairs without their own
+        include_llm_analysis: Whether reports include LLM-generated analysis
+        verbose: Print a line per finished pair
+
+    Returns:
+        The summary written to summary.json
+    """
+    reports_dir = os.path.join(output_dir, "reports")
+    os.makedirs(reports_dir, exist_ok=True)
+    workers = max(1, min(workers or os.cpu_count() or 1, len(pairs) or 1))
+
+    tasks = [
+        dict(
+            pair,
+            threshold=pair["threshold"] if pair.get("threshold") is not None else pass_threshold,
+            report=os.path.join(reports_dir, f"{pair['name']}.json"),
+            use_llm=use_llm,
+            llm_threshold=llm_threshold,
+            include_llm_analysis=include_llm_analysis,
+        )
+        for pair in pairs
+    ]
+
+    start = time.perf_counter()
+    results_by_name = {}
+    # One pair per worker process: RSS is per pair and a crash only loses that pair
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(processes=workers, maxtasksperchild=1) as pool:
+        for result in pool.imap_unordered(_evaluate_pair, tasks):
+            results_by_name[result["name"]] = result
+            if verbose:
+                if result["error"]:
+                    status = f"ERROR ({result['error']})"
+                else:
+                    status = f"{'PASS' if result['passed'] else 'FAIL'} {result['overall_score']:.1%}"
+                print(f"  [{len(results_by_name)}/{len(tasks)}] {result['name']}: {status} "
+                      f"in {result['eval_seconds']:.2f}s")
+    wall_seconds = time.perf_counter() - start
+
+    results = [results_by_name[task["name"]] for task in tasks]
+    errors = sum(1 for r in results if r["error"])
+    passed = sum(1 for r in results if r["passed"])
+    summary = {
+        "total_pairs": len(results),
+        "passed": passed,
+        "failed": len(results) - passed - errors,
+        "errors": errors,
+        "workers": workers,
+        "wall_seconds": round(wall_seconds, 4),
+        "eval_seconds": round(sum(r["eval_seconds"] for r in results), 4),
+        "max_peak_rss_mb": max((r["peak_rss_mb"] or 0 for r in results), default=0) or None,
+        "pairs": results,
+    }
+    json_io.dump(summary, os.path.join(output_dir, "summary.json"), pretty=True)
+    return summary
+
+
+def format_batch_summary(summary: Dict[str, Any]) -> str:
+    """Console table of a run_batch summary."""
+    lines = [
+        "=" * 70,
+        "BATCH EVALUATION SUMMARY",
+        "=" * 70,
+        f"{'pair':<32} {'result':>7} {'score':>7} {'time':>8} {'peak RSS':>10}",
+    ]
+    for r in summary["pairs"]:
+        if r["error"]:
+            result, score = "ERROR", "-"
+        else:
+            result, score = ("PASS" if r["passed"] else "FAIL"), f"{r['overall_score']:.1%}"
+        rss = f"{r['peak_rss_mb']:.0f} MB" if r.get("peak_rss_mb") else "-"
+        lines.append(f"{r['name'][:32]:<32} {result:>7} {score:>7} {r['eval_seconds']:7.2f}s {rss:>10}")
+    lines.append("-" * 70)
+    lines.append(
+        f"Pairs: {summary['total_pairs']}  Passed: {summary['passed']}  Failed: {summary['failed']}  "
+        f"Errors: {summary['errors']}"
+    )
+    lines.append(
+        f"Workers: {summary['workers']}  Wall time: {summary['wall_seconds']:.2f}s  "
+        f"Sum of eval times: {summary['eval_seconds']:.2f}s"
+    )
+    lines.append("=" * 70)
+    return "\n".join(lines)
@@ -7,6 +7,9 @@ Usage:
 
 Or:
     python eval/cli.py --generated <path> --reference <path> [--output <path>]
+
+Batch mode (many pairs on a process pool, see eval/batch.py for the manifest format):
+    python -m eval.cli --manifest <path> [--workers N] [--output-dir <dir>]
 """
 
 import argparse
@@ -17,6 +20,7 @@ import os
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from eval.batch import format_batch_summary, load_manifest, run_batch
 from eval.evaluator import FormFillEvaluator
 from eval.report_generator import generate_console_report
 
@@ -27,14 +31,33 @@ def main():
     )
     parser.add_argument(
         "--generated", "-g",
-        required=True,
         help="Path to generated JSON file"
     )
     parser.add_argument(
         "--reference", "-r",
-        required=True,
         help="Path to reference JSON file"
     )
+    parser.add_argument(
+        "--manifest", "-m",
+        help="Batch mode: JSON manifest of generated/reference pairs"
+    )
+    parser.add_argument(
+        "--workers", "-w",
+        type=int,
+        default=0,
+        help="Batch mode: worker processes (default: CPU count)"
+    )
+    parser.add_argument(
+        "--output-dir",
+        default=None,
+        help="Batch mode: directory for per-pair reports and summary.json "
+             "(default: eval_reports next to the manifest)"
+    )
+    parser.add_argument(
+        "--llm-cache-dir",
+        default=None,
+        help="Directory of the persistent LLM decision cache, or 'off' (default: EVAL_LLM_CACHE_DIR)"
+    )
     parser.add_argument(
         "--output", "-o",
         default=None,
@@ -70,6 +93,15 @@ def main():
 
     args = parser.parse_args()
 
+    if args.llm_cache_dir:
+        # Read by every FieldComparator, including those in batch worker processes
+        os.environ["EVAL_LLM_CACHE_DIR"] = args.llm_cache_dir
+
+    if args.manifest:
+        run_manifest(args)
+    if not args.generated or not args.reference:
+        parser.error("--generated and --reference are required (or use --manifest)")
+
     # Validate input files
     if not os.path.exists(args.generated):
         print(f"Error: Generated file not found: {args.generated}", file=sys.stderr)
@@ -126,5 +158,47 @@ def main():
         sys.exit(2)
 
 
+def run_manifest(args):
+    """Batch mode: evaluate every pair in the manifest and exit."""
+    try:
+        pairs = load_manifest(args.manifest)
+    except (OSError, ValueError) as e:
+        print(f"Error: Invalid manifest: {e}", file=sys.stderr)
+        sys.exit(2)
+
+    missing = [p for pair in pairs for p in (pair["generated"], pair["reference"]) if not os.path.exists(p)]
+    if missing:
+        for path in missing:
+            print(f"Error: File not found: {path}", file=sys.stderr)
+        sys.exit(1)
+
+    output_dir = args.output_dir or os.path.join(os.path.dirname(os.path.abspath(args.manifest)), "eval_reports")
+    print(f"Manifest: {args.manifest} ({len(pairs)} pairs)")
+    print(f"Output: {output_dir}")
+    print()
+
+    summary = run_batch(
+        pairs,
+        output_dir,
+        workers=args.workers,
+        use_llm=not args.no_llm,
+        llm_threshold=args.llm_threshold,
+        pass_threshold=args.threshold,
+        include_llm_analysis=not args.no_llm,
+        verbose=not args.json_only,
+    )
+
+    if args.json_only:
+        print(json.dumps(summary, indent=2))
+    else:
+        print()
+        print(format_batch_summary(summary))
+        print(f"\nSummary saved to: {os.path.join(output_dir, 'summary.json')}")
+
+    if summary["errors"]:
+        sys.exit(2)
+    sys.exit(0 if summary["failed"] == 0 else 1)
+
+
 if __name__ == "__main__":
     main()
@@ -6,13 +6,18 @@ Orchestrates the complete evaluation pipeline:
 2. Compare fields
 3. Compare rules for matched fields
 4. Generate evaluation report
+
+With incremental=True the evaluator keeps per-field results between
+evaluate() calls and only re-compares the rules of fields that changed (see
+incremental.py).
 """
 
-import json
 import os
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 
+from common import json_io
+
 from .models import (
     EvalResult,
     EvalReport,
@@ -23,7 +28,9 @@ from .models import (
     SelfHealInstruction,
 )
 from .field_comparator import FieldComparator
-from .rule_comparator import RuleComparator, count_rules_by_type
+from .rule_comparator import RuleComparator
+from .form_index import FormIndex, extract_form_fill_metadatas
+from .incremental import IncrementalEvalState, field_fingerprint, reference_stamp
 
 
 class FormFillEvaluator:
@@ -41,7 +48,8 @@ class FormFillEvaluator:
         self,
         use_llm: bool = True,
         llm_threshold: float = 0.8,
-        pass_threshold: float = 0.90
+        pass_threshold: float = 0.90,
+        incremental: bool = False
     ):
         """
         Initialize the evaluator.
@@ -50,6 +58,8 @@ class FormFillEvaluator:
             use_llm: Whether to use LLM for fuzzy matching
             llm_threshold: Confidence threshold for LLM matches
             pass_threshold: Overall score threshold for passing evaluation
+            incremental: Reuse unchanged fields' results from earlier
+                evaluate() calls on this instance (for self-heal loops)
         """
         self.use_llm = use_llm
         self.llm_threshold = llm_threshold
@@ -58,6 +68,7 @@ class FormFillEvaluator:
             use_llm=use_llm,
             llm_threshold=llm_threshold
         )
+        self.incremental_state = IncrementalEvalState() if incremental else None
 
     def load_json(self, path: str) -> Dict[str, Any]:
         """
@@ -76,8 +87,7 @@ class FormFillEvaluator:
         if not os.path.exists(path):
             raise FileNotFoundError(f"File not found: {path}")
 
-        with open(path, 'r') as f:
-            return json.load(f)
+        return json_io.load(path)
 
     def extract_form_fill_metadatas(
         self,
@@ -94,16 +104,7 @@ class FormFillEvaluator:
         Returns:
             List of formFillMetadata objects
         """
-        template = data.get("template", data)  # Handle both with and without template wrapper
-
-        document_types = template.get("documentTypes", [])
-
-        all_fields = []
-        for doc_type in document_types:
-            fields = doc_type.get("formFillMetadatas", [])
-            all_fields.extend(fields)
-
-        return all_fields
+        return extract_form_fill_metadatas(data)
 
     def evaluate(
         self,
@@ -126,13 +127,12 @@ class FormFillEvaluator:
             print(f"Loading generated JSON: {generated_path}")
             print(f"Loading reference JSON: {reference_path}")
 
-        # Load JSON files
-        generated_data = self.load_json(generated_path)
-        reference_data = self.load_json(reference_path)
-
-        # Extract formFillMetadatas
-        generated_fields = self.extract_form_fill_metadatas(generated_data)
-        reference_fields = self.extract_form_fill_metadatas(reference_data)
+        # Load JSON files and index their formFillMetadatas; only the metadata
+        # lists are kept, the rest of each document is released here
+        generated_index = FormIndex.from_document(self.load_json(generated_path))
+        reference_index = FormIndex.from_document(self.load_json(reference_path))
+        generated_fields = generated_index.fields
+        reference_fields = reference_index.fields
 
         if verbose:
             print(f"Generated fields: {len(generated_fields)}")
@@ -144,7 +144,9 @@ class FormFillEvaluator:
 
         field_comparison_result = self.field_comparator.compare_all_fields(
             generated_fields,
-            reference_fields
+            reference_fields,
+            generated_index=generated_index,
+            reference_index=reference_index,
         )
 
         matched_pairs = field_comparison_result["matched_pairs"]
@@ -163,7 +165,9 @@ class FormFillEvaluator:
             generated_fields,
             reference_fields,
             field_id_mapping,
-            self.field_comparator
+            self.field_comparator,
+            generated_index=generated_index,
+            reference_index=reference_index,
         )
 
         field_evaluations = []
@@ -172,41 +176,61 @@ class FormFillEvaluator:
         total_reference_rules = 0
         total_matched_rules = 0
 
-        for gen_field, ref_field, field_comparison in matched_pairs:
-            # Compare rules
-            rule_comparison = rule_comparator.compare_field_rules(gen_field, ref_field)
+        incremental = self.incremental_state
+        if incremental is not None:
+            incremental.begin(reference_stamp(reference_path))
 
+        for gen_field, ref_field, field_comparison in matched_pairs:
+            field_eval = None
+            if incremental is not None:
+                fingerprint = field_fingerprint(
+                    gen_field,
+                    reference_index.position_of(ref_field),
+                    field_comparison.name_match.match_type,
+                    field_comparison.type_match,
+                    rule_comparator,
+                )
+                field_eval = incremental.lookup(fingerprint)
+
+            if field_eval is None:
+                # Compare rules
+                rule_comparison = rule_comparator.compare_field_rules(gen_field, ref_field)
+
+                # Build FieldEvalResult
+                gen_record = generated_index.record_of(gen_field)
+                ref_record = reference_index.record_of(ref_field)
+                field_eval = FieldEvalResult(
+                    field_id=gen_record.id,
+                    field_name=gen_record.name if gen_record.name is not None else "Unknown",
+                    field_type=gen_record.type,
+                    is_matched=True,
+                    matched_reference_field_id=ref_record.id,
+                    matched_reference_field_name=ref_record.name if ref_record.name is not None else "Unknown",
+                    name_match_type=field_comparison.name_match.match_type,
+                    type_match=field_comparison.type_match,
+                    rule_comparison=rule_comparison,
+                )
+                if incremental is not None:
+                    incremental.store(fingerprint, field_eval)
+
+            rule_comparison = field_eval.rule_comparison
             total_generated_rules += rule_comparison.total_generated_rules
             total_reference_rules += rule_comparison.total_reference_rules
             total_matched_rules += rule_comparison.matched_rules
 
             all_discrepancies.extend(rule_comparison.discrepancies)
-
-            # Build FieldEvalResult
-            gen_form_tag = gen_field.get("formTag", {})
-            field_eval = FieldEvalResult(
-                field_id=gen_field.get("id", 0),
-                field_name=gen_form_tag.get("name", "Unknown"),
-                field_type=gen_form_tag.get("type", "UNKNOWN"),
-                is_matched=True,
-                matched_reference_field_id=ref_field.get("id", 0),
-                matched_reference_field_name=ref_field.get("formTag", {}).get("name", "Unknown"),
-                name_match_type=field_comparison.name_match.match_type,
-                type_match=field_comparison.type_match,
-                rule_comparison=rule_comparison,
-            )
             field_evaluations.append(field_eval)
 
         # Add evaluations for unmatched generated fields
         for gen_field in field_comparison_result["unmatched_generated"]:
-            gen_form_tag = gen_field.get("formTag", {})
-            gen_rules = gen_field.get("formFillRules", [])
+            gen_record = generated_index.record_of(gen_field)
+            gen_rules = gen_record.rules
             total_generated_rules += len(gen_rules)
 
             field_eval = FieldEvalResult(
-                field_id=gen_field.get("id", 0),
-                field_name=gen_form_tag.get("name", "Unknown"),
-                field_type=gen_form_tag.get("type", "UNKNOWN"),
+                field_id=gen_record.id,
+                field_name=gen_record.name if gen_record.name is not None else "Unknown",
+                field_type=gen_record.type,
                 is_matched=False,
                 matched_reference_field_id=None,
                 matched_reference_field_name=None,
@@ -218,9 +242,13 @@ class FormFillEvaluator:
 
         # Count reference rules from unmatched fields
         for ref_field in field_comparison_result["unmatched_reference"]:
-            ref_rules = ref_field.get("formFillRules", [])
+            ref_rules = reference_index.record_of(ref_field).rules
             total_reference_rules += len(ref_rules)
 
+        if incremental is not None and verbose:
+            print(f"Incremental: reused {incremental.reused}, "
+                  f"recomputed {incremental.recomputed} matched field results")
+
         # Calculate metrics
         field_coverage = len(matched_pairs) / len(reference_fields) if reference_fields else 1.0
         rule_coverage = total_matched_rules / total_reference_rules if total_reference_rules else 1.0
@@ -236,12 +264,10 @@ class FormFillEvaluator:
 
         passed = overall_score >= self.pass_threshold
 
-        # Build rule type comparison
-        gen_rule_counts = count_rules_by_type(generated_fields)
-        ref_rule_counts = count_rules_by_type(reference_fields)
+        # Build rule type comparison (counted while indexing)
         rule_type_comparison = {
-            "generated": gen_rule_counts,
-            "reference": ref_rule_counts,
+            "generated": dict(generated_index.rule_counts),
+            "reference": dict(reference_index.rule_counts),
         }
 
         if verbose:
@@ -535,8 +561,7 @@ class FormFillEvaluator:
         )
 
         # Save report
-        with open(output_path, 'w') as f:
-            json.dump(report.to_dict(), f, indent=2)
+        json_io.dump(report.to_dict(), output_path, pretty=True)
 
         if verbose:
             print(f"Report saved to: {output_path}")
@@ -4,12 +4,43 @@ Field Comparator for the Eval framework.
 Compares fields between generated and reference JSON using:
 1. Equality check first (deterministic)
 2. LLM fallback for fuzzy matching
+
+compare_all_fields aligns the two field lists in stages:
+1. Exact and normalized name lookups in hash buckets (O(N+M))
+2. For the fields still unmatched, a short list of the most similar
+   unmatched reference names per generated field (token overlap, character
+   similarity, initials)
+3. LLM adjudication of those candidates only (if enabled), all candidate
+   pairs in batched requests
+
+LLM decisions are cached in memory and in the persistent LLMDecisionCache
+(see llm_decision_cache.py), so repeated eval runs and self-heal iterations
+only ask about name pairs they have not seen before.
+
+Names, types and IDs are read from the FieldRecords of a FormIndex (see
+form_index.py), built once per document, not from the formTag dicts.
 """
 
 import re
+from collections import defaultdict
+from difflib import SequenceMatcher
+from functools import lru_cache
 from typing import Dict, Any, List, Optional, Tuple
+from .form_index import FieldRecord, FormIndex
 from .models import FieldMatch, FieldComparison, Discrepancy, DiscrepancyType, DiscrepancySeverity
-from .llm_client import FieldMatchLLM, get_llm_client
+from .llm_client import FieldMatchLLM, MockLLMClient, get_llm_client
+from .llm_decision_cache import LLMDecisionCache, decision_key, model_id
+
+
+# Candidate reference fields per unmatched generated field sent to the LLM
+MAX_LLM_CANDIDATES = 5
+
+# Minimum name similarity (0-1) for a reference field to be an LLM candidate
+MIN_CANDIDATE_SIMILARITY = 0.3
+
+_EDGE_UNDERSCORES = re.compile(r'^_+|_+$')
+_SPECIAL_CHARS = re.compile(r'[^a-z0-9\s]')
+_WHITESPACE_RUNS = re.compile(r'\s+')
 
 
 class FieldComparator:
@@ -26,7 +57,8 @@ class FieldComparator:
         self,
         use_llm: bool = True,
         llm_threshold: float = 0.8,
-        llm_client: Optional[Any] = None
+        llm_client: Optional[Any] = None,
+        decision_cache: Optional[LLMDecisionCache] = None
     ):
         """
         Initialize the FieldComparator.
@@ -35,10 +67,19 @@ class FieldComparator:
             use_llm: Whether to use LLM for fuzzy matching
             llm_threshold: Confidence threshold for LLM matches
             llm_client: Optional LLM client instance
+            decision_cache: Persistent LLM decision cache (default:
+                LLMDecisionCache.default(), none if EVAL_LLM_CACHE_DIR=off
+                or the client is a MockLLMClient)
         """
         self.use_llm = use_llm
         self.llm_threshold = llm_threshold
         self.field_match_llm = FieldMatchLLM(llm_client) if use_llm else None
+        self.decision_cache = None
+        self._model_id = ""
+        # Mock answers cost nothing and are not worth persisting
+        if self.field_match_llm and not isinstance(self.field_match_llm.client, MockLLMClient):
+            self.decision_cache = decision_cache or LLMDecisionCache.default()
+            self._model_id = model_id(self.field_match_llm.client)
 
         # Cache for LLM matches to avoid redundant calls
         self._llm_cache: Dict[Tuple[str, str], Dict[str, Any]] = {}
@@ -54,20 +95,7 @@ class FieldComparator:
         Returns:
             Normalized field name (lowercase, no special chars)
         """
-        # Remove leading/trailing whitespace
-        name = name.strip()
-
-        # Convert to lowercase
-        name = name.lower()
-
-        # Remove variable-style prefixes/suffixes (_fieldName_ -> fieldName)
-        name = re.sub(r'^_+|_+$', '', name)
-
-        # Replace special characters and multiple spaces with single space
-        name = re.sub(r'[^a-z0-9\s]', ' ', name)
-        name = re.sub(r'\s+', ' ', name)
-
-        return name.strip()
+        return _normalize_name(name)
 
     def exact_match(self, name1: str, name2: str) -> bool:
         """
@@ -121,25 +149,86 @@ class FieldComparator:
                 "reasoning": "LLM matching disabled"
             }
 
-        # Check cache
-        cache_key = (name1.lower(), name2.lower())
-        if cache_key in self._llm_cache:
-            return self._llm_cache[cache_key]
+        return self.llm_match_batch([(name1, name2, context1, context2)])[0]
 
-        # Also check reverse
-        cache_key_rev = (name2.lower(), name1.lower())
-        if cache_key_rev in self._llm_cache:
-            return self._llm_cache[cache_key_rev]
+    def llm_match_batch(
+        self,
+        pairs: List[Tuple[str, str, Optional[str], Optional[str]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Check many name pairs using LLM, with batched requests.
 
-        # Make LLM call
-        result = self.field_match_llm.match_field_names(
-            name1, name2, context1, context2
-        )
+        Pairs are looked up in the in-memory cache, then in the persistent
+        decision cache. The rest go to the LLM in batched requests, and
+        successful decisions are added to both caches.
 
-        # Cache result
-        self._llm_cache[cache_key] = result
+        Args:
+            pairs: (name1, name2, context1, context2) tuples
 
-        return result
+        Returns:
+            One dict with is_match, confidence, reasoning per pair, in order
+        """
+        if not self.use_llm or not self.field_match_llm:
+            return [{
+                "is_match": False,
+                "confidence": 0.0,
+                "reasoning": "LLM matching disabled"
+            } for _ in pairs]
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(pairs)
+
+        # Check cache (either order)
+        pending: Dict[Tuple[str, str], List[int]] = {}
+        for i, (name1, name2, _, _) in enumerate(pairs):
+            cache_key = (name1.lower(), name2.lower())
+            cached = self._llm_cache.get(cache_key) or self._llm_cache.get((cache_key[1], cache_key[0]))
+            if cached is not None:
+                results[i] = cached
+            else:
+                pending.setdefault(cache_key, []).append(i)
+
+        # Check the persistent cache
+        disk_keys = {}
+        if pending and self.decision_cache:
+            for cache_key, indexes in pending.items():
+                name1, name2, context1, context2 = pairs[indexes[0]]
+                disk_keys[cache_key] = decision_key(
+                    self.normalize_name(name1), self.normalize_name(name2),
+                    context1, context2, self._model_id,
+                )
+            found = self.decision_cache.get_many(disk_keys.values())
+            for cache_key in list(pending):
+                decision = found.get(disk_keys[cache_key])
+                if decision is not None:
+                    self._store_llm_result(cache_key, pending.pop(cache_key), decision, results)
+
+        # Make LLM calls
+        if pending:
+            cache_keys = list(pending)
+            llm_results = self.field_match_llm.match_field_names_batch(
+                [pairs[pending[cache_key][0]] for cache_key in cache_keys]
+            )
+            new_decisions = {}
+            for cache_key, result in zip(cache_keys, llm_results):
+                self._store_llm_result(cache_key, pending[cache_key], result, results)
+                if cache_key in disk_keys and not str(result.get("reasoning", "")).startswith("Error"):
+                    new_decisions[disk_keys[cache_key]] = result
+            if self.decision_cache:
+                self.decision_cache.put_many(new_decisions, self._model_id)
+
+        return results
+
+    def _store_llm_result(
+        self,
+        cache_key: Tuple[str, str],
+        indexes: List[int],
+        result: Dict[str, Any],
+        results: List[Optional[Dict[str, Any]]]
+    ):
+        """Cache an LLM result in memory and fill it in for its pairs."""
+        self._llm_cache[cache_key] = result
+        for i in indexes:
+            results[i] = result
 
     def compare_names(
         self,
@@ -246,7 +335,8 @@ class FieldComparator:
     def compare_field(
         self,
         generated_field: Dict[str, Any],
-        reference_field: Dict[str, Any]
+        reference_field: Dict[str, Any],
+        name_match: Optional[FieldMatch] = None
     ) -> FieldComparison:
         """
         Compare a single generated field against a reference field.
@@ -254,34 +344,53 @@ class FieldComparator:
         Args:
             generated_field: Field from generated JSON
             reference_field: Field from reference JSON
+            name_match: Name comparison already made for this pair (skips
+                compare_names)
 
         Returns:
             FieldComparison object with comparison result
         """
-        # Extract field info
-        gen_id = generated_field.get("id", 0)
-        ref_id = reference_field.get("id", 0)
+        return self.compare_records(
+            FieldRecord.from_metadata(generated_field),
+            FieldRecord.from_metadata(reference_field),
+            name_match,
+        )
 
-        gen_form_tag = generated_field.get("formTag", {})
-        ref_form_tag = reference_field.get("formTag", {})
+    def compare_records(
+        self,
+        gen_record: FieldRecord,
+        ref_record: FieldRecord,
+        name_match: Optional[FieldMatch] = None
+    ) -> FieldComparison:
+        """
+        compare_field for two indexed fields.
 
-        gen_name = gen_form_tag.get("name", "")
-        ref_name = ref_form_tag.get("name", "")
+        Args:
+            gen_record: FieldRecord of the generated field
+            ref_record: FieldRecord of the reference field
+            name_match: Name comparison already made for this pair (skips
+                compare_names)
 
-        gen_type = gen_form_tag.get("type", "")
-        ref_type = ref_form_tag.get("type", "")
+        Returns:
+            FieldComparison object with comparison result
+        """
+        gen_name = _record_name(gen_record)
+        ref_name = _record_name(ref_record)
+        gen_type = gen_record.type
+        ref_type = ref_record.type
 
         is_panel = gen_type.upper() == "PANEL" or ref_type.upper() == "PANEL"
 
         # Compare names
-        name_match = self.compare_names(gen_name, ref_name)
+        if name_match is None:
+            name_match = self.compare_names(gen_name, ref_name)
 
         # Compare types
         type_match = self.compare_types(gen_type, ref_type)
 
         return FieldComparison(
-            generated_field_id=gen_id,
-            reference_field_id=ref_id,
+            generated_field_id=gen_record.id,
+            reference_field_id=ref_record.id,
             generated_field_name=gen_name,
             reference_field_name=ref_name,
             name_match=name_match,
@@ -343,7 +452,9 @@ class FieldComparator:
     def compare_all_fields(
         self,
         generated_fields: List[Dict[str, Any]],
-        reference_fields: List[Dict[str, Any]]
+        reference_fields: List[Dict[str, Any]],
+        generated_index: Optional[FormIndex] = None,
+        reference_index: Optional[FormIndex] = None
     ) -> Dict[str, Any]:
         """
         Compare all fields between generated and reference JSON.
@@ -351,6 +462,8 @@ class FieldComparator:
         Args:
             generated_fields: List of fields from generated JSON
             reference_fields: List of fields from reference JSON
+            generated_index: FormIndex of generated_fields, if already built
+            reference_index: FormIndex of reference_fields, if already built
 
         Returns:
             Dictionary with comparison results including:
@@ -365,17 +478,20 @@ class FieldComparator:
         matched_ref_ids = set()
         field_id_mapping = {}
         discrepancies = []
+        gen_records = (generated_index or FormIndex(generated_fields)).records
+        ref_records = (reference_index or FormIndex(reference_fields)).records
 
-        # First pass: find matches
-        for gen_field in generated_fields:
-            ref_field, comparison = self.find_matching_field(
-                gen_field, reference_fields, matched_ref_ids
-            )
+        # First pass: find matches (generated index -> (reference record, comparison))
+        matches = self._align_by_name(gen_records, ref_records, matched_ref_ids)
+        if self.use_llm:
+            matches.update(self._align_with_llm(gen_records, ref_records, matches, matched_ref_ids))
+
+        for gen_index, gen_record in enumerate(gen_records):
+            ref_record, comparison = matches.get(gen_index, (None, None))
 
-            if ref_field and comparison:
-                matched_pairs.append((gen_field, ref_field, comparison))
-                matched_ref_ids.add(ref_field.get("id", 0))
-                field_id_mapping[gen_field.get("id", 0)] = ref_field.get("id", 0)
+            if ref_record and comparison:
+                matched_pairs.append((gen_record.metadata, ref_record.metadata, comparison))
+                field_id_mapping[gen_record.id] = ref_record.id
 
                 # Check for type mismatch
                 if not comparison.type_match:
@@ -390,45 +506,45 @@ class FieldComparator:
                         fix_instruction=f"Change field type from {comparison.generated_type} to {comparison.reference_type}",
                     ))
             else:
-                unmatched_generated.append(gen_field)
+                unmatched_generated.append(gen_record)
 
         # Find unmatched reference fields
         unmatched_reference = [
-            ref_field for ref_field in reference_fields
-            if ref_field.get("id", 0) not in matched_ref_ids
+            ref_record for ref_record in ref_records
+            if ref_record.id not in matched_ref_ids
         ]
 
         # Create discrepancies for unmatched fields
-        for gen_field in unmatched_generated:
-            gen_form_tag = gen_field.get("formTag", {})
+        for gen_record in unmatched_generated:
+            gen_name = gen_record.name if gen_record.name is not None else "Unknown"
             discrepancies.append(Discrepancy(
                 type=DiscrepancyType.FIELD_MISSING,
                 severity=DiscrepancySeverity.LOW,  # Extra field in generated
-                field_name=gen_form_tag.get("name", "Unknown"),
+                field_name=gen_name,
                 rule_id=None,
-                message=f"Generated field '{gen_form_tag.get('name', 'Unknown')}' has no matching reference field",
+                message=f"Generated field '{gen_name}' has no matching reference field",
                 expected=None,
-                actual=gen_form_tag.get("name", "Unknown"),
+                actual=gen_name,
                 fix_instruction="This may be an extra field not in reference",
             ))
 
-        for ref_field in unmatched_reference:
-            ref_form_tag = ref_field.get("formTag", {})
+        for ref_record in unmatched_reference:
+            ref_name = ref_record.name if ref_record.name is not None else "Unknown"
             discrepancies.append(Discrepancy(
                 type=DiscrepancyType.FIELD_MISSING,
                 severity=DiscrepancySeverity.HIGH,  # Missing field in generated
-                field_name=ref_form_tag.get("name", "Unknown"),
+                field_name=ref_name,
                 rule_id=None,
-                message=f"Reference field '{ref_form_tag.get('name', 'Unknown')}' not found in generated output",
-                expected=ref_form_tag.get("name", "Unknown"),
+                message=f"Reference field '{ref_name}' not found in generated output",
+                expected=ref_name,
                 actual=None,
-                fix_instruction=f"Add field '{ref_form_tag.get('name', 'Unknown')}' to generated output",
+                fix_instruction=f"Add field '{ref_name}' to generated output",
             ))
 
         return {
             "matched_pairs": matched_pairs,
-            "unmatched_generated": unmatched_generated,
-            "unmatched_reference": unmatched_reference,
+            "unmatched_generated": [record.metadata for record in unmatched_generated],
+            "unmatched_reference": [record.metadata for record in unmatched_reference],
             "field_id_mapping": field_id_mapping,
             "discrepancies": discrepancies,
             "summary": {
@@ -441,69 +557,202 @@ class FieldComparator:
         }
 
 
-def build_field_id_to_name_map(fields: List[Dict[str, Any]]) -> Dict[int, str]:
-    """
-    Build a mapping from field ID to field name.
+    def _align_by_name(
+        self,
+        gen_records: List[FieldRecord],
+        ref_records: List[FieldRecord],
+        matched_ref_ids: set
+    ) -> Dict[int, Tuple[FieldRecord, FieldComparison]]:
+        """
+        Exact and normalized name matches via hash buckets.
 
-    Args:
-        fields: List of field dictionaries
+        Generated fields are matched in order. Each one takes the first
+        unmatched reference field with the same name (case-insensitive), or
+        failing that the first with the same normalized name. That is the
+        pair find_matching_field picks without LLM matching. Matched
+        reference IDs are added to matched_ref_ids.
 
-    Returns:
-        Dictionary mapping field IDs to names
-    """
-    id_to_name = {}
-    for field in fields:
-        field_id = field.get("id", 0)
-        form_tag = field.get("formTag", {})
-        name = form_tag.get("name", f"field_{field_id}")
-        id_to_name[field_id] = name
-    return id_to_name
+        Returns:
+            Dict of generated field index -> (reference record, comparison)
+        """
+        exact_buckets: Dict[str, List[int]] = defaultdict(list)
+        normalized_buckets: Dict[str, List[int]] = defaultdict(list)
+        for ref_index, ref_record in enumerate(ref_records):
+            ref_name = _record_name(ref_record)
+            exact_buckets[ref_name.strip().lower()].append(ref_index)
+            normalized_buckets[self.normalize_name(ref_name)].append(ref_index)
+
+        # Position of the first possibly-unmatched entry in each bucket
+        exact_cursor: Dict[str, int] = defaultdict(int)
+        normalized_cursor: Dict[str, int] = defaultdict(int)
+
+        def first_unmatched(buckets, cursors, key) -> Optional[int]:
+            bucket = buckets.get(key)
+            if not bucket:
+                return None
+            pos = cursors[key]
+            # Entries before the cursor are matched for good (IDs only get added)
+            while pos < len(bucket) and ref_records[bucket[pos]].id in matched_ref_ids:
+                pos += 1
+            cursors[key] = pos
+            return bucket[pos] if pos < len(bucket) else None
+
+        matches = {}
+        for gen_index, gen_record in enumerate(gen_records):
+            gen_name = _record_name(gen_record)
+
+            ref_index = first_unmatched(exact_buckets, exact_cursor, gen_name.strip().lower())
+            if ref_index is None:
+                ref_index = first_unmatched(normalized_buckets, normalized_cursor, self.normalize_name(gen_name))
+            if ref_index is None:
+                continue
 
+            ref_record = ref_records[ref_index]
+            ref_name = _record_name(ref_record)
+            if self.exact_match(gen_name, ref_name):
+                name_match = FieldMatch(is_match=True, match_type="exact", confidence=1.0,
+                                        generated_name=gen_name, reference_name=ref_name)
+            else:
+                name_match = FieldMatch(is_match=True, match_type="normalized", confidence=0.95,
+                                        generated_name=gen_name, reference_name=ref_name)
 
-def build_field_id_to_type_map(fields: List[Dict[str, Any]]) -> Dict[int, str]:
-    """
-    Build a mapping from field ID to field type.
+            matches[gen_index] = (ref_record, self.compare_records(gen_record, ref_record, name_match))
+            matched_ref_ids.add(ref_record.id)
 
-    Args:
-        fields: List of field dictionaries
+        return matches
 
-    Returns:
-        Dictionary mapping field IDs to types
-    """
-    id_to_type = {}
-    for field in fields:
-        field_id = field.get("id", 0)
-        form_tag = field.get("formTag", {})
-        field_type = form_tag.get("type", "UNKNOWN")
-        id_to_type[field_id] = field_type
-    return id_to_type
+    def _align_with_llm(
+        self,
+        gen_records: List[FieldRecord],
+        ref_records: List[FieldRecord],
+        matches: Dict[int, Tuple[FieldRecord, FieldComparison]],
+        matched_ref_ids: set
+    ) -> Dict[int, Tuple[FieldRecord, FieldComparison]]:
+        """
+        LLM adjudication for the fields left unmatched by _align_by_name.
 
+        Each unmatched generated field gets at most MAX_LLM_CANDIDATES of the
+        most similar unmatched reference fields. All candidate pairs are
+        adjudicated in one llm_match_batch call. Then, in order, each
+        generated field takes the candidate with the highest accepted LLM
+        confidence that an earlier field has not taken.
 
-def build_rule_id_to_field_map(fields: List[Dict[str, Any]]) -> Dict[int, Dict[str, Any]]:
-    """
-    Build a mapping from rule ID to the field it belongs to.
+        Returns:
+            Dict of generated field index -> (reference record, comparison)
+        """
+        residual_refs = [
+            ref_record for ref_record in ref_records
+            if ref_record.id not in matched_ref_ids
+        ]
+        if not residual_refs:
+            return {}
 
-    Args:
-        fields: List of field dictionaries
+        ref_profiles = [_NameProfile(self.normalize_name(_record_name(r))) for r in residual_refs]
 
-    Returns:
-        Dictionary mapping rule IDs to field info
-    """
-    rule_to_field = {}
-    for field in fields:
-        field_id = field.get("id", 0)
-        form_tag = field.get("formTag", {})
-        field_name = form_tag.get("name", f"field_{field_id}")
-        field_type = form_tag.get("type", "UNKNOWN")
-
-        rules = field.get("formFillRules", [])
-        for rule in rules:
-            rule_id = rule.get("id", 0)
-            rule_to_field[rule_id] = {
-                "field_id": field_id,
-                "field_name": field_name,
-                "field_type": field_type,
-                "rule": rule,
-            }
+        # Candidates per unmatched generated field: gen index -> [residual positions]
+        candidates: Dict[int, List[int]] = {}
+        for gen_index, gen_record in enumerate(gen_records):
+            if gen_index in matches:
+                continue
+
+            gen_name = _record_name(gen_record)
+            gen_profile = _NameProfile(self.normalize_name(gen_name))
+
+            scored = []
+            for pos in range(len(residual_refs)):
+                score = gen_profile.similarity(ref_profiles[pos])
+                if score >= MIN_CANDIDATE_SIMILARITY:
+                    scored.append((-score, pos))
+            scored.sort()
+            if scored:
+                candidates[gen_index] = [pos for _, pos in scored[:MAX_LLM_CANDIDATES]]
+
+        pairs = [
+            (_record_name(gen_records[gen_index]), _record_name(residual_refs[pos]), None, None)
+            for gen_index, positions in candidates.items()
+            for pos in positions
+        ]
+        decisions = iter(self.llm_match_batch(pairs))
+
+        llm_matches = {}
+        for gen_index, positions in candidates.items():
+            gen_record = gen_records[gen_index]
+            gen_name = _record_name(gen_record)
+
+            best = None
+            best_confidence = 0.0
+            for pos in positions:
+                llm_result = next(decisions)
+                ref_record = residual_refs[pos]
+                if ref_record.id in matched_ref_ids:
+                    continue
+                ref_name = _record_name(ref_record)
+                if llm_result["is_match"] and llm_result["confidence"] >= self.llm_threshold \
+                        and llm_result["confidence"] > best_confidence:
+                    best_confidence = llm_result["confidence"]
+                    best = (ref_record, FieldMatch(
+                        is_match=True,
+                        match_type="llm",
+                        confidence=llm_result["confidence"],
+                        generated_name=gen_name,
+                        reference_name=ref_name,
+                        llm_reasoning=llm_result.get("reasoning"),
+                    ))
+
+            if best:
+                ref_record, name_match = best
+                llm_matches[gen_index] = (ref_record, self.compare_records(gen_record, ref_record, name_match))
+                matched_ref_ids.add(ref_record.id)
+
+        return llm_matches
+
+
+def _record_name(record: FieldRecord) -> str:
+    """Field name for matching ("" for unnamed fields)."""
+    return record.name if record.name is not None else ""
+
+
+@lru_cache(maxsize=16384)
+def _normalize_name(name: str) -> str:
+    """FieldComparator.normalize_name, memoized (rule comparison normalizes the same names many times)."""
+    # Remove leading/trailing whitespace
+    name = name.strip()
+
+    # Convert to lowercase
+    name = name.lower()
+
+    # Remove variable-style prefixes/suffixes (_fieldName_ -> fieldName)
+    name = _EDGE_UNDERSCORES.sub('', name)
+
+    # Replace special characters and multiple spaces with single space
+    name = _SPECIAL_CHARS.sub(' ', name)
+    name = _WHITESPACE_RUNS.sub(' ', name)
+
+    return name.strip()
+
+
+class _NameProfile:
+    """Normalized field name with its tokens and initials, for candidate scoring."""
+
+    __slots__ = ("name", "tokens", "initials")
+
+    def __init__(self, normalized_name: str):
+        self.name = normalized_name
+        self.tokens = frozenset(normalized_name.split())
+        self.initials = "".join(token[0] for token in normalized_name.split())
 
-    return rule_to_field
+    def similarity(self, other: "_NameProfile") -> float:
+        """Max of token overlap, character similarity and initials match (0-1)."""
+        if not self.name or not other.name:
+            return 0.0
+        union = self.tokens | other.tokens
+        token_score = len(self.tokens & other.tokens) / len(union) if union else 0.0
+        # "pan" vs "permanent account number"
+        if len(self.initials) > 1 and self.initials == other.name.replace(" ", ""):
+            return 1.0
+        if len(other.initials) > 1 and other.initials == self.name.replace(" ", ""):
+            return 1.0
+        matcher = SequenceMatcher(None, self.name, other.name)
+        if matcher.real_quick_ratio() <= token_score:
+            return token_score
+        return max(token_score, matcher.ratio())
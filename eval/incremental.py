@@ -0,0 +1,121 @@
+"""
+Incremental evaluation state for self-heal loops.
+
+Between self-heal iterations the agent usually changes a handful of fields.
+A FormFillEvaluator created with incremental=True keeps an
+IncrementalEvalState and, on the next evaluate() against the same reference
+file, reuses the FieldEvalResult (and its RuleComparison) of every matched
+field whose fingerprint is unchanged. Rule comparison, the expensive part,
+then runs only for changed fields. Rule totals are still summed over all
+fields from their (cached) results, so aggregation stays linear in the
+number of fields, like field alignment.
+
+A matched field's fingerprint covers everything its rule comparison reads:
+- the generated metadata entry (canonical JSON)
+- the reference field it is matched to and how (name match type, type match)
+- the name and type of every field ID its rules reference, and the field
+  name and action type of every postTriggerRuleId target
+
+So renaming field A also invalidates the fields whose rules point at A.
+Field alignment (compare_all_fields) is still redone on every evaluation; it
+is a linear pass with cached LLM decisions.
+"""
+
+import hashlib
+import os
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from common import json_io
+
+from .models import FieldEvalResult
+
+# Reusable field results kept across evaluations (least recently used dropped first)
+MAX_CACHED_FIELD_RESULTS = 20000
+
+
+def reference_stamp(reference_path: str) -> Tuple:
+    """Identity of a reference file: cached results are dropped when it changes."""
+    st = os.stat(reference_path)
+    return (os.path.abspath(reference_path), st.st_size, st.st_mtime_ns)
+
+
+def field_fingerprint(
+    generated_field: Dict[str, Any],
+    reference_index: int,
+    name_match_type: str,
+    type_match: bool,
+    rule_comparator: Any
+) -> str:
+    """
+    Fingerprint of a matched field pair for result reuse.
+
+    Args:
+        generated_field: Generated metadata entry
+        reference_index: Position of the matched reference field
+        name_match_type: How the names matched ("exact", "normalized", "llm")
+        type_match: Whether the field types matched
+        rule_comparator: RuleComparator of this evaluation (for ID resolution)
+
+    Returns:
+        Hex digest
+    """
+    index = rule_comparator.generated_index
+    dependencies = []
+    for rule in generated_field.get("formFillRules", []):
+        for field_id in list(rule.get("sourceIds") or []) + list(rule.get("destinationIds") or []):
+            record = index.field(field_id)
+            dependencies.append((record.label, record.type) if record else (None, None))
+        for rule_id in rule.get("postTriggerRuleIds") or []:
+            owner = index.rule_owner(rule_id)
+            dependencies.append(
+                (owner[0].label, owner[1].get("actionType", "")) if owner else None
+            )
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(json_io.dumps(generated_field, sort_keys=True, default=str).encode("utf-8"))
+    digest.update(json_io.dumps(
+        [reference_index, name_match_type, type_match, dependencies], default=str
+    ).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class IncrementalEvalState:
+    """
+    Field results of previous evaluations against one reference.
+
+    Attributes:
+        reused: Field results reused in the last evaluation
+        recomputed: Field results computed in the last evaluation
+    """
+
+    def __init__(self, max_entries: int = MAX_CACHED_FIELD_RESULTS):
+        self.max_entries = max_entries
+        self.reference: Optional[Tuple] = None
+        self.reused = 0
+        self.recomputed = 0
+        self._results: "OrderedDict[str, FieldEvalResult]" = OrderedDict()
+
+    def begin(self, reference: Tuple):
+        """Start an evaluation; forget everything if the reference changed."""
+        if reference != self.reference:
+            self.reference = reference
+            self._results.clear()
+        self.reused = 0
+        self.recomputed = 0
+
+    def lookup(self, fingerprint: str) -> Optional[FieldEvalResult]:
+        """Cached result for a matched field, or None."""
+        result = self._results.get(fingerprint)
+        if result is not None:
+            self._results.move_to_end(fingerprint)
+            self.reused += 1
+        return result
+
+    def store(self, fingerprint: str, result: FieldEvalResult):
+        """Cache the result computed for a matched field."""
+        self.recomputed += 1
+        self._results[fingerprint] = result
+        self._results.move_to_end(fingerprint)
+        while len(self._results) > self.max_entries:
+            self._results.popitem(last=False)
@@ -9,7 +9,7 @@ Provides a unified interface for making LLM calls for:
 
 import os
 import json
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from abc import ABC, abstractmethod
 
 # Try to import OpenAI
@@ -134,7 +134,18 @@ class MockLLMClient(LLMClient):
         temperature: float = 0.0,
         max_tokens: int = 1000,
     ) -> str:
-        # Return a simple response for field matching
+        # Return a simple response for field matching (one object per pair when batched)
+        pair_count = sum(1 for line in prompt.splitlines() if line.startswith("Pair "))
+        if pair_count and "field" in prompt.lower():
+            return json.dumps([
+                {
+                    "index": index,
+                    "is_match": False,
+                    "confidence": 0.5,
+                    "reasoning": "Mock response - no LLM available"
+                }
+                for index in range(1, pair_count + 1)
+            ])
         if "match" in prompt.lower() and "field" in prompt.lower():
             return json.dumps({
                 "is_match": False,
@@ -178,9 +189,7 @@ def get_llm_client(prefer: str = "openai") -> LLMClient:
 class FieldMatchLLM:
     """LLM-based field name matcher."""
 
-    SYSTEM_PROMPT = """You are a field name matching expert. Your task is to determine if two field names refer to the same field in a form.
-
-Consider the following when matching:
+    MATCHING_GUIDELINES = """Consider the following when matching:
 1. Semantic equivalence (e.g., "Name" and "Full Name" could be the same)
 2. Abbreviations (e.g., "Org" and "Organization")
 3. Different word orders (e.g., "First Name" and "Name First")
@@ -190,13 +199,31 @@ Consider the following when matching:
 However, be strict about:
 1. Different field purposes (e.g., "Billing Address" vs "Shipping Address" are different)
 2. Different data types implied (e.g., "Phone" vs "Email" are different)
-3. Different form sections (e.g., "Bank Name" in Bank Details vs "Company Name" in Basic Details)
+3. Different form sections (e.g., "Bank Name" in Bank Details vs "Company Name" in Basic Details)"""
+
+    SYSTEM_PROMPT = f"""You are a field name matching expert. Your task is to determine if two field names refer to the same field in a form.
+
+{MATCHING_GUIDELINES}
 
 Respond with a JSON object containing:
 - is_match: boolean indicating if fields match
 - confidence: float between 0 and 1
 - reasoning: brief explanation of your decision"""
 
+    BATCH_SYSTEM_PROMPT = f"""You are a field name matching expert. Your task is to determine, for each numbered pair of field names, if the two names refer to the same field in a form.
+
+{MATCHING_GUIDELINES}
+
+Respond with a JSON array containing one object per pair:
+- index: the pair number
+- is_match: boolean indicating if fields match
+- confidence: float between 0 and 1
+- reasoning: brief explanation of your decision"""
+
+    # Name pairs per batched request, and response tokens budgeted per pair
+    BATCH_SIZE = 20
+    BATCH_TOKENS_PER_PAIR = 60
+
     def __init__(self, client: Optional[LLMClient] = None):
         self.client = client or get_llm_client()
 
@@ -239,16 +266,7 @@ Field 2: "{name2}"
                 max_tokens=200,
             )
 
-            # Parse JSON from response
-            # Handle potential markdown code blocks
-            response = response.strip()
-            if response.startswith("```"):
-                response = response.split("```")[1]
-                if response.startswith("json"):
-                    response = response[4:]
-            response = response.strip()
-
-            result = json.loads(response)
+            result = _parse_json_response(response)
             return {
                 "is_match": result.get("is_match", False),
                 "confidence": result.get("confidence", 0.0),
@@ -262,6 +280,94 @@ Field 2: "{name2}"
             }
 
 
+    def match_field_names_batch(
+        self,
+        pairs: List[Tuple[str, str, Optional[str], Optional[str]]],
+    ) -> List[Dict[str, Any]]:
+        """
+        Check many name pairs, BATCH_SIZE pairs per LLM request.
+
+        Args:
+            pairs: (name1, name2, context1, context2) tuples
+
+        Returns:
+            One dict with is_match, confidence and reasoning per pair, in
+            order. A pair missing from the response, or in a request that
+            failed, gets a no-match result whose reasoning starts with
+            "Error".
+        """
+        results = []
+        for start in range(0, len(pairs), self.BATCH_SIZE):
+            results.extend(self._match_batch(pairs[start:start + self.BATCH_SIZE]))
+        return results
+
+    def _match_batch(
+        self,
+        pairs: List[Tuple[str, str, Optional[str], Optional[str]]],
+    ) -> List[Dict[str, Any]]:
+        """One batched request for at most BATCH_SIZE pairs."""
+        if len(pairs) == 1:
+            return [self.match_field_names(*pairs[0])]
+
+        lines = ["Compare each pair of field names:", ""]
+        for index, (name1, name2, context1, context2) in enumerate(pairs, 1):
+            lines.append(f'Pair {index}: Field 1 "{name1}" | Field 2 "{name2}"')
+            if context1 or context2:
+                lines.append(f"  Contexts: {context1 or '-'} | {context2 or '-'}")
+        lines.append("")
+        lines.append("For each pair, do the two field names refer to the same form field? "
+                     "Respond with a JSON array only.")
+
+        try:
+            response = self.client.complete(
+                prompt="\n".join(lines),
+                system_prompt=self.BATCH_SYSTEM_PROMPT,
+                temperature=0.0,
+                max_tokens=100 + self.BATCH_TOKENS_PER_PAIR * len(pairs),
+            )
+            parsed = _parse_json_response(response)
+            if isinstance(parsed, dict):
+                parsed = parsed.get("results", [parsed])
+            by_index = {}
+            for item in parsed:
+                if isinstance(item, dict) and isinstance(item.get("index"), int):
+                    by_index[item["index"]] = item
+        except Exception as e:
+            error = {
+                "is_match": False,
+                "confidence": 0.0,
+                "reasoning": f"Error during batched LLM matching: {str(e)}",
+            }
+            return [dict(error) for _ in pairs]
+
+        results = []
+        for index in range(1, len(pairs) + 1):
+            item = by_index.get(index)
+            if item is None:
+                results.append({
+                    "is_match": False,
+                    "confidence": 0.0,
+                    "reasoning": f"Error during batched LLM matching: no result for pair {index}",
+                })
+            else:
+                results.append({
+                    "is_match": item.get("is_match", False),
+                    "confidence": item.get("confidence", 0.0),
+                    "reasoning": item.get("reasoning", ""),
+                })
+        return results
+
+
+def _parse_json_response(response: str) -> Any:
+    """Parse an LLM JSON response, handling markdown code blocks."""
+    response = response.strip()
+    if response.startswith("```"):
+        response = response.split("```")[1]
+        if response.startswith("json"):
+            response = response[4:]
+    return json.loads(response.strip())
+
+
 class ReportGeneratorLLM:
     """LLM-based report generator."""
 
@@ -377,15 +483,7 @@ Respond with a JSON array only."""
                 max_tokens=1500,
             )
 
-            # Parse JSON from response
-            response = response.strip()
-            if response.startswith("```"):
-                response = response.split("```")[1]
-                if response.startswith("json"):
-                    response = response[4:]
-            response = response.strip()
-
-            fixes = json.loads(response)
+            fixes = _parse_json_response(response)
             return fixes[:max_fixes] if isinstance(fixes, list) else []
         except Exception as e:
             # Fall back to simple extraction from discrepancies
@@ -0,0 +1,205 @@
+"""
+Persistent cache of LLM field-name match decisions.
+
+The same generated/reference name pairs are adjudicated again and again: by
+every `eval` run on the same BUD and by every self-heal iteration of the
+orchestrators, each of which builds a new FieldComparator. Decisions are kept
+in a small SQLite database so those runs (and concurrent processes) share
+them.
+
+A decision is keyed by the normalized names, their contexts and the model
+that made it. The key is symmetric: (A, B) and (B, A) share one entry. Failed
+LLM calls are never stored.
+
+    EVAL_LLM_CACHE_DIR   Database directory (default: <tmp>/doc_parser_eval_llm,
+                         set to "off" to disable the persistent cache)
+
+Usage:
+    from eval.llm_decision_cache import LLMDecisionCache
+
+    cache = LLMDecisionCache.default()      # None when disabled
+    decision = cache.get(key)
+    cache.put_many({key: decision})
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Union
+
+DB_FILENAME = "field_match_decisions.sqlite3"
+
+# Bump when the key or the stored decision changes so old entries are ignored
+CACHE_VERSION = 1
+
+
+def decision_key(
+    name1: str,
+    name2: str,
+    context1: Optional[str],
+    context2: Optional[str],
+    model: str,
+) -> str:
+    """
+    Cache key for one name-pair decision.
+
+    Args:
+        name1, name2: Normalized field names
+        context1, context2: Contexts sent with each name (or None)
+        model: Identifier of the model making the decision
+
+    Returns:
+        Hex digest, the same for both orders of the pair
+    """
+    sides = sorted([(name1, context1 or ""), (name2, context2 or "")])
+    payload = json.dumps([CACHE_VERSION, model, sides], ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def model_id(client: Any) -> str:
+    """Identifier of an LLM client's model ("OpenAIClient:gpt-4o-mini")."""
+    return f"{type(client).__name__}:{getattr(client, 'model', '')}"
+
+
+class LLMDecisionCache:
+    """
+    SQLite-backed decision store shared by processes on this machine.
+
+    The connection is opened lazily and per process, so instances can be
+    pickled into worker processes.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.hits = 0
+        self.misses = 0
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_pid: Optional[int] = None
+        self._failed = False
+        self._lock = threading.Lock()
+
+    @classmethod
+    def default(cls) -> Optional["LLMDecisionCache"]:
+        """The cache in EVAL_LLM_CACHE_DIR, or None if it is disabled."""
+        setting = os.environ.get("EVAL_LLM_CACHE_DIR", "")
+        if setting.lower() == "off":
+            return None
+        cache_dir = Path(setting) if setting else Path(tempfile.gettempdir()) / "doc_parser_eval_llm"
+        return cls(cache_dir / DB_FILENAME)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_conn"] = None
+        state["_conn_pid"] = None
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        if self._conn is not None and self._conn_pid == os.getpid():
+            return self._conn
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS decisions ("
+                " key TEXT PRIMARY KEY, model TEXT, is_match INTEGER,"
+                " confidence REAL, reasoning TEXT, created REAL)"
+            )
+            conn.commit()
+        except (OSError, sqlite3.Error) as e:
+            print(f"  Warning: LLM decision cache unavailable ({self.path}): {e}")
+            self._failed = True
+            return None
+        self._conn, self._conn_pid = conn, os.getpid()
+        return conn
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Look up several decisions.
+
+        Args:
+            keys: Keys from decision_key
+
+        Returns:
+            Dict of key -> {is_match, confidence, reasoning} for the keys found
+        """
+        keys = list(dict.fromkeys(keys))
+        if not keys or self._failed:
+            return {}
+        found = {}
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return {}
+            try:
+                # SQLite's default host-parameter limit is 999
+                for start in range(0, len(keys), 500):
+                    chunk = keys[start:start + 500]
+                    rows = conn.execute(
+                        "SELECT key, is_match, confidence, reasoning FROM decisions "
+                        f"WHERE key IN ({','.join('?' * len(chunk))})",
+                        chunk,
+                    ).fetchall()
+                    for key, is_match, confidence, reasoning in rows:
+                        found[key] = {
+                            "is_match": bool(is_match),
+                            "confidence": confidence,
+                            "reasoning": reasoning,
+                        }
+            except sqlite3.Error as e:
+                print(f"  Warning: LLM decision cache read failed: {e}")
+                return {}
+        self.hits += len(found)
+        self.misses += len(keys) - len(found)
+        return found
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Look up one decision (None if not cached)."""
+        return self.get_many([key]).get(key)
+
+    def put_many(self, decisions: Dict[str, Dict[str, Any]], model: str = "") -> None:
+        """
+        Store decisions (existing keys are overwritten).
+
+        Args:
+            decisions: Dict of key -> {is_match, confidence, reasoning}
+            model: Model identifier, kept for inspection
+        """
+        if not decisions or self._failed:
+            return
+        now = time.time()
+        rows = [
+            (key, model, int(bool(d.get("is_match"))), float(d.get("confidence") or 0.0),
+             d.get("reasoning", ""), now)
+            for key, d in decisions.items()
+        ]
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            try:
+                with conn:
+                    conn.executemany("INSERT OR REPLACE INTO decisions VALUES (?, ?, ?, ?, ?, ?)", rows)
+            except sqlite3.Error as e:
+                print(f"  Warning: LLM decision cache write failed: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Path and hit/miss counters for this process."""
+        lookups = self.hits + self.misses
+        return {
+            "path": None if self._failed else str(self.path),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
@@ -7,10 +7,11 @@ Provides integration with the self-healing orchestrator:
 3. extract_self_heal_instructions() - Extract instructions for next iteration
 """
 
-import json
 import os
 from typing import Dict, Any, Tuple, Optional
 
+from common import json_io
+
 from .evaluator import FormFillEvaluator
 from .report_generator import ReportGenerator, generate_console_report
 from .models import EvalReport
@@ -189,8 +190,7 @@ def save_self_heal_instructions(
         Path to saved file
     """
     output_path = os.path.join(workspace_dir, f"self_heal_instructions_v{iteration}.json")
-    with open(output_path, 'w') as f:
-        json.dump(self_heal_instructions, f, indent=2)
+    json_io.dump(self_heal_instructions, output_path, pretty=True)
     return output_path
 
 
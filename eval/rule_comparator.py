@@ -7,9 +7,18 @@ Compares rules between generated and reference JSON including:
 3. Conditions and conditional values
 4. postTriggerRuleIds
 5. params
+
+compare_field_rules pairs the rules of two matched fields by optimal
+assignment: rules are bucketed by actionType, every generated/reference pair
+in a bucket is compared once, and the Hungarian method picks the pairing with
+the most full matches (then the highest total score). Rules are put in a
+canonical order (by their JSON) before solving, so ties are broken the same
+way whatever order the rules come in, and, unlike greedy per-rule matching,
+the pairing does not depend on the order of the rules.
 """
 
 import json
+from collections import defaultdict
 from typing import Dict, Any, List, Optional, Tuple, Set
 from .models import (
     RuleComparison,
@@ -19,12 +28,8 @@ from .models import (
     DiscrepancyType,
     DiscrepancySeverity,
 )
-from .field_comparator import (
-    FieldComparator,
-    build_field_id_to_name_map,
-    build_field_id_to_type_map,
-    build_rule_id_to_field_map,
-)
+from .field_comparator import FieldComparator
+from .form_index import FormIndex
 
 
 class RuleComparator:
@@ -40,7 +45,9 @@ class RuleComparator:
         generated_fields: List[Dict[str, Any]],
         reference_fields: List[Dict[str, Any]],
         field_id_mapping: Dict[int, int],
-        field_comparator: Optional[FieldComparator] = None
+        field_comparator: Optional[FieldComparator] = None,
+        generated_index: Optional[FormIndex] = None,
+        reference_index: Optional[FormIndex] = None
     ):
         """
         Initialize the RuleComparator.
@@ -50,23 +57,25 @@ class RuleComparator:
             reference_fields: List of fields from reference JSON
             field_id_mapping: Mapping from generated field IDs to reference field IDs
             field_comparator: Optional FieldComparator for name matching
+            generated_index: FormIndex of generated_fields, if already built
+            reference_index: FormIndex of reference_fields, if already built
         """
         self.generated_fields = generated_fields
         self.reference_fields = reference_fields
         self.field_id_mapping = field_id_mapping
         self.field_comparator = field_comparator or FieldComparator(use_llm=True)
 
-        # Build helper maps
-        self.gen_id_to_name = build_field_id_to_name_map(generated_fields)
-        self.ref_id_to_name = build_field_id_to_name_map(reference_fields)
-        self.gen_id_to_type = build_field_id_to_type_map(generated_fields)
-        self.ref_id_to_type = build_field_id_to_type_map(reference_fields)
-        self.gen_rule_to_field = build_rule_id_to_field_map(generated_fields)
-        self.ref_rule_to_field = build_rule_id_to_field_map(reference_fields)
+        # ID, rule-ID and name lookups for both documents
+        self.generated_index = generated_index or FormIndex(generated_fields)
+        self.reference_index = reference_index or FormIndex(reference_fields)
 
         # Reverse mapping: reference ID to generated ID
         self.reverse_field_mapping = {v: k for k, v in field_id_mapping.items()}
 
+        # compare_id_lists results by (generated IDs, reference IDs, id_type); the
+        # rules of a field mostly share their source/destination lists
+        self._id_list_cache: Dict[Tuple, Tuple[bool, List, List]] = {}
+
     def resolve_id(
         self,
         field_id: int,
@@ -82,18 +91,14 @@ class RuleComparator:
         Returns:
             IdResolution with resolved info
         """
-        if source == "generated":
-            id_to_name = self.gen_id_to_name
-            id_to_type = self.gen_id_to_type
-        else:
-            id_to_name = self.ref_id_to_name
-            id_to_type = self.ref_id_to_type
+        index = self.generated_index if source == "generated" else self.reference_index
+        record = index.field(field_id)
 
-        if field_id in id_to_name:
+        if record is not None:
             return IdResolution(
                 original_id=field_id,
-                resolved_field_name=id_to_name[field_id],
-                resolved_field_type=id_to_type.get(field_id, "UNKNOWN"),
+                resolved_field_name=record.label,
+                resolved_field_type=record.type,
                 is_valid=True,
                 source_json=source,
             )
@@ -124,22 +129,32 @@ class RuleComparator:
         Returns:
             Tuple of (all_match, resolutions, discrepancies)
         """
+        try:
+            cache_key = (tuple(generated_ids), tuple(reference_ids), id_type)
+            hash(cache_key)
+        except TypeError:
+            return self._compare_id_lists(generated_ids, reference_ids, id_type)
+
+        cached = self._id_list_cache.get(cache_key)
+        if cached is None:
+            cached = self._compare_id_lists(generated_ids, reference_ids, id_type)
+            self._id_list_cache[cache_key] = cached
+        all_match, resolutions, discrepancies = cached
+        return all_match, list(resolutions), list(discrepancies)
+
+    def _compare_id_lists(
+        self,
+        generated_ids: List[int],
+        reference_ids: List[int],
+        id_type: str
+    ) -> Tuple[bool, List[Tuple[IdResolution, IdResolution]], List[Discrepancy]]:
+        """compare_id_lists without the result cache."""
         resolutions = []
         discrepancies = []
 
-        # Resolve all generated IDs to names
-        gen_names = set()
-        for gen_id in generated_ids:
-            gen_resolution = self.resolve_id(gen_id, "generated")
-            if gen_resolution.is_valid:
-                gen_names.add(gen_resolution.resolved_field_name.lower())
-
-        # Resolve all reference IDs to names
-        ref_names = set()
-        for ref_id in reference_ids:
-            ref_resolution = self.resolve_id(ref_id, "reference")
-            if ref_resolution.is_valid:
-                ref_names.add(ref_resolution.resolved_field_name.lower())
+        # Resolve all IDs to names once
+        gen_resolutions = [self.resolve_id(gen_id, "generated") for gen_id in generated_ids]
+        ref_resolutions = [self.resolve_id(ref_id, "reference") for ref_id in reference_ids]
 
         # Compare using field names (case-insensitive)
         # For each reference name, check if there's a matching generated name
@@ -147,16 +162,14 @@ class RuleComparator:
         matched_gen_names = set()
         matched_ref_names = set()
 
-        for gen_id in generated_ids:
-            gen_resolution = self.resolve_id(gen_id, "generated")
+        for gen_resolution in gen_resolutions:
             best_ref_resolution = None
 
             if gen_resolution.is_valid:
                 gen_name = gen_resolution.resolved_field_name
 
                 # Try to find matching reference ID
-                for ref_id in reference_ids:
-                    ref_resolution = self.resolve_id(ref_id, "reference")
+                for ref_resolution in ref_resolutions:
                     if ref_resolution.is_valid:
                         ref_name = ref_resolution.resolved_field_name
 
@@ -182,8 +195,7 @@ class RuleComparator:
                 )))
 
         # Check for unmatched reference IDs (missing in generated)
-        for ref_id in reference_ids:
-            ref_resolution = self.resolve_id(ref_id, "reference")
+        for ref_resolution in ref_resolutions:
             if ref_resolution.is_valid:
                 if ref_resolution.resolved_field_name.lower() not in matched_ref_names:
                     all_match = False
@@ -204,8 +216,7 @@ class RuleComparator:
                     ))
 
         # Check for extra generated IDs (not in reference)
-        for gen_id in generated_ids:
-            gen_resolution = self.resolve_id(gen_id, "generated")
+        for gen_resolution in gen_resolutions:
             if gen_resolution.is_valid:
                 if gen_resolution.resolved_field_name.lower() not in matched_gen_names:
                     # This is an extra ID - not necessarily wrong, but note it
@@ -262,26 +273,26 @@ class RuleComparator:
         # 1. There's a corresponding rule in generated
         # 2. The rule is on the correct field
         for ref_trigger_id in ref_post_trigger_ids:
-            ref_trigger_info = self.ref_rule_to_field.get(ref_trigger_id)
+            ref_trigger_owner = self.reference_index.rule_owner(ref_trigger_id)
 
-            if not ref_trigger_info:
+            if not ref_trigger_owner:
                 # Reference rule ID not found - skip
                 continue
 
-            ref_trigger_field_name = ref_trigger_info["field_name"]
-            ref_trigger_rule = ref_trigger_info["rule"]
+            ref_trigger_record, ref_trigger_rule = ref_trigger_owner
+            ref_trigger_field_name = ref_trigger_record.label
             ref_trigger_action_type = ref_trigger_rule.get("actionType", "")
 
             # Find matching generated post-trigger rule
             found_match = False
             for gen_trigger_id in gen_post_trigger_ids:
-                gen_trigger_info = self.gen_rule_to_field.get(gen_trigger_id)
+                gen_trigger_owner = self.generated_index.rule_owner(gen_trigger_id)
 
-                if not gen_trigger_info:
+                if not gen_trigger_owner:
                     continue
 
-                gen_trigger_field_name = gen_trigger_info["field_name"]
-                gen_trigger_rule = gen_trigger_info["rule"]
+                gen_trigger_record, gen_trigger_rule = gen_trigger_owner
+                gen_trigger_field_name = gen_trigger_record.label
                 gen_trigger_action_type = gen_trigger_rule.get("actionType", "")
 
                 # Check if action types match
@@ -554,7 +565,10 @@ class RuleComparator:
         already_matched: Set[int] = None
     ) -> Tuple[Optional[Dict[str, Any]], Optional[RuleEvalResult]]:
         """
-        Find a matching reference rule for a generated rule.
+        Find a matching reference rule for a generated rule (greedy).
+
+        Takes the best-scoring unmatched reference rule of the same action
+        type. compare_field_rules uses match_rules_by_assignment instead.
 
         Args:
             generated_rule: Rule from generated JSON
@@ -587,19 +601,7 @@ class RuleComparator:
 
         for ref_rule in candidate_rules:
             eval_result = self.compare_single_rule(generated_rule, ref_rule, field_name)
-
-            # Calculate score based on matches
-            score = 0
-            if eval_result.action_type_match:
-                score += 10
-            if eval_result.source_ids_match:
-                score += 5
-            if eval_result.destination_ids_match:
-                score += 5
-            if eval_result.condition_match:
-                score += 3
-            if eval_result.conditional_values_match:
-                score += 2
+            score = rule_match_score(eval_result)
 
             if score > best_score:
                 best_score = score
@@ -608,6 +610,71 @@ class RuleComparator:
 
         return best_match, best_eval
 
+    def match_rules_by_assignment(
+        self,
+        generated_rules: List[Dict[str, Any]],
+        reference_rules: List[Dict[str, Any]],
+        field_name: str
+    ) -> Dict[int, Tuple[Dict[str, Any], RuleEvalResult]]:
+        """
+        Pair generated with reference rules by optimal assignment per action type.
+
+        Reference rules are bucketed by actionType once. Within a bucket every
+        generated/reference pair is compared once, and the assignment that
+        maximizes the number of full matches, then the total
+        rule_match_score, is chosen. Both sides are sorted by canonical JSON
+        first, so tied assignments resolve identically for any rule order.
+        As with greedy matching, every rule in a bucket is paired while the
+        other side has rules left, and a reference rule ID already paired is
+        not paired again.
+
+        Args:
+            generated_rules: Rules of the generated field
+            reference_rules: Rules of the reference field
+            field_name: Name of the field
+
+        Returns:
+            Dict of generated rule index -> (reference rule, eval result)
+        """
+        # Canonical order: the Hungarian method breaks ties by position
+        ref_buckets: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        for ref_rule in sorted(reference_rules, key=canonical_rule_key):
+            ref_buckets[ref_rule.get("actionType")].append(ref_rule)
+
+        gen_keys = [canonical_rule_key(gen_rule) for gen_rule in generated_rules]
+        gen_buckets: Dict[str, List[int]] = defaultdict(list)
+        for gen_index in sorted(range(len(generated_rules)), key=gen_keys.__getitem__):
+            gen_buckets[generated_rules[gen_index].get("actionType", "")].append(gen_index)
+
+        assignment = {}
+        for action_type, gen_indexes in gen_buckets.items():
+            # Rules sharing a reference ID count once, like already_matched in find_matching_rule
+            candidates = []
+            seen_ids = set()
+            for ref_rule in ref_buckets.get(action_type, []):
+                ref_id = ref_rule.get("id")
+                if ref_id not in seen_ids:
+                    seen_ids.add(ref_id)
+                    candidates.append(ref_rule)
+            if not candidates:
+                continue
+
+            evals = [
+                [self.compare_single_rule(generated_rules[gen_index], ref_rule, field_name)
+                 for ref_rule in candidates]
+                for gen_index in gen_indexes
+            ]
+            # Full matches first, total score second
+            match_weight = MAX_RULE_MATCH_SCORE * min(len(gen_indexes), len(candidates)) + 1
+            weights = [
+                [match_weight * eval_result.is_match + rule_match_score(eval_result) for eval_result in row]
+                for row in evals
+            ]
+            for row, col in max_weight_assignment(weights):
+                assignment[gen_indexes[row]] = (candidates[col], evals[row][col])
+
+        return assignment
+
     def compare_field_rules(
         self,
         generated_field: Dict[str, Any],
@@ -623,22 +690,21 @@ class RuleComparator:
         Returns:
             RuleComparison with comparison result
         """
-        gen_form_tag = generated_field.get("formTag", {})
-        field_name = gen_form_tag.get("name", "Unknown")
+        gen_record = self.generated_index.record_of(generated_field)
+        field_name = gen_record.name if gen_record.name is not None else "Unknown"
 
-        gen_rules = generated_field.get("formFillRules", [])
-        ref_rules = reference_field.get("formFillRules", [])
+        gen_rules = gen_record.rules
+        ref_rules = self.reference_index.record_of(reference_field).rules
 
         rule_evaluations = []
         matched_ref_ids = set()
         discrepancies = []
 
         # Find matches for each generated rule
+        assignment = self.match_rules_by_assignment(gen_rules, ref_rules, field_name)
         matched_count = 0
-        for gen_rule in gen_rules:
-            ref_rule, eval_result = self.find_matching_rule(
-                gen_rule, ref_rules, field_name, matched_ref_ids
-            )
+        for gen_index, gen_rule in enumerate(gen_rules):
+            ref_rule, eval_result = assignment.get(gen_index, (None, None))
 
             if ref_rule and eval_result:
                 rule_evaluations.append(eval_result)
@@ -700,23 +766,110 @@ class RuleComparator:
         )
 
 
-def count_rules_by_type(fields: List[Dict[str, Any]]) -> Dict[str, int]:
+# rule_match_score weights
+MAX_RULE_MATCH_SCORE = 25
+
+
+def rule_match_score(eval_result: RuleEvalResult) -> int:
     """
-    Count rules by action type across all fields.
+    Score a rule comparison (0-MAX_RULE_MATCH_SCORE).
 
     Args:
-        fields: List of field dictionaries
+        eval_result: Result of compare_single_rule
 
     Returns:
-        Dictionary mapping action types to counts
+        10 for the action type, 5 each for source and destination IDs, 3 for
+        the condition and 2 for the conditional values
     """
-    counts = {}
-    for field in fields:
-        rules = field.get("formFillRules", [])
-        for rule in rules:
-            action_type = rule.get("actionType", "UNKNOWN")
-            counts[action_type] = counts.get(action_type, 0) + 1
-    return counts
+    score = 0
+    if eval_result.action_type_match:
+        score += 10
+    if eval_result.source_ids_match:
+        score += 5
+    if eval_result.destination_ids_match:
+        score += 5
+    if eval_result.condition_match:
+        score += 3
+    if eval_result.conditional_values_match:
+        score += 2
+    return score
+
+
+def canonical_rule_key(rule: Dict[str, Any]) -> str:
+    """Order-independent sort key for a rule (its JSON with sorted keys)."""
+    return json.dumps(rule, sort_keys=True, default=str)
+
+
+def max_weight_assignment(weights: List[List[int]]) -> List[Tuple[int, int]]:
+    """
+    Maximum-weight assignment of rows to columns (Hungarian method).
+
+    Every row is assigned if there are at least as many columns, otherwise
+    every column. O(n^2 * m) for n = min(rows, columns), m = max. Ties go to
+    the solution the method reaches first, so they depend on row and column
+    order; callers that need order independence sort their inputs first.
+
+    Args:
+        weights: Rectangular matrix of non-negative integer weights
+
+    Returns:
+        (row, column) pairs, sorted by row
+    """
+    if not weights or not weights[0]:
+        return []
+    transposed = len(weights) > len(weights[0])
+    if transposed:
+        weights = [list(column) for column in zip(*weights)]
+
+    n, m = len(weights), len(weights[0])
+    top = max(max(row) for row in weights)
+    cost = [[top - w for w in row] for row in weights]
+
+    # Potentials u (rows) and v (columns); p[j] is the row assigned to column j (1-based, 0 = none)
+    inf = float("inf")
+    u = [0] * (n + 1)
+    v = [0] * (m + 1)
+    p = [0] * (m + 1)
+    way = [0] * (m + 1)
+    for i in range(1, n + 1):
+        p[0] = i
+        j0 = 0
+        min_v = [inf] * (m + 1)
+        used = [False] * (m + 1)
+        while True:
+            used[j0] = True
+            i0 = p[j0]
+            cost_row = cost[i0 - 1]
+            delta = inf
+            j1 = 0
+            for j in range(1, m + 1):
+                if not used[j]:
+                    reduced = cost_row[j - 1] - u[i0] - v[j]
+                    if reduced < min_v[j]:
+                        min_v[j] = reduced
+                        way[j] = j0
+                    if min_v[j] < delta:
+                        delta = min_v[j]
+                        j1 = j
+            for j in range(m + 1):
+                if used[j]:
+                    u[p[j]] += delta
+                    v[j] -= delta
+                else:
+                    min_v[j] -= delta
+            j0 = j1
+            if p[j0] == 0:
+                break
+        # Augment along the alternating path
+        while j0:
+            j1 = way[j0]
+            p[j0] = p[j1]
+            j0 = j1
+
+    pairs = [(p[j] - 1, j - 1) for j in range(1, m + 1) if p[j]]
+    if transposed:
+        pairs = [(col, row) for row, col in pairs]
+    return sorted(pairs)
 
 
 def get_all_rules(fields: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -8,6 +8,9 @@ import sys
 from pathlib import Path
 from collections import defaultdict
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from common.rule_schema_registry import RuleSchemaRegistry
+
 def load_reference_rules(ref_path):
     """Load reference rules from vendor_creation.json"""
     with open(ref_path, 'r') as f:
@@ -65,22 +68,19 @@ def load_generated_rules(output_dir):
 
 def load_rule_schemas(schema_path):
     """Load Rule-Schemas.json to map names to action/source"""
-    with open(schema_path, 'r') as f:
-        data = json.load(f)
+    registry = RuleSchemaRegistry.load(schema_path)
 
     name_to_rule = {}
 
-    for rule in data.get('content', []):
-        name = rule.get('name', '')
+    for name, rule in registry.by_name.items():
         action = rule.get('action', '')
         source = rule.get('source', '')
 
-        if name:
-            name_to_rule[name] = {
-                'action': action,
-                'source': source,
-                'full': f"{action}_{source}" if source else action
-            }
+        name_to_rule[name] = {
+            'action': action,
+            'source': source,
+            'full': f"{action}_{source}" if source else action
+        }
 
     return name_to_rule
 
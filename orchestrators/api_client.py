@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+HTTP Client for API Schema Validation
+
+call_api in the orchestrators posts the generated schema (up to about a MB
+of JSON) to the process API. This client sends those posts:
+- over pooled keep-alive connections (a requests.Session if requests is
+  installed, otherwise reused http.client connections per thread)
+- with separate connect and read timeouts
+- with retries, using exponential backoff with full jitter (Retry-After is
+  honoured), only where the post cannot have created a template: when no
+  connection could be made or the body could not be sent, and on 429/503
+- optionally gzip-compressed from GZIP_MIN_BYTES (1 KB) up. If the server
+  answers 415, the post is resent uncompressed once and the client stops
+  compressing.
+
+The post is not idempotent. After a read timeout, a dropped response or a
+502/504 the template may already exist, so those are not retried unless
+API_RETRY_UNSAFE is on. A retry that the API had already processed creates
+a second template or gets "already present".
+
+    API_CONNECT_TIMEOUT   Seconds to establish a connection (default: 10)
+    API_READ_TIMEOUT      Seconds to wait for the response (default: 120)
+    API_MAX_ATTEMPTS      Attempts per post, including the first (default: 4)
+    API_BACKOFF_BASE      First backoff ceiling in seconds, doubled per retry (default: 1.0)
+    API_GZIP              "on" to gzip request bodies (default: off)
+    API_RETRY_UNSAFE      "on" to also retry read timeouts, dropped responses and 502/504 (default: off)
+
+Usage:
+    from api_client import get_api_client
+
+    client = get_api_client()
+    status_code, response_data = client.post(url, body_bytes, headers)
+"""
+
+import gzip
+import http.client
+import json
+import logging
+import os
+import random
+import select
+import socket
+import threading
+import time
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.exceptions import NewConnectionError
+    REQUESTS_AVAILABLE = True
+except ImportError:
+    REQUESTS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Statuses that mean the request was not processed, and those where it may have been
+RETRY_STATUSES = {429, 503}
+UNSAFE_RETRY_STATUSES = {502, 504}
+GZIP_MIN_BYTES = 1024
+MAX_BACKOFF = 30.0
+POOL_SIZE = 8
+
+
+def _parse_body(raw: bytes, content_encoding: str) -> object:
+    """Response JSON, or {"raw_response": text} if it is not JSON."""
+    if content_encoding.lower() == "gzip":
+        raw = gzip.decompress(raw)
+    text = raw.decode("utf-8", errors="replace")
+    try:
+        return json.loads(text)
+    except ValueError:
+        return {"raw_response": text}
+
+
+class RequestNotSentError(ConnectionError):
+    """The request never reached the API (connecting or sending the body failed), so resending is safe."""
+
+
+class ApiValidationClient:
+    """
+    Pooled, retrying poster for the validation API. Safe to share between threads.
+
+    Only attempts that cannot have been processed are retried, unless
+    retry_unsafe is set.
+
+    Attributes:
+        stats: Counters: requests, attempts, retries, bytes_sent, raw_bytes
+    """
+
+    def __init__(
+        self,
+        connect_timeout: float = 10.0,
+        read_timeout: float = 120.0,
+        max_attempts: int = 4,
+        backoff_base: float = 1.0,
+        use_gzip: bool = False,
+        retry_unsafe: bool = False
+    ):
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.max_attempts = max(1, max_attempts)
+        self.backoff_base = backoff_base
+        self.use_gzip = use_gzip
+        self.retry_unsafe = retry_unsafe
+        self.retry_statuses = RETRY_STATUSES | UNSAFE_RETRY_STATUSES if retry_unsafe else RETRY_STATUSES
+        self.stats = {"requests": 0, "attempts": 0, "retries": 0, "bytes_sent": 0, "raw_bytes": 0}
+        self._stats_lock = threading.Lock()
+        self._local = threading.local()
+        self._session = None
+        if REQUESTS_AVAILABLE:
+            self._session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, max_retries=0)
+            self._session.mount("http://", adapter)
+            self._session.mount("https://", adapter)
+
+    def _count(self, **increments) -> None:
+        with self._stats_lock:
+            for key, value in increments.items():
+                self.stats[key] += value
+
+    # ── Transport ───────────────────────────────────────────────────────────
+
+    def _connection(self, url) -> Tuple[http.client.HTTPConnection, bool]:
+        """This thread's kept-alive connection for the URL's host, and whether it was reused."""
+        connections = getattr(self._local, "connections", None)
+        if connections is None:
+            connections = self._local.connections = {}
+        key = (url.scheme, url.netloc)
+        conn = connections.get(key)
+        if conn is not None:
+            # An idle socket that is readable was closed by the server; don't send on it
+            if conn.sock is not None and not select.select([conn.sock], [], [], 0)[0]:
+                return conn, True
+            del connections[key]
+            conn.close()
+
+        conn_class = http.client.HTTPSConnection if url.scheme == "https" else http.client.HTTPConnection
+        conn = conn_class(url.hostname, url.port, timeout=self.connect_timeout)
+        try:
+            conn.connect()
+        except OSError as e:
+            conn.close()
+            raise RequestNotSentError(f"Could not connect to {url.netloc}: {e}") from e
+        conn.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        conn.sock.settimeout(self.read_timeout)
+        connections[key] = conn
+        return conn, False
+
+    def _drop_connection(self, url) -> None:
+        conn = getattr(self._local, "connections", {}).pop((url.scheme, url.netloc), None)
+        if conn is not None:
+            conn.close()
+
+    def _send_http_client(self, url_text: str, body: bytes, headers: Dict[str, str]) -> Tuple[int, object, Dict]:
+        url = urlsplit(url_text)
+        path = url.path or "/"
+        if url.query:
+            path += "?" + url.query
+        conn, _ = self._connection(url)
+        try:
+            conn.request("POST", path, body=body, headers=headers)
+        except (BrokenPipeError, ConnectionResetError) as e:
+            # The server closed the connection before taking the whole body
+            self._drop_connection(url)
+            raise RequestNotSentError(f"Connection closed while sending: {e}") from e
+        except Exception:
+            self._drop_connection(url)
+            raise
+        try:
+            resp = conn.getresponse()
+            raw = resp.read()
+        except Exception:
+            self._drop_connection(url)
+            raise
+        if resp.will_close:
+            self._drop_connection(url)
+        return resp.status, _parse_body(raw, resp.getheader("Content-Encoding", "")), dict(resp.getheaders())
+
+    def _send(self, url: str, body: bytes, headers: Dict[str, str]) -> Tuple[int, object, Dict]:
+        if self._session is not None:
+            response = self._session.post(url, data=body, headers=headers,
+                                          timeout=(self.connect_timeout, self.read_timeout))
+            try:
+                data = response.json()
+            except ValueError:
+                data = {"raw_response": response.text}
+            return response.status_code, data, response.headers
+        return self._send_http_client(url, body, headers)
+
+    def _is_retryable(self, error: Exception) -> bool:
+        """Whether a failed attempt may be resent: if it never reached the API, or any failure with retry_unsafe."""
+        if isinstance(error, RequestNotSentError):
+            return True
+        if REQUESTS_AVAILABLE:
+            if isinstance(error, requests.ConnectTimeout):
+                return True
+            reason = getattr(error.args[0], "reason", None) if error.args else None
+            if isinstance(error, requests.ConnectionError) and isinstance(reason, NewConnectionError):
+                return True
+            if self.retry_unsafe and isinstance(error, (requests.ConnectionError, requests.Timeout)):
+                return True
+        return self.retry_unsafe and isinstance(error, (OSError, http.client.HTTPException))
+
+    def _backoff(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Full-jitter delay before retry number `attempt`, at least Retry-After if the server sent one."""
+        delay = random.uniform(0, min(MAX_BACKOFF, self.backoff_base * 2 ** (attempt - 1)))
+        if retry_after:
+            try:
+                delay = max(delay, min(float(retry_after), MAX_BACKOFF))
+            except ValueError:
+                pass
+        return delay
+
+    # ── Public API ──────────────────────────────────────────────────────────
+
+    def post(self, url: str, body: bytes, headers: Dict[str, str]) -> Tuple[int, object]:
+        """
+        POST a JSON body, retrying failures that left it unprocessed.
+
+        Args:
+            url: Endpoint URL
+            body: Encoded JSON request body
+            headers: Request headers (auth, content type)
+
+        Returns:
+            Tuple of (status_code, parsed response JSON or {"raw_response": text})
+
+        Raises:
+            The error of the last attempt if it was not retryable or attempts ran out
+        """
+        headers = dict(headers, **{"Accept-Encoding": "gzip"})
+        payload = body
+        if self.use_gzip and len(body) >= GZIP_MIN_BYTES:
+            payload = gzip.compress(body, compresslevel=5)
+            headers["Content-Encoding"] = "gzip"
+        self._count(requests=1, raw_bytes=len(body))
+
+        start = time.perf_counter()
+        attempt = 0
+        while True:
+            attempt += 1
+            self._count(attempts=1, bytes_sent=len(payload))
+            try:
+                status_code, data, response_headers = self._send(url, payload, headers)
+            except Exception as e:
+                if not self._is_retryable(e) or attempt >= self.max_attempts:
+                    raise
+                delay = self._backoff(attempt)
+                logger.warning(f"API request failed ({type(e).__name__}: {e}), "
+                               f"retry {attempt}/{self.max_attempts - 1} in {delay:.1f}s")
+                self._count(retries=1)
+                time.sleep(delay)
+                continue
+
+            if status_code == 415 and "Content-Encoding" in headers:
+                logger.warning("API does not accept gzip request bodies, sending uncompressed from now on")
+                self.use_gzip = False
+                payload = body
+                del headers["Content-Encoding"]
+                attempt -= 1
+                continue
+
+            if status_code in self.retry_statuses and attempt < self.max_attempts:
+                delay = self._backoff(attempt, response_headers.get("Retry-After"))
+                logger.warning(f"API returned {status_code}, retry {attempt}/{self.max_attempts - 1} in {delay:.1f}s")
+                self._count(retries=1)
+                time.sleep(delay)
+                continue
+
+            logger.debug(f"API POST {len(body) / 1024:.0f} KB (sent {len(payload) / 1024:.0f} KB): "
+                         f"{status_code} after {attempt} attempt(s) in {time.perf_counter() - start:.2f}s")
+            return status_code, data
+
+    def close(self) -> None:
+        """Close pooled connections (of this thread, on the http.client path)."""
+        if self._session is not None:
+            self._session.close()
+        for conn in getattr(self._local, "connections", {}).values():
+            conn.close()
+        self._local.connections = {}
+
+
+_client: Optional[ApiValidationClient] = None
+_client_lock = threading.Lock()
+
+
+def get_api_client() -> ApiValidationClient:
+    """The process-wide client, configured from the API_* env vars."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = ApiValidationClient(
+                connect_timeout=float(os.environ.get("API_CONNECT_TIMEOUT", 10)),
+                read_timeout=float(os.environ.get("API_READ_TIMEOUT", 120)),
+                max_attempts=int(os.environ.get("API_MAX_ATTEMPTS", 4)),
+                backoff_base=float(os.environ.get("API_BACKOFF_BASE", 1.0)),
+                use_gzip=os.environ.get("API_GZIP", "").lower() == "on",
+                retry_unsafe=os.environ.get("API_RETRY_UNSAFE", "").lower() == "on",
+            )
+        return _client
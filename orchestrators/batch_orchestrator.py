@@ -0,0 +1,456 @@
+#!/usr/bin/env python3
+"""
+Batch Orchestrator for Multiple BUDs
+
+Runs one of the single-document orchestrators on many BUDs concurrently:
+- mini:            mini_agent_orchestrator.py
+- coding:          coding_mini_agent_orchestrator.py
+- rule_extraction: orchestrator_rule_extraction.py
+
+Each document runs as its own orchestrator process with its own workspace
+(adws/batch_<timestamp>/<name>/). The orchestrator's setup_logging then
+only resets that process's root logger, and its orchestrator.log stays in
+the run's workspace. The batch process never touches the root logger. It
+gives every run a named logger that copies the run's console output to
+<workspace>/console.log and writes its own progress to batch.log.
+
+All runs share:
+- the agent concurrency budget (agent_governor lock files in AGENT_GOVERNOR_DIR)
+- the precompiled Rule-Schemas.json registry (RULE_SCHEMA_CACHE_DIR)
+- the eval LLM decision cache (EVAL_LLM_CACHE_DIR)
+--cache-dir places both caches under one directory.
+
+The manifest is a JSON list of runs, or {"runs": [...]}:
+
+    {"runs": [
+      {"name": "vendor", "document": "documents/Vendor Creation.docx",
+       "schema": "output/vendor/schema.json", "reference": "documents/json_output/vendor_creation.json",
+       "args": ["--end-stage", "3"]}
+    ]}
+
+"name" and "args" are optional. Relative paths are resolved against the
+manifest's directory. Arguments after "--" are passed to every run.
+
+Usage:
+    python orchestrators/batch_orchestrator.py manifest.json --max-concurrent-runs 3 -- --skip-api
+"""
+
+import argparse
+import json
+import logging
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+ORCHESTRATORS = {
+    "mini": {"script": "orchestrators/mini_agent_orchestrator.py", "needs_reference": True},
+    "coding": {"script": "orchestrators/coding_mini_agent_orchestrator.py", "needs_reference": True},
+    "rule_extraction": {"script": "orchestrators/orchestrator_rule_extraction.py", "needs_reference": False},
+}
+
+# Batch progress logger (never the root logger)
+logger = logging.getLogger("batch_orchestrator")
+
+
+def setup_batch_logging(batch_dir: str, verbose: bool = False) -> None:
+    """
+    Configure the batch logger: batch.log in the batch directory plus console.
+
+    Args:
+        batch_dir: Batch directory for the log file
+        verbose: If True, set console to DEBUG level
+    """
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    logger.handlers.clear()
+
+    file_handler = logging.FileHandler(os.path.join(batch_dir, "batch.log"), mode='w', encoding='utf-8')
+    file_handler.setLevel(logging.DEBUG)
+    file_handler.setFormatter(logging.Formatter(
+        '%(asctime)s | %(levelname)-8s | %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    ))
+    logger.addHandler(file_handler)
+
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setLevel(logging.DEBUG if verbose else logging.INFO)
+    console_handler.setFormatter(logging.Formatter('%(asctime)s | %(message)s', datefmt='%H:%M:%S'))
+    logger.addHandler(console_handler)
+
+
+def create_run_logger(name: str, workspace_dir: str) -> logging.Logger:
+    """
+    Logger for one run: writes only to <workspace>/console.log.
+
+    Args:
+        name: Run name
+        workspace_dir: The run's workspace
+
+    Returns:
+        Logger that does not propagate to the batch or root logger
+    """
+    run_logger = logging.getLogger(f"batch_orchestrator.run.{name}")
+    run_logger.setLevel(logging.DEBUG)
+    run_logger.propagate = False
+    run_logger.handlers.clear()
+    handler = logging.FileHandler(os.path.join(workspace_dir, "console.log"), mode='w', encoding='utf-8')
+    handler.setFormatter(logging.Formatter('%(asctime)s | %(message)s', datefmt='%H:%M:%S'))
+    run_logger.addHandler(handler)
+    return run_logger
+
+
+def close_run_logger(run_logger: logging.Logger) -> None:
+    for handler in list(run_logger.handlers):
+        handler.close()
+        run_logger.removeHandler(handler)
+
+
+def load_manifest(manifest_path: str, needs_reference: bool = True) -> List[Dict[str, Any]]:
+    """
+    Load and validate a batch manifest.
+
+    Args:
+        manifest_path: Path to the manifest JSON
+        needs_reference: Whether every run needs a reference JSON
+
+    Returns:
+        Runs with absolute paths and unique names
+
+    Raises:
+        ValueError: If the manifest is malformed
+    """
+    with open(manifest_path, 'r') as f:
+        data = json.load(f)
+    entries = data.get("runs") if isinstance(data, dict) else data
+    if not isinstance(entries, list):
+        raise ValueError(f"Manifest must be a list of runs or {{\"runs\": [...]}}: {manifest_path}")
+
+    base_dir = os.path.dirname(os.path.abspath(manifest_path))
+    required = ["document", "schema"] + (["reference"] if needs_reference else [])
+    runs = []
+    used_names = set()
+    for i, entry in enumerate(entries):
+        if not isinstance(entry, dict) or any(not entry.get(key) for key in required):
+            raise ValueError(f"Manifest entry {i} needs {', '.join(required)}")
+
+        name = re.sub(r"[^\w.-]+", "_", entry.get("name") or Path(entry["document"]).stem)
+        unique_name, suffix = name, 2
+        while unique_name in used_names:
+            unique_name = f"{name}_{suffix}"
+            suffix += 1
+        used_names.add(unique_name)
+
+        runs.append({
+            "name": unique_name,
+            "document": os.path.normpath(os.path.join(base_dir, entry["document"])),
+            "schema": os.path.normpath(os.path.join(base_dir, entry["schema"])),
+            "reference": os.path.normpath(os.path.join(base_dir, entry["reference"])) if entry.get("reference") else None,
+            "args": [str(arg) for arg in entry.get("args", [])],
+        })
+    return runs
+
+
+def shared_environment(cache_dir: Optional[str] = None) -> Dict[str, str]:
+    """
+    Environment for every run, with the shared governor and cache directories pinned.
+
+    Args:
+        cache_dir: Directory for both caches (default: their own settings)
+
+    Returns:
+        Environment dict for subprocess
+    """
+    env = os.environ.copy()
+    tmp = tempfile.gettempdir()
+    env.setdefault("AGENT_GOVERNOR_DIR", os.path.join(tmp, "doc_parser_agent_governor"))
+    if cache_dir:
+        env["RULE_SCHEMA_CACHE_DIR"] = os.path.join(cache_dir, "rule_schemas")
+        env["EVAL_LLM_CACHE_DIR"] = os.path.join(cache_dir, "eval_llm")
+    else:
+        env.setdefault("RULE_SCHEMA_CACHE_DIR", os.path.join(tmp, "doc_parser_rule_schemas"))
+        env.setdefault("EVAL_LLM_CACHE_DIR", os.path.join(tmp, "doc_parser_eval_llm"))
+    # Children print as they go, not in 4 KB blocks
+    env["PYTHONUNBUFFERED"] = "1"
+    return env
+
+
+def run_one(
+    run: Dict[str, Any],
+    orchestrator: str,
+    workspace_dir: str,
+    extra_args: List[str],
+    env: Dict[str, str]
+) -> Dict[str, Any]:
+    """
+    Run one orchestrator process for a document and collect its outcome.
+
+    Args:
+        run: Run from load_manifest
+        orchestrator: Key of ORCHESTRATORS
+        workspace_dir: The run's own workspace
+        extra_args: Arguments passed to every run
+        env: Environment from shared_environment
+
+    Returns:
+        Run result for the batch summary
+    """
+    os.makedirs(workspace_dir, exist_ok=True)
+    run_logger = create_run_logger(run["name"], workspace_dir)
+
+    cmd = [sys.executable, ORCHESTRATORS[orchestrator]["script"], run["document"],
+           "--schema", run["schema"], "--workspace", workspace_dir]
+    if run["reference"] and ORCHESTRATORS[orchestrator]["needs_reference"]:
+        cmd.extend(["--reference", run["reference"]])
+    cmd.extend(run["args"])
+    cmd.extend(extra_args)
+
+    result = {
+        "name": run["name"],
+        "document": run["document"],
+        "workspace": workspace_dir,
+        "returncode": None,
+        "status": "error",
+        "elapsed_seconds": 0.0,
+        "overall_passed": False,
+        "final_output": None,
+        "stage_scores": {},
+        "queue_wait_seconds": 0.0,
+        "error": None,
+    }
+
+    logger.info(f"[{run['name']}] started -> {workspace_dir}")
+    run_logger.info(f"Command: {' '.join(cmd)}")
+    start = time.monotonic()
+    try:
+        process = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+            cwd=str(PROJECT_ROOT),
+            env=env
+        )
+        for line in process.stdout:
+            run_logger.info(line.rstrip("\n"))
+        process.wait()
+        result["returncode"] = process.returncode
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+        run_logger.error(f"Failed to run orchestrator: {result['error']}")
+    finally:
+        result["elapsed_seconds"] = round(time.monotonic() - start, 2)
+        close_run_logger(run_logger)
+
+    summary_path = os.path.join(workspace_dir, "orchestration_summary.json")
+    if os.path.exists(summary_path):
+        try:
+            with open(summary_path, 'r') as f:
+                summary = json.load(f)
+            stages = summary.get("stages", {})
+            result["overall_passed"] = bool(summary.get("overall_passed"))
+            result["final_output"] = summary.get("final_output")
+            result["stage_scores"] = {stage: info.get("score", 0.0) for stage, info in stages.items()}
+            result["queue_wait_seconds"] = round(
+                sum(info.get("queue_wait_seconds", 0.0) for info in stages.values()), 2
+            )
+        except (OSError, ValueError) as e:
+            result["error"] = result["error"] or f"Unreadable orchestration summary: {e}"
+    elif orchestrator == "rule_extraction" and result["returncode"] == 0:
+        output_path = os.path.join(workspace_dir, "populated_schema.json")
+        result["overall_passed"] = os.path.exists(output_path)
+        result["final_output"] = output_path if result["overall_passed"] else None
+
+    if result["returncode"] is not None and result["error"] is None:
+        result["status"] = "passed" if result["overall_passed"] and result["returncode"] == 0 else "failed"
+
+    logger.info(f"[{run['name']}] {result['status'].upper()} in {result['elapsed_seconds']:.0f}s "
+                f"(exit {result['returncode']}, log: {os.path.join(workspace_dir, 'console.log')})")
+    return result
+
+
+def run_batch(
+    runs: List[Dict[str, Any]],
+    orchestrator: str,
+    batch_dir: str,
+    max_concurrent_runs: int = 2,
+    extra_args: Optional[List[str]] = None,
+    cache_dir: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Run every document concurrently and write batch_summary.json.
+
+    Args:
+        runs: Runs from load_manifest
+        orchestrator: Key of ORCHESTRATORS
+        batch_dir: Batch directory (one workspace per run inside it)
+        max_concurrent_runs: Orchestrator processes running at once; agent
+            launches are limited separately by the shared governor
+        extra_args: Arguments passed to every run
+        cache_dir: Directory for the shared caches (see shared_environment)
+
+    Returns:
+        The summary written to batch_summary.json
+    """
+    env = shared_environment(cache_dir)
+    workers = max(1, min(max_concurrent_runs, len(runs) or 1))
+    start = time.monotonic()
+    results_by_name = {}
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(run_one, run, orchestrator, os.path.join(batch_dir, run["name"]), extra_args or [], env)
+            for run in runs
+        ]
+        for future in as_completed(futures):
+            result = future.result()
+            results_by_name[result["name"]] = result
+
+    results = [results_by_name[run["name"]] for run in runs]
+    summary = {
+        "batch_dir": batch_dir,
+        "orchestrator": orchestrator,
+        "timestamp": datetime.now().isoformat(),
+        "total_runs": len(results),
+        "passed": sum(1 for r in results if r["status"] == "passed"),
+        "failed": sum(1 for r in results if r["status"] == "failed"),
+        "errors": sum(1 for r in results if r["status"] == "error"),
+        "max_concurrent_runs": workers,
+        "wall_seconds": round(time.monotonic() - start, 2),
+        "run_seconds": round(sum(r["elapsed_seconds"] for r in results), 2),
+        "queue_wait_seconds": round(sum(r["queue_wait_seconds"] for r in results), 2),
+        "shared": {
+            "agent_max_concurrency": env.get("AGENT_MAX_CONCURRENCY", "4"),
+            "agent_governor_dir": env["AGENT_GOVERNOR_DIR"],
+            "rule_schema_cache_dir": env["RULE_SCHEMA_CACHE_DIR"],
+            "eval_llm_cache_dir": env["EVAL_LLM_CACHE_DIR"],
+        },
+        "runs": results,
+    }
+
+    with open(os.path.join(batch_dir, "batch_summary.json"), 'w') as f:
+        json.dump(summary, f, indent=2)
+    return summary
+
+
+def format_batch_summary(summary: Dict[str, Any]) -> str:
+    """Console table of a run_batch summary."""
+    lines = [
+        "=" * 70,
+        "BATCH ORCHESTRATION SUMMARY",
+        "=" * 70,
+        f"{'run':<28} {'status':>7} {'time':>8} {'queue':>8}  stage scores",
+    ]
+    for r in summary["runs"]:
+        scores = " ".join(f"{score:.0%}" for score in r["stage_scores"].values()) or "-"
+        lines.append(f"{r['name'][:28]:<28} {r['status'].upper():>7} {r['elapsed_seconds']:7.0f}s "
+                     f"{r['queue_wait_seconds']:7.0f}s  {scores}")
+    lines.append("-" * 70)
+    lines.append(f"Runs: {summary['total_runs']}  Passed: {summary['passed']}  Failed: {summary['failed']}  "
+                 f"Errors: {summary['errors']}")
+    lines.append(f"Concurrent runs: {summary['max_concurrent_runs']}  Wall time: {summary['wall_seconds']:.0f}s  "
+                 f"Sum of run times: {summary['run_seconds']:.0f}s  Agent queue wait: {summary['queue_wait_seconds']:.0f}s")
+    lines.append(f"Agent slots (shared): {summary['shared']['agent_max_concurrency']}  "
+                 f"Governor: {summary['shared']['agent_governor_dir']}")
+    lines.append("=" * 70)
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run an orchestrator on many BUDs concurrently (arguments after -- go to every run)"
+    )
+    parser.add_argument(
+        "manifest",
+        help="JSON manifest of runs (document, schema, reference, optional name and args)"
+    )
+    parser.add_argument(
+        "--orchestrator",
+        default="mini",
+        choices=sorted(ORCHESTRATORS),
+        help="Orchestrator to run for each document (default: mini)"
+    )
+    parser.add_argument(
+        "--max-concurrent-runs",
+        type=int,
+        default=2,
+        help="Documents processed at once (default: 2); agent launches share AGENT_MAX_CONCURRENCY"
+    )
+    parser.add_argument(
+        "--batch-dir",
+        default=None,
+        help="Batch directory (default: adws/batch_<timestamp>/)"
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=None,
+        help="Directory for the shared rule-schema and eval LLM caches"
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Enable verbose output"
+    )
+
+    # Split at the first "--" ourselves: argparse drops a "--" that directly follows the positional
+    argv = sys.argv[1:]
+    separator = argv.index("--") if "--" in argv else len(argv)
+    args = parser.parse_args(argv[:separator])
+    extra_args = argv[separator + 1:]
+
+    config = ORCHESTRATORS[args.orchestrator]
+    try:
+        runs = load_manifest(args.manifest, needs_reference=config["needs_reference"])
+    except (OSError, ValueError) as e:
+        print(f"Error: Invalid manifest: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    for run in runs:
+        for key in ("document", "schema", "reference"):
+            if run[key] and not os.path.exists(run[key]):
+                print(f"Error: {key.title()} not found for {run['name']}: {run[key]}", file=sys.stderr)
+                sys.exit(1)
+
+    batch_dir = os.path.abspath(
+        args.batch_dir or os.path.join("adws", f"batch_{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}")
+    )
+    os.makedirs(batch_dir, exist_ok=True)
+    setup_batch_logging(batch_dir, verbose=args.verbose)
+
+    logger.info("=" * 70)
+    logger.info("BATCH ORCHESTRATOR")
+    logger.info("=" * 70)
+    logger.info(f"Orchestrator: {config['script']}")
+    logger.info(f"Runs: {len(runs)} ({args.max_concurrent_runs} at a time)")
+    logger.info(f"Batch directory: {batch_dir}")
+    if extra_args:
+        logger.info(f"Arguments for every run: {' '.join(extra_args)}")
+    logger.info("=" * 70)
+
+    summary = run_batch(
+        runs,
+        args.orchestrator,
+        batch_dir,
+        max_concurrent_runs=args.max_concurrent_runs,
+        extra_args=extra_args,
+        cache_dir=args.cache_dir
+    )
+
+    print()
+    print(format_batch_summary(summary))
+    print(f"\nSummary saved to: {os.path.join(batch_dir, 'batch_summary.json')}")
+
+    sys.exit(0 if summary["passed"] == summary["total_runs"] else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -25,19 +25,15 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 
-try:
-    import requests
-    REQUESTS_AVAILABLE = True
-except ImportError:
-    import urllib.request
-    import urllib.error
-    REQUESTS_AVAILABLE = False
-
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "dispatchers" / "agents"))
 
 from eval.evaluator import FormFillEvaluator
 from eval.orchestrator_integration import extract_self_heal_instructions
+from agent_governor import agent_slot, estimate_tokens, governor_stats
+from stage_code_worker import get_stage_worker, StageWorkerError
+from api_client import get_api_client
 
 # Module logger
 logger = logging.getLogger(__name__)
@@ -508,13 +504,14 @@ def run_code_gen_agent(stage: int, prompt: str, workspace_dir: str, iteration: i
     # Run claude
     try:
         cmd = ["claude", "-p", prompt, "--allowedTools", "Read,Write,Edit,Bash,Glob,Grep"]
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=900,
-            cwd=str(Path(__file__).parent.parent)
-        )
+        with agent_slot(estimate_tokens(prompt), label=f"stage {stage}"):
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                text=True,
+                timeout=900,
+                cwd=str(Path(__file__).parent.parent)
+            )
 
         if result.returncode != 0:
             logger.error(f"Agent failed: {result.stderr[:500]}")
@@ -572,19 +569,32 @@ def execute_generated_code(
             arg_name = f"--{input_type.replace('_', '-')}"
             cmd.extend([arg_name, pre_extraction_outputs[input_type]])
 
+    project_root = str(Path(__file__).parent.parent)
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=600,
-            cwd=str(Path(__file__).parent.parent)
-        )
+        # Preloaded worker first; a fresh interpreter if it is disabled or fails
+        result = None
+        executor = "subprocess"
+        worker = get_stage_worker()
+        if worker is not None:
+            try:
+                result = worker.run(code_path, cmd[2:], cwd=project_root, timeout=600)
+                executor = f"stage worker (pid {worker.pid})"
+            except StageWorkerError as e:
+                logger.warning(f"Stage worker failed, running in a new interpreter: {e}")
+        if result is None:
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                text=True,
+                timeout=600,
+                cwd=project_root
+            )
 
         # Save execution log
         log_path = os.path.join(workspace_dir, f"stage_{stage}_execution_v{iteration}.log")
         with open(log_path, 'w') as f:
-            f.write(f"Command: {' '.join(cmd)}\n\n")
+            f.write(f"Command: {' '.join(cmd)}\n")
+            f.write(f"Executor: {executor}\n\n")
             f.write(f"Return code: {result.returncode}\n\n")
             f.write(f"STDOUT:\n{result.stdout}\n\n")
             f.write(f"STDERR:\n{result.stderr}\n")
@@ -609,8 +619,9 @@ def execute_generated_code(
 
 
 def run_stage_eval(stage: int, generated_path: str, reference_path: str,
-                   workspace_dir: str, iteration: int) -> Tuple[bool, float, Dict]:
-    """Run evaluation for a stage output."""
+                   workspace_dir: str, iteration: int,
+                   evaluator: Optional[FormFillEvaluator] = None) -> Tuple[bool, float, Dict]:
+    """Run evaluation for a stage output (with the stage's incremental evaluator, if given)."""
     config = STAGE_CONFIG[stage]
     threshold = config["threshold"]
 
@@ -619,11 +630,12 @@ def run_stage_eval(stage: int, generated_path: str, reference_path: str,
     eval_report_path = os.path.join(workspace_dir, f"stage_{stage}_eval_v{iteration}.json")
 
     try:
-        evaluator = FormFillEvaluator(
-            use_llm=True,
-            llm_threshold=0.8,
-            pass_threshold=threshold
-        )
+        if evaluator is None:
+            evaluator = FormFillEvaluator(
+                use_llm=True,
+                llm_threshold=0.8,
+                pass_threshold=threshold
+            )
 
         passed, report = evaluator.evaluate_and_save_report(
             generated_path,
@@ -681,6 +693,14 @@ def run_stage_with_healing(
     eval_report = None
     final_code_path = None
 
+    # One evaluator for all iterations: unchanged fields' results are reused
+    evaluator = FormFillEvaluator(
+        use_llm=True,
+        llm_threshold=0.8,
+        pass_threshold=config["threshold"],
+        incremental=True
+    )
+
     for iteration in range(1, max_retries + 1):
         logger.info(f"Stage {stage} - Iteration {iteration}/{max_retries}")
 
@@ -732,7 +752,8 @@ def run_stage_with_healing(
             generated_path=output_path,
             reference_path=reference_path,
             workspace_dir=workspace_dir,
-            iteration=iteration
+            iteration=iteration,
+            evaluator=evaluator
         )
 
         final_score = score
@@ -808,7 +829,8 @@ def save_orchestration_summary(workspace_dir: str, stage_results: Dict[int, Dict
             "score_vs_threshold": f"{result.get('score', 0):.0%} / {result.get('threshold', 0):.0%}",
             "output_json": result.get("output"),
             "generated_code": result.get("code_file"),
-            "pipeline_iteration": result.get("pipeline_iteration", 1)
+            "pipeline_iteration": result.get("pipeline_iteration", 1),
+            "queue_wait_seconds": result.get("queue_wait_seconds", 0.0)
         }
 
     summary_path = os.path.join(workspace_dir, "orchestration_summary.json")
@@ -900,58 +922,35 @@ def call_api(
 
     workspace_id = uuid.uuid4().hex
     auth_retry_count = 0
+    client = get_api_client()
+    schema_data = None
+    body_for = None  # workspace_id the current body and api_schema.json were made for
 
     while auth_retry_count < max_auth_retries:
         try:
             # Load schema
-            with open(schema_path, 'r') as f:
-                schema_data = json.load(f)
-
-            # Make template unique
-            schema_data = make_template_unique(schema_data, workspace_id)
-
-            # Save modified schema
-            api_schema_path = os.path.join(workspace_dir, "api_schema.json")
-            with open(api_schema_path, 'w') as f:
-                json.dump(schema_data, f, indent=2)
-            logger.debug(f"Modified schema saved: {api_schema_path}")
+            if schema_data is None:
+                with open(schema_path, 'r') as f:
+                    schema_data = json.load(f)
+
+            # Make template unique (auth retries resend the same body)
+            if body_for != workspace_id:
+                schema_data = make_template_unique(schema_data, workspace_id)
+                body = json.dumps(schema_data).encode('utf-8')
+                body_for = workspace_id
+
+                # Save modified schema
+                api_schema_path = os.path.join(workspace_dir, "api_schema.json")
+                with open(api_schema_path, 'w') as f:
+                    json.dump(schema_data, f, indent=2)
+                logger.debug(f"Modified schema saved: {api_schema_path}")
 
             # Make API call
             headers = {
                 API_CONFIG["auth_header"]: API_CONFIG["auth_token"],
                 "Content-Type": API_CONFIG["content_type"]
             }
-
-            if REQUESTS_AVAILABLE:
-                response = requests.post(
-                    API_CONFIG["base_url"],
-                    headers=headers,
-                    json=schema_data,
-                    timeout=120
-                )
-                status_code = response.status_code
-                try:
-                    response_data = response.json()
-                except Exception:
-                    response_data = {"raw_response": response.text}
-            else:
-                # Use urllib as fallback
-                req = urllib.request.Request(
-                    API_CONFIG["base_url"],
-                    data=json.dumps(schema_data).encode('utf-8'),
-                    headers=headers,
-                    method='POST'
-                )
-                try:
-                    with urllib.request.urlopen(req, timeout=120) as resp:
-                        status_code = resp.status
-                        response_data = json.loads(resp.read().decode('utf-8'))
-                except urllib.error.HTTPError as e:
-                    status_code = e.code
-                    try:
-                        response_data = json.loads(e.read().decode('utf-8'))
-                    except Exception:
-                        response_data = {"error": str(e)}
+            status_code, response_data = client.post(API_CONFIG["base_url"], body, headers)
 
             # Save API response
             api_response_path = os.path.join(workspace_dir, "api_response.json")
@@ -1045,7 +1044,8 @@ def save_iteration_summary(
             "passed": result.get("passed", False),
             "score": result.get("score", 0.0),
             "output": result.get("output"),
-            "code_file": result.get("code_file")
+            "code_file": result.get("code_file"),
+            "queue_wait_seconds": result.get("queue_wait_seconds", 0.0)
         }
 
     if api_result:
@@ -1179,6 +1179,7 @@ def main():
                     "instruction": "The API rejected the previous output. Fix the schema based on these errors."
                 }
 
+            queue_wait_before = governor_stats()["total_wait_seconds"]
             passed, output_path, score, code_path = run_stage_with_healing(
                 stage=stage,
                 schema_path=args.schema,
@@ -1197,7 +1198,8 @@ def main():
                 "output": output_path,
                 "code_file": code_path or os.path.join(generated_code_dir, f"{STAGE_CONFIG[stage]['code_file']}_v1.py"),
                 "threshold": STAGE_CONFIG[stage]["threshold"],
-                "pipeline_iteration": pipeline_iteration
+                "pipeline_iteration": pipeline_iteration,
+                "queue_wait_seconds": round(governor_stats()["total_wait_seconds"] - queue_wait_before, 2)
             }
 
             if not passed:
@@ -1281,7 +1283,8 @@ def main():
     logger.info("Stage Results:")
     for stage, result in stage_results.items():
         status = "PASS" if result["passed"] else "FAIL"
-        logger.info(f"  Stage {stage} ({STAGE_CONFIG[stage]['name']}): {result['score']:.0%} {status}")
+        logger.info(f"  Stage {stage} ({STAGE_CONFIG[stage]['name']}): {result['score']:.0%} {status} "
+                    f"(agent queue wait: {result.get('queue_wait_seconds', 0.0):.1f}s)")
     logger.info("")
     if not args.skip_api and api_result:
         api_passed = api_result.get("success", False)
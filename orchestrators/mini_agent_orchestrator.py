@@ -10,6 +10,9 @@ This orchestrator runs mini agents sequentially with eval checks after each stag
 5. Assembly Agent - Consolidates rules, assigns IDs, validates structure
 
 Self-healing: If eval fails below threshold, agent is called again with feedback.
+Best-of-N (--parallel-attempts K): each self-heal round runs K agent attempts of the
+stage concurrently (each with its own approach hint), evaluates each as it finishes,
+keeps the highest-scoring output and kills the remaining attempts once one passes.
 API validation: After final stage, validates output against the API.
 """
 
@@ -20,24 +23,22 @@ import subprocess
 import sys
 import os
 import re
+import signal
+import threading
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 
-try:
-    import requests
-    REQUESTS_AVAILABLE = True
-except ImportError:
-    import urllib.request
-    import urllib.error
-    REQUESTS_AVAILABLE = False
-
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "dispatchers" / "agents"))
 
 from eval.evaluator import FormFillEvaluator
 from eval.orchestrator_integration import extract_self_heal_instructions
+from agent_governor import agent_slot, estimate_tokens, governor_stats
+from api_client import get_api_client
 
 # Module logger
 logger = logging.getLogger(__name__)
@@ -149,6 +150,24 @@ STAGE_CONFIG = {
 }
 
 
+# Approach hints for best-of-N attempts (attempt k uses hint k-1, cycling)
+ATTEMPT_STRATEGIES = [
+    "Follow the agent instructions exactly as written.",
+    "Work through the fields in document order and check every rule against the BUD text before writing it.",
+    "Start from the rule types and counts in the reference JSON, then confirm each rule against the BUD.",
+    "Fix the listed issues first, then re-check the fields around them for the same kind of mistake.",
+]
+
+# Seconds between checks for cancellation while an agent runs
+AGENT_POLL_INTERVAL = 1.0
+
+
+def stage_output_path(workspace_dir: str, stage: int, iteration: int, attempt: Optional[int] = None) -> str:
+    """Output JSON path of a stage iteration (and best-of-N attempt)."""
+    suffix = f"_a{attempt}" if attempt else ""
+    return os.path.join(workspace_dir, "stage_outputs", f"stage_{stage}_output_v{iteration}{suffix}.json")
+
+
 def create_workspace(base_dir: str = "adws") -> Tuple[str, str, str]:
     """
     Create timestamped workspace directory structure.
@@ -305,7 +324,9 @@ def build_agent_prompt(
     self_heal_instructions: Optional[Dict] = None,
     document_path: str = None,
     reference_path: str = None,
-    api_error_context: Optional[Dict] = None
+    api_error_context: Optional[Dict] = None,
+    attempt: Optional[int] = None,
+    total_attempts: int = 1
 ) -> str:
     """
     Build the prompt for a mini agent.
@@ -320,6 +341,9 @@ def build_agent_prompt(
         self_heal_instructions: Instructions from failed eval (if any)
         document_path: Path to BUD document
         reference_path: Path to reference JSON
+        api_error_context: API errors from previous pipeline iteration
+        attempt: Best-of-N attempt number (1-based), None when not running attempts
+        total_attempts: Number of concurrent attempts of this iteration
 
     Returns:
         Complete prompt string for the agent
@@ -354,14 +378,22 @@ def build_agent_prompt(
         prompt_parts.append(f"- **Previous Stage Output**: {previous_output}")
 
     # Add output path
-    stage_output_dir = os.path.join(workspace_dir, "stage_outputs")
-    output_path = os.path.join(stage_output_dir, f"stage_{stage}_output_v{iteration}.json")
+    output_path = stage_output_path(workspace_dir, stage, iteration, attempt)
     prompt_parts.extend([
         "",
         "## Output",
         f"Write the output JSON to: {output_path}",
     ])
 
+    # Best-of-N: each concurrent attempt gets its own approach
+    if attempt and total_attempts > 1:
+        prompt_parts.extend([
+            "",
+            f"## Attempt {attempt} of {total_attempts}",
+            "Other agents are working on this stage at the same time; the best-scoring output is kept.",
+            f"Approach: {ATTEMPT_STRATEGIES[(attempt - 1) % len(ATTEMPT_STRATEGIES)]}",
+        ])
+
     # Add self-heal instructions if present
     if self_heal_instructions:
         prompt_parts.extend([
@@ -372,7 +404,12 @@ def build_agent_prompt(
             "### Priority Fixes",
         ])
 
-        for i, fix in enumerate(self_heal_instructions.get("priority_fixes", [])[:10], 1):
+        priority_fixes = self_heal_instructions.get("priority_fixes", [])[:10]
+        if attempt and total_attempts > 1 and priority_fixes:
+            # Lead each attempt with a different fix
+            shift = (attempt - 1) % len(priority_fixes)
+            priority_fixes = priority_fixes[shift:] + priority_fixes[:shift]
+        for i, fix in enumerate(priority_fixes, 1):
             if isinstance(fix, dict):
                 category = fix.get("category", "Unknown")
                 action = fix.get("action", "N/A")
@@ -430,7 +467,9 @@ def run_mini_agent(
     prompt: str,
     workspace_dir: str,
     iteration: int,
-    verbose: bool = False
+    verbose: bool = False,
+    attempt: Optional[int] = None,
+    cancel_event: Optional[threading.Event] = None
 ) -> Optional[str]:
     """
     Run a mini agent using claude -p command.
@@ -441,22 +480,26 @@ def run_mini_agent(
         workspace_dir: Workspace directory
         iteration: Current iteration
         verbose: Enable verbose output
+        attempt: Best-of-N attempt number (own prompt and output files)
+        cancel_event: When set, the agent is killed (or not started)
 
     Returns:
-        Path to output file or None if failed
+        Path to output file or None if failed or cancelled
     """
     config = STAGE_CONFIG[stage]
+    attempt_label = f", Attempt {attempt}" if attempt else ""
+    suffix = f"_a{attempt}" if attempt else ""
 
-    logger.info(f"Running {config['name']} Agent (Iteration {iteration})...")
+    logger.info(f"Running {config['name']} Agent (Iteration {iteration}{attempt_label})...")
 
     # Save prompt to file
-    prompt_file = os.path.join(workspace_dir, f"stage_{stage}_prompt_v{iteration}.md")
+    prompt_file = os.path.join(workspace_dir, f"stage_{stage}_prompt_v{iteration}{suffix}.md")
     with open(prompt_file, 'w') as f:
         f.write(prompt)
     logger.debug(f"Prompt saved to: {prompt_file}")
 
     # Expected output path
-    output_path = os.path.join(workspace_dir, "stage_outputs", f"stage_{stage}_output_v{iteration}.json")
+    output_path = stage_output_path(workspace_dir, stage, iteration, attempt)
 
     # Run claude with the prompt
     try:
@@ -468,19 +511,30 @@ def run_mini_agent(
 
         logger.debug(f"Executing: claude -p <prompt> --allowedTools ...")
 
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            cwd=str(Path(__file__).parent.parent)
-        )
+        with agent_slot(estimate_tokens(prompt), label=f"stage {stage}{suffix}"):
+            if cancel_event is not None and cancel_event.is_set():
+                logger.info(f"Stage {stage}{attempt_label} cancelled before start")
+                return None
+            process = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                cwd=str(Path(__file__).parent.parent),
+                start_new_session=True
+            )
+            stdout, stderr = _wait_for_agent(process, cancel_event)
 
-        if result.returncode != 0:
-            logger.error(f"Agent failed with return code {result.returncode}: {result.stderr[:500]}")
+        if stdout is None:
+            logger.info(f"Stage {stage}{attempt_label} cancelled: another attempt passed")
+            return None
+
+        if process.returncode != 0:
+            logger.error(f"Agent failed with return code {process.returncode}: {stderr[:500]}")
             return None
 
         if verbose:
-            logger.debug(f"Agent stdout: {result.stdout[:2000]}")
+            logger.debug(f"Agent stdout: {stdout[:2000]}")
 
         # Check if output was created
         if os.path.exists(output_path):
@@ -498,38 +552,75 @@ def run_mini_agent(
         return None
 
 
+def _wait_for_agent(
+    process: subprocess.Popen,
+    cancel_event: Optional[threading.Event]
+) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Collect an agent's output, killing it if cancel_event is set.
+
+    Returns:
+        (stdout, stderr), or (None, None) if the agent was cancelled
+    """
+    if cancel_event is None:
+        return process.communicate()
+
+    while True:
+        try:
+            return process.communicate(timeout=AGENT_POLL_INTERVAL)
+        except subprocess.TimeoutExpired:
+            if cancel_event.is_set():
+                # The agent runs in its own session; kill its children too
+                try:
+                    os.killpg(process.pid, signal.SIGKILL)
+                except (AttributeError, OSError):
+                    process.kill()
+                process.communicate()
+                return None, None
+
+
 def run_stage_eval(
     stage: int,
     generated_path: str,
     reference_path: str,
     workspace_dir: str,
-    iteration: int
+    iteration: int,
+    evaluator: Optional[FormFillEvaluator] = None,
+    attempt: Optional[int] = None
 ) -> Tuple[bool, float, Dict]:
     """
     Run evaluation for a stage output.
 
+    Args:
+        evaluator: Evaluator kept across the stage's iterations (incremental
+            mode reuses unchanged fields' results); a new one if None
+        attempt: Best-of-N attempt number (own eval report file)
+
     Returns:
         Tuple of (passed, score, eval_report)
     """
     config = STAGE_CONFIG[stage]
     threshold = config["threshold"]
+    suffix = f"_a{attempt}" if attempt else ""
 
-    logger.info(f"Evaluating Stage {stage} (Threshold: {threshold:.0%})...")
+    attempt_label = f", Attempt {attempt}" if attempt else ""
+    logger.info(f"Evaluating Stage {stage}{attempt_label} (Threshold: {threshold:.0%})...")
 
-    eval_report_path = os.path.join(workspace_dir, f"stage_{stage}_eval_v{iteration}.json")
+    eval_report_path = os.path.join(workspace_dir, f"stage_{stage}_eval_v{iteration}{suffix}.json")
 
     try:
-        evaluator = FormFillEvaluator(
-            use_llm=True,
-            llm_threshold=0.8,
-            pass_threshold=threshold
-        )
+        if evaluator is None:
+            evaluator = FormFillEvaluator(
+                use_llm=True,
+                llm_threshold=0.8,
+                pass_threshold=threshold
+            )
 
         passed, report = evaluator.evaluate_and_save_report(
             generated_path,
             reference_path,
             eval_report_path,
-            verbose=True,
+            verbose=attempt is None,  # concurrent attempts would interleave the output
             include_llm_analysis=False
         )
 
@@ -551,6 +642,70 @@ def run_stage_eval(
         return False, 0.0, {}
 
 
+def run_parallel_attempts(
+    stage: int,
+    prompts: List[str],
+    workspace_dir: str,
+    iteration: int,
+    reference_path: str,
+    evaluators: List[FormFillEvaluator],
+    verbose: bool = False
+) -> List[Dict]:
+    """
+    Run one self-heal round as concurrent best-of-N agent attempts.
+
+    Every attempt runs in its own thread (and agent_governor slot) and is
+    evaluated as soon as its agent finishes. The first attempt to pass sets
+    a shared event that kills the attempts still running.
+
+    Args:
+        stage: Stage number
+        prompts: One prompt per attempt (attempt k uses prompts[k-1])
+        workspace_dir: Workspace directory
+        iteration: Current iteration
+        reference_path: Path to reference JSON
+        evaluators: One evaluator per attempt
+        verbose: Enable verbose output
+
+    Returns:
+        Per attempt: {attempt, output, passed, score, eval_report, cancelled}
+    """
+    cancel_event = threading.Event()
+
+    def run_attempt(attempt: int) -> Dict:
+        result = {"attempt": attempt, "output": None, "passed": False, "score": 0.0,
+                  "eval_report": {}, "cancelled": False}
+        output_path = run_mini_agent(
+            stage=stage,
+            prompt=prompts[attempt - 1],
+            workspace_dir=workspace_dir,
+            iteration=iteration,
+            verbose=verbose,
+            attempt=attempt,
+            cancel_event=cancel_event
+        )
+        if not output_path or cancel_event.is_set():
+            result["cancelled"] = cancel_event.is_set()
+            return result
+
+        passed, score, eval_report = run_stage_eval(
+            stage=stage,
+            generated_path=output_path,
+            reference_path=reference_path,
+            workspace_dir=workspace_dir,
+            iteration=iteration,
+            evaluator=evaluators[attempt - 1],
+            attempt=attempt
+        )
+        if passed:
+            cancel_event.set()
+        result.update(output=output_path, passed=passed, score=score, eval_report=eval_report)
+        return result
+
+    with ThreadPoolExecutor(max_workers=len(prompts)) as executor:
+        return list(executor.map(run_attempt, range(1, len(prompts) + 1)))
+
+
 def run_stage_with_healing(
     stage: int,
     schema_path: str,
@@ -560,7 +715,8 @@ def run_stage_with_healing(
     document_path: str,
     reference_path: str,
     verbose: bool = False,
-    api_error_context: Optional[Dict] = None
+    api_error_context: Optional[Dict] = None,
+    parallel_attempts: int = 1
 ) -> Tuple[bool, Optional[str], float]:
     """
     Run a stage with self-healing retries.
@@ -575,6 +731,8 @@ def run_stage_with_healing(
         reference_path: Path to reference JSON
         verbose: Enable verbose output
         api_error_context: API errors from previous pipeline iteration (for retry)
+        parallel_attempts: Concurrent agent attempts per iteration; with more
+            than one, the best-scoring output of all iterations is returned
 
     Returns:
         Tuple of (success, output_path, final_score)
@@ -582,6 +740,12 @@ def run_stage_with_healing(
     config = STAGE_CONFIG[stage]
     max_retries = config["max_retries"]
 
+    if parallel_attempts > 1:
+        return run_stage_best_of_n(
+            stage, schema_path, pre_extraction_outputs, previous_output, workspace_dir,
+            document_path, reference_path, parallel_attempts, verbose, api_error_context
+        )
+
     logger.info("=" * 70)
     logger.info(f"STAGE {stage}: {config['name'].upper()}")
     logger.info("=" * 70)
@@ -590,6 +754,14 @@ def run_stage_with_healing(
     output_path = None
     final_score = 0.0
 
+    # One evaluator for all iterations: unchanged fields' results are reused
+    evaluator = FormFillEvaluator(
+        use_llm=True,
+        llm_threshold=0.8,
+        pass_threshold=config["threshold"],
+        incremental=True
+    )
+
     for iteration in range(1, max_retries + 1):
         logger.info(f"Stage {stage} - Iteration {iteration}/{max_retries}")
 
@@ -626,7 +798,8 @@ def run_stage_with_healing(
             generated_path=output_path,
             reference_path=reference_path,
             workspace_dir=workspace_dir,
-            iteration=iteration
+            iteration=iteration,
+            evaluator=evaluator
         )
 
         final_score = score
@@ -644,6 +817,110 @@ def run_stage_with_healing(
     return False, output_path, final_score
 
 
+def run_stage_best_of_n(
+    stage: int,
+    schema_path: str,
+    pre_extraction_outputs: Dict[str, str],
+    previous_output: Optional[str],
+    workspace_dir: str,
+    document_path: str,
+    reference_path: str,
+    parallel_attempts: int,
+    verbose: bool = False,
+    api_error_context: Optional[Dict] = None
+) -> Tuple[bool, Optional[str], float]:
+    """
+    run_stage_with_healing with best-of-N concurrent attempts per iteration.
+
+    Each iteration runs parallel_attempts attempts (see run_parallel_attempts).
+    The stage passes as soon as one attempt passes. Otherwise the next
+    iteration's self-heal instructions come from the best attempt so far.
+
+    Returns:
+        Tuple of (success, best_output_path, best_score)
+    """
+    config = STAGE_CONFIG[stage]
+    max_retries = config["max_retries"]
+
+    logger.info("=" * 70)
+    logger.info(f"STAGE {stage}: {config['name'].upper()} (best of {parallel_attempts})")
+    logger.info("=" * 70)
+
+    self_heal_instructions = None
+    best = None
+
+    # One incremental evaluator per attempt slot, kept across iterations
+    evaluators = [
+        FormFillEvaluator(
+            use_llm=True,
+            llm_threshold=0.8,
+            pass_threshold=config["threshold"],
+            incremental=True
+        )
+        for _ in range(parallel_attempts)
+    ]
+
+    for iteration in range(1, max_retries + 1):
+        logger.info(f"Stage {stage} - Iteration {iteration}/{max_retries} ({parallel_attempts} attempts)")
+
+        prompts = [
+            build_agent_prompt(
+                stage=stage,
+                schema_path=schema_path,
+                pre_extraction_outputs=pre_extraction_outputs,
+                previous_output=previous_output,
+                workspace_dir=workspace_dir,
+                iteration=iteration,
+                self_heal_instructions=self_heal_instructions,
+                document_path=document_path,
+                reference_path=reference_path,
+                api_error_context=api_error_context if iteration == 1 else None,
+                attempt=attempt,
+                total_attempts=parallel_attempts
+            )
+            for attempt in range(1, parallel_attempts + 1)
+        ]
+
+        results = run_parallel_attempts(
+            stage, prompts, workspace_dir, iteration, reference_path, evaluators, verbose
+        )
+
+        for result in results:
+            if result["cancelled"]:
+                status = "cancelled"
+            elif not result["output"]:
+                status = "no output"
+            else:
+                status = f"{'PASSED' if result['passed'] else 'failed'} ({result['score']:.0%})"
+            logger.info(f"  Attempt {result['attempt']}: {status}")
+
+        scored = [r for r in results if r["output"]]
+        if not scored:
+            logger.warning("No attempt produced output, retrying...")
+            continue
+
+        round_best = max(scored, key=lambda r: (r["passed"], r["score"]))
+        if best is None or (round_best["passed"], round_best["score"]) > (best["passed"], best["score"]):
+            best = round_best
+
+        if round_best["passed"]:
+            logger.info(f"Stage {stage} PASSED on iteration {iteration} (attempt {round_best['attempt']})")
+            return True, round_best["output"], round_best["score"]
+
+        if iteration < max_retries:
+            logger.info(f"Extracting self-heal instructions from attempt {best['attempt']} for retry...")
+            self_heal_instructions = extract_self_heal_instructions(best["eval_report"], iteration)
+            logger.info(f"Priority fixes to apply: {len(self_heal_instructions.get('priority_fixes', []))}")
+
+    if best is None:
+        logger.warning(f"Stage {stage} FAILED after {max_retries} iterations (no output)")
+        return False, None, 0.0
+
+    logger.warning(f"Stage {stage} FAILED after {max_retries} iterations "
+                   f"(best score: {best['score']:.0%}, {best['output']})")
+    return False, best["output"], best["score"]
+
+
 def save_iteration_summary(
     workspace_dir: str,
     pipeline_iteration: int,
@@ -687,7 +964,8 @@ def save_iteration_summary(
             "name": STAGE_CONFIG[stage]["name"],
             "passed": result.get("passed", False),
             "score": result.get("score", 0.0),
-            "output": result.get("output")
+            "output": result.get("output"),
+            "queue_wait_seconds": result.get("queue_wait_seconds", 0.0)
         }
 
     if api_result:
@@ -761,7 +1039,8 @@ def save_orchestration_summary(
             "passed": result.get("passed", False),
             "score": result.get("score", 0.0),
             "output": result.get("output"),
-            "iterations": result.get("iterations", 0)
+            "iterations": result.get("iterations", 0),
+            "queue_wait_seconds": result.get("queue_wait_seconds", 0.0)
         }
 
     orch_summary_path = os.path.join(workspace_dir, "orchestration_summary.json")
@@ -852,57 +1131,35 @@ def call_api(
 
     workspace_id = uuid.uuid4().hex
     auth_retry_count = 0
+    client = get_api_client()
+    schema_data = None
+    body_for = None  # workspace_id the current body and api_schema.json were made for
 
     while auth_retry_count < max_auth_retries:
         try:
             # Load schema
-            with open(schema_path, 'r') as f:
-                schema_data = json.load(f)
-
-            # Make template unique
-            schema_data = make_template_unique(schema_data, workspace_id)
-
-            # Save modified schema
-            api_schema_path = os.path.join(workspace_dir, "api_schema.json")
-            with open(api_schema_path, 'w') as f:
-                json.dump(schema_data, f, indent=2)
-            logger.debug(f"Modified schema saved: {api_schema_path}")
+            if schema_data is None:
+                with open(schema_path, 'r') as f:
+                    schema_data = json.load(f)
+
+            # Make template unique (auth retries resend the same body)
+            if body_for != workspace_id:
+                schema_data = make_template_unique(schema_data, workspace_id)
+                body = json.dumps(schema_data).encode('utf-8')
+                body_for = workspace_id
+
+                # Save modified schema
+                api_schema_path = os.path.join(workspace_dir, "api_schema.json")
+                with open(api_schema_path, 'w') as f:
+                    json.dump(schema_data, f, indent=2)
+                logger.debug(f"Modified schema saved: {api_schema_path}")
 
             # Make API call
             headers = {
                 API_CONFIG["auth_header"]: API_CONFIG["auth_token"],
                 "Content-Type": API_CONFIG["content_type"]
             }
-
-            if REQUESTS_AVAILABLE:
-                response = requests.post(
-                    API_CONFIG["base_url"],
-                    headers=headers,
-                    json=schema_data,
-                )
-                status_code = response.status_code
-                try:
-                    response_data = response.json()
-                except Exception:
-                    response_data = {"raw_response": response.text}
-            else:
-                # Use urllib as fallback
-                req = urllib.request.Request(
-                    API_CONFIG["base_url"],
-                    data=json.dumps(schema_data).encode('utf-8'),
-                    headers=headers,
-                    method='POST'
-                )
-                try:
-                    with urllib.request.urlopen(req, timeout=60) as resp:
-                        status_code = resp.status
-                        response_data = json.loads(resp.read().decode('utf-8'))
-                except urllib.error.HTTPError as e:
-                    status_code = e.code
-                    try:
-                        response_data = json.loads(e.read().decode('utf-8'))
-                    except Exception:
-                        response_data = {"error": str(e)}
+            status_code, response_data = client.post(API_CONFIG["base_url"], body, headers)
 
             # Save API response
             api_response_path = os.path.join(workspace_dir, "api_response.json")
@@ -1029,6 +1286,12 @@ def main():
         default=None,
         help="API base URL (overrides default)"
     )
+    parser.add_argument(
+        "--parallel-attempts",
+        type=int,
+        default=1,
+        help="Concurrent agent attempts per stage iteration, best output kept (default: 1)"
+    )
     parser.add_argument(
         "--max-pipeline-iterations",
         type=int,
@@ -1080,6 +1343,8 @@ def main():
     logger.info(f"Templates Output: {templates_output_dir}")
     logger.info(f"Stages: {args.start_stage} -> {args.end_stage}")
     logger.info(f"Overall Threshold: {args.overall_threshold:.0%}")
+    if args.parallel_attempts > 1:
+        logger.info(f"Parallel Attempts: {args.parallel_attempts} per stage iteration")
     logger.info("=" * 70)
 
     # Run pre-extraction (only once) - outputs go to templates_output/
@@ -1124,6 +1389,7 @@ def main():
                     "instruction": "The API rejected the previous output. Fix the schema based on these errors."
                 }
 
+            queue_wait_before = governor_stats()["total_wait_seconds"]
             passed, output_path, score = run_stage_with_healing(
                 stage=stage,
                 schema_path=args.schema,
@@ -1133,14 +1399,16 @@ def main():
                 document_path=args.document_path,
                 reference_path=args.reference,
                 verbose=args.verbose,
-                api_error_context=stage_api_error_context
+                api_error_context=stage_api_error_context,
+                parallel_attempts=args.parallel_attempts
             )
 
             stage_results[stage] = {
                 "passed": passed,
                 "score": score,
                 "output": output_path,
-                "pipeline_iteration": pipeline_iteration
+                "pipeline_iteration": pipeline_iteration,
+                "queue_wait_seconds": round(governor_stats()["total_wait_seconds"] - queue_wait_before, 2)
             }
 
             if not passed:
@@ -1223,7 +1491,8 @@ def main():
     logger.info("Stage Results:")
     for stage, result in stage_results.items():
         status = "PASS" if result["passed"] else "FAIL"
-        logger.info(f"  Stage {stage} ({STAGE_CONFIG[stage]['name']}): {result['score']:.0%} {status}")
+        logger.info(f"  Stage {stage} ({STAGE_CONFIG[stage]['name']}): {result['score']:.0%} {status} "
+                    f"(agent queue wait: {result.get('queue_wait_seconds', 0.0):.1f}s)")
     logger.info("")
     if not args.skip_api and api_result:
         api_passed = api_result.get("success", False)
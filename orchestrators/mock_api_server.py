@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Local Stand-in for the Schema Validation API
+
+Implements the contract call_api relies on, so orchestrator runs (and the
+latency of their API step) can be tested offline:
+
+    POST <any path>   body: API JSON ({"template": {...}}), optionally gzip-encoded
+    200  {"status": "SUCCESS", "id": n, "templateName": ..., "code": ...}
+    400  {"message": "Template code <code> already present"}   (code posted before)
+    400  {"message": "Validation failed: ..."}                 (structural errors)
+    401  {"message": "Unauthorized"}                           (wrong auth header)
+
+Validation is structural only: the template needs templateName, code and
+documentTypes. Each documentType needs a code and a formFillMetadatas list.
+Each field needs a unique id and a formTag with name and type, and each
+rule needs an actionType. The real API checks much more. The stand-in is
+for exercising the request path, not for judging schemas.
+
+Connections are kept alive (HTTP/1.1). --latency and --jitter delay each
+response, and --upload-mbps adds the time the request body would take to
+upload over a link of that speed. --fail-rate answers that share of posts
+with 503, to exercise the client's retries.
+
+Usage:
+    python orchestrators/mock_api_server.py --port 8765 --latency 0.3
+    python orchestrators/coding_mini_agent_orchestrator.py doc.docx --schema s.json \\
+        --api-url http://127.0.0.1:8765/process --api-token mock-token
+
+    # In-process (benchmarks):
+    from mock_api_server import start_mock_server
+    server, url = start_mock_server(latency=0.05)
+    ...
+    server.shutdown()
+"""
+
+import argparse
+import gzip
+import json
+import random
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+
+DEFAULT_TOKEN = "mock-token"
+MAX_REPORTED_ERRORS = 5
+
+
+def validate_schema(data: Any) -> List[str]:
+    """Structural errors in an API JSON (empty if it looks valid)."""
+    template = data.get("template") if isinstance(data, dict) else None
+    if not isinstance(template, dict):
+        return ["Missing template object"]
+
+    errors = []
+    for key in ("templateName", "code"):
+        if not template.get(key):
+            errors.append(f"template.{key} is required")
+    doc_types = template.get("documentTypes")
+    if not isinstance(doc_types, list) or not doc_types:
+        errors.append("template.documentTypes must be a non-empty list")
+        return errors
+
+    seen_ids = set()
+    for d, doc_type in enumerate(doc_types):
+        if not doc_type.get("code"):
+            errors.append(f"documentTypes[{d}].code is required")
+        fields = doc_type.get("formFillMetadatas")
+        if not isinstance(fields, list):
+            errors.append(f"documentTypes[{d}].formFillMetadatas must be a list")
+            continue
+        for f, field in enumerate(fields):
+            field_id = field.get("id")
+            where = f"documentTypes[{d}].formFillMetadatas[{f}] (id {field_id})"
+            if field_id in seen_ids:
+                errors.append(f"{where}: duplicate field id")
+            seen_ids.add(field_id)
+            form_tag = field.get("formTag")
+            if not isinstance(form_tag, dict) or not form_tag.get("name") or not form_tag.get("type"):
+                errors.append(f"{where}: formTag needs name and type")
+            for r, rule in enumerate(field.get("formFillRules") or []):
+                if not rule.get("actionType"):
+                    errors.append(f"{where}.formFillRules[{r}]: actionType is required")
+    return errors
+
+
+class MockApiServer(ThreadingHTTPServer):
+    """ThreadingHTTPServer with the stand-in's settings and the template codes it has accepted."""
+
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], token: str = DEFAULT_TOKEN, auth_header: str = "X-Authorization",
+                 latency: float = 0.0, jitter: float = 0.0, fail_rate: float = 0.0, upload_mbps: float = 0.0):
+        super().__init__(address, MockApiHandler)
+        self.token = token
+        self.auth_header = auth_header
+        self.latency = latency
+        self.jitter = jitter
+        self.fail_rate = fail_rate
+        self.upload_mbps = upload_mbps
+        self.accepted_codes = set()
+        self.stats = {"requests": 0, "connections": 0, "gzip_requests": 0, "bytes_received": 0}
+        self.lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/process"
+
+
+class MockApiHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, like the real API
+
+    def setup(self):
+        super().setup()
+        # Headers and body go out in separate writes; don't let Nagle hold the body back on kept-alive connections
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        with self.server.lock:
+            self.server.stats["connections"] += 1
+
+    def log_message(self, format, *args):
+        pass
+
+    def _reply(self, status: int, payload: Dict, extra_headers: Optional[Dict[str, str]] = None):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (extra_headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        server = self.server
+        raw = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        is_gzip = self.headers.get("Content-Encoding", "").lower() == "gzip"
+        with server.lock:
+            server.stats["requests"] += 1
+            server.stats["bytes_received"] += len(raw)
+            server.stats["gzip_requests"] += is_gzip
+
+        if server.upload_mbps:
+            time.sleep(len(raw) * 8 / (server.upload_mbps * 1e6))
+        if server.latency or server.jitter:
+            time.sleep(server.latency + random.uniform(0, server.jitter))
+        if server.fail_rate and random.random() < server.fail_rate:
+            self._reply(503, {"message": "Service temporarily unavailable"}, {"Retry-After": "0"})
+            return
+        if self.headers.get(server.auth_header) != server.token:
+            self._reply(401, {"message": "Unauthorized"})
+            return
+
+        try:
+            data = json.loads(gzip.decompress(raw) if is_gzip else raw)
+        except (OSError, ValueError) as e:
+            self._reply(400, {"message": f"Malformed request body: {e}"})
+            return
+
+        errors = validate_schema(data)
+        if errors:
+            shown = "; ".join(errors[:MAX_REPORTED_ERRORS])
+            more = f" (+{len(errors) - MAX_REPORTED_ERRORS} more)" if len(errors) > MAX_REPORTED_ERRORS else ""
+            self._reply(400, {"message": f"Validation failed: {shown}{more}"})
+            return
+
+        template = data["template"]
+        with server.lock:
+            if template["code"] in server.accepted_codes:
+                duplicate = True
+            else:
+                duplicate = False
+                server.accepted_codes.add(template["code"])
+                template_id = len(server.accepted_codes)
+        if duplicate:
+            self._reply(400, {"message": f"Template code {template['code']} already present"})
+            return
+        self._reply(200, {
+            "status": "SUCCESS",
+            "id": template_id,
+            "templateName": template["templateName"],
+            "code": template["code"],
+        })
+
+
+def start_mock_server(host: str = "127.0.0.1", port: int = 0, **settings) -> Tuple[MockApiServer, str]:
+    """
+    Start the stand-in on a background thread.
+
+    Args:
+        host: Interface to bind
+        port: Port (0 picks a free one)
+        **settings: token, auth_header, latency, jitter, fail_rate, upload_mbps
+
+    Returns:
+        Tuple of (server, endpoint URL); call server.shutdown() when done
+    """
+    server = MockApiServer((host, port), **settings)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, server.url
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for the schema validation API")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to bind (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="Port (default: 8765)")
+    parser.add_argument("--token", default=DEFAULT_TOKEN, help=f"Accepted auth token (default: {DEFAULT_TOKEN})")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random delay up to this many seconds")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="Share of posts answered with 503 (0-1)")
+    parser.add_argument("--upload-mbps", type=float, default=0.0, help="Simulated upload bandwidth, 0 = unlimited")
+    args = parser.parse_args()
+
+    server = MockApiServer((args.host, args.port), token=args.token, latency=args.latency,
+                           jitter=args.jitter, fail_rate=args.fail_rate, upload_mbps=args.upload_mbps)
+    print(f"Mock validation API on {server.url} (token: {args.token})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"Served: {server.stats}")
+
+
+if __name__ == "__main__":
+    main()
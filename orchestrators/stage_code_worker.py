@@ -0,0 +1,391 @@
+#!/usr/bin/env python3
+"""
+Persistent Worker for Generated Stage Code
+
+The coding orchestrator runs each generated stage script once per
+iteration. Starting a fresh interpreter for every run means paying for
+interpreter startup, the python-docx/lxml imports and the Rule-Schemas.json
+registry build again each time, although the script itself often does only
+a few milliseconds of work.
+
+This module starts one long-lived worker process that does that
+preloading once. For each script it forks a child from the warm worker.
+The child runs the script as __main__ with the same argv, cwd and
+sys.path[0] that `python3 script.py ...` would give it. Each run is
+sandboxed:
+- it runs in its own process group, killed as a whole on timeout
+- address-space (STAGE_CODE_MEMORY_MB) and CPU-time limits apply
+- stdin is /dev/null, and stdout/stderr are captured into files
+- module globals, sys.argv and cwd changes die with the child
+
+Protocol: one JSON object per line on the worker's stdin/stdout.
+    worker -> {"ready": true, "pid": ..., "preloaded": [...]}
+    client -> {"id": n, "code_path": ..., "args": [...], "cwd": ..., "timeout": s, "memory_mb": m}
+    worker -> {"id": n, "returncode": ..., "stdout": ..., "stderr": ..., "timed_out": bool, "elapsed": s}
+
+StageCodeWorker.run() raises StageWorkerError if the worker dies or breaks
+the protocol. Callers then fall back to a plain subprocess. The next run()
+starts a new worker.
+
+    STAGE_CODE_WORKER      "off" to always use a new interpreter (default: on)
+    STAGE_CODE_MEMORY_MB   Address-space limit per run in MB, 0 = none (default: 4096)
+
+Usage:
+    from stage_code_worker import get_stage_worker, StageWorkerError
+
+    worker = get_stage_worker()          # None if disabled or unsupported
+    result = worker.run("generated_code/stage_1_v1.py", ["--schema", "s.json"], cwd=root, timeout=600)
+    result.returncode, result.stdout, result.stderr    # like subprocess.run
+"""
+
+import atexit
+import importlib
+import json
+import os
+import select
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import traceback
+from pathlib import Path
+from typing import Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Imported once by the worker; generated stage code gets them from sys.modules
+PRELOAD_MODULES = [
+    "argparse", "collections", "dataclasses", "datetime", "difflib", "json", "logging", "re", "typing",
+    "docx", "lxml.etree",
+    "common.json_io", "common.rule_schema_registry",
+]
+
+DEFAULT_MEMORY_MB = 4096
+STARTUP_TIMEOUT = 60
+# Extra seconds the client waits for a response beyond the run's own timeout
+RESPONSE_GRACE = 30
+
+
+class StageWorkerError(Exception):
+    """The worker crashed, hung or broke the protocol."""
+
+
+# ── Worker process ──────────────────────────────────────────────────────────
+
+def _preload() -> List[str]:
+    """Import shared modules and build the Rule-Schemas.json registry."""
+    sys.path.insert(0, str(PROJECT_ROOT))
+    loaded = []
+    for name in PRELOAD_MODULES:
+        try:
+            importlib.import_module(name)
+            loaded.append(name)
+        except ImportError:
+            pass
+    try:
+        from common.rule_schema_registry import RuleSchemaRegistry
+        RuleSchemaRegistry.load()
+        loaded.append("RuleSchemaRegistry")
+    except Exception as e:
+        print(f"stage worker: registry preload failed: {e}", file=sys.stderr)
+    sys.path.remove(str(PROJECT_ROOT))
+    return loaded
+
+
+def _run_child(request: Dict, stdout_path: str, stderr_path: str) -> None:
+    """Forked child: apply limits, redirect output and run the script as __main__. Never returns."""
+    code = 1
+    try:
+        os.setpgid(0, 0)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+
+        devnull = os.open(os.devnull, os.O_RDONLY)
+        os.dup2(devnull, 0)
+        for fd, path in ((1, stdout_path), (2, stderr_path)):
+            target = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            os.dup2(target, fd)
+            os.close(target)
+        sys.stdin = open(0, "r", closefd=False)
+        sys.stdout = open(1, "w", buffering=1, closefd=False)
+        sys.stderr = open(2, "w", buffering=1, closefd=False)
+
+        if resource is not None:
+            memory_mb = int(request.get("memory_mb") or 0)
+            if memory_mb > 0:
+                limit = memory_mb * 1024 * 1024
+                resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+            cpu_seconds = int(request.get("timeout") or 0)
+            if cpu_seconds > 0:
+                resource.setrlimit(resource.RLIMIT_CPU, (cpu_seconds + 5, cpu_seconds + 5))
+
+        code_path = os.path.abspath(os.path.join(request["cwd"], request["code_path"]))
+        os.chdir(request["cwd"])
+        sys.argv = [request["code_path"]] + list(request.get("args", []))
+        sys.path.insert(0, os.path.dirname(code_path))
+
+        import runpy
+        try:
+            runpy.run_path(code_path, run_name="__main__")
+            code = 0
+        except SystemExit as e:
+            if e.code is None:
+                code = 0
+            elif isinstance(e.code, int):
+                code = e.code
+            else:
+                print(e.code, file=sys.stderr)
+                code = 1
+        except BaseException as e:
+            # Drop the worker and runpy frames so the traceback reads like `python3 script.py`
+            tb = e.__traceback__
+            while tb is not None and tb.tb_frame.f_code.co_filename != code_path:
+                tb = tb.tb_next
+            traceback.print_exception(type(e), e, tb or e.__traceback__)
+            code = 1
+    finally:
+        try:
+            sys.stdout.flush()
+            sys.stderr.flush()
+        finally:
+            os._exit(code & 0xFF if code >= 0 else 1)
+
+
+def _execute(request: Dict) -> Dict:
+    """Run one request in a forked child and collect its result."""
+    timeout = float(request.get("timeout") or 0)
+    with tempfile.TemporaryDirectory(prefix="stage_worker_") as tmp:
+        stdout_path = os.path.join(tmp, "stdout")
+        stderr_path = os.path.join(tmp, "stderr")
+
+        sys.stdout.flush()
+        sys.stderr.flush()
+        start = time.monotonic()
+        pid = os.fork()
+        if pid == 0:
+            _run_child(request, stdout_path, stderr_path)
+
+        timed_out = False
+        poll = 0.002
+        while True:
+            done, status = os.waitpid(pid, os.WNOHANG)
+            if done:
+                break
+            if timeout and time.monotonic() - start > timeout:
+                timed_out = True
+                try:
+                    os.killpg(pid, signal.SIGKILL)
+                except OSError:
+                    os.kill(pid, signal.SIGKILL)
+                _, status = os.waitpid(pid, 0)
+                break
+            time.sleep(poll)
+            poll = min(poll * 2, 0.05)
+
+        if os.WIFSIGNALED(status):
+            returncode = -os.WTERMSIG(status)
+        else:
+            returncode = os.WEXITSTATUS(status)
+
+        outputs = []
+        for path in (stdout_path, stderr_path):
+            try:
+                with open(path, "r", encoding="utf-8", errors="replace") as f:
+                    outputs.append(f.read())
+            except OSError:
+                outputs.append("")
+
+    return {
+        "id": request.get("id"),
+        "returncode": returncode,
+        "stdout": outputs[0],
+        "stderr": outputs[1],
+        "timed_out": timed_out,
+        "elapsed": round(time.monotonic() - start, 4),
+    }
+
+
+def worker_main() -> None:
+    """Worker loop: preload, then serve requests from stdin until EOF."""
+    # Keep the protocol channel private; stray prints go to stderr
+    protocol_out = os.fdopen(os.dup(1), "w", buffering=1, encoding="utf-8")
+    os.dup2(2, 1)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    preloaded = _preload()
+    protocol_out.write(json.dumps({"ready": True, "pid": os.getpid(), "preloaded": preloaded}) + "\n")
+
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        try:
+            request = json.loads(line)
+        except ValueError:
+            continue
+        if request.get("shutdown"):
+            break
+        try:
+            response = _execute(request)
+        except Exception as e:
+            response = {"id": request.get("id"), "error": f"{type(e).__name__}: {e}"}
+        protocol_out.write(json.dumps(response) + "\n")
+
+
+# ── Client ──────────────────────────────────────────────────────────────────
+
+class StageCodeWorker:
+    """
+    Client for one worker process, started on first use.
+
+    Attributes:
+        memory_mb: Address-space limit per run (0 = none)
+        runs: Runs served by the current worker process
+    """
+
+    def __init__(self, memory_mb: int = DEFAULT_MEMORY_MB, python: str = sys.executable):
+        self.memory_mb = memory_mb
+        self.python = python
+        self.runs = 0
+        self.preloaded: List[str] = []
+        self._process: Optional[subprocess.Popen] = None
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self._process.pid if self._process else None
+
+    def _start(self) -> None:
+        self._process = subprocess.Popen(
+            [self.python, os.path.abspath(__file__), "--serve"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1,
+            cwd=str(PROJECT_ROOT)
+        )
+        self.runs = 0
+        ready = self._read_message(STARTUP_TIMEOUT)
+        if not ready.get("ready"):
+            self.stop()
+            raise StageWorkerError(f"Unexpected worker greeting: {ready}")
+        self.preloaded = ready.get("preloaded", [])
+
+    def _read_message(self, timeout: float) -> Dict:
+        stdout = self._process.stdout
+        ready, _, _ = select.select([stdout], [], [], timeout)
+        if not ready:
+            self.stop()
+            raise StageWorkerError(f"No response from worker within {timeout:.0f}s")
+        line = stdout.readline()
+        if not line:
+            code = self._process.poll()
+            self.stop()
+            raise StageWorkerError(f"Worker exited (code {code})")
+        try:
+            return json.loads(line)
+        except ValueError:
+            self.stop()
+            raise StageWorkerError(f"Malformed worker response: {line[:200]}")
+
+    def run(
+        self,
+        code_path: str,
+        args: List[str],
+        cwd: str,
+        timeout: float = 600
+    ) -> subprocess.CompletedProcess:
+        """
+        Run a stage script in a forked, sandboxed child of the worker.
+
+        Args:
+            code_path: Script path (relative to cwd or absolute)
+            args: Command-line arguments after the script
+            cwd: Working directory for the script
+            timeout: Seconds before the run is killed
+
+        Returns:
+            CompletedProcess with returncode, stdout and stderr
+
+        Raises:
+            subprocess.TimeoutExpired: The script ran longer than timeout
+            StageWorkerError: The worker failed (caller should fall back)
+        """
+        with self._lock:
+            if self._process is None or self._process.poll() is not None:
+                self._start()
+
+            self._next_id += 1
+            request = {
+                "id": self._next_id,
+                "code_path": code_path,
+                "args": list(args),
+                "cwd": cwd,
+                "timeout": timeout,
+                "memory_mb": self.memory_mb,
+            }
+            try:
+                self._process.stdin.write(json.dumps(request) + "\n")
+                self._process.stdin.flush()
+            except OSError as e:
+                self.stop()
+                raise StageWorkerError(f"Worker not accepting requests: {e}")
+
+            response = self._read_message(timeout + RESPONSE_GRACE)
+            if response.get("id") != request["id"] or "error" in response:
+                self.stop()
+                raise StageWorkerError(response.get("error") or f"Response for wrong request: {response.get('id')}")
+            self.runs += 1
+
+        cmd = ["python3", code_path] + list(args)
+        if response["timed_out"]:
+            raise subprocess.TimeoutExpired(cmd, timeout, output=response["stdout"], stderr=response["stderr"])
+        return subprocess.CompletedProcess(cmd, response["returncode"], response["stdout"], response["stderr"])
+
+    def stop(self) -> None:
+        """Stop the worker process (a later run() starts a new one)."""
+        process, self._process = self._process, None
+        if process is None:
+            return
+        try:
+            if process.poll() is None:
+                process.stdin.write(json.dumps({"shutdown": True}) + "\n")
+                process.stdin.flush()
+                process.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired, ValueError):
+            process.kill()
+            process.wait()
+
+
+_worker: Optional[StageCodeWorker] = None
+_worker_lock = threading.Lock()
+
+
+def get_stage_worker() -> Optional[StageCodeWorker]:
+    """The process-wide worker client, or None if disabled or unsupported on this platform."""
+    global _worker
+    if os.environ.get("STAGE_CODE_WORKER", "").lower() == "off" or not hasattr(os, "fork"):
+        return None
+    with _worker_lock:
+        if _worker is None:
+            _worker = StageCodeWorker(
+                memory_mb=int(os.environ.get("STAGE_CODE_MEMORY_MB", DEFAULT_MEMORY_MB))
+            )
+            atexit.register(_worker.stop)
+        return _worker
+
+
+if __name__ == "__main__":
+    if sys.argv[1:] == ["--serve"]:
+        worker_main()
+    else:
+        print("Usage: stage_code_worker.py --serve (started by StageCodeWorker)", file=sys.stderr)
+        sys.exit(2)
@@ -28,12 +28,13 @@ Usage:
     )
 """
 
-import json
 import re
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from collections import defaultdict
 
+from common import json_io
+
 from .main import RuleExtractionAgent
 from .models import id_generator
 
@@ -94,11 +95,9 @@ class EnhancedRuleExtractionAgent(RuleExtractionAgent):
         id_generator.reset()
 
         # Load inputs
-        with open(schema_json_path, 'r') as f:
-            schema = json.load(f)
+        schema = json_io.load(schema_json_path)
 
-        with open(intra_panel_path, 'r') as f:
-            intra_panel = json.load(f)
+        intra_panel = json_io.load(intra_panel_path)
 
         if self.verbose:
             print("\n" + "=" * 60)
@@ -130,8 +129,7 @@ class EnhancedRuleExtractionAgent(RuleExtractionAgent):
 
         # Save updated schema
         if output_path:
-            with open(output_path, 'w') as f:
-                json.dump(result['schema'], f, indent=2)
+            json_io.dump_streaming(result['schema'], output_path, json_io.FORM_FILL_METADATAS_PATH, pretty=True)
 
         return result
 
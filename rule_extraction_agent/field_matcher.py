@@ -1,10 +1,14 @@
 """Field matching using fuzzy string matching."""
 
 import re
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, FrozenSet, List, Optional, Tuple
 from .models import FieldInfo
 
 
+_NON_WORD = re.compile(r'[^\w\s]')
+_WHITESPACE = re.compile(r'\s+')
+
+
 class FieldMatcher:
     """Match field references from logic text to actual field IDs in schema."""
 
@@ -14,6 +18,12 @@ class FieldMatcher:
         self.by_id: Dict[int, FieldInfo] = {}
         self.by_variable: Dict[str, FieldInfo] = {}
 
+        # Per-field normalized names and token sets (parallel to self.fields),
+        # and token -> field positions for fuzzy candidate lookup
+        self._normalized_names: List[str] = []
+        self._token_sets: List[FrozenSet[str]] = []
+        self._token_index: Dict[str, List[int]] = {}
+
         if fields:
             self.load_fields(fields)
 
@@ -23,6 +33,9 @@ class FieldMatcher:
         self.by_name = {}
         self.by_id = {}
         self.by_variable = {}
+        self._normalized_names = []
+        self._token_sets = []
+        self._token_index = {}
 
         for field_data in fields:
             form_tag = field_data.get('formTag', {})
@@ -37,12 +50,20 @@ class FieldMatcher:
                 visible=field_data.get('visible', True),
             )
 
+            position = len(self.fields)
             self.fields.append(field_info)
 
             # Index by normalized name
             normalized_name = self._normalize(field_info.name)
             self.by_name[normalized_name] = field_info
 
+            # Token set and inverted index for fuzzy matching
+            tokens = frozenset(normalized_name.split())
+            self._normalized_names.append(normalized_name)
+            self._token_sets.append(tokens)
+            for token in tokens:
+                self._token_index.setdefault(token, []).append(position)
+
             # Index by ID
             self.by_id[field_info.id] = field_info
 
@@ -56,8 +77,8 @@ class FieldMatcher:
             return ""
         # Lowercase and remove special characters
         text = text.lower().strip()
-        text = re.sub(r'[^\w\s]', ' ', text)
-        text = re.sub(r'\s+', ' ', text)
+        text = _NON_WORD.sub(' ', text)
+        text = _WHITESPACE.sub(' ', text)
         return text
 
     def find_by_name(self, name: str) -> Optional[FieldInfo]:
@@ -96,16 +117,24 @@ class FieldMatcher:
         query_normalized = self._normalize(query)
         query_tokens = set(query_normalized.split())
 
-        for field in self.fields:
-            field_normalized = self._normalize(field.name)
-            field_tokens = set(field_normalized.split())
-
+        if threshold < 0:
+            # Fields sharing no token score 0, which only wins below a zero threshold
+            candidates = range(len(self.fields))
+        else:
+            # Only fields sharing a token can score above zero; visit them in
+            # field order so ties resolve to the same field as a full scan
+            shared = set()
+            for token in query_tokens:
+                shared.update(self._token_index.get(token, ()))
+            candidates = sorted(shared)
+
+        for position in candidates:
             # Token-based similarity
-            score = self._token_similarity(query_tokens, field_tokens)
+            score = self._token_similarity(query_tokens, self._token_sets[position])
 
             if score > best_score:
                 best_score = score
-                best_match = field
+                best_match = self.fields[position]
 
         return best_match
 
@@ -146,9 +175,7 @@ class FieldMatcher:
         key_terms = self._normalize(key_terms)
 
         related = []
-        for field in self.fields:
-            field_normalized = self._normalize(field.name)
-
+        for field, field_normalized in zip(self.fields, self._normalized_names):
             # Check if key terms appear in field name
             if key_terms in field_normalized or field_normalized in key_terms:
                 related.append(field)
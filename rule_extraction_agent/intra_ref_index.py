@@ -0,0 +1,86 @@
+"""One-time index of intra-panel references for RuleExtractionAgent.process()."""
+
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
+
+from .field_matcher import FieldMatcher
+from .models import FieldInfo
+
+
+def ref_field_name(value: Any) -> str:
+    """Field name of a reference end, which is a string or a {"field_name": ...} dict."""
+    if isinstance(value, dict):
+        return value.get('field_name') or ''
+    return value if isinstance(value, str) else ''
+
+
+class IntraRefIndex:
+    """
+    Intra-panel references indexed by field name and dependency type.
+
+    Built once per process() run. The lookups return the same results, in the
+    same order, as scanning the full reference list:
+
+    - logic_for(name): descriptions of refs where the field is the
+      dependent, source, target or referenced field (string shapes only, as
+      before)
+    - data_population_targets(name): data_population refs whose source
+      (string or dict) is the field
+    - refs_of_type(type): refs with that dependency_type
+    - match(name): field_matcher.match_field(name), memoized by normalized
+      name (match_field only depends on the normalized query)
+    """
+
+    # Ref roles in the order _get_field_logic checked them, with the
+    # description key(s) each role contributes
+    _LOGIC_ROLES = (
+        ('dependent_field', ('rule_description',)),
+        ('source_field', ('dependency_description', 'logic_excerpt')),
+        ('target_field', ('dependency_description',)),
+        ('referenced_field', ('rule_description',)),
+    )
+
+    def __init__(self, refs: List[Dict], field_matcher: FieldMatcher):
+        self.refs = refs
+        self.field_matcher = field_matcher
+        self._logic_parts: Dict[str, List[str]] = defaultdict(list)
+        self._data_population_by_source: Dict[str, List[Dict]] = defaultdict(list)
+        self._by_dependency_type: Dict[str, List[Dict]] = defaultdict(list)
+        self._matches: Dict[str, Optional[FieldInfo]] = {}
+
+        for ref in refs:
+            for role, desc_keys in self._LOGIC_ROLES:
+                name = ref.get(role, '')
+                if not isinstance(name, str):
+                    continue
+                desc = ''
+                for key in desc_keys:
+                    desc = desc or ref.get(key, '')
+                if desc and isinstance(desc, str):
+                    self._logic_parts[name.lower().strip()].append(desc)
+
+            ref_type = ref.get('reference_type', ref.get('dependency_type', ''))
+            if ref_type == 'data_population':
+                source = ref_field_name(ref.get('source_field', ''))
+                self._data_population_by_source[source.lower().strip()].append(ref)
+
+            self._by_dependency_type[ref.get('dependency_type', '')].append(ref)
+
+    def logic_for(self, field_name: str) -> str:
+        """Combined logic text for a field from the references."""
+        return ' '.join(self._logic_parts.get(field_name.lower().strip(), ()))
+
+    def data_population_targets(self, source_field_name: str) -> List[Dict]:
+        """data_population refs whose source is the given field, in ref order."""
+        return self._data_population_by_source.get(source_field_name.lower().strip(), [])
+
+    def refs_of_type(self, dependency_type: str) -> List[Dict]:
+        """Refs with the given dependency_type, in ref order."""
+        return self._by_dependency_type.get(dependency_type, [])
+
+    def match(self, name: str) -> Optional[FieldInfo]:
+        """field_matcher.match_field(name) with the default threshold, memoized."""
+        key = self.field_matcher._normalize(name)
+        if key not in self._matches:
+            self._matches[key] = self.field_matcher.match_field(name)
+        return self._matches[key]
@@ -1,20 +1,12 @@
 """Parse natural language logic statements into structured data."""
 
-import re
+from dataclasses import replace
 from typing import List, Dict, Optional, Tuple
 from .models import ParsedLogic, Condition
+from .memo import get_memo
+from . import patterns
 
 
-# Patterns to skip (expression/execute rules)
-SKIP_PATTERNS = [
-    r"mvi\s*\(",
-    r"mm\s*\(",
-    r"expr-eval",
-    r"\bEXECUTE\b",
-    r"execute\s+rule",
-    r"execute\s+script",
-]
-
 # Keyword patterns for different rule types
 VISIBILITY_KEYWORDS = [
     "visible", "invisible", "show", "hide", "display", "hidden"
@@ -53,18 +45,33 @@ class LogicParser:
     """Parse natural language logic statements into structured data."""
 
     def __init__(self):
-        self.skip_patterns = [re.compile(p, re.IGNORECASE) for p in SKIP_PATTERNS]
+        self.skip_patterns = patterns.SKIP_PATTERNS
+        self.memo = get_memo("logic_parser.parse")
 
     def parse(self, logic_text: str) -> ParsedLogic:
         """
         Parse a logic statement into structured data.
 
+        Results are memoized per exact logic text (see memo.py); each call
+        returns its own copy.
+
         Args:
             logic_text: Natural language logic statement
 
         Returns:
             ParsedLogic with extracted keywords, actions, conditions, etc.
         """
+        parsed = self.memo.get(logic_text, lambda: self._parse(logic_text))
+        return replace(
+            parsed,
+            keywords=list(parsed.keywords),
+            actions=list(parsed.actions),
+            condition=replace(parsed.condition) if parsed.condition else None,
+            field_refs=list(parsed.field_refs),
+        )
+
+    def _parse(self, logic_text: str) -> ParsedLogic:
+        """Parse a logic statement (uncached)."""
         if not logic_text:
             return ParsedLogic(
                 raw_text="",
@@ -150,14 +157,14 @@ class LogicParser:
 
         # OCR detection
         if any(kw in keywords for kw in OCR_KEYWORDS):
-            if re.search(r"(from|using)\s+ocr|ocr\s+rule|get\s+\w+\s+from\s+ocr", text_lower):
+            if patterns.PARSER_OCR_ACTION.search(text_lower):
                 actions.append("OCR")
 
         # VERIFY detection (not destination fields)
         if any(kw in keywords for kw in VALIDATION_KEYWORDS):
             # Skip if this is a destination field
-            if not re.search(r"data\s+will\s+come\s+from", text_lower):
-                if re.search(r"perform\s+\w+\s+validation|validate\s+\w+", text_lower):
+            if not patterns.PARSER_DATA_FROM.search(text_lower):
+                if patterns.PARSER_VERIFY_ACTION.search(text_lower):
                     actions.append("VERIFY")
 
         # Visibility detection
@@ -188,20 +195,10 @@ class LogicParser:
 
     def _extract_condition(self, text: str) -> Optional[Condition]:
         """Extract conditional logic from text."""
-        # Pattern: "if field 'X' is/values is Y then ..."
-        patterns = [
-            # "if the field 'X' values is Y then"
-            r"if\s+(?:the\s+)?field\s+['\"]([^'\"]+)['\"]\s+(?:value[s]?\s+is|is)\s+([^,\s]+(?:\s+[^,\s]+)?)\s+then",
-            # "if 'X' is Y then"
-            r"if\s+['\"]([^'\"]+)['\"]\s+is\s+([^,\s]+)\s+then",
-            # "when field 'X' is Y"
-            r"when\s+(?:the\s+)?field\s+['\"]([^'\"]+)['\"]\s+is\s+([^,\s]+)",
-            # "based on X selection"
-            r"based\s+on\s+(?:the\s+)?['\"]?([^'\"]+?)['\"]?\s+selection",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        # "if the field 'X' values is Y then", "if 'X' is Y then",
+        # "when field 'X' is Y", "based on X selection"
+        for pattern in patterns.CONDITION_PATTERNS:
+            match = pattern.search(text)
             if match:
                 groups = match.groups()
                 if len(groups) >= 2:
@@ -226,17 +223,12 @@ class LogicParser:
         field_refs = []
 
         # Pattern: field names in quotes
-        quoted_fields = re.findall(r"['\"]([^'\"]+)['\"]", text)
+        quoted_fields = patterns.QUOTED_TEXT.findall(text)
         field_refs.extend(quoted_fields)
 
         # Pattern: "field X" or "the X field"
-        field_patterns = [
-            r"field\s+([A-Z][a-zA-Z\s]+)",
-            r"the\s+([A-Z][a-zA-Z\s]+)\s+field",
-        ]
-
-        for pattern in field_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        for pattern in patterns.FIELD_REFERENCE_PATTERNS:
+            matches = pattern.findall(text)
             field_refs.extend(matches)
 
         # Clean and dedupe
@@ -252,9 +244,9 @@ class LogicParser:
         """Detect document type mentioned in logic."""
         text_lower = text.lower()
 
-        for doc_type, patterns in DOC_TYPE_PATTERNS.items():
-            for pattern in patterns:
-                if pattern in text_lower:
+        for doc_type, keywords in DOC_TYPE_PATTERNS.items():
+            for keyword in keywords:
+                if keyword in text_lower:
                     return doc_type.upper()
 
         return None
@@ -303,64 +295,40 @@ class LogicParser:
         }
 
         # Extract controlling field
-        field_match = re.search(
-            r"if\s+(?:the\s+)?field\s+['\"]([^'\"]+)['\"]",
-            text, re.IGNORECASE
-        )
+        field_match = patterns.VISIBILITY_CONTROLLING_FIELD.search(text)
         if field_match:
             result["controlling_field"] = field_match.group(1)
 
         # Extract visible values
-        visible_match = re.search(
-            r"(?:values?\s+is|is)\s+([^,]+?)\s+then\s+visible",
-            text, re.IGNORECASE
-        )
+        visible_match = patterns.VISIBILITY_VISIBLE_VALUE.search(text)
         if visible_match:
             result["visible_when"].append(visible_match.group(1).strip())
 
-        # Extract invisible values
-        invisible_match = re.search(
-            r"otherwise\s+invisible|(?:if|when).*?([^,]+?)\s+then\s+invisible",
-            text, re.IGNORECASE
-        )
+        # Extract invisible values: "otherwise invisible", or the value before
+        # "then invisible" in an if/when clause - whichever comes first
+        otherwise_match = patterns.VISIBILITY_OTHERWISE_INVISIBLE.search(text)
+        condition_start = patterns.VISIBILITY_CONDITION_START.search(text)
+        invisible_match = None
+        if condition_start and not (otherwise_match and otherwise_match.start() < condition_start.start()):
+            invisible_match = patterns.VISIBILITY_INVISIBLE_VALUE.search(text, condition_start.end())
         if invisible_match:
-            if invisible_match.group(0).startswith("otherwise"):
-                result["invisible_when"].append("otherwise")
-            else:
-                result["invisible_when"].append(invisible_match.group(1).strip())
+            result["invisible_when"].append(invisible_match.group(1).strip())
+        elif otherwise_match:
+            result["invisible_when"].append("otherwise")
 
         return result
 
     def is_destination_field(self, text: str) -> bool:
         """Check if this field is a destination of another rule."""
-        patterns = [
-            r"data\s+will\s+come\s+from",
-            r"populated\s+from",
-            r"derived\s+from",
-            r"auto-?fill(?:ed)?\s+from",
-            r"value\s+(?:comes?|derived)\s+from",
-        ]
-
         text_lower = text.lower()
-        return any(re.search(p, text_lower) for p in patterns)
+        return any(p.search(text_lower) for p in patterns.DESTINATION_PATTERNS)
 
     def detect_ocr_source_type(self, text: str, field_name: str) -> Optional[str]:
         """Detect OCR source type from logic and field name."""
         combined = f"{field_name} {text}".lower()
 
-        # OCR source type mappings
-        ocr_mappings = [
-            (r"upload\s*pan|pan\s*(?:image|upload|file)", "PAN_IMAGE"),
-            (r"upload\s*gstin|gstin\s*(?:image|upload|file)", "GSTIN_IMAGE"),
-            (r"aadhaa?r\s*front|front\s*aadhaa?r", "AADHAR_IMAGE"),
-            (r"aadhaa?r\s*back|back\s*aadhaa?r", "AADHAR_BACK_IMAGE"),
-            (r"cheque|cancelled\s*cheque", "CHEQUEE"),
-            (r"cin\s*(?:image|upload|file)|upload\s*cin", "CIN"),
-            (r"msme\s*(?:image|upload|file)|upload\s*msme|udyam", "MSME"),
-        ]
-
-        for pattern, source_type in ocr_mappings:
-            if re.search(pattern, combined, re.IGNORECASE):
+        for pattern, source_type in patterns.OCR_SOURCE_PATTERNS:
+            if pattern.search(combined):
                 return source_type
 
         return None
@@ -373,19 +341,8 @@ class LogicParser:
         if self.is_destination_field(text):
             return None
 
-        # VERIFY source type mappings
-        verify_mappings = [
-            (r"pan\s+validation|validate\s+pan", "PAN_NUMBER"),
-            (r"gstin?\s+validation|validate\s+gstin?", "GSTIN"),
-            (r"bank\s+(?:account\s+)?validation|validate\s+bank|ifsc\s+validation", "BANK_ACCOUNT_NUMBER"),
-            (r"msme\s+validation|validate\s+msme|udyam\s+validation", "MSME_UDYAM_REG_NUMBER"),
-            (r"cin\s+validation|validate\s+cin", "CIN_ID"),
-            (r"tan\s+validation|validate\s+tan", "TAN_NUMBER"),
-            (r"fssai\s+validation|validate\s+fssai", "FSSAI"),
-        ]
-
-        for pattern, source_type in verify_mappings:
-            if re.search(pattern, combined, re.IGNORECASE):
+        for pattern, source_type in patterns.PARSER_VERIFY_SOURCE_PATTERNS:
+            if pattern.search(combined):
                 return source_type
 
         return None
@@ -1,17 +1,24 @@
 """Main rule extraction pipeline - Enhanced version with comprehensive rule extraction."""
 
 import json
+import os
 import re
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Set
 from collections import defaultdict
 from datetime import datetime
 
+from common import json_io
+
 from .models import id_generator, FieldInfo
 from .schema_lookup import RuleSchemaLookup, OCR_VERIFY_CHAINS, VERIFY_SCHEMAS, OCR_SCHEMAS
 from .id_mapper import DestinationIdMapper
 from .field_matcher import FieldMatcher
+from .intra_ref_index import IntraRefIndex, ref_field_name
+from .memo import memo_stats
+from .patterns import BUD_QUALIFIED_CONDITIONS, BUD_UNQUALIFIED_CONDITION
 from .logic_parser import LogicParser
 from .rule_tree import RuleTree, VisibilityGrouper
 from .matchers.pipeline import MatchingPipeline, VisibilityRuleGrouper
@@ -69,6 +76,29 @@ OCR_DISABLED_FIELDS = [
     "MSME Registration Number",
 ]
 
+# Phase 2 fields per worker task when generating rules on a process pool
+FIELD_CHUNK_SIZE = 32
+
+# Per-process state for Phase 2 pool workers (set by _init_field_worker)
+_field_worker_state: Dict = {}
+
+
+def _init_field_worker(agent: "RuleExtractionAgent", visibility_groups: Dict,
+                       all_fields: List[Dict], intra_refs: List[Dict]) -> None:
+    """Pool initializer: keep one copy of the agent and shared inputs per worker."""
+    _field_worker_state.update(
+        agent=agent, visibility_groups=visibility_groups,
+        all_fields=all_fields, intra_refs=intra_refs,
+    )
+
+
+def _generate_field_chunk(tasks: List[Tuple[Dict, str]]) -> List[List[Dict]]:
+    """Pool task: Phase 2 rules for a chunk of (field, logic_text), locally numbered."""
+    state = _field_worker_state
+    return state['agent']._generate_field_rules_local(
+        tasks, state['visibility_groups'], state['all_fields'], state['intra_refs']
+    )
+
 
 class RuleExtractionAgent:
     """Main agent for extracting rules from BUD documents."""
@@ -80,7 +110,8 @@ class RuleExtractionAgent:
         verbose: bool = False,
         validate: bool = False,
         edv_tables_path: str = None,
-        field_edv_mapping_path: str = None
+        field_edv_mapping_path: str = None,
+        workers: int = 1
     ):
         # Initialize components
         self.schema_lookup = RuleSchemaLookup(schema_path)
@@ -110,21 +141,19 @@ class RuleExtractionAgent:
         # Options
         self.verbose = verbose
         self.validate = validate
+        self.workers = max(1, workers or os.cpu_count() or 1)
 
         # EDV tables and mappings
         self.edv_tables = {}
         self.field_edv_mappings = {}
         if edv_tables_path:
-            with open(edv_tables_path, 'r') as f:
-                edv_data = json.load(f)
-                self.edv_tables = edv_data
+            self.edv_tables = json_io.load(edv_tables_path)
         if field_edv_mapping_path:
-            with open(field_edv_mapping_path, 'r') as f:
-                edv_mapping_data = json.load(f)
-                self.field_edv_mappings = {
-                    m['field_name'].lower(): m
-                    for m in edv_mapping_data.get('field_edv_mappings', [])
-                }
+            edv_mapping_data = json_io.load(field_edv_mapping_path)
+            self.field_edv_mappings = {
+                m['field_name'].lower(): m
+                for m in edv_mapping_data.get('field_edv_mappings', [])
+            }
 
         # Statistics
         self.stats = {
@@ -165,11 +194,9 @@ class RuleExtractionAgent:
         }
 
         # Load inputs
-        with open(schema_json_path, 'r') as f:
-            schema = json.load(f)
+        schema = json_io.load(schema_json_path)
 
-        with open(intra_panel_path, 'r') as f:
-            intra_panel = json.load(f)
+        intra_panel = json_io.load(intra_panel_path)
 
         # Extract fields from schema
         all_fields = self._extract_fields_from_schema(schema)
@@ -188,6 +215,7 @@ class RuleExtractionAgent:
 
         # Extract intra-panel references
         intra_refs = self._extract_intra_refs(intra_panel)
+        ref_index = IntraRefIndex(intra_refs, self.field_matcher)
 
         if self.verbose:
             print(f"Loaded {len(intra_refs)} intra-panel references")
@@ -200,7 +228,7 @@ class RuleExtractionAgent:
         visibility_groups_from_bud = self._extract_visibility_from_bud_logic(all_fields, bud_field_logic)
 
         # Phase 1.6: Identify visibility controlling fields from intra-panel refs
-        visibility_groups_from_refs = self._identify_visibility_groups(all_fields, intra_refs)
+        visibility_groups_from_refs = self._identify_visibility_groups(all_fields, ref_index)
 
         # Merge both sources
         visibility_groups = self._merge_visibility_groups(visibility_groups_from_bud, visibility_groups_from_refs)
@@ -209,15 +237,17 @@ class RuleExtractionAgent:
             print(f"Found {len(visibility_groups)} controlling fields with {sum(len(v) for v in visibility_groups.values())} dependencies")
 
         # Phase 2: Generate rules for each field
+        # Fields are independent here, so they may be generated on a worker pool;
+        # rule IDs are assigned afterwards in field order (_assign_rule_ids)
         all_generated_rules = []
         field_rules_map = {}  # field_id -> list of rules
 
+        field_tasks = []
         for field in all_fields:
-            field_id = field.get('id')
             field_name = field.get('formTag', {}).get('name', '')
 
             # Get logic from BUD document (priority) or intra-panel refs (fallback)
-            logic_text = bud_field_logic.get(field_name.lower(), '') or self._get_field_logic(field_name, intra_refs)
+            logic_text = bud_field_logic.get(field_name.lower(), '') or self._get_field_logic(field_name, ref_index)
 
             # Check if this field is a controlling field (visibility source)
             controlling_key = field_name.lower()
@@ -227,10 +257,13 @@ class RuleExtractionAgent:
             if not logic_text and not is_controlling_field:
                 continue
 
-            # Generate rules
-            rules = self._generate_rules_for_field(
-                field, logic_text, visibility_groups, all_fields, intra_refs
-            )
+            field_tasks.append((field, logic_text))
+
+        field_rules = self._generate_field_rules(field_tasks, visibility_groups, all_fields, intra_refs)
+
+        for (field, _), rules in zip(field_tasks, field_rules):
+            field_id = field.get('id')
+            self._assign_rule_ids(rules)
 
             if rules:
                 field_rules_map[field_id] = rules
@@ -238,7 +271,7 @@ class RuleExtractionAgent:
                 self.stats["fields_with_rules"] += 1
 
         # Phase 3: Generate OCR and VERIFY rules from data_population references
-        data_pop_rules = self._generate_ocr_verify_from_refs(intra_refs, field_rules_map)
+        data_pop_rules = self._generate_ocr_verify_from_refs(ref_index, field_rules_map)
         all_generated_rules.extend(data_pop_rules)
 
         # Phase 3b: Generate ALL OCR rules based on field names (comprehensive scan)
@@ -246,7 +279,7 @@ class RuleExtractionAgent:
         all_generated_rules.extend(ocr_rules)
 
         # Phase 3c: Generate ALL VERIFY rules based on field names (comprehensive scan)
-        verify_rules = self._generate_all_verify_rules(all_fields, intra_refs, field_rules_map)
+        verify_rules = self._generate_all_verify_rules(all_fields, ref_index, field_rules_map)
         all_generated_rules.extend(verify_rules)
 
         # Phase 3d: Generate CONVERT_TO rules for uppercase fields
@@ -259,11 +292,11 @@ class RuleExtractionAgent:
             all_generated_rules.extend(edv_rules)
 
         # Phase 3f: Generate VALIDATION rules
-        validation_rules = self._generate_validation_rules(all_fields, intra_refs, field_rules_map)
+        validation_rules = self._generate_validation_rules(all_fields, ref_index, field_rules_map)
         all_generated_rules.extend(validation_rules)
 
         # Phase 3g: Generate COPY_TO rules
-        copy_to_rules = self._generate_copy_to_rules(all_fields, intra_refs, field_rules_map)
+        copy_to_rules = self._generate_copy_to_rules(all_fields, ref_index, field_rules_map)
         all_generated_rules.extend(copy_to_rules)
 
         # Phase 4: Link OCR -> VERIFY chains
@@ -288,13 +321,15 @@ class RuleExtractionAgent:
             issues = self.validator.validate_rules(consolidated_rules)
             self.stats["validation_errors"] = len(issues)
 
+        # Logic memo hit rates (process-wide, cumulative across runs)
+        self.stats["logic_memo"] = memo_stats()
+
         # Update schema with rules
         self._populate_schema_with_rules(schema, field_rules_map)
 
         # Save output
         if output_path:
-            with open(output_path, 'w') as f:
-                json.dump(schema, f, indent=2)
+            json_io.dump_streaming(schema, output_path, json_io.FORM_FILL_METADATAS_PATH, pretty=True)
 
             if self.verbose:
                 print(f"Saved populated schema to {output_path}")
@@ -327,51 +362,19 @@ class RuleExtractionAgent:
 
         return refs
 
-    def _get_field_logic(self, field_name: str, intra_refs: List[Dict]) -> str:
+    def _get_field_logic(self, field_name: str, ref_index: IntraRefIndex) -> str:
         """Get combined logic text for a field from intra-panel references."""
-        logic_parts = []
-        field_name_lower = field_name.lower().strip()
-
-        for ref in intra_refs:
-            # Check if this field is the dependent field
-            dependent = ref.get('dependent_field', '')
-            if isinstance(dependent, str) and dependent.lower().strip() == field_name_lower:
-                desc = ref.get('rule_description', '')
-                if desc and isinstance(desc, str):
-                    logic_parts.append(desc)
-
-            # Check if this field is the source field
-            source = ref.get('source_field', '')
-            if isinstance(source, str) and source.lower().strip() == field_name_lower:
-                desc = ref.get('dependency_description', '') or ref.get('logic_excerpt', '')
-                if desc and isinstance(desc, str):
-                    logic_parts.append(desc)
-
-            # Check if this field is the target field
-            target = ref.get('target_field', '')
-            if isinstance(target, str) and target.lower().strip() == field_name_lower:
-                desc = ref.get('dependency_description', '')
-                if desc and isinstance(desc, str):
-                    logic_parts.append(desc)
-
-            # Check if this field is the referenced field
-            referenced = ref.get('referenced_field', '')
-            if isinstance(referenced, str) and referenced.lower().strip() == field_name_lower:
-                desc = ref.get('rule_description', '')
-                if desc and isinstance(desc, str):
-                    logic_parts.append(desc)
-
-        return ' '.join(logic_parts)
+        return ref_index.logic_for(field_name)
 
     def _identify_visibility_groups(
         self,
         all_fields: List[Dict],
-        intra_refs: List[Dict]
+        ref_index: IntraRefIndex
     ) -> Dict[str, List[Dict]]:
         """Identify fields grouped by their controlling field - ENHANCED to parse unknown deps."""
         groups = defaultdict(list)
 
-        for ref in intra_refs:
+        for ref in ref_index.refs:
             dep_type = ref.get('dependency_type', ref.get('reference_type', ''))
             rule_desc = ref.get('rule_description', '')
 
@@ -421,7 +424,7 @@ class RuleExtractionAgent:
 
                 if referenced_field and dependent_field:
                     # Find dependent field ID
-                    dep_field_info = self.field_matcher.match_field(dependent_field)
+                    dep_field_info = ref_index.match(dependent_field)
 
                     groups[referenced_field.lower()].append({
                         'dependent_field': dependent_field,
@@ -434,7 +437,7 @@ class RuleExtractionAgent:
 
     def _generate_ocr_verify_from_refs(
         self,
-        intra_refs: List[Dict],
+        ref_index: IntraRefIndex,
         field_rules_map: Dict[int, List[Dict]]
     ) -> List[Dict]:
         """Generate OCR and VERIFY rules from data_population references."""
@@ -442,7 +445,7 @@ class RuleExtractionAgent:
         processed_ocr = set()  # Track processed OCR source fields
         processed_verify = set()  # Track processed VERIFY source fields
 
-        for ref in intra_refs:
+        for ref in ref_index.refs:
             ref_type = ref.get('reference_type', ref.get('dependency_type', ''))
             logic = ref.get('logic_excerpt', ref.get('rule_description', ref.get('dependency_description', '')))
 
@@ -478,8 +481,8 @@ class RuleExtractionAgent:
                             break
 
                 if source_name and target_name and source_name not in processed_ocr:
-                    source_field = self.field_matcher.match_field(source_name)
-                    target_field = self.field_matcher.match_field(target_name)
+                    source_field = ref_index.match(source_name)
+                    target_field = ref_index.match(target_name)
 
                     if source_field and target_field:
                         # Detect OCR source type
@@ -529,8 +532,8 @@ class RuleExtractionAgent:
 
                     if is_gstin_pan_cross and 'GSTIN_WITH_PAN' not in processed_verify:
                         # Find PAN and GSTIN fields
-                        pan_field = self.field_matcher.match_field('PAN')
-                        gstin_field = self.field_matcher.match_field('GSTIN')
+                        pan_field = ref_index.match('PAN')
+                        gstin_field = ref_index.match('GSTIN')
 
                         if pan_field and gstin_field:
                             # GSTIN_WITH_PAN: sourceIds = [GSTIN, PAN] - use specialized builder
@@ -555,14 +558,14 @@ class RuleExtractionAgent:
                         continue
 
                 if source_name and source_name not in processed_verify:
-                    source_field = self.field_matcher.match_field(source_name)
+                    source_field = ref_index.match(source_name)
 
                     if source_field:
                         # Detect VERIFY source type
                         verify_source = self._detect_verify_type_from_name(source_name)
                         if verify_source:
                             # Find all destination fields for this verification
-                            dest_mappings = self._find_verify_destinations(source_name, intra_refs)
+                            dest_mappings = self._find_verify_destinations(source_name, ref_index)
 
                             verify_rule = self.verify_builder.build(
                                 source_type=verify_source,
@@ -625,35 +628,79 @@ class RuleExtractionAgent:
     def _find_verify_destinations(
         self,
         source_field_name: str,
-        intra_refs: List[Dict]
+        ref_index: IntraRefIndex
     ) -> Dict[str, int]:
         """Find destination field mappings for a VERIFY rule."""
         mappings = {}
 
-        for ref in intra_refs:
-            ref_type = ref.get('reference_type', ref.get('dependency_type', ''))
-            src = ref.get('source_field', '')
+        for ref in ref_index.data_population_targets(source_field_name):
+            target_name = ref_field_name(ref.get('target_field', ''))
 
-            # Handle dict source_field
-            if isinstance(src, dict):
-                src = src.get('field_name', '')
+            if target_name:
+                target_field = ref_index.match(target_name)
+                if target_field:
+                    # Map using target field name - try to match to schema destination names
+                    # The schema has standard names like "Fullname", "Pan type" etc.
+                    # BUD fields might have names like "Pan Holder Name", "PAN Type"
+                    mappings[target_name] = target_field.id
 
-            if ref_type == 'data_population' and src.lower().strip() == source_field_name.lower().strip():
-                target_name = ref.get('target_field', '')
+        return mappings
 
-                # Handle dict target_field
-                if isinstance(target_name, dict):
-                    target_name = target_name.get('field_name', '')
+    def _generate_field_rules(
+        self,
+        field_tasks: List[Tuple[Dict, str]],
+        visibility_groups: Dict,
+        all_fields: List[Dict],
+        intra_refs: List[Dict]
+    ) -> List[List[Dict]]:
+        """
+        Phase 2 rules for each (field, logic_text), serially or on a process pool.
 
-                if target_name:
-                    target_field = self.field_matcher.match_field(target_name)
-                    if target_field:
-                        # Map using target field name - try to match to schema destination names
-                        # The schema has standard names like "Fullname", "Pan type" etc.
-                        # BUD fields might have names like "Pan Holder Name", "PAN Type"
-                        mappings[target_name] = target_field.id
+        Rules come back numbered locally per field (from 1); the caller gives
+        them their final IDs with _assign_rule_ids in field order, so the
+        result does not depend on how fields were split between workers.
+        """
+        workers = min(self.workers, -(-len(field_tasks) // FIELD_CHUNK_SIZE))
+        if workers <= 1:
+            return self._generate_field_rules_local(field_tasks, visibility_groups, all_fields, intra_refs)
 
-        return mappings
+        chunks = [field_tasks[i:i + FIELD_CHUNK_SIZE] for i in range(0, len(field_tasks), FIELD_CHUNK_SIZE)]
+        if self.verbose:
+            print(f"Generating rules for {len(field_tasks)} fields on {workers} workers ({len(chunks)} chunks)")
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_field_worker,
+                                 initargs=(self, visibility_groups, all_fields, intra_refs)) as executor:
+            results = []
+            for chunk_rules in executor.map(_generate_field_chunk, chunks):
+                results.extend(chunk_rules)
+        return results
+
+    def _generate_field_rules_local(
+        self,
+        field_tasks: List[Tuple[Dict, str]],
+        visibility_groups: Dict,
+        all_fields: List[Dict],
+        intra_refs: List[Dict]
+    ) -> List[List[Dict]]:
+        """Phase 2 rules for each (field, logic_text) in this process, numbered per field."""
+        results = []
+        for field, logic_text in field_tasks:
+            with id_generator.isolated():
+                results.append(self._generate_rules_for_field(
+                    field, logic_text, visibility_groups, all_fields, intra_refs
+                ))
+        return results
+
+    def _assign_rule_ids(self, rules: List[Dict]):
+        """Replace locally numbered rule IDs (and references to them) with the next global IDs."""
+        local_to_global = {}
+        for rule in rules:
+            local_id = rule.get('id')
+            rule['id'] = id_generator.next_id('rule')
+            local_to_global[local_id] = rule['id']
+        for rule in rules:
+            if rule.get('postTriggerRuleIds'):
+                rule['postTriggerRuleIds'] = [local_to_global.get(rid, rid) for rid in rule['postTriggerRuleIds']]
 
     def _generate_rules_for_field(
         self,
@@ -1064,7 +1111,7 @@ class RuleExtractionAgent:
     def _generate_all_verify_rules(
         self,
         all_fields: List[Dict],
-        intra_refs: List[Dict],
+        ref_index: IntraRefIndex,
         field_rules_map: Dict[int, List[Dict]]
     ) -> List[Dict]:
         """Generate VERIFY rules for all fields that match verification patterns."""
@@ -1114,7 +1161,7 @@ class RuleExtractionAgent:
                 continue
 
             # Find destination fields from intra-panel references
-            dest_mappings = self._find_verify_destinations(field_name, intra_refs)
+            dest_mappings = self._find_verify_destinations(field_name, ref_index)
 
             # Build VERIFY rule
             source_ids = [field_id]
@@ -1357,7 +1404,7 @@ class RuleExtractionAgent:
     def _generate_validation_rules(
         self,
         all_fields: List[Dict],
-        intra_refs: List[Dict],
+        ref_index: IntraRefIndex,
         field_rules_map: Dict[int, List[Dict]]
     ) -> List[Dict]:
         """Generate VALIDATION rules for fields with validation constraints."""
@@ -1368,7 +1415,7 @@ class RuleExtractionAgent:
             print(f"\n=== Generating VALIDATION Rules ===")
 
         # Strategy 1: From intra-panel references (validation dependency type)
-        for ref in intra_refs:
+        for ref in ref_index.refs_of_type('validation'):
             dep_type = ref.get('dependency_type', '')
 
             # Look for validation dependencies
@@ -1380,7 +1427,7 @@ class RuleExtractionAgent:
                     continue
 
                 # Find field ID
-                field_info = self.field_matcher.match_field(dependent_field)
+                field_info = ref_index.match(dependent_field)
                 if not field_info:
                     continue
 
@@ -1459,7 +1506,7 @@ class RuleExtractionAgent:
     def _generate_copy_to_rules(
         self,
         all_fields: List[Dict],
-        intra_refs: List[Dict],
+        ref_index: IntraRefIndex,
         field_rules_map: Dict[int, List[Dict]]
     ) -> List[Dict]:
         """Generate COPY_TO rules for field value propagation."""
@@ -1469,7 +1516,7 @@ class RuleExtractionAgent:
         if self.verbose:
             print(f"\n=== Generating COPY_TO Rules ===")
 
-        for ref in intra_refs:
+        for ref in ref_index.refs_of_type('value_derivation'):
             dep_type = ref.get('dependency_type', '')
             rule_desc = ref.get('rule_description', '')
 
@@ -1485,8 +1532,8 @@ class RuleExtractionAgent:
                         continue
 
                     # Find field IDs
-                    source_info = self.field_matcher.match_field(source_field)
-                    dest_info = self.field_matcher.match_field(dest_field)
+                    source_info = ref_index.match(source_field)
+                    dest_info = ref_index.match(dest_field)
 
                     if not source_info or not dest_info:
                         continue
@@ -1617,17 +1664,9 @@ class RuleExtractionAgent:
         field_list = [(f.get('formTag', {}).get('name', ''), f.get('id'), f.get('formTag', {}).get('type', ''))
                       for f in all_fields]
 
-        # Pattern to match "If 'FieldName' is X then..." or "If FieldName is X then..."
-        # Also match variations like "when", "if field", etc.
-        patterns = [
-            r"(?:if|when)\s+.*?field.*?['\"](.+?)['\"].*?(?:is|=|equals?|value\s+is)\s+['\"]?(\w+)['\"]?\s+then\s+(.*?)(?:\.|$)",
-            r"(?:if|when)\s+['\"](.+?)['\"].*?(?:is|=|equals?|value\s+is)\s+['\"]?(\w+)['\"]?\s+then\s+(.*?)(?:\.|$)",
-        ]
-
-        # Pattern for unqualified conditionals like "If Yes then..." or "If 'No' then..."
-        # These need to infer the controlling field from context (usually previous field)
-        unqualified_pattern = r"(?:if|when)\s+['\"]?(yes|no)['\"]?\s*[,;]?\s+then\s+(.*?)(?:\.|,|$)"
-
+        # Qualified conditionals ("If the field 'FieldName' is X then...", "If 'FieldName' is X then...")
+        # and unqualified ones ("If Yes then...") whose controlling field is inferred
+        # from context (usually the previous field)
         for idx, field in enumerate(all_fields):
             field_name = field.get('formTag', {}).get('name', '')
             field_id = field.get('id')
@@ -1640,9 +1679,8 @@ class RuleExtractionAgent:
             found_match = False
 
             # Try qualified patterns first (with field name)
-            for pattern in patterns:
-                matches = re.finditer(pattern, logic_lower, re.IGNORECASE)
-                for match in matches:
+            for pattern in BUD_QUALIFIED_CONDITIONS:
+                for match in pattern.finditer(logic_lower):
                     controlling_field = match.group(1).strip().strip('\'"')
                     condition_value = match.group(2).strip().strip('\'"')
                     action_text = match.group(3).strip()
@@ -1670,8 +1708,7 @@ class RuleExtractionAgent:
 
             # If no qualified match, try unqualified pattern
             if not found_match:
-                matches = re.finditer(unqualified_pattern, logic_lower, re.IGNORECASE)
-                for match in matches:
+                for match in BUD_UNQUALIFIED_CONDITION.finditer(logic_lower):
                     condition_value = match.group(1).strip().capitalize()  # "Yes" or "No"
                     action_text = match.group(2).strip()
 
@@ -1805,6 +1842,12 @@ def main():
         '--field-edv-mapping',
         help='Path to field-EDV mapping JSON'
     )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Worker processes for per-field rule generation (default: 1, 0 = CPU count)'
+    )
 
     args = parser.parse_args()
 
@@ -1819,7 +1862,8 @@ def main():
         verbose=args.verbose,
         validate=args.validate,
         edv_tables_path=args.edv_tables,
-        field_edv_mapping_path=args.field_edv_mapping
+        field_edv_mapping_path=args.field_edv_mapping,
+        workers=args.workers
     )
 
     result = agent.process(
@@ -1844,6 +1888,12 @@ def main():
     if stats['validation_errors'] > 0:
         print(f"\nValidation errors: {stats['validation_errors']}")
 
+    if args.verbose:
+        print("\nLogic memo:")
+        for memo in stats.get('logic_memo', []):
+            print(f"  {memo['name']}: {memo['hits']} hits, {memo['misses']} misses "
+                  f"({memo['hit_rate']:.0%}), {memo['size']}/{memo['maxsize']} entries")
+
     print(f"\nOutput saved to: {args.output}")
 
     # Save report if requested
@@ -1855,8 +1905,7 @@ def main():
             "output": args.output,
             "statistics": stats,
         }
-        with open(args.report, 'w') as f:
-            json.dump(report, f, indent=2)
+        json_io.dump(report, args.report, pretty=True)
         print(f"Report saved to: {args.report}")
 
 
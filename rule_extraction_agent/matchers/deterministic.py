@@ -2,7 +2,9 @@
 
 import re
 from typing import List, Dict, Optional, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+
+from ..memo import get_memo
 
 
 @dataclass
@@ -26,6 +28,7 @@ class DeterministicMatcher:
 
     def __init__(self):
         self._build_patterns()
+        self.memo = get_memo("deterministic_matcher.match")
 
     def _build_patterns(self):
         """Build all matching patterns."""
@@ -106,6 +109,13 @@ class DeterministicMatcher:
         if not logic_text:
             return []
 
+        # The field name is only used lowercased (OCR source detection)
+        key = (logic_text, field_name.lower())
+        results = self.memo.get(key, lambda: self._match(logic_text, field_name))
+        return [replace(r, conditional_values=list(r.conditional_values)) for r in results]
+
+    def _match(self, logic_text: str, field_name: str) -> List[MatchResult]:
+        """Match logic text to rule patterns (uncached)."""
         results = []
         text_lower = logic_text.lower()
         combined = f"{field_name} {logic_text}".lower()
@@ -1,6 +1,5 @@
 """Multi-stage matching pipeline."""
 
-import re
 from typing import List, Dict, Optional, Any
 from dataclasses import dataclass, field
 
@@ -8,6 +7,7 @@ from .deterministic import DeterministicMatcher, MatchResult
 from ..schema_lookup import RuleSchemaLookup
 from ..field_matcher import FieldMatcher
 from ..models import FieldInfo
+from ..patterns import CONDITIONAL_VALUE_PATTERNS, CONTROLLING_FIELD_PATTERNS
 
 
 @dataclass
@@ -93,15 +93,8 @@ class MatchingPipeline:
 
     def _extract_controlling_field(self, text: str) -> Optional[str]:
         """Extract the controlling field name from logic text."""
-        patterns = [
-            r"if\s+(?:the\s+)?field\s+['\"]([^'\"]+)['\"]",
-            r"when\s+(?:the\s+)?field\s+['\"]([^'\"]+)['\"]",
-            r"based\s+on\s+(?:the\s+)?['\"]([^'\"]+)['\"]",
-            r"depending\s+on\s+['\"]([^'\"]+)['\"]",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in CONTROLLING_FIELD_PATTERNS:
+            match = pattern.search(text)
             if match:
                 return match.group(1).strip()
 
@@ -111,15 +104,9 @@ class MatchingPipeline:
         """Extract conditional values from logic text."""
         values = []
 
-        # Pattern: "is X then" or "values is X then"
-        patterns = [
-            r"(?:value[s]?\s+is|is)\s+['\"]?([^'\"]+?)['\"]?\s+then",
-            r"(?:equal[s]?\s+to|==)\s+['\"]?([^'\"]+?)['\"]?",
-            r"select(?:ed|ion)?\s+['\"]?([^'\"]+?)['\"]?",
-        ]
-
-        for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        # Pattern: "is X then" or "values is X then", "equals X", "selected X"
+        for pattern in CONDITIONAL_VALUE_PATTERNS:
+            matches = pattern.findall(text)
             values.extend([m.strip() for m in matches if m.strip()])
 
         return list(set(values))
@@ -0,0 +1,132 @@
+"""
+Process-wide LRU memoization for logic-text analysis.
+
+The same logic text turns up many times in one BUD (master table rows repeated
+in the 4.5.x actor tables, duplicates concatenated by _merge_field_data) and
+again across RuleExtractionAgent runs in one process. LogicParser.parse,
+DeterministicMatcher.match and RuleTree.select_rules look their results up in
+a named LRUMemo before running any regex.
+
+Memos are shared by every instance in the process (get_memo returns the same
+memo for a name) and are bounded:
+
+    LOGIC_MEMO_SIZE   Entries per memo (default: 4096, 0 disables memoization)
+
+Cached results are shared objects; callers hand out copies so nothing a
+caller mutates leaks into later lookups.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+DEFAULT_MEMO_SIZE = 4096
+
+_memos: Dict[str, "LRUMemo"] = {}
+_memos_lock = threading.Lock()
+
+
+def _memo_size_setting() -> int:
+    try:
+        return int(os.environ.get("LOGIC_MEMO_SIZE", DEFAULT_MEMO_SIZE))
+    except ValueError:
+        return DEFAULT_MEMO_SIZE
+
+
+class LRUMemo:
+    """Bounded least-recently-used memo with hit/miss counters."""
+
+    def __init__(self, name: str, maxsize: int = DEFAULT_MEMO_SIZE):
+        self.name = name
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        Return the memoized value for key, computing and storing it on a miss.
+
+        Args:
+            key: Hashable lookup key
+            compute: Called with no arguments to produce the value on a miss
+
+        Returns:
+            The cached or freshly computed value (shared - do not mutate)
+        """
+        if self.maxsize <= 0:
+            self.misses += 1
+            return compute()
+
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+
+        value = compute()
+
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+        return value
+
+    def clear(self):
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Size and hit-rate counters."""
+        lookups = self.hits + self.misses
+        return {
+            "name": self.name,
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+def get_memo(name: str, maxsize: Optional[int] = None) -> LRUMemo:
+    """
+    Get the process-wide memo for a name, creating it on first use.
+
+    Args:
+        name: Memo name (e.g. "logic_parser.parse")
+        maxsize: Entry bound for a new memo (default: LOGIC_MEMO_SIZE)
+
+    Returns:
+        The shared LRUMemo
+    """
+    with _memos_lock:
+        memo = _memos.get(name)
+        if memo is None:
+            memo = LRUMemo(name, _memo_size_setting() if maxsize is None else maxsize)
+            _memos[name] = memo
+        return memo
+
+
+def memo_stats() -> List[Dict[str, Any]]:
+    """Stats of every memo in this process, by name."""
+    with _memos_lock:
+        memos = sorted(_memos.values(), key=lambda m: m.name)
+    return [memo.stats() for memo in memos]
+
+
+def clear_memos():
+    """Clear every memo in this process (entries and counters)."""
+    with _memos_lock:
+        memos = list(_memos.values())
+    for memo in memos:
+        memo.clear()
@@ -1,5 +1,6 @@
 """Data models for rule extraction agent."""
 
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from typing import List, Dict, Optional, Any
 from enum import Enum
@@ -209,6 +210,22 @@ class IdGenerator:
         """Get current ID without incrementing."""
         return self.counters.get(id_type, 0)
 
+    @contextmanager
+    def isolated(self):
+        """
+        Allocate from fresh counters inside the block.
+
+        IDs handed out inside start again from 1 and the outer counters are
+        restored afterwards, so work can be numbered locally and renumbered
+        into the global sequence later (see RuleExtractionAgent._assign_rule_ids).
+        """
+        saved = self.counters
+        self.counters = {}
+        try:
+            yield self
+        finally:
+            self.counters = saved
+
 
 # Global ID generator instance
 id_generator = IdGenerator()
@@ -0,0 +1,205 @@
+"""
+Precompiled regex bank for logic-text parsing.
+
+Every pattern the agent runs over BUD logic text is compiled here once, at
+import time, instead of being rebuilt or looked up in re's cache on every
+call.
+
+Patterns that scan free text avoid nested unbounded lazy quantifiers such as
+`.*?field.*?['"](.+?)['"].*?`. On long logic paragraphs with no match, those
+backtrack polynomially. The replacements use the same structure with:
+- negated classes that cannot run past the next delimiter (quote, comma,
+  newline, period)
+- a single lookahead in place of "lazy gap, keyword, lazy gap"
+- bounded gaps (MAX_GAP) between the parts of a conditional
+
+Each start position therefore does bounded work, and a scan is linear in the
+text length. benchmarks/bench_logic_patterns.py checks this on 10 KB inputs.
+"""
+
+import re
+
+# Longest free-text gap between parts of a conditional ("if <gap> field <gap>
+# 'Name' <gap> is Yes then ..."). Real BUD clauses are far shorter.
+MAX_GAP = 200
+
+# Longest quoted field name and action clause considered
+MAX_NAME = 200
+MAX_ACTION = 1000
+
+_I = re.IGNORECASE
+
+
+# ── RuleExtractionAgent._extract_visibility_from_bud_logic ──────────────────
+
+# "If the field 'X' values is Yes then visible and mandatory."
+BUD_FIELD_CONDITION = re.compile(
+    rf"(?:if|when)\s+(?=[^'\"\n]{{0,{MAX_GAP}}}?field)[^'\"\n]{{0,{MAX_GAP}}}['\"]([^'\"\n]{{1,{MAX_NAME}}})['\"]"
+    rf"[^\n]{{0,{MAX_GAP}}}?(?:is|=|equals?|value\s+is)\s+['\"]?(\w+)['\"]?\s+then\s+([^.\n]{{0,{MAX_ACTION}}})(?:\.|$)",
+    _I,
+)
+
+# "If 'X' is Yes then visible."
+BUD_QUOTED_CONDITION = re.compile(
+    rf"(?:if|when)\s+['\"]([^'\"\n]{{1,{MAX_NAME}}})['\"]"
+    rf"[^\n]{{0,{MAX_GAP}}}?(?:is|=|equals?|value\s+is)\s+['\"]?(\w+)['\"]?\s+then\s+([^.\n]{{0,{MAX_ACTION}}})(?:\.|$)",
+    _I,
+)
+
+BUD_QUALIFIED_CONDITIONS = (BUD_FIELD_CONDITION, BUD_QUOTED_CONDITION)
+
+# "If Yes then ..." / "If 'No', then ..." - controlling field inferred from context
+BUD_UNQUALIFIED_CONDITION = re.compile(
+    rf"(?:if|when)\s+['\"]?(yes|no)['\"]?(?:\s*[,;])?\s+then\s+([^.,\n]{{0,{MAX_ACTION}}})(?:\.|,|$)",
+    _I,
+)
+
+
+# ── LogicParser ─────────────────────────────────────────────────────────────
+
+# Expression/execute rules that are skipped
+SKIP_PATTERNS = [re.compile(p, _I) for p in (
+    r"mvi\s*\(",
+    r"mm\s*\(",
+    r"expr-eval",
+    r"\bEXECUTE\b",
+    r"execute\s+rule",
+    r"execute\s+script",
+)]
+
+PARSER_OCR_ACTION = re.compile(r"(from|using)\s+ocr|ocr\s+rule|get\s+\w+\s+from\s+ocr")
+PARSER_DATA_FROM = re.compile(r"data\s+will\s+come\s+from")
+PARSER_VERIFY_ACTION = re.compile(r"perform\s+\w+\s+validation|validate\s+\w+")
+
+CONDITION_PATTERNS = [re.compile(p, _I) for p in (
+    # "if the field 'X' values is Y then"
+    r"if\s+(?:the\s+)?field\s+['\"]([^'\"]+)['\"]\s+(?:value[s]?\s+is|is)\s+([^,\s]+(?:\s+[^,\s]+)?)\s+then",
+    # "if 'X' is Y then"
+    r"if\s+['\"]([^'\"]+)['\"]\s+is\s+([^,\s]+)\s+then",
+    # "when field 'X' is Y"
+    r"when\s+(?:the\s+)?field\s+['\"]([^'\"]+)['\"]\s+is\s+([^,\s]+)",
+    # "based on X selection"
+    rf"based\s+on\s+(?:the\s+)?['\"]?([^'\"]{{1,{MAX_NAME}}}?)['\"]?\s+selection",
+)]
+
+QUOTED_TEXT = re.compile(r"['\"]([^'\"]+)['\"]")
+
+FIELD_REFERENCE_PATTERNS = [re.compile(p, _I) for p in (
+    r"field\s+([A-Z][a-zA-Z\s]+)",
+    rf"the\s+([A-Z][a-zA-Z\s]{{0,{MAX_NAME}}})\s+field",
+)]
+
+VISIBILITY_CONTROLLING_FIELD = re.compile(r"if\s+(?:the\s+)?field\s+['\"]([^'\"]+)['\"]", _I)
+VISIBILITY_VISIBLE_VALUE = re.compile(rf"(?:values?\s+is|is)\s+([^,]{{1,{MAX_GAP}}}?)\s+then\s+visible", _I)
+VISIBILITY_OTHERWISE_INVISIBLE = re.compile(r"otherwise\s+invisible", _I)
+# Last comma-free run before "then invisible" within an if/when clause
+VISIBILITY_INVISIBLE_VALUE = re.compile(rf"([^,\n]{{1,{MAX_GAP}}}?)\s+then\s+invisible", _I)
+VISIBILITY_CONDITION_START = re.compile(r"if|when", _I)
+
+DESTINATION_PATTERNS = [re.compile(p, _I) for p in (
+    r"data\s+will\s+come\s+from",
+    r"populated\s+from",
+    r"derived\s+from",
+    r"auto-?fill(?:ed)?\s+from",
+    r"value\s+(?:comes?|derived)\s+from",
+)]
+
+OCR_SOURCE_PATTERNS = [(re.compile(p, _I), source_type) for p, source_type in (
+    (r"upload\s*pan|pan\s*(?:image|upload|file)", "PAN_IMAGE"),
+    (r"upload\s*gstin|gstin\s*(?:image|upload|file)", "GSTIN_IMAGE"),
+    (r"aadhaa?r\s*front|front\s*aadhaa?r", "AADHAR_IMAGE"),
+    (r"aadhaa?r\s*back|back\s*aadhaa?r", "AADHAR_BACK_IMAGE"),
+    (r"cheque|cancelled\s*cheque", "CHEQUEE"),
+    (r"cin\s*(?:image|upload|file)|upload\s*cin", "CIN"),
+    (r"msme\s*(?:image|upload|file)|upload\s*msme|udyam", "MSME"),
+)]
+
+PARSER_VERIFY_SOURCE_PATTERNS = [(re.compile(p, _I), source_type) for p, source_type in (
+    (r"pan\s+validation|validate\s+pan", "PAN_NUMBER"),
+    (r"gstin?\s+validation|validate\s+gstin?", "GSTIN"),
+    (r"bank\s+(?:account\s+)?validation|validate\s+bank|ifsc\s+validation", "BANK_ACCOUNT_NUMBER"),
+    (r"msme\s+validation|validate\s+msme|udyam\s+validation", "MSME_UDYAM_REG_NUMBER"),
+    (r"cin\s+validation|validate\s+cin", "CIN_ID"),
+    (r"tan\s+validation|validate\s+tan", "TAN_NUMBER"),
+    (r"fssai\s+validation|validate\s+fssai", "FSSAI"),
+)]
+
+
+# ── RuleTree ────────────────────────────────────────────────────────────────
+# (pattern, action_type, source_type, confidence)
+
+RULE_TREE_VISIBILITY = [(re.compile(p, _I), a, s, c) for p, a, s, c in (
+    (r"(?:make\s+)?visible\s+(?:if|when)", "MAKE_VISIBLE", None, 0.95),
+    (r"then\s+visible", "MAKE_VISIBLE", None, 0.90),
+    (r"show\s+(?:this|field|when)", "MAKE_VISIBLE", None, 0.85),
+    (r"(?:make\s+)?invisible|hide(?:n)?", "MAKE_INVISIBLE", None, 0.95),
+    (r"otherwise\s+invisible", "MAKE_INVISIBLE", None, 0.90),
+)]
+
+RULE_TREE_MANDATORY = [(re.compile(p, _I), a, s, c) for p, a, s, c in (
+    (r"(?:make\s+)?mandatory\s+(?:if|when)", "MAKE_MANDATORY", None, 0.95),
+    (r"then\s+mandatory", "MAKE_MANDATORY", None, 0.90),
+    (r"required\s+(?:if|when)", "MAKE_MANDATORY", None, 0.85),
+    (r"non-?mandatory|optional", "MAKE_NON_MANDATORY", None, 0.90),
+    (r"otherwise\s+non-?mandatory", "MAKE_NON_MANDATORY", None, 0.85),
+)]
+
+RULE_TREE_DISABLE = [(re.compile(p, _I), a, s, c) for p, a, s, c in (
+    (r"non-?editable", "MAKE_DISABLED", None, 0.95),
+    (r"read-?only", "MAKE_DISABLED", None, 0.95),
+    (r"disable(?:d)?", "MAKE_DISABLED", None, 0.90),
+    (r"system\s+generated", "MAKE_DISABLED", None, 0.85),
+)]
+
+RULE_TREE_VERIFY = [(re.compile(p, _I), a, s, c) for p, a, s, c in (
+    (r"pan\s+validation|validate\s+pan|perform\s+pan", "VERIFY", "PAN_NUMBER", 0.95),
+    (r"gstin?\s+validation|validate\s+gstin?|perform\s+gstin?", "VERIFY", "GSTIN", 0.95),
+    (r"bank\s+(?:account\s+)?validation|validate\s+bank", "VERIFY", "BANK_ACCOUNT_NUMBER", 0.95),
+    (r"ifsc\s+validation", "VERIFY", "BANK_ACCOUNT_NUMBER", 0.90),
+    (r"msme\s+validation|validate\s+msme|udyam\s+validation", "VERIFY", "MSME_UDYAM_REG_NUMBER", 0.95),
+    (r"cin\s+validation|validate\s+cin", "VERIFY", "CIN_ID", 0.95),
+    (r"tan\s+validation|validate\s+tan", "VERIFY", "TAN_NUMBER", 0.95),
+    (r"fssai\s+validation|validate\s+fssai", "VERIFY", "FSSAI", 0.95),
+)]
+
+RULE_TREE_OCR = [(re.compile(p, _I), a, s, c) for p, a, s, c in (
+    (r"(?:from|using)\s+ocr", "OCR", None, 0.95),
+    (r"ocr\s+rule", "OCR", None, 0.95),
+    (r"get\s+\w+\s+from\s+ocr", "OCR", None, 0.95),
+    (r"extract\s+from\s+(?:image|document)", "OCR", None, 0.85),
+    (r"data\s+will\s+come\s+from\s+.*ocr", "OCR", None, 0.90),
+)]
+
+# Logic that marks a field as a rule DESTINATION, not a source
+RULE_TREE_DESTINATION = [re.compile(p, _I) for p in (
+    r"data\s+will\s+come\s+from",
+    r"populated\s+from",
+    r"derived\s+from",
+    r"auto-?fill(?:ed)?\s+from",
+    r"value\s+(?:comes?|derived)\s+from",
+    r"store\s+(?:the\s+)?data\s+in",
+    r"next\s+fields",
+)]
+
+UPPER_CASE = re.compile(r"upper\s*case", _I)
+
+# "if field 'X' is Y then visible" (VisibilityGrouper)
+GROUPER_CONDITION = re.compile(
+    r"if\s+(?:the\s+)?field\s+['\"]([^'\"]+)['\"].*then\s+(visible|mandatory|invisible)", _I
+)
+
+
+# ── MatchingPipeline ────────────────────────────────────────────────────────
+
+CONTROLLING_FIELD_PATTERNS = [re.compile(p, _I) for p in (
+    r"if\s+(?:the\s+)?field\s+['\"]([^'\"]+)['\"]",
+    r"when\s+(?:the\s+)?field\s+['\"]([^'\"]+)['\"]",
+    r"based\s+on\s+(?:the\s+)?['\"]([^'\"]+)['\"]",
+    r"depending\s+on\s+['\"]([^'\"]+)['\"]",
+)]
+
+CONDITIONAL_VALUE_PATTERNS = [re.compile(p, _I) for p in (
+    rf"(?:value[s]?\s+is|is)\s+['\"]?([^'\"]{{1,{MAX_GAP}}}?)['\"]?\s+then",
+    r"(?:equal[s]?\s+to|==)\s+['\"]?([^'\"]+?)['\"]?",
+    r"select(?:ed|ion)?\s+['\"]?([^'\"]+?)['\"]?",
+)]
@@ -1,9 +1,11 @@
 """Decision tree for deterministic rule selection."""
 
-import re
+from dataclasses import replace
 from typing import List, Dict, Optional, Tuple
 from .models import RuleSelection, ParsedLogic
 from .schema_lookup import VERIFY_SCHEMAS, OCR_SCHEMAS
+from .memo import get_memo
+from . import patterns
 
 
 class RuleTree:
@@ -11,62 +13,19 @@ class RuleTree:
 
     def __init__(self):
         self._build_patterns()
+        self.memo = get_memo("rule_tree.select_rules")
 
     def _build_patterns(self):
-        """Build pattern matching rules."""
-        # Pattern format: (regex, action_type, source_type, confidence)
-        self.visibility_patterns = [
-            (r"(?:make\s+)?visible\s+(?:if|when)", "MAKE_VISIBLE", None, 0.95),
-            (r"then\s+visible", "MAKE_VISIBLE", None, 0.90),
-            (r"show\s+(?:this|field|when)", "MAKE_VISIBLE", None, 0.85),
-            (r"(?:make\s+)?invisible|hide(?:n)?", "MAKE_INVISIBLE", None, 0.95),
-            (r"otherwise\s+invisible", "MAKE_INVISIBLE", None, 0.90),
-        ]
-
-        self.mandatory_patterns = [
-            (r"(?:make\s+)?mandatory\s+(?:if|when)", "MAKE_MANDATORY", None, 0.95),
-            (r"then\s+mandatory", "MAKE_MANDATORY", None, 0.90),
-            (r"required\s+(?:if|when)", "MAKE_MANDATORY", None, 0.85),
-            (r"non-?mandatory|optional", "MAKE_NON_MANDATORY", None, 0.90),
-            (r"otherwise\s+non-?mandatory", "MAKE_NON_MANDATORY", None, 0.85),
-        ]
-
-        self.disable_patterns = [
-            (r"non-?editable", "MAKE_DISABLED", None, 0.95),
-            (r"read-?only", "MAKE_DISABLED", None, 0.95),
-            (r"disable(?:d)?", "MAKE_DISABLED", None, 0.90),
-            (r"system\s+generated", "MAKE_DISABLED", None, 0.85),
-        ]
-
-        self.verify_patterns = [
-            (r"pan\s+validation|validate\s+pan|perform\s+pan", "VERIFY", "PAN_NUMBER", 0.95),
-            (r"gstin?\s+validation|validate\s+gstin?|perform\s+gstin?", "VERIFY", "GSTIN", 0.95),
-            (r"bank\s+(?:account\s+)?validation|validate\s+bank", "VERIFY", "BANK_ACCOUNT_NUMBER", 0.95),
-            (r"ifsc\s+validation", "VERIFY", "BANK_ACCOUNT_NUMBER", 0.90),
-            (r"msme\s+validation|validate\s+msme|udyam\s+validation", "VERIFY", "MSME_UDYAM_REG_NUMBER", 0.95),
-            (r"cin\s+validation|validate\s+cin", "VERIFY", "CIN_ID", 0.95),
-            (r"tan\s+validation|validate\s+tan", "VERIFY", "TAN_NUMBER", 0.95),
-            (r"fssai\s+validation|validate\s+fssai", "VERIFY", "FSSAI", 0.95),
-        ]
-
-        self.ocr_patterns = [
-            (r"(?:from|using)\s+ocr", "OCR", None, 0.95),
-            (r"ocr\s+rule", "OCR", None, 0.95),
-            (r"get\s+\w+\s+from\s+ocr", "OCR", None, 0.95),
-            (r"extract\s+from\s+(?:image|document)", "OCR", None, 0.85),
-            (r"data\s+will\s+come\s+from\s+.*ocr", "OCR", None, 0.90),
-        ]
+        """Use the precompiled pattern tables from the pattern bank."""
+        # Pattern format: (compiled regex, action_type, source_type, confidence)
+        self.visibility_patterns = patterns.RULE_TREE_VISIBILITY
+        self.mandatory_patterns = patterns.RULE_TREE_MANDATORY
+        self.disable_patterns = patterns.RULE_TREE_DISABLE
+        self.verify_patterns = patterns.RULE_TREE_VERIFY
+        self.ocr_patterns = patterns.RULE_TREE_OCR
 
         # Patterns that indicate this field is a DESTINATION, not source
-        self.destination_patterns = [
-            r"data\s+will\s+come\s+from",
-            r"populated\s+from",
-            r"derived\s+from",
-            r"auto-?fill(?:ed)?\s+from",
-            r"value\s+(?:comes?|derived)\s+from",
-            r"store\s+(?:the\s+)?data\s+in",
-            r"next\s+fields",
-        ]
+        self.destination_patterns = patterns.RULE_TREE_DESTINATION
 
     def select_rules(self, parsed_logic: ParsedLogic) -> List[RuleSelection]:
         """
@@ -81,7 +40,13 @@ class RuleTree:
         if parsed_logic.should_skip:
             return []
 
+        # Selection only depends on the lowercased text
         text = parsed_logic.raw_text.lower()
+        selections = self.memo.get(text, lambda: self._select_rules(text))
+        return [replace(sel) for sel in selections]
+
+    def _select_rules(self, text: str) -> List[RuleSelection]:
+        """Select rules for lowercased logic text (uncached)."""
         selections = []
 
         # Check if this is a destination field
@@ -89,59 +54,59 @@ class RuleTree:
 
         # Check visibility patterns
         for pattern, action, source, conf in self.visibility_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
+            if pattern.search(text):
                 selections.append(RuleSelection(
                     action_type=action,
                     source_type=source,
                     confidence=conf,
-                    pattern_matched=pattern,
+                    pattern_matched=pattern.pattern,
                 ))
 
         # Check mandatory patterns
         for pattern, action, source, conf in self.mandatory_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
+            if pattern.search(text):
                 selections.append(RuleSelection(
                     action_type=action,
                     source_type=source,
                     confidence=conf,
-                    pattern_matched=pattern,
+                    pattern_matched=pattern.pattern,
                 ))
 
         # Check disable patterns
         for pattern, action, source, conf in self.disable_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
+            if pattern.search(text):
                 selections.append(RuleSelection(
                     action_type=action,
                     source_type=source,
                     confidence=conf,
-                    pattern_matched=pattern,
+                    pattern_matched=pattern.pattern,
                 ))
 
         # Check VERIFY patterns (only if not a destination field)
         if not is_destination:
             for pattern, action, source, conf in self.verify_patterns:
-                if re.search(pattern, text, re.IGNORECASE):
+                if pattern.search(text):
                     schema_id = VERIFY_SCHEMAS.get(source)
                     selections.append(RuleSelection(
                         action_type=action,
                         source_type=source,
                         schema_id=schema_id,
                         confidence=conf,
-                        pattern_matched=pattern,
+                        pattern_matched=pattern.pattern,
                     ))
 
         # Check OCR patterns
         for pattern, action, source, conf in self.ocr_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
+            if pattern.search(text):
                 selections.append(RuleSelection(
                     action_type=action,
                     source_type=source,
                     confidence=conf,
-                    pattern_matched=pattern,
+                    pattern_matched=pattern.pattern,
                 ))
 
         # Check for CONVERT_TO upper case
-        if re.search(r"upper\s*case", text, re.IGNORECASE):
+        if patterns.UPPER_CASE.search(text):
             selections.append(RuleSelection(
                 action_type="CONVERT_TO",
                 source_type="UPPER_CASE",
@@ -163,7 +128,7 @@ class RuleTree:
     def _is_destination_field(self, text: str) -> bool:
         """Check if this field is a destination of another rule."""
         for pattern in self.destination_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
+            if pattern.search(text):
                 return True
         return False
 
@@ -171,19 +136,8 @@ class RuleTree:
         """Detect OCR source type from field name and logic."""
         combined = f"{field_name} {logic_text}".lower()
 
-        # OCR source type mappings
-        ocr_mappings = [
-            (r"upload\s*pan|pan\s*(?:image|upload|file)", "PAN_IMAGE"),
-            (r"upload\s*gstin|gstin\s*(?:image|upload|file)", "GSTIN_IMAGE"),
-            (r"aadhaa?r\s*front|front\s*aadhaa?r", "AADHAR_IMAGE"),
-            (r"aadhaa?r\s*back|back\s*aadhaa?r", "AADHAR_BACK_IMAGE"),
-            (r"cheque|cancelled\s*cheque", "CHEQUEE"),
-            (r"cin\s*(?:image|upload|file)|upload\s*cin", "CIN"),
-            (r"msme\s*(?:image|upload|file)|upload\s*msme|udyam", "MSME"),
-        ]
-
-        for pattern, source_type in ocr_mappings:
-            if re.search(pattern, combined, re.IGNORECASE):
+        for pattern, source_type in patterns.OCR_SOURCE_PATTERNS:
+            if pattern.search(combined):
                 return source_type
 
         return None
@@ -198,7 +152,7 @@ class RuleTree:
 
         # Check patterns
         for pattern, action, source, conf in self.verify_patterns:
-            if re.search(pattern, combined, re.IGNORECASE):
+            if pattern.search(combined):
                 return source
 
         return None
@@ -232,10 +186,7 @@ class VisibilityGrouper:
             return
 
         # Pattern: "if field 'X' is Y then visible"
-        match = re.search(
-            r"if\s+(?:the\s+)?field\s+['\"]([^'\"]+)['\"].*then\s+(visible|mandatory|invisible)",
-            logic_text, re.IGNORECASE
-        )
+        match = patterns.GROUPER_CONDITION.search(logic_text)
 
         if match:
             controlling_field = match.group(1).strip()
@@ -1,64 +1,25 @@
 """Query interface for Rule-Schemas.json."""
 
-import json
 from typing import Dict, List, Optional, Any
-from pathlib import Path
+
+from common.rule_schema_registry import RuleSchemaRegistry
 
 
 class RuleSchemaLookup:
     """Query interface for Rule-Schemas.json (182 pre-defined rules)."""
 
     def __init__(self, path: str = None):
-        if path is None:
-            # Default to rules/Rule-Schemas.json relative to project root
-            path = Path(__file__).parent.parent / "rules" / "Rule-Schemas.json"
-
-        with open(path, 'r') as f:
-            data = json.load(f)
-
-        self.schemas = data.get('content', [])
+        # Defaults to rules/Rule-Schemas.json relative to project root
+        self.registry = RuleSchemaRegistry.load(path)
+        self.schemas = self.registry.schemas
         self._build_indexes()
 
     def _build_indexes(self):
-        """Build fast lookup indexes."""
-        self.by_id: Dict[int, Dict] = {}
-        self.by_action: Dict[str, List[Dict]] = {}
-        self.by_source: Dict[str, Dict] = {}
-        self.by_action_source: Dict[str, Dict] = {}
-
-        for schema in self.schemas:
-            schema_id = schema.get('id')
-            action = schema.get('action')
-            source = schema.get('source')
-
-            if schema_id:
-                self.by_id[schema_id] = schema
-
-            if action:
-                if action not in self.by_action:
-                    self.by_action[action] = []
-                self.by_action[action].append(schema)
-
-            if source:
-                self.by_source[source] = schema
-
-            if action and source:
-                key = f"{action}:{source}"
-                # Prefer schemas with more destination fields or SERVER processing
-                existing = self.by_action_source.get(key)
-                if existing:
-                    # Compare: prefer SERVER over CLIENT, prefer more destination fields
-                    existing_dest_count = existing.get('destinationFields', {}).get('numberOfItems', 0)
-                    new_dest_count = schema.get('destinationFields', {}).get('numberOfItems', 0)
-                    existing_is_server = existing.get('processingType') == 'SERVER'
-                    new_is_server = schema.get('processingType') == 'SERVER'
-
-                    # Replace if new is better
-                    if (new_is_server and not existing_is_server) or \
-                       (new_dest_count > existing_dest_count and new_is_server == existing_is_server):
-                        self.by_action_source[key] = schema
-                else:
-                    self.by_action_source[key] = schema
+        """Use the shared registry's lookup indexes."""
+        self.by_id: Dict[int, Dict] = self.registry.by_id
+        self.by_action: Dict[str, List[Dict]] = self.registry.by_action
+        self.by_source: Dict[str, Dict] = self.registry.by_source
+        self.by_action_source: Dict[str, Dict] = self.registry.by_action_source
 
     def find_by_id(self, schema_id: int) -> Optional[Dict]:
         """Find schema by ID."""
@@ -27,6 +27,7 @@ BUD_NAME="Vendor Creation"
 START_STAGE=1
 END_STAGE=10
 PRETTY_FLAG=""
+RESUME_FLAG=""
 
 # ── Usage ───────────────────────────────────────────────────────────────────
 usage() {
@@ -48,6 +49,7 @@ ${BOLD}Options:${NC}
   --start-stage <1-10>      Start from this stage (default: 1)
   --end-stage <1-10>        Stop after this stage (default: 10)
   --pretty                  Pretty print final API JSON
+  --resume                  Reuse panels checkpointed by an interrupted run (stages 1-9)
   -h, --help                Show this help
 
 ${BOLD}Stages:${NC}
@@ -70,6 +72,9 @@ ${BOLD}Examples:${NC}
   # Run only stages 3-5
   $0 --bud "documents/Vendor Creation Sample BUD.docx" --start-stage 3 --end-stage 5
 
+  # Resume stage 5 after a crash, reusing finished panels
+  $0 --bud "documents/Vendor Creation Sample BUD.docx" --start-stage 5 --resume
+
   # Custom output directory
   $0 --bud "documents/Vendor Creation Sample BUD.docx" --output-dir output/run1
 EOF
@@ -89,6 +94,7 @@ while [[ $# -gt 0 ]]; do
         --start-stage)   START_STAGE="$2"; shift 2 ;;
         --end-stage)     END_STAGE="$2"; shift 2 ;;
         --pretty)        PRETTY_FLAG="--pretty"; shift ;;
+        --resume)        RESUME_FLAG="--resume"; shift ;;
         -h|--help)       usage ;;
         *)               echo -e "${RED}Unknown option: $1${NC}"; usage ;;
     esac
@@ -179,60 +185,60 @@ run_stage 1 "Rule Placement" \
         --bud "$BUD_DOC" \
         --keyword-tree "$KEYWORD_TREE" \
         --rule-schemas "$RULE_SCHEMAS" \
-        --output "$STAGE1_OUT"
+        --output "$STAGE1_OUT" $RESUME_FLAG
 
 # ── Stage 2: Source / Destination ──────────────────────────────────────────
 run_stage 2 "Source / Destination" \
     python3 "${DISPATCHERS}/source_destination_dispatcher.py" \
         --input "$STAGE1_OUT" \
         --rule-schemas "$RULE_SCHEMAS" \
-        --output "$STAGE2_OUT"
+        --output "$STAGE2_OUT" $RESUME_FLAG
 
 # ── Stage 3: EDV Rules ────────────────────────────────────────────────────
 run_stage 3 "EDV Rules" \
     python3 "${DISPATCHERS}/edv_rule_dispatcher.py" \
         --bud "$BUD_DOC" \
         --source-dest-output "$STAGE2_OUT" \
-        --output "$STAGE3_OUT"
+        --output "$STAGE3_OUT" $RESUME_FLAG
 
 # ── Stage 4: Validate EDV ─────────────────────────────────────────────────
 run_stage 4 "Validate EDV" \
     python3 "${DISPATCHERS}/validate_edv_dispatcher.py" \
         --bud "$BUD_DOC" \
         --edv-output "$STAGE3_OUT" \
-        --output "$STAGE4_OUT"
+        --output "$STAGE4_OUT" $RESUME_FLAG
 
 # ── Stage 5: Conditional Logic ─────────────────────────────────────────────
 run_stage 5 "Conditional Logic" \
     python3 "${DISPATCHERS}/conditional_logic_dispatcher.py" \
         --validate-edv-output "$STAGE4_OUT" \
-        --output "$STAGE5_OUT"
+        --output "$STAGE5_OUT" $RESUME_FLAG
 
 # ── Stage 6: Derivation Logic ──────────────────────────────────────────────
 run_stage 6 "Derivation Logic" \
     python3 "${DISPATCHERS}/derivation_logic_dispatcher.py" \
         --conditional-logic-output "$STAGE5_OUT" \
-        --output "$STAGE6_OUT"
+        --output "$STAGE6_OUT" $RESUME_FLAG
 
 # ── Stage 7: Clear Child Fields ───────────────────────────────────────────
 run_stage 7 "Clear Child Fields" \
     python3 "${DISPATCHERS}/clear_child_fields_dispatcher.py" \
         --derivation-output "$STAGE6_OUT" \
-        --output "$STAGE7_OUT"
+        --output "$STAGE7_OUT" $RESUME_FLAG
 
 # ── Stage 8: Inter-Panel Rules ─────────────────────────────────────────────
 run_stage 8 "Inter-Panel Rules" \
     python3 "${DISPATCHERS}/inter_panel_dispatcher.py" \
         --clear-child-output "$STAGE7_OUT" \
         --bud "$BUD_DOC" \
-        --output "$STAGE8_OUT"
+        --output "$STAGE8_OUT" $RESUME_FLAG
 
 # ── Stage 9: Session Based ────────────────────────────────────────────────
 run_stage 9 "Session Based" \
     python3 "${DISPATCHERS}/session_based_dispatcher.py" \
         --clear-child-output "$STAGE8_OUT" \
         --bud "$BUD_DOC" \
-        --output "$STAGE9_OUT"
+        --output "$STAGE9_OUT" $RESUME_FLAG
 
 # ── Stage 10: Convert to API Format ───────────────────────────────────────
 STAGE10_ARGS=(